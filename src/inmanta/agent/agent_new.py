@@ -82,7 +82,9 @@ class Agent(SessionEndpoint):
 
         self.executor_manager: executor.ExecutorManager[executor.Executor] = self.create_executor_manager()
         assert self.session is not None
-        self.scheduler = scheduler.ResourceScheduler(self._environment_id, self.executor_manager, self.session.get_client())
+        self.scheduler = scheduler.ResourceScheduler(
+            self._environment_id, self.executor_manager, self.session.get_client(), state_dir=self._storage["scheduler"]
+        )
 
         self.working = False
         # Prevents that the start_working() and stop_working() methods execute concurrently.
@@ -380,6 +382,9 @@ class Agent(SessionEndpoint):
                         │
                         ├─ compiler/
                         │
+                        ├─ scheduler/
+                        │   ├─ model_state.snapshot
+                        │
                         ├─ scheduler.cfg
 
         """
@@ -390,5 +395,6 @@ class Agent(SessionEndpoint):
 
         dir_map = {
             "executors": ensure_directory_exist(state_dir, "executors"),
+            "scheduler": ensure_directory_exist(state_dir, "scheduler"),
         }
         return dir_map
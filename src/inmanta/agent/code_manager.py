@@ -16,10 +16,13 @@ limitations under the License.
 Contact: code@inmanta.com
 """
 
+import collections
 import itertools
 import logging
 import sys
 import uuid
+from collections.abc import Mapping, Sequence, Set
+from typing import Any, Optional
 
 import inmanta.data.sqlalchemy as models
 from inmanta import data
@@ -27,25 +30,63 @@ from inmanta.agent import executor
 from inmanta.agent.executor import ModuleInstallSpec
 from inmanta.data.model import LEGACY_PIP_DEFAULT, ModuleSource, ModuleSourceMetadata, PipConfig
 from inmanta.util.async_lru import async_lru_cache
-from sqlalchemy import and_, select
+from sqlalchemy import Row, and_, select
 
 LOGGER = logging.getLogger(__name__)
 
 
 class CouldNotResolveCode(Exception):
 
-    def __init__(self, agent_name: str, version: int) -> None:
+    def __init__(self, agent_name: str, version: int, missing_files: Optional[Set[str]] = None) -> None:
         self.msg = f"Failed to get source code for agent `{agent_name}` on version {version}."
+        if missing_files:
+            self.msg += f" The content of the files with hash {', '.join(sorted(missing_files))} was not found."
         super().__init__(self.msg)
 
 
+class BlobCache:
+    """
+    Memory bounded LRU cache for file contents, keyed on the hash of the content.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """
+        :param max_size: The maximal total size of the cached contents, in bytes.
+        """
+        self.max_size = max_size
+        self._blobs: collections.OrderedDict[str, bytes] = collections.OrderedDict()
+        self._total_size = 0
+
+    def get(self, content_hash: str) -> Optional[bytes]:
+        blob = self._blobs.get(content_hash)
+        if blob is not None:
+            self._blobs.move_to_end(content_hash)
+        return blob
+
+    def put(self, content_hash: str, blob: bytes) -> None:
+        if content_hash in self._blobs or len(blob) > self.max_size:
+            return
+        self._blobs[content_hash] = blob
+        self._total_size += len(blob)
+        while self._total_size > self.max_size:
+            _, evicted = self._blobs.popitem(last=False)
+            self._total_size -= len(evicted)
+
+
 class CodeManager:
     """
     Helper responsible for translating resource versions into code
 
-    Caches heavily
+    Caches heavily: the module files of a version are resolved once for all agents and file contents are cached by hash,
+    so a new version with unchanged modules only costs a metadata query.
     """
 
+    def __init__(self, blob_cache_size: int = 256 * 1024 * 1024) -> None:
+        """
+        :param blob_cache_size: The maximal total size of the cached file contents, in bytes.
+        """
+        self._blob_cache = BlobCache(blob_cache_size)
+
     @async_lru_cache(maxsize=1024)
     async def get_code(self, environment: uuid.UUID, model_version: int, agent_name: str) -> list[ModuleInstallSpec]:
         """
@@ -57,15 +98,74 @@ class CodeManager:
         """
         module_install_specs = []
 
-        modules_for_agent = (
+        modules_for_version: Mapping[str, Sequence[Row[Any]]] = await self._get_module_files(environment, model_version)
+        rows_for_agent: Sequence[Row[Any]] = modules_for_version.get(agent_name, [])
+        content_hashes: Set[str] = {row.file_content_hash for row in rows_for_agent}
+        contents: Mapping[str, bytes] = await self._get_file_contents(content_hashes)
+        if len(contents) != len(content_hashes):
+            # The content was removed after the module files were resolved, e.g. by a concurrent cleanup
+            raise CouldNotResolveCode(agent_name, model_version, content_hashes - contents.keys())
+
+        for module_name, rows in itertools.groupby(rows_for_agent, key=lambda r: r.inmanta_module_name):
+            rows_list = list(rows)
+            assert rows_list
+
+            first_row = rows_list[0]
+            _pip_config = first_row.pip_config
+            for row in rows_list:
+
+                # The following attributes should be consistent across all modules in this version
+                assert row.inmanta_module_version == first_row.inmanta_module_version
+                assert row.pip_config == _pip_config
+                assert set(row.requirements) == set(first_row.requirements)
+                assert row.project_constraints == first_row.project_constraints
+
+            pip_config = LEGACY_PIP_DEFAULT if _pip_config is None else PipConfig(**_pip_config)
+            module_install_specs.append(
+                ModuleInstallSpec(
+                    module_name=module_name,
+                    module_version=first_row.inmanta_module_version,
+                    blueprint=executor.ExecutorBlueprint(
+                        pip_config=pip_config,
+                        requirements=first_row.requirements,
+                        sources=[
+                            ModuleSource(
+                                metadata=ModuleSourceMetadata(
+                                    name=row.python_module_name,
+                                    hash_value=row.file_content_hash,
+                                    is_byte_code=row.is_byte_code,
+                                ),
+                                source=contents[row.file_content_hash],
+                            )
+                            for row in rows_list
+                        ],
+                        python_version=sys.version_info[:2],
+                        environment_id=environment,
+                        project_constraints=first_row.project_constraints if first_row.project_constraints else None,
+                    ),
+                )
+            )
+
+        if not module_install_specs:
+            raise CouldNotResolveCode(agent_name, model_version)
+        return module_install_specs
+
+    @async_lru_cache(maxsize=16)
+    async def _get_module_files(self, environment: uuid.UUID, model_version: int) -> Mapping[str, Sequence[Row[Any]]]:
+        """
+        Get the module files required by each agent for the given version, without their content.
+
+        :return: The module files for each agent, ordered by inmanta module name.
+        """
+        modules_for_version = (
             select(
+                models.AgentModules.agent_name,
                 models.AgentModules.inmanta_module_name,
                 models.AgentModules.inmanta_module_version,
                 models.InmantaModule.requirements,
                 models.ModuleFiles.python_module_name,
                 models.ModuleFiles.file_content_hash,
                 models.ModuleFiles.is_byte_code,
-                models.File.content.label("source_file_content"),
                 models.Configurationmodel.pip_config,
                 models.Configurationmodel.project_constraints,
             )
@@ -85,10 +185,6 @@ class CodeManager:
                     models.InmantaModule.environment == models.ModuleFiles.environment,
                 ),
             )
-            .join(
-                models.File,
-                models.ModuleFiles.file_content_hash == models.File.content_hash,
-            )
             .join(
                 models.Configurationmodel,
                 and_(
@@ -98,54 +194,34 @@ class CodeManager:
             )
             .where(
                 models.AgentModules.environment == environment,
-                models.AgentModules.agent_name == agent_name,
                 models.AgentModules.cm_version == model_version,
             )
-            .order_by(models.AgentModules.inmanta_module_name)
+            .order_by(models.AgentModules.agent_name, models.AgentModules.inmanta_module_name)
         )
 
         async with data.get_session() as session:
-            result = await session.execute(modules_for_agent)
-            for module_name, rows in itertools.groupby(result.all(), key=lambda r: r.inmanta_module_name):
-                rows_list = list(rows)
-                assert rows_list
-
-                first_row = rows_list[0]
-                _pip_config = first_row.pip_config
-                for row in rows_list:
-
-                    # The following attributes should be consistent across all modules in this version
-                    assert row.inmanta_module_version == first_row.inmanta_module_version
-                    assert row.pip_config == _pip_config
-                    assert set(row.requirements) == set(first_row.requirements)
-                    assert row.project_constraints == first_row.project_constraints
-
-                pip_config = LEGACY_PIP_DEFAULT if _pip_config is None else PipConfig(**_pip_config)
-                module_install_specs.append(
-                    ModuleInstallSpec(
-                        module_name=module_name,
-                        module_version=first_row.inmanta_module_version,
-                        blueprint=executor.ExecutorBlueprint(
-                            pip_config=pip_config,
-                            requirements=first_row.requirements,
-                            sources=[
-                                ModuleSource(
-                                    metadata=ModuleSourceMetadata(
-                                        name=row.python_module_name,
-                                        hash_value=row.file_content_hash,
-                                        is_byte_code=row.is_byte_code,
-                                    ),
-                                    source=row.source_file_content,
-                                )
-                                for row in rows_list
-                            ],
-                            python_version=sys.version_info[:2],
-                            environment_id=environment,
-                            project_constraints=first_row.project_constraints if first_row.project_constraints else None,
-                        ),
-                    )
-                )
+            result = await session.execute(modules_for_version)
+            return {agent_name: list(rows) for agent_name, rows in itertools.groupby(result.all(), key=lambda r: r.agent_name)}
 
-        if not module_install_specs:
-            raise CouldNotResolveCode(agent_name, model_version)
-        return module_install_specs
+    async def _get_file_contents(self, content_hashes: Set[str]) -> Mapping[str, bytes]:
+        """
+        Get the contents of the files with the given hashes. Only the contents that are not cached are fetched.
+        """
+        contents: dict[str, bytes] = {}
+        missing: list[str] = []
+        for content_hash in content_hashes:
+            blob = self._blob_cache.get(content_hash)
+            if blob is not None:
+                contents[content_hash] = blob
+            else:
+                missing.append(content_hash)
+
+        if missing:
+            async with data.get_session() as session:
+                result = await session.execute(
+                    select(models.File.content_hash, models.File.content).where(models.File.content_hash.in_(missing))
+                )
+                for content_hash, content in result.all():
+                    contents[content_hash] = content
+                    self._blob_cache.put(content_hash, content)
+        return contents
@@ -90,6 +90,54 @@ scheduler_db_connection_timeout: Option[float] = Option(
     " (in seconds).",
     is_float,
 )
+scheduler_deploy_result_batch_window: Option[float] = Option(
+    "scheduler",
+    "deploy-result-batch-window",
+    0.0,
+    "In each environment, group the deploy results that finish within this time window (in seconds) into a single "
+    "database transaction. Set to 0 to write every deploy result in its own transaction.",
+    is_float,
+)
+scheduler_deploy_result_batch_size: Option[int] = Option(
+    "scheduler",
+    "deploy-result-batch-size",
+    200,
+    "The maximum number of deploy results that are written to the database in a single transaction when "
+    ":inmanta.config:option:`scheduler.deploy-result-batch-window` is set.",
+    is_lower_bounded_int(1),
+)
+
+scheduler_timer_jitter: Option[float] = Option(
+    "scheduler",
+    "timer-jitter",
+    0.0,
+    "In each environment, spread the periodic per-resource deploys and repairs over time by scheduling them up to this "
+    "fraction of the interval earlier, e.g. 0.1 for up to 10% earlier. The offset is stable per resource. Must be between "
+    "0 and 1, set to 0 to disable.",
+    is_float,
+)
+
+scheduler_state_snapshot_interval: Option[int] = Option(
+    "scheduler",
+    "state-snapshot-interval",
+    0,
+    "In each environment, write a snapshot of the resource scheduler's model state to disk at most this number of seconds "
+    "after it processed a new model version. When the scheduler starts, it restores its state from the snapshot if it "
+    "matches the last processed version, which avoids reading the full model from the database. Set to 0 to disable "
+    "snapshots.",
+    is_lower_bounded_int(0),
+)
+
+scheduler_compact_model_state: Option[bool] = Option(
+    "scheduler",
+    "compact-model-state",
+    False,
+    "In each environment, keep the resource scheduler's in-memory model state in a compact representation: resource ids "
+    "are interned to integer indexes, the resource state is stored in array-backed columns and the requires-provides "
+    "relation is stored as adjacency arrays. This considerably reduces the memory footprint of the scheduler for "
+    "environments with a large number of resources, at the cost of slightly slower state access.",
+    is_bool,
+)
 
 agent_executor_cap = Option[int](
     "agent",
@@ -100,6 +148,24 @@ agent_executor_cap = Option[int](
     is_lower_bounded_int(1),
 )
 
+agent_executor_prewarm_budget = Option[int](
+    "agent",
+    "executor-prewarm-budget",
+    0,
+    "Maximum number of executor processes that are created ahead of their first use when a new version is released. "
+    "Pre-warming creates the venv and loads the handler code before the first deploy needs it. Set to 0 to disable "
+    "pre-warming.",
+    is_lower_bounded_int(0),
+)
+
+agent_executor_venv_build_workers = Option[int](
+    "agent",
+    "executor-venv-build-workers",
+    4,
+    "Maximum number of Python virtual environments for executors that are built concurrently.",
+    is_lower_bounded_int(1),
+)
+
 agent_executor_retention_time = Option[int](
     "agent",
     "executor-retention-time",
@@ -108,6 +174,15 @@ agent_executor_retention_time = Option[int](
     is_time,
 )
 
+agent_executor_file_cache_size = Option[int](
+    "agent",
+    "executor-file-cache-size",
+    256,
+    "Maximum size (in MiB) of the on-disk cache for the files that handlers retrieve from the server. The cache is shared "
+    "by all executors of an environment. Set to 0 to disable the cache.",
+    is_lower_bounded_int(0),
+)
+
 agent_cache_cleanup_tick_rate = Option[int](
     "agent",
     "cache-cleanup-tick-rate",
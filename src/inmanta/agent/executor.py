@@ -21,7 +21,9 @@ import asyncio
 import concurrent.futures
 import dataclasses
 import datetime
+import enum
 import hashlib
+import importlib.metadata
 import json
 import logging
 import os
@@ -40,6 +42,7 @@ import packaging.requirements
 from inmanta import const
 from inmanta.agent import config as cfg
 from inmanta.agent import resourcepool
+from inmanta.agent.file_cache import FileCache
 from inmanta.agent.handler import HandlerContext
 from inmanta.const import Change
 from inmanta.data import LogLine
@@ -60,6 +63,8 @@ class AgentInstance(abc.ABC):
     sessionid: uuid.UUID
     environment: uuid.UUID
     uri: str
+    # Cache for the files retrieved by the handlers, if enabled
+    file_cache: Optional[FileCache] = None
 
     @abc.abstractmethod
     def is_stopped(self) -> bool:
@@ -415,26 +420,123 @@ class ExecutorVirtualEnvironment(PythonEnvironment, resourcepool.PoolMember[str]
 
         return None
 
-    async def _create_and_install_environment(self, blueprint: EnvBlueprint) -> None:
+    async def _create_and_install_environment(
+        self,
+        blueprint: EnvBlueprint,
+        clone_from: Optional["ExecutorVirtualEnvironment"] = None,
+        cache_dir: Optional[str] = None,
+    ) -> None:
         """
         Creates and configures the virtual environment according to the provided blueprint.
 
         :param blueprint: An instance of EnvBlueprint containing the configuration for
             the pip installation and the requirements to install.
+        :param clone_from: An existing venv whose installed packages are a subset of the packages required by the
+            blueprint. Its packages are hardlinked into this venv, so pip only has to install the difference.
+        :param cache_dir: The wheel cache directory to pass to pip.
         """
         req: list[str] = list(blueprint.requirements)
-        await asyncio.get_running_loop().run_in_executor(self.io_threadpool, self.init_env)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self.io_threadpool, self.init_env)
         # Ensure our storage folder exists
         os.makedirs(self.inmanta_storage, exist_ok=True)
 
+        if clone_from is not None:
+            await loop.run_in_executor(self.io_threadpool, self.clone_site_packages, clone_from)
+
         constraint_file: str | None = self._write_constraint_file(blueprint)
         if len(req):  # install_for_config expects at least 1 requirement or a path to install
             await self.async_install_for_config(
                 requirements=[packaging.requirements.Requirement(requirement_string=e) for e in req],
                 config=blueprint.pip_config,
                 constraint_files=[constraint_file] if constraint_file else None,
+                cache_dir=cache_dir,
             )
 
+    def clone_site_packages(self, source: "ExecutorVirtualEnvironment") -> None:
+        """
+        Populate this freshly initialized venv with the packages installed in the given venv. Besides the content of
+        site-packages, the files that a package installed elsewhere in the venv are cloned as well, e.g. its console scripts
+        and data files. The shebang of the scripts is rewritten to the python interpreter of this venv. Packages that
+        installed files outside of the venv are not cloned, pip installs them from scratch.
+
+        Files are hardlinked when possible and copied otherwise. This is safe because pip never modifies an installed file
+        in place: it removes the file before writing a new one.
+
+        This method must be called on a threadpool to not block the ioloop.
+        """
+        source_root: str = os.path.realpath(source.env_path)
+        source_site_packages: str = os.path.realpath(source.site_packages_dir)
+        source_bin_dir: bytes = os.fsencode(os.path.join(source.env_path, "bin") + os.sep)
+        target_bin_dir: bytes = os.fsencode(os.path.join(self.env_path, "bin") + os.sep)
+
+        def is_relative_to(path: str, directory: str) -> bool:
+            return os.path.commonpath([path, directory]) == directory
+
+        def link_or_copy(src: str, dst: str) -> None:
+            try:
+                os.link(src, dst)
+            except OSError:
+                # E.g. the venvs are on different file systems
+                shutil.copy2(src, dst)
+
+        # The files outside of site-packages to clone, relative to the root of the venv
+        files_outside_site_packages: list[str] = []
+        # The files in site-packages that belong to packages that can not be cloned
+        ignored_files: set[str] = set()
+        for dist in importlib.metadata.distributions(path=[source.site_packages_dir]):
+            files: Sequence[importlib.metadata.PackagePath] = dist.files or []
+            paths: list[str] = [os.path.realpath(dist.locate_file(file)) for file in files]
+            outside: list[str] = [path for path in paths if not is_relative_to(path, source_site_packages)]
+            if all(is_relative_to(path, source_root) for path in outside):
+                files_outside_site_packages.extend(os.path.relpath(path, source_root) for path in outside)
+            else:
+                LOGGER.debug(
+                    "Not cloning package %s from venv %s: it installed files outside of the venv",
+                    dist.name,
+                    source.env_path,
+                )
+                ignored_files.update(paths)
+                # The metadata directory as well, so that pip doesn't consider the package installed
+                ignored_files.update(os.path.dirname(path) for path in paths if path.endswith(f".dist-info{os.sep}RECORD"))
+
+        # The inmanta managed files were written by init_env
+        pth_file_name: str = os.path.basename(self._path_pth_file)
+
+        def ignore(directory: str, names: list[str]) -> set[str]:
+            return {
+                name
+                for name in names
+                if name == pth_file_name or os.path.realpath(os.path.join(directory, name)) in ignored_files
+            }
+
+        shutil.copytree(
+            source.site_packages_dir,
+            self.site_packages_dir,
+            ignore=ignore,
+            copy_function=link_or_copy,
+            dirs_exist_ok=True,
+        )
+
+        for relative_path in files_outside_site_packages:
+            src: str = os.path.join(source_root, relative_path)
+            dst: str = os.path.join(self.env_path, relative_path)
+            if not os.path.isfile(src) or os.path.lexists(dst):
+                # Don't overwrite the files written by init_env, e.g. the python interpreter
+                continue
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            with open(src, "rb") as fh:
+                is_script: bool = fh.read(2) == b"#!"
+            if not is_script:
+                link_or_copy(src, dst)
+                continue
+            # Scripts refer to the python interpreter of the venv they were installed in
+            with open(src, "rb") as fh:
+                content: bytes = fh.read()
+            with open(dst, "wb") as fh:
+                fh.write(content.replace(source_bin_dir, target_bin_dir))
+            shutil.copymode(src, dst)
+
     def is_correctly_initialized(self) -> bool:
         """
         Was the venv correctly initialized: the inmanta status file exists
@@ -503,7 +605,18 @@ class VirtualEnvironmentManager(resourcepool.TimeBasedPoolManager[EnvBlueprint,
     for storing these environments.
     """
 
-    def __init__(self, envs_dir: str, thread_pool: concurrent.futures.thread.ThreadPoolExecutor) -> None:
+    def __init__(
+        self,
+        envs_dir: str,
+        thread_pool: concurrent.futures.thread.ThreadPoolExecutor,
+        wheel_cache_dir: Optional[str] = None,
+    ) -> None:
+        """
+        :param envs_dir: The directory to create the venvs in.
+        :param thread_pool: The thread pool to perform blocking IO on.
+        :param wheel_cache_dir: The wheel cache shared by all pip installs of this manager. The default pip cache is used
+            when None.
+        """
         # We rely on a Named lock (`self._locks`, inherited from PoolManager) to be able to lock specific entries of the
         # `_environment_map` dict. This allows us to prevent creating and deleting the same venv at a given time. The keys of
         # this named lock are the hash of venv
@@ -512,6 +625,13 @@ class VirtualEnvironmentManager(resourcepool.TimeBasedPoolManager[EnvBlueprint,
         )
         self.envs_dir: pathlib.Path = pathlib.Path(envs_dir).absolute()
         self.thread_pool = thread_pool
+        self.wheel_cache_dir = wheel_cache_dir
+
+        # Venvs for different blueprints are built concurrently, up to this limit
+        self._build_slots = asyncio.Semaphore(cfg.agent_executor_venv_build_workers.get())
+        # The blueprints of the venvs in the pool, to find a venv to clone. Venvs found on disk at startup are not
+        # included, as their blueprint is not stored.
+        self._blueprints: dict[str, EnvBlueprint] = {}
 
     async def start(self) -> None:
         await self.init_environment_map()
@@ -575,6 +695,75 @@ class VirtualEnvironmentManager(resourcepool.TimeBasedPoolManager[EnvBlueprint,
             else:
                 await asyncio.get_running_loop().run_in_executor(self.thread_pool, virtual_environment.remove_venv)
 
+    async def notify_member_shutdown(self, pool_member: ExecutorVirtualEnvironment) -> bool:
+        self._blueprints.pop(pool_member.get_id(), None)
+        return await super().notify_member_shutdown(pool_member)
+
+    def _find_clone_source(self, blueprint: EnvBlueprint) -> Optional[str]:
+        """
+        Find the venv that is the best starting point to build a venv for the given blueprint: the venv with the most
+        requirements, for which all requirements are also requirements of the given blueprint and all other properties of
+        the blueprint are the same. Venvs with other requirements are never used, as they could contain packages that
+        don't belong in the new venv.
+
+        :return: The id of the venv to clone or None if no venv is suitable.
+        """
+        requirements = set(blueprint.requirements)
+        best: Optional[str] = None
+        best_size = 0
+        for venv_id, candidate in self._blueprints.items():
+            venv = self.pool.get(venv_id)
+            if venv is None or venv.shutting_down:
+                continue
+            if (
+                candidate.environment_id != blueprint.environment_id
+                or candidate.pip_config != blueprint.pip_config
+                or candidate.python_version != blueprint.python_version
+                or candidate.project_constraints != blueprint.project_constraints
+                or candidate.libc_version != blueprint.libc_version
+            ):
+                continue
+            if len(candidate.requirements) > best_size and requirements.issuperset(candidate.requirements):
+                best = venv_id
+                best_size = len(candidate.requirements)
+        return best
+
+    async def _build_environment(self, process_environment: ExecutorVirtualEnvironment, blueprint: EnvBlueprint) -> None:
+        """
+        Build the venv for the given blueprint, starting from a clone of the closest existing venv if there is one.
+
+        Must be called under the lock of the venv that is being built.
+        """
+        loop = asyncio.get_running_loop()
+        source_id = self._find_clone_source(blueprint)
+        if source_id is not None:
+            # Hold the lock of the source venv, to prevent it from being removed while we copy it
+            async with self._locks.get(self.get_lock_name_for(source_id)):
+                source = self.pool.get(source_id)
+                if source is not None and not source.shutting_down and source.is_correctly_initialized():
+                    LOGGER.info(
+                        "Creating venv for content %s, content hash: %s, starting from the venv with hash %s",
+                        str(blueprint),
+                        process_environment.get_id(),
+                        source_id,
+                    )
+                    try:
+                        await process_environment._create_and_install_environment(
+                            blueprint, clone_from=source, cache_dir=self.wheel_cache_dir
+                        )
+                        return
+                    except Exception:
+                        LOGGER.warning(
+                            "Failed to create venv %s from venv %s, building it from scratch",
+                            process_environment.get_id(),
+                            source_id,
+                            exc_info=True,
+                        )
+                        await loop.run_in_executor(self.thread_pool, process_environment.reset)
+
+        LOGGER.info("Creating venv for content %s, content hash: %s", str(blueprint), process_environment.get_id())
+        await process_environment._create_and_install_environment(blueprint, cache_dir=self.wheel_cache_dir)
+
     async def get_environment(self, blueprint: EnvBlueprint) -> ExecutorVirtualEnvironment:
         """
         Retrieves an existing virtual environment that matches the given blueprint or creates a new one if no match is found.
@@ -625,10 +814,11 @@ class VirtualEnvironmentManager(resourcepool.TimeBasedPoolManager[EnvBlueprint,
             is_new = True
 
         if is_new:
-            LOGGER.info("Creating venv for content %s, content hash: %s", str(member_id), internal_id)
-            await process_environment._create_and_install_environment(member_id)
+            async with self._build_slots:
+                await self._build_environment(process_environment, member_id)
 
         process_environment.touch()
+        self._blueprints[internal_id] = member_id
         return process_environment
 
 
@@ -758,6 +948,16 @@ class Executor(abc.ABC):
 E = typing.TypeVar("E", bound=Executor, covariant=True)
 
 
+class PrewarmState(str, enum.Enum):
+    """
+    State of an executor process that is created ahead of its first use
+    """
+
+    WARMING = "warming"
+    READY = "ready"
+    FAILED = "failed"
+
+
 class ExecutorManager(abc.ABC, typing.Generic[E]):
     """
     Manages Executors by ensuring that Executors are created and reused efficiently based on their configurations.
@@ -831,6 +1031,21 @@ class ExecutorManager(abc.ABC, typing.Generic[E]):
         """
         pass
 
+    async def prewarm(self, blueprints: Sequence[ExecutorBlueprint]) -> None:
+        """
+        Prepare executors for the given blueprints ahead of their first use, e.g. when a new version is released.
+        Managers that can't prepare executors ahead of time ignore this call.
+
+        :param blueprints: The blueprints that will be needed, most important first.
+        """
+        pass
+
+    def get_prewarm_status(self) -> Mapping[str, PrewarmState]:
+        """
+        Returns the state of the executors that are prepared ahead of their first use, by blueprint hash.
+        """
+        return {}
+
 
 class ModuleLoadingException(Exception):
     """
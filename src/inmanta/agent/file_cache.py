@@ -0,0 +1,192 @@
+"""
+Copyright 2026 Inmanta
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Contact: code@inmanta.com
+"""
+
+import asyncio
+import base64
+import collections
+import logging
+import os
+import tempfile
+from collections.abc import Iterable
+from typing import Optional
+
+from inmanta import protocol
+from inmanta.util import hash_file
+
+LOGGER = logging.getLogger(__name__)
+
+
+class FileCache:
+    """
+    Content addressed, size bounded cache on disk for the files retrieved from the file server.
+
+    Files on the server are immutable and identified by the hash of their content, so a file that was downloaded and
+    verified once never has to be downloaded again. When the cache exceeds its maximum size, the least recently used
+    files are evicted.
+
+    The folder can be shared by multiple processes: files are stored atomically and a file that was evicted by another
+    process is downloaded again. The size bound is enforced by each process for the files it knows about.
+
+    All methods must be called on the event loop of the executor.
+    """
+
+    # Maximal number of concurrent downloads when prefetching files
+    PREFETCH_CONCURRENCY = 8
+
+    def __init__(self, folder: str, max_size: int, client: protocol.Client) -> None:
+        """
+        :param folder: The folder to store the cached files in.
+        :param max_size: The maximal total size of the cached files, in bytes.
+        :param client: The client used to download files from the server.
+        """
+        self.folder = folder
+        self.max_size = max_size
+        self.client = client
+
+        # Size of each cached file, in least recently used order
+        self._index: collections.OrderedDict[str, int] = collections.OrderedDict()
+        self._total_size = 0
+        # Downloads in progress, so concurrent requests for the same file share a single download
+        self._in_flight: dict[str, asyncio.Task[Optional[bytes]]] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def load(self) -> None:
+        """
+        Index the files that are already present in the cache folder, e.g. from a previous executor process. Files are
+        considered used in the order in which they were last modified.
+
+        This method performs blocking IO.
+        """
+        os.makedirs(self.folder, exist_ok=True)
+        entries: list[tuple[float, str, int]] = []
+        with os.scandir(self.folder) as it:
+            for entry in it:
+                if not entry.is_file() or entry.name.startswith("."):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, entry.name, stat.st_size))
+        for _, hash_id, size in sorted(entries):
+            self._add(hash_id, size)
+        self._evict()
+
+    async def get(self, hash_id: str) -> Optional[bytes]:
+        """
+        Get the content of the file with the given hash, downloading it from the server if it is not in the cache.
+
+        :param hash_id: The hash of the file to retrieve.
+        :return: The content of the file or None if the file doesn't exist on the server.
+        """
+        if hash_id in self._index:
+            try:
+                content = await asyncio.get_running_loop().run_in_executor(None, self._read, hash_id)
+            except FileNotFoundError:
+                # Evicted by another process
+                self._remove(hash_id)
+            else:
+                if hash_id in self._index:
+                    self._index.move_to_end(hash_id)
+                self.hits += 1
+                return content
+
+        download = self._in_flight.get(hash_id)
+        if download is None:
+            self.misses += 1
+            download = asyncio.create_task(self._download(hash_id))
+            self._in_flight[hash_id] = download
+            download.add_done_callback(lambda _: self._in_flight.pop(hash_id, None))
+        # Don't cancel the download for the other requests of this file when this request is cancelled
+        return await asyncio.shield(download)
+
+    async def prefetch(self, hash_ids: Iterable[str]) -> None:
+        """
+        Make sure the files with the given hashes are in the cache, e.g. for all files used by a batch of resources.
+        Failures are logged and otherwise ignored: the file will be retrieved again when it is requested.
+
+        :param hash_ids: The hashes of the files to fetch.
+        """
+        semaphore = asyncio.Semaphore(self.PREFETCH_CONCURRENCY)
+
+        async def fetch(hash_id: str) -> None:
+            async with semaphore:
+                try:
+                    await self.get(hash_id)
+                except Exception:
+                    LOGGER.debug("Failed to prefetch file %s", hash_id, exc_info=True)
+
+        await asyncio.gather(*(fetch(hash_id) for hash_id in set(hash_ids) if hash_id not in self._index))
+
+    async def _download(self, hash_id: str) -> Optional[bytes]:
+        result = await self.client.get_file(hash_id)
+        if result.code == 404:
+            return None
+        elif result.result and result.code == 200:
+            file_contents = base64.b64decode(result.result["content"])
+            actual_hash_of_file = hash_file(file_contents)
+            if hash_id != actual_hash_of_file:
+                raise Exception(f"File hash verification failed, expected: {hash_id} but got {actual_hash_of_file}")
+        else:
+            raise Exception("An error occurred while retrieving file %s" % hash_id)
+
+        if len(file_contents) <= self.max_size:
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, self._write, hash_id, file_contents)
+            except OSError:
+                LOGGER.warning("Failed to store file %s in the file cache", hash_id, exc_info=True)
+            else:
+                self._add(hash_id, len(file_contents))
+                self._evict()
+        return file_contents
+
+    def _read(self, hash_id: str) -> bytes:
+        with open(os.path.join(self.folder, hash_id), "rb") as fh:
+            return fh.read()
+
+    def _write(self, hash_id: str, content: bytes) -> None:
+        # Write to a temporary file first, so other processes never observe a partially written file
+        fd, tmp_path = tempfile.mkstemp(dir=self.folder, prefix=".")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(content)
+            os.replace(tmp_path, os.path.join(self.folder, hash_id))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _add(self, hash_id: str, size: int) -> None:
+        self._remove(hash_id)
+        self._index[hash_id] = size
+        self._total_size += size
+
+    def _remove(self, hash_id: str) -> None:
+        size = self._index.pop(hash_id, None)
+        if size is not None:
+            self._total_size -= size
+
+    def _evict(self) -> None:
+        while self._total_size > self.max_size:
+            hash_id, size = self._index.popitem(last=False)
+            self._total_size -= size
+            try:
+                os.remove(os.path.join(self.folder, hash_id))
+            except FileNotFoundError:
+                pass
@@ -105,6 +105,7 @@ from inmanta.agent.executor import (
     ModuleLoadingException,
     VirtualEnvironmentManager,
 )
+from inmanta.agent.file_cache import FileCache
 from inmanta.agent.resourcepool import PoolManager, PoolMember
 from inmanta.const import LOGGER_NAME_EXECUTOR
 from inmanta.protocol.ipc_light import (
@@ -128,6 +129,7 @@ class ExecutorContext:
 
     client: typing.Optional[inmanta.protocol.Client]
     venv: typing.Optional[inmanta.env.VirtualEnv]
+    file_cache: typing.Optional[FileCache] = None
     environment: uuid.UUID
     executors: dict[str, "inmanta.agent.in_process_executor.InProcessExecutor"] = {}
 
@@ -167,6 +169,7 @@ class ExecutorContext:
             client=self.client,
             eventloop=loop,
             parent_logger=parent_logger,
+            file_cache=self.file_cache,
         )
         await executor.start()
 
@@ -397,16 +400,22 @@ class InitCommand(inmanta.protocol.ipc_light.IPCMethod[ExecutorContext, FailedIn
         storage_folder: str,
         sources: Sequence[inmanta.data.model.ModuleSource],
         venv_touch_interval: float = 60.0,
+        file_cache_folder: typing.Optional[str] = None,
+        file_cache_size: int = 0,
     ):
         """
         :param venv_touch_interval: The time interval after which the virtual environment must be touched. Only used for
             testing. The default value is set to 60.0. It should not be used except for testing purposes. It can be
             overridden to speed up the tests
+        :param file_cache_folder: The folder for the cache of the files retrieved by the handlers. None disables the cache.
+        :param file_cache_size: The maximal size of the file cache, in bytes.
         """
         self.venv_path = venv_path
         self.storage_folder = storage_folder
         self.sources = sources
         self._venv_touch_interval = venv_touch_interval
+        self.file_cache_folder = file_cache_folder
+        self.file_cache_size = file_cache_size
 
     async def call(self, context: ExecutorContext) -> FailedInmantaModules:
         assert context.server.timer_venv_scheduler_interval is None, "InitCommand should be only called once!"
@@ -420,6 +429,12 @@ class InitCommand(inmanta.protocol.ipc_light.IPCMethod[ExecutorContext, FailedIn
         # setup client
         context.client = inmanta.protocol.Client("agent")
 
+        # setup file cache
+        if self.file_cache_folder is not None and self.file_cache_size > 0:
+            file_cache = FileCache(self.file_cache_folder, self.file_cache_size, context.client)
+            await loop.run_in_executor(context.threadpool, file_cache.load)
+            context.file_cache = file_cache
+
         # activate venv
         context.venv = inmanta.env.VirtualEnv(self.venv_path)
         context.venv.use_virtual_env()
@@ -885,9 +900,21 @@ class MPPool(resourcepool.PoolManager[executor.ExecutorBlueprint, executor.Execu
         self.code_folder = pathlib.Path(self.storage_folder) / "code"
         self.code_folder.mkdir(exist_ok=True)
 
+        # Processes created ahead of their first use, see prewarm()
+        self.prewarm_budget: int = inmanta.agent.config.agent_executor_prewarm_budget.get()
+        self._prewarmed: dict[str, executor.ExecutorBlueprint] = {}
+        self._prewarm_failed: set[str] = set()
+        self._prewarm_tasks: dict[str, asyncio.Task[None]] = {}
+
+        # Shared by all executor processes, created by the executors themselves
+        self.file_cache_folder = pathlib.Path(self.storage_folder) / "files"
+        self.file_cache_size: int = inmanta.agent.config.agent_executor_file_cache_size.get() * 1024 * 1024
+
         # Env manager
         self.environment_manager = inmanta.agent.executor.VirtualEnvironmentManager(
-            envs_dir=str(venv_dir.absolute()), thread_pool=self.thread_pool
+            envs_dir=str(venv_dir.absolute()),
+            thread_pool=self.thread_pool,
+            wheel_cache_dir=str(pathlib.Path(self.storage_folder) / "pip-cache"),
         )
 
         # logging
@@ -940,6 +967,71 @@ class MPPool(resourcepool.PoolManager[executor.ExecutorBlueprint, executor.Execu
     def _id_to_internal(self, ext_id: executor.ExecutorBlueprint) -> executor.ExecutorBlueprint:
         return ext_id
 
+    async def prewarm(self, blueprints: Sequence[executor.ExecutorBlueprint]) -> None:
+        """
+        Create processes for the given blueprints ahead of their first use, so the first deploy doesn't have to wait for
+        the venv and the handler code. At most `prewarm_budget` processes are kept warm and unused at any time.
+
+        Processes that were created for blueprints that are no longer requested are stopped if they were never used.
+
+        :param blueprints: The blueprints that will be needed, most important first.
+        """
+        if self.prewarm_budget == 0 or not self.running:
+            return
+        wanted: dict[str, executor.ExecutorBlueprint] = {blueprint.blueprint_hash(): blueprint for blueprint in blueprints}
+
+        for blueprint_hash, blueprint in list(self._prewarmed.items()):
+            if blueprint_hash in wanted or blueprint_hash in self._prewarm_tasks:
+                continue
+            del self._prewarmed[blueprint_hash]
+            self._prewarm_failed.discard(blueprint_hash)
+            process: typing.Optional[MPProcess] = self.pool.get(blueprint)
+            if process is not None and not process.pool:
+                LOGGER.debug("Stopping unused pre-warmed %s", self.render_id(blueprint))
+                await process.request_shutdown()
+
+        def is_idle(blueprint: executor.ExecutorBlueprint) -> bool:
+            process: typing.Optional[MPProcess] = self.pool.get(blueprint)
+            return process is not None and not process.shutting_down and not process.pool
+
+        in_use: int = len(self._prewarm_tasks) + sum(1 for blueprint in self._prewarmed.values() if is_idle(blueprint))
+        for blueprint_hash, blueprint in wanted.items():
+            if in_use >= self.prewarm_budget:
+                break
+            if blueprint_hash in self._prewarmed or blueprint in self.pool:
+                continue
+            self._prewarmed[blueprint_hash] = blueprint
+            self._prewarm_tasks[blueprint_hash] = asyncio.create_task(self._prewarm_one(blueprint))
+            in_use += 1
+
+    async def _prewarm_one(self, blueprint: executor.ExecutorBlueprint) -> None:
+        blueprint_hash: str = blueprint.blueprint_hash()
+        try:
+            await self.get(blueprint)
+        except resourcepool.PoolManagerNotRunning:
+            pass
+        except Exception:
+            LOGGER.info("Failed to pre-warm %s", self.render_id(blueprint), exc_info=True)
+            self._prewarm_failed.add(blueprint_hash)
+        finally:
+            del self._prewarm_tasks[blueprint_hash]
+
+    def get_prewarm_status(self) -> Mapping[str, executor.PrewarmState]:
+        """
+        Returns the state of the processes that were created ahead of their first use, by blueprint hash.
+        """
+        result: dict[str, executor.PrewarmState] = {}
+        for blueprint_hash, blueprint in self._prewarmed.items():
+            process: typing.Optional[MPProcess] = self.pool.get(blueprint)
+            if blueprint_hash in self._prewarm_tasks:
+                result[blueprint_hash] = executor.PrewarmState.WARMING
+            elif blueprint_hash in self._prewarm_failed:
+                result[blueprint_hash] = executor.PrewarmState.FAILED
+            elif process is not None and not process.shutting_down:
+                result[blueprint_hash] = executor.PrewarmState.READY
+            # else: the process was used and has been cleaned up since
+        return result
+
     async def create_member(self, blueprint: executor.ExecutorBlueprint) -> MPProcess:
         venv = await self.environment_manager.get_environment(blueprint.to_env_blueprint())
         executor: MPProcess = await self.make_child_and_connect(blueprint, venv)
@@ -957,6 +1049,8 @@ class MPPool(resourcepool.PoolManager[executor.ExecutorBlueprint, executor.Execu
                     storage_folder=storage_for_blueprint,
                     sources=blueprint.sources,
                     venv_touch_interval=self.venv_checkup_interval,
+                    file_cache_folder=str(self.file_cache_folder),
+                    file_cache_size=self.file_cache_size,
                 )
             )
             if failed_modules:
@@ -1150,6 +1244,12 @@ class MPManager(
         await super().join()
         await self.process_pool.join()
 
+    async def prewarm(self, blueprints: Sequence[executor.ExecutorBlueprint]) -> None:
+        await self.process_pool.prewarm(blueprints)
+
+    def get_prewarm_status(self) -> Mapping[str, executor.PrewarmState]:
+        return self.process_pool.get_prewarm_status()
+
     async def stop_all_executors(self) -> list[MPExecutor]:
         """
         Requests all executors to shutdown and returns these executors.
@@ -43,6 +43,7 @@ from inmanta.util import hash_file
 
 if typing.TYPE_CHECKING:
     import inmanta.agent.executor
+    from inmanta.agent.file_cache import FileCache
 
 
 LOGGER = logging.getLogger(__name__)
@@ -770,11 +771,15 @@ class HandlerAPI(ABC, Generic[TResource]):
 
     def get_file(self, hash_id: str) -> Optional[bytes]:
         """
-        Retrieve a file from the fileserver identified with the given id.
+        Retrieve a file from the fileserver identified with the given id. Files are served from the local file cache of
+        the executor when it is enabled.
 
         :param hash_id: The id of the content/file to retrieve from the server.
         :return: The content in the form of a bytestring or none is the content does not exist.
         """
+        file_cache: Optional["FileCache"] = self._get_file_cache()
+        if file_cache is not None:
+            return self.run_sync(partial(file_cache.get, hash_id))
 
         def call() -> Awaitable[Result]:
             return self.get_client().get_file(hash_id)
@@ -791,6 +796,22 @@ class HandlerAPI(ABC, Generic[TResource]):
         else:
             raise Exception("An error occurred while retrieving file %s" % hash_id)
 
+    def prefetch_files(self, hash_ids: Sequence[str]) -> None:
+        """
+        Make sure the files with the given ids are present in the local file cache of the executor, so that subsequent
+        calls to :meth:`get_file` don't have to wait for the server. This is a no-op when the file cache is disabled.
+
+        :param hash_ids: The ids of the files that will be retrieved, e.g. for all resources in a deploy batch.
+        """
+        file_cache: Optional["FileCache"] = self._get_file_cache()
+        if file_cache is not None:
+            self.run_sync(partial(file_cache.prefetch, hash_ids))
+
+    def _get_file_cache(self) -> Optional["FileCache"]:
+        # Handlers can be constructed without an agent, e.g. in tests
+        agent: Optional["inmanta.agent.executor.AgentInstance"] = getattr(self, "_agent", None)
+        return agent.file_cache if agent is not None else None
+
     def stat_file(self, hash_id: str) -> bool:
         """
         Check if a file exists on the server.
@@ -31,6 +31,7 @@ import inmanta.util
 from inmanta import const, data, env, tracing
 from inmanta.agent import executor, handler
 from inmanta.agent.executor import DeployReport, DryrunReport, FailedInmantaModules, GetFactReport, ResourceDetails
+from inmanta.agent.file_cache import FileCache
 from inmanta.agent.handler import HandlerAPI, SkipResource, SkipResourceForDependencies
 from inmanta.const import NAME_RESOURCE_ACTION_LOGGER, ParameterSource
 from inmanta.data.model import AttributeStateChange
@@ -56,7 +57,11 @@ class InProcessExecutor(executor.Executor, executor.AgentInstance):
         client: inmanta.protocol.Client,
         eventloop: asyncio.AbstractEventLoop,
         parent_logger: logging.Logger,
+        file_cache: Optional[FileCache] = None,
     ):
+        """
+        :param file_cache: The cache for the files retrieved by the handlers, shared by all executors in this process.
+        """
         self.name = agent_name
         self.client = client
         self.uri = agent_uri
@@ -79,6 +84,8 @@ class InProcessExecutor(executor.Executor, executor.AgentInstance):
 
         self.failed_modules: FailedInmantaModules = dict()
 
+        self.file_cache = file_cache
+
         self.cache_cleanup_tick_rate = inmanta.agent.config.agent_cache_cleanup_tick_rate.get()
         self.periodic_cache_cleanup_job: Optional[asyncio.Task[None]] = None
 
@@ -63,6 +63,7 @@ from inmanta.command import CLIException, Commander, ShowUsageException, command
 from inmanta.compiler import do_compile
 from inmanta.config import Config, Option
 from inmanta.const import ALL_LOG_CONTEXT_VARS, EXIT_START_FAILED, LOG_CONTEXT_VAR_ENVIRONMENT
+from inmanta.execute import profiler
 from inmanta.export import cfg_env
 from inmanta.logging import InmantaLoggerConfig, _is_on_tty
 from inmanta.protocol import common
@@ -257,6 +258,12 @@ def compiler_config(parser: argparse.ArgumentParser, parent_parsers: abc.Sequenc
         dest="export_compile_data_file",
         help="File to export compile data to. If omitted %s is used." % compiler.config.default_compile_data_file,
     )
+    parser.add_argument(
+        "--profile-model",
+        dest="profile_model_file",
+        help="Profile the compile at the level of the model and write the profile as json to this file. A flamegraph-compatible"
+        " folded stack file is written next to it.",
+    )
     parser.add_argument(
         "--no-cache",
         dest="feature_compiler_cache",
@@ -318,6 +325,9 @@ def compile_project(options: argparse.Namespace) -> None:
     if options.export_compile_data_file is not None:
         Config.set("compiler", "export_compile_data_file", options.export_compile_data_file)
 
+    if options.profile_model_file is not None:
+        Config.set("compiler", "profile_model_file", options.profile_model_file)
+
     if options.feature_compiler_cache is False:
         Config.set("compiler", "cache", "false")
 
@@ -331,19 +341,20 @@ def compile_project(options: argparse.Namespace) -> None:
 
     with tracing.span("compile"):
         summary_reporter = CompileSummaryReporter()
-        if options.profile:
-            import cProfile
-            import pstats
-
-            with summary_reporter.compiler_exception.capture():
-                cProfile.runctx("do_compile()", globals(), {}, "run.profile")
-            p = pstats.Stats("run.profile")
-            p.strip_dirs().sort_stats("time").print_stats(20)
-        else:
-            t1 = time.time()
-            with summary_reporter.compiler_exception.capture():
-                do_compile()
-            LOGGER.debug("The entire compile command took %0.03f seconds", time.time() - t1)
+        with profiler.profile(compiler.config.profile_model_file.get()):
+            if options.profile:
+                import cProfile
+                import pstats
+
+                with summary_reporter.compiler_exception.capture():
+                    cProfile.runctx("do_compile()", globals(), {}, "run.profile")
+                p = pstats.Stats("run.profile")
+                p.strip_dirs().sort_stats("time").print_stats(20)
+            else:
+                t1 = time.time()
+                with summary_reporter.compiler_exception.capture():
+                    do_compile()
+                LOGGER.debug("The entire compile command took %0.03f seconds", time.time() - t1)
 
         summary_reporter.print_summary_and_exit(show_stack_traces=options.errors)
 
@@ -448,6 +459,12 @@ def export_parser_config(parser: argparse.ArgumentParser, parent_parsers: abc.Se
         dest="export_compile_data_file",
         help="File to export compile data to. If omitted %s is used." % compiler.config.default_compile_data_file,
     )
+    parser.add_argument(
+        "--profile-model",
+        dest="profile_model_file",
+        help="Profile the compile at the level of the model and write the profile as json to this file. A flamegraph-compatible"
+        " folded stack file is written next to it.",
+    )
     parser.add_argument(
         "--no-cache",
         dest="feature_compiler_cache",
@@ -544,6 +561,9 @@ def export(options: argparse.Namespace) -> None:
     if options.export_compile_data_file is not None:
         Config.set("compiler", "export_compile_data_file", options.export_compile_data_file)
 
+    if options.profile_model_file is not None:
+        Config.set("compiler", "profile_model_file", options.profile_model_file)
+
     if options.feature_compiler_cache is False:
         Config.set("compiler", "cache", "false")
 
@@ -571,42 +591,43 @@ def export(options: argparse.Namespace) -> None:
 
     from inmanta.export import Exporter  # noqa: H307
 
-    with tracing.span("compiler"):
+    with profiler.profile(compiler.config.profile_model_file.get()):
         summary_reporter = CompileSummaryReporter()
 
-        types: Optional[dict[str, inmanta_type.Type]]
-        scopes: Optional[Namespace]
-
-        t1 = time.time()
-        with summary_reporter.compiler_exception.capture():
-            try:
-                types, scopes = do_compile()
-            except Exception:
-                types, scopes = (None, None)
-                raise
-
-    # Even if the compile failed we might have collected additional data such as unknowns. So
-    # continue the export
-    with tracing.span("exporter"):
-        export = Exporter(options)
-        with summary_reporter.exporter_exception.capture():
-            results = export.run(
-                types,
-                scopes,
-                metadata=metadata,
-                export_plugin=options.export_plugin,
-                partial_compile=options.partial_compile,
-                resource_sets_to_remove=list(resource_sets_to_remove),
-                allow_handler_code_update=options.allow_handler_code_update,
-            )
+        with tracing.span("compiler"):
+            types: Optional[dict[str, inmanta_type.Type]]
+            scopes: Optional[Namespace]
 
-        if not summary_reporter.is_failure() and options.deploy:
-            version = results[0]
-            conn = protocol.SyncClient("compiler")
-            LOGGER.info("Triggering deploy for version %d" % version)
-            tid = cfg_env.get()
-            agent_trigger_method = const.AgentTriggerMethod.get_agent_trigger_method(options.full_deploy)
-            conn.release_version(tid, version, True, agent_trigger_method)
+            t1 = time.time()
+            with summary_reporter.compiler_exception.capture():
+                try:
+                    types, scopes = do_compile()
+                except Exception:
+                    types, scopes = (None, None)
+                    raise
+
+        # Even if the compile failed we might have collected additional data such as unknowns. So
+        # continue the export
+        with tracing.span("exporter"):
+            export = Exporter(options)
+            with summary_reporter.exporter_exception.capture(), profiler.phase("export"):
+                results = export.run(
+                    types,
+                    scopes,
+                    metadata=metadata,
+                    export_plugin=options.export_plugin,
+                    partial_compile=options.partial_compile,
+                    resource_sets_to_remove=list(resource_sets_to_remove),
+                    allow_handler_code_update=options.allow_handler_code_update,
+                )
+
+            if not summary_reporter.is_failure() and options.deploy:
+                version = results[0]
+                conn = protocol.SyncClient("compiler")
+                LOGGER.info("Triggering deploy for version %d" % version)
+                tid = cfg_env.get()
+                agent_trigger_method = const.AgentTriggerMethod.get_agent_trigger_method(options.full_deploy)
+                conn.release_version(tid, version, True, agent_trigger_method)
 
     LOGGER.debug("The entire export command took %0.03f seconds", time.time() - t1)
     summary_reporter.print_summary_and_exit(show_stack_traces=options.errors)
@@ -45,9 +45,10 @@ from inmanta.ast.entity import Entity
 from inmanta.ast.statements.define import DefineEntity, DefineRelation, PluginStatement
 from inmanta.compiler import config as compiler_config
 from inmanta.compiler.data import CompileData
-from inmanta.execute import scheduler
+from inmanta.execute import profiler, scheduler
 from inmanta.execute.dataflow.datatrace import DataTraceRenderer
 from inmanta.execute.dataflow.root_cause import UnsetRootCauseAnalyzer
+from inmanta.execute.plugin_cache import plugin_cache
 from inmanta.execute.runtime import ResultVariable
 from inmanta.parser import ParserException
 from inmanta.plugins import Plugin, PluginMeta
@@ -103,13 +104,15 @@ def do_compile(refs: Optional[abc.Mapping[object, object]] = None) -> tuple[dict
     project = module.Project.get()
     with relaxed_gc_thresholds():
         try:
-            statements, blocks = compiler.compile()
+            with profiler.phase("parse"):
+                statements, blocks = compiler.compile()
         except ParserException as e:
             compiler.handle_exception(e)
         sched = scheduler.Scheduler(compiler_config.track_dataflow(), project.get_relation_precedence_policy())
         raised_compile_exception: bool = False
         try:
-            success = sched.run(compiler, statements, blocks)
+            with profiler.phase("execute"):
+                success = sched.run(compiler, statements, blocks)
         except CompilerException as e:
             raised_compile_exception = True
             if compiler_config.dataflow_graphic_enable.get():
@@ -118,8 +121,13 @@ def do_compile(refs: Optional[abc.Mapping[object, object]] = None) -> tuple[dict
             success = False
         finally:
             Finalizers.call_finalizers(raised_compile_exception)
+            plugin_cache.finish_compile()
     LOGGER.debug("Compile done")
 
+    active_profiler = profiler.get_active_profiler()
+    if active_profiler is not None:
+        active_profiler.record_instances(sched.get_types())
+
     if not success:
         sys.stderr.write("Unable to execute all statements.\n")
     if compiler_config.export_compile_data.get():
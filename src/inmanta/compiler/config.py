@@ -16,7 +16,9 @@ limitations under the License.
 Contact: code@inmanta.com
 """
 
-from inmanta.config import Option, is_bool, is_lower_bounded_int, is_str
+from typing import Optional
+
+from inmanta.config import Option, is_bool, is_lower_bounded_int, is_str, is_str_opt
 
 datatrace_enable: Option[bool] = Option(
     "compiler",
@@ -50,6 +52,28 @@ feature_compiler_cache: Option[bool] = Option(
 )
 
 
+compiler_cache_dir: Option[Optional[str]] = Option(
+    "compiler",
+    "cache_dir",
+    None,
+    "Directory to store the cache of compiled files in. Cache entries are keyed on the content of the compiled file, so "
+    "the directory can be shared by all projects on a machine, e.g. by all environments of an orchestrator. When not "
+    "set, the cache is stored in the .cfcache directory of the project.",
+    is_str_opt,
+)
+
+
+parse_workers: Option[int] = Option(
+    "compiler",
+    "parse_workers",
+    0,
+    "Number of worker processes used to parse the files of the modules of a project in parallel, when they are not in "
+    "the cache of compiled files. Starting the workers takes time, so this only speeds up the compile of projects with "
+    "many modules. Set to 0 or 1 to parse the files in the compiler process.",
+    is_lower_bounded_int(0),
+)
+
+
 export_compile_data: Option[bool] = Option(
     "compiler",
     "export_compile_data",
@@ -82,3 +106,35 @@ export_compile_data_file: Option[str] = Option(
     "File to export compile data to. If omitted %s is used." % default_compile_data_file,
     is_str,
 )
+
+
+profile_model_file: Option[Optional[str]] = Option(
+    "compiler",
+    "profile_model_file",
+    None,
+    "Profile the compile at the level of the model and write the profile as json to this file. The profile contains the "
+    "time spent per phase, the time and number of calls per plugin, the statements executed per statement type and per "
+    "source location, the instances created per entity and the number of scheduler iterations. A flamegraph-compatible "
+    "folded stack file is written next to it, with the .folded extension.",
+    is_str_opt,
+)
+
+
+plugin_cache_enabled: Option[bool] = Option(
+    "compiler",
+    "plugin_cache",
+    True,
+    "Enables the memoization of the results of plugins that are registered as cacheable.",
+    is_bool,
+)
+
+
+plugin_cache_dir: Option[Optional[str]] = Option(
+    "compiler",
+    "plugin_cache_dir",
+    None,
+    "Directory to store the results of plugins that are registered as cacheable in, so they are reused by later compiles. "
+    "Entries are keyed on the source file of the plugin, so the directory can be shared by all projects on a machine. When "
+    "not set, the results are only reused within the compiler process.",
+    is_str_opt,
+)
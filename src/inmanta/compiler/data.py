@@ -29,4 +29,14 @@ class CompileData(ast_export.Exportable):
         self.errors.append(error)
 
     def export(self) -> "model.CompileData":
-        return model.CompileData(errors=[e.export() for e in self.errors])
+        # import loop
+        from inmanta.parser.plyInmantaParser import cache_manager
+
+        return model.CompileData(
+            errors=[e.export() for e in self.errors],
+            parser_cache=(
+                model.ParserCacheStats(hits=cache_manager.hits, misses=cache_manager.misses, failures=cache_manager.failures)
+                if cache_manager.cache_enabled.get() and cache_manager.is_attached_to_project()
+                else None
+            ),
+        )
@@ -410,6 +410,8 @@ CF_CACHE_DIR = ".cfcache"
 PG_ADVISORY_KEY_PUT_VERSION = 1
 PG_ADVISORY_KEY_RELEASE_VERSION = 2
 """ lock against releasing a version in an environment, to prevent release races"""
+PG_ADVISORY_KEY_RESOURCE_ACTION = 3
+""" lock against inserting two resource actions with the same action id, which the partitioned table can't prevent"""
 
 
 # The filename of the changelog file in an Inmanta module
@@ -3517,6 +3517,22 @@ class Agent(BaseDocument):
         values = [cls._get_value(environment), cls._get_value(endpoint)]
         await cls._execute_query(query, *values, connection=connection)
 
+    @classmethod
+    async def insert_many_if_not_exist(
+        cls, environment: uuid.UUID, endpoints: Collection[str], connection: Optional[asyncpg.connection.Connection] = None
+    ) -> None:
+        """
+        Insert the given agents in a single query, skipping the ones that already exist.
+        """
+        query = """
+            INSERT INTO agent
+            (paused,unpause_on_resume,environment,name)
+            SELECT FALSE,NULL,$1,name
+            FROM unnest($2::varchar[]) AS name
+            ON CONFLICT DO NOTHING
+        """
+        await cls._execute_query(query, cls._get_value(environment), sorted(endpoints), connection=connection)
+
     @classmethod
     async def persist_on_halt(cls, env: uuid.UUID, connection: Optional[asyncpg.connection.Connection] = None) -> None:
         """
@@ -4100,6 +4116,13 @@ class LogLine(DataDocument):
         self._data["timestamp"] = parse_timestamp(cast(str, self._data["timestamp"]))
 
 
+# The number of days, after the current one, for which a partition of the resource action tables is created upfront
+RESOURCE_ACTION_PARTITIONS_AHEAD = 3
+RESOURCE_ACTION_PARTITION_NAME_REGEX = re.compile(r"^resourceaction_(p[0-9]{8})$")
+# The number of seconds to wait for the locks required to drop a partition of the resource action tables
+RESOURCE_ACTION_PARTITION_LOCK_TIMEOUT = 5
+
+
 @stable_api
 class ResourceAction(BaseDocument):
     """
@@ -4118,6 +4141,10 @@ class ResourceAction(BaseDocument):
                    contain old and current keys and the associated values. An empty dict indicates that the field
                    was changed but not data was provided by the agent.
     :param change: The change result of an action
+
+    The resourceaction table and the resourceaction_resource table are partitioned by range on the started column, with one
+    partition per day (resourceaction_pYYYYMMDD). Rows that don't fit in any of these partitions end up in the default
+    partition.
     """
 
     __primary_key__ = ("action_id",)
@@ -4175,14 +4202,15 @@ class ResourceAction(BaseDocument):
         SELECT ra.* FROM public.resourceaction as ra
                     INNER JOIN public.resourceaction_resource as jt
                         ON ra.action_id = jt.resource_action_id
+                        AND ra.started = jt.started
                     WHERE jt.environment=$1 AND jt.resource_id = $2 AND  jt.resource_version = $3
         """
         id = resources.Id.parse_id(resource_version_id)
         values = [cls._get_value(environment), id.resource_str(), id.version]
         if action is not None:
-            query += " AND action=$4"
+            query += " AND ra.action=$4"
             values.append(cls._get_value(action))
-        query += " ORDER BY started DESC"
+        query += " ORDER BY ra.started DESC"
         if limit is not None and limit > 0:
             query += " LIMIT $%d" % (len(values) + 1)
             values.append(cls._get_value(limit))
@@ -4224,8 +4252,15 @@ class ResourceAction(BaseDocument):
         return await cls.get_one(action_id=action_id, connection=connection)
 
     async def insert(self, connection: Optional[asyncpg.connection.Connection] = None) -> None:
+        """
+        :raises asyncpg.UniqueViolationError: A resource action with the same action_id already exists.
+        """
         async with self.get_connection(connection) as con:
             async with con.transaction():
+                # The primary key has to include the partition key, so it doesn't make the action_id unique on its own
+                await self._xact_lock(const.PG_ADVISORY_KEY_RESOURCE_ACTION, self.action_id, connection=con)
+                if await con.fetchval(f"SELECT EXISTS(SELECT 1 FROM {self.table_name()} WHERE action_id=$1)", self.action_id):
+                    raise asyncpg.UniqueViolationError(f"A resource action with id {self.action_id} already exists.")
                 await super().insert(con)
 
                 # Also do the join table in the same transaction
@@ -4235,12 +4270,13 @@ class ResourceAction(BaseDocument):
                 # No additional checking of field validity is done here, because the insert above validates all fields
                 await con.execute(
                     "INSERT INTO public.resourceaction_resource "
-                    "(resource_id, resource_version, environment, resource_action_id) "
-                    "SELECT unnest($1::text[]), unnest($2::int[]), $3, $4",
+                    "(resource_id, resource_version, environment, resource_action_id, started) "
+                    "SELECT unnest($1::text[]), unnest($2::int[]), $3, $4, $5",
                     [id.resource_str() for id in parsed_rv],
                     [id.get_version() for id in parsed_rv],
                     self.environment,
                     self.action_id,
+                    self.started,
                 )
 
     def set_field(self, name: str, value: object) -> None:
@@ -4300,6 +4336,124 @@ class ResourceAction(BaseDocument):
         await self.update_fields(connection=connection, **self._updates)
         self._updates = {}
 
+    @classmethod
+    def _get_partition_bounds(cls, day: datetime.date) -> tuple[str, str]:
+        """
+        Returns the lower and upper bound of the partition for the given day, formatted as a timestamp literal.
+        """
+        next_day = day + datetime.timedelta(days=1)
+        return f"{day.isoformat()} 00:00:00+00", f"{next_day.isoformat()} 00:00:00+00"
+
+    @classmethod
+    async def create_partitions(cls, connection: Optional[asyncpg.connection.Connection] = None) -> None:
+        """
+        Make sure that the resourceaction table and the resourceaction_resource table have a partition for the current day
+        and for the RESOURCE_ACTION_PARTITIONS_AHEAD days after it.
+        """
+        async with cls.get_connection(connection) as con:
+            today: datetime.date = await con.fetchval("SELECT (now() AT TIME ZONE 'UTC')::date")
+            for i in range(RESOURCE_ACTION_PARTITIONS_AHEAD + 1):
+                day = today + datetime.timedelta(days=i)
+                suffix = day.strftime("p%Y%m%d")
+                lower, upper = cls._get_partition_bounds(day)
+                try:
+                    async with con.transaction():
+                        await con.execute(f"""
+                            CREATE TABLE IF NOT EXISTS public.resourceaction_{suffix} PARTITION OF {cls.table_name()}
+                                FOR VALUES FROM ('{lower}') TO ('{upper}');
+                            CREATE TABLE IF NOT EXISTS public.resourceaction_resource_{suffix}
+                                PARTITION OF public.resourceaction_resource
+                                FOR VALUES FROM ('{lower}') TO ('{upper}');
+                            """)
+                except asyncpg.CheckViolationError:
+                    # The default partition already contains rows for this day. They remain there and are purged row by row.
+                    LOGGER.warning(
+                        "Unable to create the partition of the resource action tables for %s, because the default partition"
+                        " already contains resource actions for that day.",
+                        day.isoformat(),
+                    )
+                except asyncpg.DuplicateTableError:
+                    # Created concurrently by another server
+                    pass
+
+    @classmethod
+    async def _drop_expired_partitions(cls, default_retention_time: int, connection: asyncpg.connection.Connection) -> None:
+        """
+        Drop the daily partitions that only contain resource actions that are past the retention time of their environment.
+        A partition that contains resource actions of a halted environment, or of an environment that still has to retain
+        them, is kept. The expired resource actions in it are deleted row by row.
+        """
+        partitions = await connection.fetch(f"""
+            SELECT c.relname AS name
+            FROM pg_catalog.pg_inherits AS i
+            INNER JOIN pg_catalog.pg_class AS c
+                ON c.oid=i.inhrelid
+            WHERE i.inhparent='public.{cls.table_name()}'::regclass
+            """)
+
+        async def has_unexpired_actions(suffix: str, upper: datetime.datetime) -> bool:
+            """
+            Returns True iff the partition with the given suffix contains resource actions that have to be retained.
+            """
+            return await connection.fetchval(
+                f"""
+                SELECT EXISTS(
+                    SELECT 1
+                    FROM {Environment.table_name()} AS e
+                    WHERE (
+                        e.halted
+                        OR $1 > now() - make_interval(
+                            days => COALESCE((e.settings->'settings'->'resource_action_logs_retention'->>'value')::int, $2)
+                        )
+                    )
+                    AND EXISTS(SELECT 1 FROM public.resourceaction_{suffix} AS ra WHERE ra.environment=e.id)
+                )
+                """,
+                upper,
+                default_retention_time,
+            )
+
+        now = datetime.datetime.now().astimezone()
+        for partition in sorted(record["name"] for record in partitions):
+            match = RESOURCE_ACTION_PARTITION_NAME_REGEX.fullmatch(partition)
+            if match is None:
+                # The default partition
+                continue
+            suffix = match.group(1)
+            upper = datetime.datetime.strptime(suffix, "p%Y%m%d").replace(tzinfo=datetime.timezone.utc) + datetime.timedelta(
+                days=1
+            )
+            if upper > now:
+                # The partitions are sorted by day, none of the remaining ones has expired
+                break
+            if await has_unexpired_actions(suffix, upper):
+                continue
+            try:
+                async with connection.transaction():
+                    # Dropping a partition requires an ACCESS EXCLUSIVE lock on the parent tables. Lock the parent tables
+                    # first, in the order in which resource actions are inserted, so that this can't deadlock with queries
+                    # that lock a parent table before its partitions. Queries on the resource action tables queue up behind
+                    # this lock request, so don't wait long for it. The partition is dropped by a later purge instead.
+                    await connection.execute(f"SET LOCAL lock_timeout = '{RESOURCE_ACTION_PARTITION_LOCK_TIMEOUT}s'")
+                    await connection.execute(
+                        f"LOCK TABLE {cls.table_name()}, public.resourceaction_resource IN ACCESS EXCLUSIVE MODE"
+                    )
+                    # Resource actions may have been added before the lock was acquired
+                    if await has_unexpired_actions(suffix, upper):
+                        continue
+                    await connection.execute(f"""
+                        DROP TABLE IF EXISTS public.resourceaction_resource_{suffix};
+                        ALTER TABLE {cls.table_name()} DETACH PARTITION public.resourceaction_{suffix};
+                        DROP TABLE public.resourceaction_{suffix};
+                        """)
+                    LOGGER.debug("Dropped the partition of the resource action tables for %s", suffix)
+            except asyncpg.LockNotAvailableError:
+                LOGGER.info(
+                    "Unable to drop the partition of the resource action tables for %s, because the tables are in use."
+                    " Retrying on the next purge.",
+                    suffix,
+                )
+
     @classmethod
     async def purge_logs(cls) -> None:
         default_retention_time = Environment._settings[RESOURCE_ACTION_LOGS_RETENTION].default
@@ -4318,8 +4472,17 @@ class ResourceAction(BaseDocument):
             USING non_halted_envs
             WHERE environment = non_halted_envs.id
                 AND started < now() AT TIME ZONE 'UTC' - make_interval(days => non_halted_envs.retention_days)
+                -- The same bound for all environments, so that the partitions that are retained by every environment
+                -- are pruned and not scanned
+                AND started < (
+                    SELECT max(now() AT TIME ZONE 'UTC' - make_interval(days => retention_days)) FROM non_halted_envs
+                )
         """
-        await cls._execute_query(query, default_retention_time)
+        async with cls.get_connection() as con:
+            # Drop the partitions that have expired as a whole, the remaining expired resource actions are deleted row by row
+            await cls._drop_expired_partitions(default_retention_time, connection=con)
+            await con.execute(query, default_retention_time)
+            await cls.create_partitions(connection=con)
 
     @classmethod
     async def query_resource_actions(
@@ -4350,6 +4513,7 @@ class ResourceAction(BaseDocument):
                         AND rscm.model = jt.resource_version
                     INNER JOIN public.resourceaction as ra
                         ON ra.action_id = jt.resource_action_id
+                        AND ra.started = jt.started
                         WHERE r.environment=$1 AND ra.environment=$1"""
         values: list[object] = [cls._get_value(environment)]
 
@@ -4388,21 +4552,21 @@ class ResourceAction(BaseDocument):
             values.append(cls._get_value(action))
             parameter_index += 1
         if first_timestamp and action_id:
-            query += f" AND (started, action_id) > (${parameter_index}, ${parameter_index + 1})"
+            query += f" AND (ra.started, ra.action_id) > (${parameter_index}, ${parameter_index + 1})"
             values.append(cls._get_value(first_timestamp))
             values.append(cls._get_value(action_id))
             parameter_index += 2
         elif first_timestamp:
-            query += f" AND started > ${parameter_index}"
+            query += f" AND ra.started > ${parameter_index}"
             values.append(cls._get_value(first_timestamp))
             parameter_index += 1
         if last_timestamp and action_id:
-            query += f" AND (started, action_id) < (${parameter_index}, ${parameter_index + 1})"
+            query += f" AND (ra.started, ra.action_id) < (${parameter_index}, ${parameter_index + 1})"
             values.append(cls._get_value(last_timestamp))
             values.append(cls._get_value(action_id))
             parameter_index += 2
         elif last_timestamp:
-            query += f" AND started < ${parameter_index}"
+            query += f" AND ra.started < ${parameter_index}"
             values.append(cls._get_value(last_timestamp))
             parameter_index += 1
 
@@ -4414,9 +4578,9 @@ class ResourceAction(BaseDocument):
             parameter_index += len(exclude_changes)
 
         if first_timestamp:
-            query += " ORDER BY started, action_id"
+            query += " ORDER BY ra.started, ra.action_id"
         else:
-            query += " ORDER BY started DESC, action_id DESC"
+            query += " ORDER BY ra.started DESC, ra.action_id DESC"
         if limit is not None and limit > 0:
             query += " LIMIT $%d" % parameter_index
             values.append(cls._get_value(limit))
@@ -4505,6 +4669,7 @@ class ResourceAction(BaseDocument):
         FROM public.resourceaction_resource as jt
         INNER JOIN public.resourceaction as ra
             ON ra.action_id = jt.resource_action_id
+            AND ra.started = jt.started
         WHERE jt.environment=$1 AND ra.environment=$1 AND jt.resource_id=ANY($2::varchar[]) AND ra.action='deploy' {filter}
         ORDER BY ra.started DESC;
             """
@@ -4678,6 +4843,30 @@ class ResourcePersistentState(BaseDocument):
                 values,
             )
 
+    @classmethod
+    async def get_managed_raw(
+        cls,
+        environment: UUID,
+        *,
+        projection: Collection[typing.LiteralString],
+        connection: Optional[Connection] = None,
+    ) -> dict[ResourceIdStr, dict[str, object]]:
+        """
+        Returns the given columns for all resources in the environment that are not orphaned, keyed by resource id.
+
+        :param projection: The columns to include in the returned dictionaries.
+        """
+        records = await cls._fetch_query(
+            f"""
+            SELECT resource_id, {", ".join(projection)}
+            FROM {cls.table_name()}
+            WHERE environment=$1 AND orphaned_after IS NULL
+            """,
+            environment,
+            connection=connection,
+        )
+        return {ResourceIdStr(record["resource_id"]): dict(record) for record in records}
+
     @classmethod
     async def trim(cls, environment: UUID, connection: Optional[Connection] = None) -> None:
         """Remove all records that have no corresponding resource anymore"""
@@ -5276,16 +5465,32 @@ class ResourceSet(BaseDocument):
         :param version: The version to delete from the resource_set_configuration_model table.
         :param connection: The connection to use
         """
+        await cls.clear_resource_sets_in_versions(environment, [version], connection=connection)
+
+    @classmethod
+    async def clear_resource_sets_in_versions(
+        cls,
+        environment: uuid.UUID,
+        versions: Sequence[int],
+        *,
+        connection: asyncpg.connection.Connection,
+    ) -> None:
+        """
+        Same as clear_resource_sets_in_version, but for several versions at once.
+
+        :param environment: The environment from which to delete the resource sets
+        :param versions: The versions to delete from the resource_set_configuration_model table.
+        :param connection: The connection to use
+        """
 
-        # Delete all links from the resource set to this version
+        # Delete all links from the resource set to these versions
         await cls._execute_query(
             """
             DELETE FROM resource_set_configuration_model AS rscm
-            WHERE rscm.environment=$1 AND rscm.model=$2
-            RETURNING rscm.resource_set
+            WHERE rscm.environment=$1 AND rscm.model=ANY($2::int[])
             """,
             environment,
-            version,
+            versions,
             connection=connection,
         )
         # Delete resource sets that are no longer linked to a configuration model
@@ -5535,6 +5740,62 @@ class Resource(BaseDocument):
                         resources_list.append(cls(from_postgres=True, **record))
         return resources_list
 
+    @classmethod
+    async def get_changed_resources_between_versions(
+        cls,
+        environment: uuid.UUID,
+        from_version: int,
+        to_version: int,
+        *,
+        connection: Optional[asyncpg.connection.Connection] = None,
+    ) -> AsyncIterator[tuple[ResourceIdStr, Optional[dict[str, object]], Optional[dict[str, object]]]]:
+        """
+        Stream the resources that might differ between the two given versions, ordered by resource id. For each resource,
+        the attributes in from_version and to_version are returned, or None if the resource doesn't exist in that version.
+
+        Resources that exist in both versions are left out when their attribute_hash and the attributes that are not
+        covered by the attribute_hash are equal. The other resources still have to be compared attribute by attribute.
+        """
+        query = f"""
+            WITH from_resources AS (
+                SELECT r.resource_id, r.attribute_hash, r.attributes
+                FROM resource_set_configuration_model AS rscm
+                INNER JOIN {cls.table_name()} AS r
+                    ON rscm.environment=r.environment
+                    AND rscm.resource_set=r.resource_set
+                WHERE rscm.environment=$1 AND rscm.model=$2
+            ), to_resources AS (
+                SELECT r.resource_id, r.attribute_hash, r.attributes
+                FROM resource_set_configuration_model AS rscm
+                INNER JOIN {cls.table_name()} AS r
+                    ON rscm.environment=r.environment
+                    AND rscm.resource_set=r.resource_set
+                WHERE rscm.environment=$1 AND rscm.model=$3
+            )
+            SELECT
+                COALESCE(f.resource_id, t.resource_id) AS resource_id,
+                f.attributes AS from_attributes,
+                t.attributes AS to_attributes
+            FROM from_resources AS f
+            FULL OUTER JOIN to_resources AS t
+                ON f.resource_id=t.resource_id
+            WHERE
+                f.resource_id IS NULL
+                OR t.resource_id IS NULL
+                OR f.attribute_hash IS NULL
+                OR f.attribute_hash IS DISTINCT FROM t.attribute_hash
+                -- These attributes are not part of the attribute_hash
+                OR f.attributes->'id' IS DISTINCT FROM t.attributes->'id'
+                OR f.attributes->'requires' IS DISTINCT FROM t.attributes->'requires'
+                OR f.attributes->'provides' IS DISTINCT FROM t.attributes->'provides'
+            -- Sort in code point order, as Python does
+            ORDER BY COALESCE(f.resource_id, t.resource_id) COLLATE "C"
+        """
+        async with cls.get_connection(connection) as con:
+            async with con.transaction():
+                async for record in con.cursor(query, environment, from_version, to_version):
+                    yield record["resource_id"], record["from_attributes"], record["to_attributes"]
+
     @classmethod
     async def get_resources_for_version_as_dto(
         cls,
@@ -5691,6 +5952,7 @@ class Resource(BaseDocument):
         *,
         since: int,
         projection: Collection[typing.LiteralString],
+        skip_unchanged: bool = False,
         connection: Optional[Connection] = None,
     ) -> list[tuple[int, inmanta.types.ResourceSets[dict[str, object]]]]:
         """
@@ -5698,6 +5960,11 @@ class Resource(BaseDocument):
         Returned versions are returned as partial versions. In other words, only resource sets that changed since the previous
         version are included. Resource sets that were deleted are represented as empty sets.
 
+        When skip_unchanged is set, the diff is refined on the resource level: resources whose intent (attribute hash,
+        requires and defined status) is identical to the same resource in the previous version of their resource set are
+        returned with only the `resource_id` key. This keeps the amount of data to transfer and process proportional to the
+        number of changed resources, rather than to the size of the changed resource sets.
+
         Note that a partial model version on this layer does not map one on one with how it was exported. Notably, if a partial
         model version contains the shared set, it will contain all of its resources, rather than only those that were present in
         the associated export.
@@ -5705,11 +5972,48 @@ class Resource(BaseDocument):
         :param since: The boundary version (excluding). This version should exist and be released.
         :param projection: The resource columns to include in the returned resource dictionaries.
             Must not overlap with other projection parameters.
+        :param skip_unchanged: Only include the projected columns for resources whose intent changed.
 
         :returns: A list of model versions and resources, grouped by resource set.
         :raises PartialBaseMissing: The `since` version does not exist or has not been released.
         """
-        projection_selectors: typing.LiteralString = ", ".join([f"r.{col}" for col in projection])
+        projection_selectors: typing.LiteralString = ", ".join(
+            [
+                (
+                    f"CASE WHEN change.intent_changed THEN r.{col} END AS {col}"
+                    if skip_unchanged and col != "resource_id"
+                    else f"r.{col}"
+                )
+                for col in projection
+            ]
+        )
+        # Compare each resource to the same resource in the set's previous version (if any). The previous set is looked up
+        # by name rather than taken from the diff, because the diff doesn't report the previous version of the shared set.
+        intent_change_joins: typing.LiteralString = (
+            f"""
+        LEFT JOIN LATERAL (
+            SELECT rs_old.resource_set
+            FROM rs_with_name AS rs_old
+            WHERE rs_old.model = model_pairs.old
+                AND rs_old.name IS NOT DISTINCT FROM diff.name
+        ) AS previous_set
+        ON true
+        LEFT JOIN {cls.table_name()} AS r_old
+            ON r_old.environment = $1
+            AND r_old.resource_set = previous_set.resource_set
+            AND r_old.resource_id = r.resource_id
+        CROSS JOIN LATERAL (
+            SELECT (
+                r_old.resource_id IS NULL
+                OR r_old.attribute_hash IS DISTINCT FROM r.attribute_hash
+                OR r_old.is_undefined IS DISTINCT FROM r.is_undefined
+                OR r_old.attributes->'requires' IS DISTINCT FROM r.attributes->'requires'
+            ) AS intent_changed
+        ) AS change
+        """
+            if skip_unchanged
+            else ""
+        )
 
         # We query the database for all resources in all released versions since the requested one. For each version, we
         # request the diff with the previous version.
@@ -5780,6 +6084,7 @@ class Resource(BaseDocument):
             (diff.old_resource_set IS NULL AND diff.resource_set IS NULL) AS empty_model,
             diff.name AS resource_set_name,
             diff.resource_set,
+            {"change.intent_changed," if skip_unchanged else ""}
             {projection_selectors}
         FROM reference_model
         LEFT JOIN model_pairs ON true
@@ -5809,6 +6114,7 @@ class Resource(BaseDocument):
         LEFT JOIN {cls.table_name()} as r
             ON r.environment = $1
             AND r.resource_set = diff.resource_set
+        {intent_change_joins}
         ORDER BY model_pairs.new, diff.name, r.resource_id
         """
         with pyformance.timer("sql.get_partial_resources_since_version_raw").time():
@@ -5848,7 +6154,11 @@ class Resource(BaseDocument):
                     continue
                 record: asyncpg.Record
                 for record in records:
-                    model_sets[resource_set_name].append({k: record[k] for k in projection})
+                    model_sets[resource_set_name].append(
+                        {k: record[k] for k in projection}
+                        if not skip_unchanged or record["intent_changed"]
+                        else {"resource_id": record["resource_id"]}
+                    )
             result.append((version, model_sets))
         return result
 
@@ -6563,49 +6873,111 @@ class ConfigurationModel(BaseDocument):
         )
         return versions
 
-    async def delete_cascade(self, connection: Optional[asyncpg.connection.Connection] = None) -> None:
+    @classmethod
+    async def get_versions_to_purge(
+        cls, environment: uuid.UUID, n_versions_to_keep: int, *, connection: Optional[asyncpg.connection.Connection] = None
+    ) -> list[int]:
+        """
+        Returns the versions of the given environment that exceed the number of versions to keep, in ascending order.
+        The latest released version is always kept and doesn't count towards the number of versions to keep.
         """
+        query = f"""
+            SELECT version
+            FROM (
+                SELECT version, ROW_NUMBER() OVER (ORDER BY version DESC) AS newer_versions
+                FROM {cls.table_name()}
+                WHERE environment=$1
+                AND version <> COALESCE(
+                    (SELECT max(version) FROM {cls.table_name()} WHERE environment=$1 AND released),
+                    -1
+                )
+            ) AS v
+            WHERE newer_versions > $2
+            ORDER BY version
+        """
+        result = await cls._fetch_query(query, environment, n_versions_to_keep, connection=connection)
+        return [record["version"] for record in result]
+
+    @classmethod
+    async def delete_versions(
+        cls, environment: uuid.UUID, versions: Sequence[int], *, connection: Optional[asyncpg.connection.Connection] = None
+    ) -> None:
+        """
+        Delete the given versions of the given environment with one statement per table.
+
         This method doesn't rely on the DELETE CASCADE functionality of PostgreSQL because it causes deadlocks.
         As such, we perform the deletes on each table in a separate transaction.
+
+        The facts that belonged to the resources of these versions are not deleted, use delete_orphaned_facts for that.
         """
-        async with self.get_connection(connection=connection) as con:
+        if not versions:
+            return
+        async with cls.get_connection(connection=connection) as con:
             # Delete of compile record triggers cascading delete report table
-            await Compile.delete_all(environment=self.environment, version=self.version, connection=con)
-            await DryRun.delete_all(environment=self.environment, model=self.version, connection=con)
+            for table_name, version_column in [
+                (Compile.table_name(), "version"),
+                (DryRun.table_name(), "model"),
+            ]:
+                await cls._execute_query(
+                    f"DELETE FROM {table_name} WHERE environment=$1 AND {version_column}=ANY($2::int[])",
+                    environment,
+                    versions,
+                    connection=con,
+                )
 
-            await AgentModules.delete_version(environment=self.environment, model_version=self.version, connection=con)
-            await InmantaModule.delete_version(environment=self.environment, model_version=self.version, connection=con)
-            await ModuleFiles.delete_version(environment=self.environment, model_version=self.version, connection=con)
+            await AgentModules.delete_versions(environment=environment, model_versions=versions, connection=con)
+            await InmantaModule.delete_versions(environment=environment, model_versions=versions, connection=con)
+            await ModuleFiles.delete_versions(environment=environment, model_versions=versions, connection=con)
 
-            await UnknownParameter.delete_all(environment=self.environment, version=self.version, connection=con)
-            await self._execute_query(
-                "DELETE FROM public.resourceaction_resource WHERE environment=$1 AND resource_version=$2",
-                self.environment,
-                self.version,
+            for table_name, version_column in [
+                (UnknownParameter.table_name(), "version"),
+                ("public.resourceaction_resource", "resource_version"),
+                (ResourceAction.table_name(), "version"),
+            ]:
+                await cls._execute_query(
+                    f"DELETE FROM {table_name} WHERE environment=$1 AND {version_column}=ANY($2::int[])",
+                    environment,
+                    versions,
+                    connection=con,
+                )
+            await ResourceSet.clear_resource_sets_in_versions(environment=environment, versions=versions, connection=con)
+            await cls._execute_query(
+                f"DELETE FROM {cls.table_name()} WHERE environment=$1 AND version=ANY($2::int[])",
+                environment,
+                versions,
                 connection=con,
             )
-            await ResourceAction.delete_all(environment=self.environment, version=self.version, connection=con)
-            await ResourceSet.clear_resource_sets_in_version(environment=self.environment, version=self.version, connection=con)
-            await self.delete(connection=con)
 
-            # Delete facts when the resources in this version are the only
-            await self._execute_query(
-                f"""
-                DELETE FROM {Parameter.table_name()} p
-                WHERE(
-                    environment=$1 AND
-                    resource_id<>'' AND
-                    NOT EXISTS(
-                        SELECT 1
-                        FROM {Resource.table_name()} r
-                        WHERE p.environment=r.environment
-                        AND p.resource_id=r.resource_id
-                    )
+    @classmethod
+    async def delete_orphaned_facts(
+        cls, environment: uuid.UUID, *, connection: Optional[asyncpg.connection.Connection] = None
+    ) -> None:
+        """
+        Delete the facts of the given environment that belong to a resource that is no longer part of any version.
+        """
+        await cls._execute_query(
+            f"""
+            DELETE FROM {Parameter.table_name()} p
+            WHERE(
+                environment=$1 AND
+                resource_id<>'' AND
+                NOT EXISTS(
+                    SELECT 1
+                    FROM {Resource.table_name()} r
+                    WHERE p.environment=r.environment
+                    AND p.resource_id=r.resource_id
                 )
-                """,
-                self.environment,
-                connection=con,
             )
+            """,
+            environment,
+            connection=connection,
+        )
+
+    async def delete_cascade(self, connection: Optional[asyncpg.connection.Connection] = None) -> None:
+        async with self.get_connection(connection=connection) as con:
+            await self.delete_versions(self.environment, [self.version], connection=con)
+            # Delete facts when the resources in this version are the only
+            await self.delete_orphaned_facts(self.environment, connection=con)
 
     def get_undeployable(self) -> list[ResourceIdStr]:
         """
@@ -6655,7 +7027,8 @@ class DryRun(BaseDocument):
     :param date: The date the run was requested
     :param total: The number of resources that do a dryrun for
     :param todo: The number of resources left to do
-    :param resources: Changes for each of the resources in the version
+
+    The changes for each of the resources in the version are stored in the dryrun_resource table, one row per resource.
     """
 
     __primary_key__ = ("id",)
@@ -6666,7 +7039,6 @@ class DryRun(BaseDocument):
     date: datetime.datetime
     total: int = 0
     todo: int = 0
-    resources: dict[str, object] = {}
 
     @classmethod
     async def update_resource(cls, dryrun_id: uuid.UUID, resource_id: ResourceVersionIdStr, dryrun_data: JsonType) -> None:
@@ -6674,20 +7046,58 @@ class DryRun(BaseDocument):
         Register a resource update with a specific query that sets the dryrun_data and decrements the todo counter, only
         if the resource has not been saved yet.
         """
-        jsonb_key = uuid.uuid5(dryrun_id, resource_id)
-        query = (
-            "UPDATE "
-            + cls.table_name()
-            + " SET todo = todo - 1, resources=jsonb_set(resources, $1::text[], $2) "
-            + "WHERE id=$3 and NOT resources ? $4"
-        )
-        values = [
-            cls._get_value([jsonb_key]),
-            cls._get_value(dryrun_data),
+        await cls.update_resources(dryrun_id, {resource_id: dryrun_data})
+
+    @classmethod
+    async def update_resources(
+        cls,
+        dryrun_id: uuid.UUID,
+        dryrun_data: abc.Mapping[ResourceVersionIdStr, JsonType],
+        connection: Optional[asyncpg.connection.Connection] = None,
+    ) -> None:
+        """
+        Store the dryrun_data of the given resources and decrement the todo counter with the number of resources that
+        were stored. Resources that have already been saved are ignored.
+        """
+        if not dryrun_data:
+            return
+        query = f"""
+            WITH inserted AS (
+                INSERT INTO public.dryrun_resource (dryrun, resource_version_id, payload)
+                SELECT $1, r.resource_version_id, r.payload
+                FROM unnest($2::varchar[], $3::jsonb[]) AS r(resource_version_id, payload)
+                ON CONFLICT DO NOTHING
+                RETURNING 1
+            )
+            UPDATE {cls.table_name()}
+            SET todo = todo - (SELECT COUNT(*) FROM inserted)
+            WHERE id=$1
+        """
+        await cls._execute_query(
+            query,
             cls._get_value(dryrun_id),
-            cls._get_value(jsonb_key),
-        ]
-        await cls._execute_query(query, *values)
+            list(dryrun_data.keys()),
+            [cls._get_value(payload) for payload in dryrun_data.values()],
+            connection=connection,
+        )
+
+    @classmethod
+    async def get_resources(
+        cls, dryrun_id: uuid.UUID, connection: Optional[asyncpg.connection.Connection] = None
+    ) -> AsyncIterator[tuple[ResourceVersionIdStr, JsonType]]:
+        """
+        Stream the dryrun_data of the resources of the given dryrun, ordered by resource version id.
+        """
+        query = """
+            SELECT resource_version_id, payload
+            FROM public.dryrun_resource
+            WHERE dryrun=$1
+            ORDER BY resource_version_id
+        """
+        async with cls.get_connection(connection) as con:
+            async with con.transaction():
+                async for record in con.cursor(query, cls._get_value(dryrun_id)):
+                    yield ResourceVersionIdStr(record["resource_version_id"]), record["payload"]
 
     @classmethod
     async def create(cls, environment: uuid.UUID, model: int, total: int, todo: int) -> "DryRun":
@@ -6695,7 +7105,6 @@ class DryRun(BaseDocument):
             environment=environment,
             model=model,
             date=datetime.datetime.now().astimezone(),
-            resources={},
             total=total,
             todo=todo,
         )
@@ -6732,12 +7141,6 @@ class DryRun(BaseDocument):
             for record in records
         ]
 
-    def to_dict(self) -> JsonType:
-        dict_result = BaseDocument.to_dict(self)
-        resources = {r["id"]: r for r in dict_result["resources"].values()}
-        dict_result["resources"] = resources
-        return dict_result
-
     def to_dto(self) -> m.DryRun:
         return m.DryRun(
             id=self.id,
@@ -7098,6 +7501,23 @@ class File(BaseDocument):
         result = await cls._fetch_query(query, content_hashes)
         return {cast(str, r["content_hash"]) for r in result}
 
+    @classmethod
+    async def insert_many_if_not_exist(
+        cls, files: abc.Mapping[str, bytes], connection: Optional[asyncpg.connection.Connection] = None
+    ) -> None:
+        """
+        Insert the given files, by content hash, in a single query, skipping the ones that already exist.
+        """
+        if not files:
+            return
+        query = f"""
+            INSERT INTO {cls.table_name()}
+            (content_hash, content)
+            SELECT * FROM unnest($1::varchar[], $2::bytea[])
+            ON CONFLICT DO NOTHING
+        """
+        await cls._execute_query(query, list(files.keys()), list(files.values()), connection=connection)
+
 
 class Scheduler(BaseDocument):
     """
@@ -17,8 +17,12 @@ Contact: code@inmanta.com
 """
 
 import abc
+import json
+import re
+import time
 import urllib.parse
 from abc import ABC
+from collections import OrderedDict
 from collections.abc import Sequence
 from datetime import datetime
 from typing import Generic, Mapping, Optional, TypeVar, Union, cast
@@ -70,6 +74,7 @@ from inmanta.protocol.exceptions import BadRequest
 from inmanta.protocol.return_value_meta import ReturnValueWithMeta
 from inmanta.resources import Id
 from inmanta.server import config as opt
+from inmanta.server.config import PageCountStrategy
 from inmanta.server.validate_filter import (
     BooleanEqualityFilter,
     BooleanIsNotNullFilter,
@@ -171,19 +176,68 @@ class RequestedPagingBoundaries:
 
 
 class PagingMetadata:
-    def __init__(self, total: int, before: int, after: int, page_size: int) -> None:
+    def __init__(
+        self,
+        total: int,
+        before: int,
+        after: int,
+        page_size: int,
+        count_strategy: PageCountStrategy = PageCountStrategy.exact,
+    ) -> None:
         self.total = total
         self.before = before
         self.after = after
         self.page_size = page_size
+        self.count_strategy = count_strategy
 
-    def to_dict(self) -> dict[str, int]:
-        return {
+    def to_dict(self) -> dict[str, int | str]:
+        result: dict[str, int | str] = {
             "total": self.total,
             "before": self.before,
             "after": self.after,
             "page_size": self.page_size,
         }
+        if self.count_strategy is not PageCountStrategy.exact:
+            # Only reported when the counts might not be exact
+            result["count_strategy"] = self.count_strategy.value
+        return result
+
+
+class PageCountCache:
+    """
+    A bounded cache for the page counts of the views that use the cached page count strategy. The counts are keyed on the
+    count query and its arguments and expire after :inmanta.config:option:`server.page-count-cache-ttl` seconds.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        self.max_size = max_size
+        # Maps a count query and its arguments on the time the counts were taken and the total, before and after counts
+        self._entries: OrderedDict[tuple[str, str], tuple[float, tuple[int, int, int]]] = OrderedDict()
+
+    def get(self, query: str, values: Sequence[object]) -> Optional[tuple[int, int, int]]:
+        key = (query, str(values))
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        created, counts = entry
+        if time.monotonic() - created > opt.server_page_count_cache_ttl.get():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return counts
+
+    def put(self, query: str, values: Sequence[object], counts: tuple[int, int, int]) -> None:
+        key = (query, str(values))
+        self._entries[key] = (time.monotonic(), counts)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+page_count_cache = PageCountCache()
 
 
 class DataView(FilterValidator, Generic[T_ORDER, T_DTO], ABC):
@@ -229,6 +283,21 @@ class DataView(FilterValidator, Generic[T_ORDER, T_DTO], ABC):
         """
         return {}
 
+    @classmethod
+    def get_name(cls) -> str:
+        """
+        Return the name of this view, as used in the server.page-count-strategy config option
+
+        e.g. "resource_logs" for the ResourceLogsView
+        """
+        return re.sub(r"(?<!^)(?=[A-Z])", "_", cls.__name__.removesuffix("View")).lower()
+
+    def get_page_count_strategy(self) -> PageCountStrategy:
+        """
+        Return the strategy used to calculate the page counts of this view
+        """
+        return opt.server_page_count_strategy.get().get(self.get_name(), PageCountStrategy.exact)
+
     async def get_data(self) -> tuple[Sequence[T_DTO], PagingBoundaries]:
         query_builder = self.get_base_query()
 
@@ -355,13 +424,13 @@ class DataView(FilterValidator, Generic[T_ORDER, T_DTO], ABC):
             end, start = start, end
             last_id, first_id = first_id, last_id
 
-        values = query_builder.values
-        after_filter_statements, after_values = self.order.as_filter(len(values) + 1, start, first_id, start=not reversed)
-        values.extend(after_values)
+        nr_of_values: int = len(query_builder.values)
+        after_filter_statements, after_values = self.order.as_filter(nr_of_values + 1, start, first_id, start=not reversed)
         after_filter = data.BaseDocument._join_filter_statements(after_filter_statements)
 
-        before_filter_statements, before_values = self.order.as_filter(len(values) + 1, end, last_id, start=reversed)
-        values.extend(before_values)
+        before_filter_statements, before_values = self.order.as_filter(
+            nr_of_values + len(after_values) + 1, end, last_id, start=reversed
+        )
         before_filter = data.BaseDocument._join_filter_statements(before_filter_statements)
 
         # If the currently requested page was empty,
@@ -382,24 +451,87 @@ class DataView(FilterValidator, Generic[T_ORDER, T_DTO], ABC):
                 page_size=self.limit,
             )
 
+        strategy: PageCountStrategy = self.get_page_count_strategy()
+        if strategy is PageCountStrategy.estimated:
+            return await self._estimate_page_count(
+                query_builder,
+                after_filter=(after_filter_statements, after_values),
+                before_filter=(before_filter_statements, before_values),
+                before_filter_standalone=self.order.as_filter(nr_of_values + 1, end, last_id, start=reversed),
+            )
+
         select_clause = (
             "SELECT COUNT(*) as count_total"
             + (f", COUNT(*) filter ({before_filter}) as count_before" if before_filter else "")
             + (f", COUNT(*) filter ({after_filter}) as count_after " if after_filter else "")
         )
 
-        query_builder = query_builder.select(select_clause)
+        sql_query, values = query_builder.select(select_clause).filter([], after_values + before_values).build()
+        if strategy is PageCountStrategy.cached:
+            counts: Optional[tuple[int, int, int]] = page_count_cache.get(sql_query, values)
+            if counts is not None:
+                total, before, after = counts
+                return PagingMetadata(total=total, before=before, after=after, page_size=self.limit, count_strategy=strategy)
 
-        sql_query, values = query_builder.build()
         result = await data.Resource.select_query(sql_query, values, no_obj=True)
         result = cast(list[Record], result)
         if not result:
             raise InvalidQueryParameter("Could not determine page bounds")
-        return PagingMetadata(
+        metadata = PagingMetadata(
             total=cast(int, result[0]["count_total"]),
             before=cast(int, result[0].get("count_before", 0)),
             after=cast(int, result[0].get("count_after", 0)),
             page_size=self.limit,
+            count_strategy=strategy,
+        )
+        if strategy is PageCountStrategy.cached:
+            page_count_cache.put(sql_query, values, (metadata.total, metadata.before, metadata.after))
+        return metadata
+
+    async def _estimate_page_count(
+        self,
+        query_builder: SimpleQueryBuilder,
+        after_filter: tuple[list[str], list[object]],
+        before_filter: tuple[list[str], list[object]],
+        before_filter_standalone: tuple[list[str], list[object]],
+    ) -> PagingMetadata:
+        """
+        Estimate the page counts from the row estimates of the query planner. Whether there are records before and after the
+        page is verified exactly, because the paging links depend on it.
+
+        :param after_filter: The filter for the records after the page, its values follow the values of the query builder.
+        :param before_filter: The filter for the records before the page, its values follow the values of the after filter.
+        :param before_filter_standalone: The same filter as before_filter, with values that directly follow the values of
+            the query builder.
+        """
+        exists_query_builder = query_builder.select("SELECT 1")
+        checks: list[str] = []
+        for name, (filter_statements, _) in (("has_after", after_filter), ("has_before", before_filter)):
+            if filter_statements:
+                # Postgres allows the prelude of the query in a subquery
+                subquery, _ = exists_query_builder.filter(filter_statements, []).build()
+                checks.append(f"EXISTS ({subquery}) AS {name}")
+        result = await data.Resource.select_query(
+            f"SELECT {', '.join(checks)}", query_builder.values + after_filter[1] + before_filter[1], no_obj=True
+        )
+
+        async def estimate(filter_statements: list[str], values: list[object]) -> int:
+            sql_query, query_values = query_builder.select("SELECT 1").filter(filter_statements, values).build()
+            result = await data.Resource.select_query(f"EXPLAIN (FORMAT JSON) {sql_query}", query_values, no_obj=True)
+            plan = result[0]["QUERY PLAN"]
+            if isinstance(plan, str):
+                # The plan is only decoded when the json codec is installed on the connection
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"])
+
+        after: int = await estimate(*after_filter) if result[0].get("has_after", False) else 0
+        before: int = await estimate(*before_filter_standalone) if result[0].get("has_before", False) else 0
+        return PagingMetadata(
+            total=max(await estimate([], []), before + after),
+            before=before,
+            after=after,
+            page_size=self.limit,
+            count_strategy=PageCountStrategy.estimated,
         )
 
     async def prepare_paging_links(
@@ -922,6 +1054,7 @@ class ResourceLogsView(DataView[ResourceLogOrder, ResourceLog]):
                     INNER JOIN  {ResourceAction.table_name()} AS ra
                         ON rr.environment=ra.environment
                         AND rr.resource_action_id=ra.action_id
+                        AND rr.started=ra.started
                     WHERE rr.environment=$1 AND rr.resource_id=$2
                 )
             """,
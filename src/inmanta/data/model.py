@@ -122,6 +122,17 @@ class StatusResponse(BaseModel):
     postgresql_version: str | None
 
 
+@stable_api
+class ParserCacheStats(BaseModel):
+    """
+    Statistics of the cache of parsed files during a compile.
+    """
+
+    hits: int
+    misses: int
+    failures: int
+
+
 @stable_api
 class CompileData(BaseModel):
     """
@@ -132,6 +143,10 @@ class CompileData(BaseModel):
     """
         All errors occurred while trying to compile.
     """
+    parser_cache: Optional[ParserCacheStats] = None
+    """
+        Statistics of the cache of parsed files, None when the cache was not used.
+    """
 
 
 class CompileRunBase(BaseModel):
@@ -1140,6 +1155,7 @@ class SchedulerStatusReport(BaseModel):
     :param db_state: Desired state of the resources as persisted in the database
     :param discrepancies: Discrepancies between the in-memory representation of the resources
         and their state in the database.
+    :param executor_prewarm: The state of the executors that are prepared ahead of their first use, by blueprint hash.
     """
 
     # Can't type properly because of current module structure
@@ -1147,6 +1163,7 @@ class SchedulerStatusReport(BaseModel):
     db_state: Mapping[ResourceIdStr, object]  # "True" type is deploy.state.ResourceIntent
     resource_states: Mapping[ResourceIdStr, const.ResourceState]
     discrepancies: list[Discrepancy] | dict[ResourceIdStr, list[Discrepancy]]
+    executor_prewarm: Mapping[str, str] = {}  # "True" type of the values is agent.executor.PrewarmState
 
 
 class DataBaseReport(BaseModel):
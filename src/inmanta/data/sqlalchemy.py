@@ -185,14 +185,16 @@ class InmantaModule(Base):
                 file_content_hash,
                 python_module_name,
                 is_byte_code
-            ) VALUES(
-                $1,
-                $2,
-                $3,
-                $4,
-                $5,
-                $6
             )
+            SELECT
+                f.inmanta_module_name,
+                f.inmanta_module_version,
+                $1,
+                f.file_content_hash,
+                f.python_module_name,
+                f.is_byte_code
+            FROM unnest($2::varchar[], $3::varchar[], $4::varchar[], $5::varchar[], $6::boolean[])
+                AS f(inmanta_module_name, inmanta_module_version, file_content_hash, python_module_name, is_byte_code)
             ON CONFLICT DO NOTHING;
         """
         async with connection.transaction():
@@ -208,25 +210,30 @@ class InmantaModule(Base):
                     for inmanta_module_name, inmanta_module_data in modules.items()
                 ],
             )
-            await connection.executemany(
-                insert_files_query,
-                [
-                    (
-                        inmanta_module_name,
-                        inmanta_module_data.version,
-                        environment,
-                        file.hash_value,
-                        file.name,
-                        file.is_byte_code,
-                    )
-                    for inmanta_module_name, inmanta_module_data in modules.items()
-                    for file in inmanta_module_data.files_in_module
-                ],
-            )
+            # The files are inserted in a single statement, there are typically a lot more files than modules
+            files: list[tuple[str, str, str, str, bool]] = [
+                (
+                    inmanta_module_name,
+                    inmanta_module_data.version,
+                    file.hash_value,
+                    file.name,
+                    file.is_byte_code,
+                )
+                for inmanta_module_name, inmanta_module_data in modules.items()
+                for file in inmanta_module_data.files_in_module
+            ]
+            if files:
+                await connection.execute(insert_files_query, environment, *(list(column) for column in zip(*files)))
 
     @classmethod
     async def delete_version(
         cls, environment: uuid.UUID, model_version: int, connection: asyncpg.connection.Connection
+    ) -> None:
+        await cls.delete_versions(environment, [model_version], connection)
+
+    @classmethod
+    async def delete_versions(
+        cls, environment: uuid.UUID, model_versions: Sequence[int], connection: asyncpg.connection.Connection
     ) -> None:
         await connection.execute(
             f"""
@@ -235,11 +242,11 @@ class InmantaModule(Base):
                 SELECT environment, inmanta_module_name, inmanta_module_version
                 FROM public.agent_modules
                 WHERE environment=$1
-                AND cm_version=$2
+                AND cm_version=ANY($2::int[])
             )
             """,
             environment,
-            model_version,
+            model_versions,
         )
 
 
@@ -277,6 +284,12 @@ class ModuleFiles(Base):
     @classmethod
     async def delete_version(
         cls, environment: uuid.UUID, model_version: int, connection: asyncpg.connection.Connection
+    ) -> None:
+        await cls.delete_versions(environment, [model_version], connection)
+
+    @classmethod
+    async def delete_versions(
+        cls, environment: uuid.UUID, model_versions: Sequence[int], connection: asyncpg.connection.Connection
     ) -> None:
         await connection.execute(
             f"""
@@ -285,11 +298,11 @@ class ModuleFiles(Base):
                 SELECT environment, inmanta_module_name, inmanta_module_version
                 FROM {AgentModules.__tablename__}
                 WHERE environment=$1
-                AND cm_version=$2
+                AND cm_version=ANY($2::int[])
             )
             """,
             environment,
-            model_version,
+            model_versions,
         )
 
 
@@ -422,42 +435,44 @@ class AgentModules(Base):
                 agent_name,
                 inmanta_module_name,
                 inmanta_module_version
-            ) VALUES(
+            )
+            SELECT
                 $1,
                 $2,
-                $3,
-                $4,
-                $5
-            )
+                m.agent_name,
+                m.inmanta_module_name,
+                m.inmanta_module_version
+            FROM unnest($3::varchar[], $4::varchar[], $5::varchar[])
+                AS m(agent_name, inmanta_module_name, inmanta_module_version)
             ON CONFLICT DO NOTHING;
         """
-        async with connection.transaction():
-            values = []
-            for inmanta_module_name, (inmanta_module_version, agents_to_register) in module_usage_info.items():
-                for agent_name in agents_to_register:
-                    values.append(
-                        (
-                            model_version,
-                            environment,
-                            agent_name,
-                            inmanta_module_name,
-                            inmanta_module_version,
-                        )
-                    )
-
-            await connection.executemany(
-                query,
-                values,
-            )
+        agent_names: list[str] = []
+        module_names: list[str] = []
+        module_versions: list[str] = []
+        for inmanta_module_name, (inmanta_module_version, agents_to_register) in module_usage_info.items():
+            for agent_name in agents_to_register:
+                agent_names.append(agent_name)
+                module_names.append(inmanta_module_name)
+                module_versions.append(inmanta_module_version)
+        if not agent_names:
+            return
+        # A single statement for all agents, rather than a round-trip per agent-module pair
+        await connection.execute(query, model_version, environment, agent_names, module_names, module_versions)
 
     @classmethod
     async def delete_version(
         cls, environment: uuid.UUID, model_version: int, connection: asyncpg.connection.Connection
+    ) -> None:
+        await cls.delete_versions(environment, [model_version], connection)
+
+    @classmethod
+    async def delete_versions(
+        cls, environment: uuid.UUID, model_versions: Sequence[int], connection: asyncpg.connection.Connection
     ) -> None:
         await connection.execute(
-            f"DELETE FROM {AgentModules.__tablename__} WHERE environment=$1 AND cm_version=$2",
+            f"DELETE FROM {AgentModules.__tablename__} WHERE environment=$1 AND cm_version=ANY($2::int[])",
             environment,
-            model_version,
+            model_versions,
         )
 
 
@@ -1147,9 +1162,25 @@ class Dryrun(Base):
     date: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime(True))
     total: Mapped[Optional[int]] = mapped_column(Integer, server_default=text("0"))
     todo: Mapped[Optional[int]] = mapped_column(Integer, server_default=text("0"))
-    resources: Mapped[Optional[dict[str, Any]]] = mapped_column(JSONB, server_default=text("'{}'::jsonb"))
 
     configurationmodel: Mapped["Configurationmodel"] = relationship("Configurationmodel", back_populates="dryrun")
+    dryrun_resource: Mapped[list["DryrunResource"]] = relationship("DryrunResource", back_populates="dryrun_")
+
+
+class DryrunResource(Base):
+    __tablename__ = "dryrun_resource"
+    __table_args__ = (
+        ForeignKeyConstraint(["dryrun"], ["dryrun.id"], ondelete="CASCADE", name="dryrun_resource_dryrun_fkey"),
+        PrimaryKeyConstraint("dryrun", "resource_version_id", name="dryrun_resource_pkey"),
+    )
+
+    dryrun: Mapped[uuid.UUID] = mapped_column(UUID, primary_key=True, doc="The dryrun this result belongs to")
+    resource_version_id: Mapped[str] = mapped_column(
+        String, primary_key=True, doc="The resource version id of the resource this result is for"
+    )
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False, doc="The changes the dryrun found for the resource")
+
+    dryrun_: Mapped["Dryrun"] = relationship("Dryrun", back_populates="dryrun_resource")
 
 
 class Report(Base):
@@ -1252,17 +1283,18 @@ class Resourceaction(Base):
             ondelete="CASCADE",
             name="resourceaction_environment_version_fkey",
         ),
-        PrimaryKeyConstraint("action_id", name="resourceaction_pkey"),
+        PrimaryKeyConstraint("action_id", "started", name="resourceaction_pkey"),
         Index("resourceaction_environment_action_started_index", "environment", "action", column("started").desc()),
         Index("resourceaction_environment_version_started_index", "environment", "version", column("started").desc()),
         Index("resourceaction_started_index", "started"),
+        {"postgresql_partition_by": "RANGE (started)"},
     )
 
     action_id: Mapped[uuid.UUID] = mapped_column(UUID, primary_key=True)
     action: Mapped[str] = mapped_column(
         Enum("store", "push", "pull", "deploy", "dryrun", "getfact", "other", name="resourceaction_type"), nullable=False
     )
-    started: Mapped[datetime.datetime] = mapped_column(DateTime(True), nullable=False)
+    started: Mapped[datetime.datetime] = mapped_column(DateTime(True), primary_key=True)
     environment: Mapped[uuid.UUID] = mapped_column(UUID, nullable=False)
     version: Mapped[int] = mapped_column(Integer, nullable=False)
     resource_version_ids: Mapped[list[str]] = mapped_column(ARRAY(String()), nullable=False)
@@ -1344,21 +1376,30 @@ class ResourceactionResource(Base):
     __tablename__ = "resourceaction_resource"
     __table_args__ = (
         ForeignKeyConstraint(
-            ["resource_action_id"],
-            ["resourceaction.action_id"],
+            ["resource_action_id", "started"],
+            ["resourceaction.action_id", "resourceaction.started"],
             ondelete="CASCADE",
             name="resourceaction_resource_resource_action_id_fkey",
         ),
         PrimaryKeyConstraint(
-            "environment", "resource_id", "resource_version", "resource_action_id", name="resourceaction_resource_pkey"
+            "environment",
+            "resource_id",
+            "resource_version",
+            "resource_action_id",
+            "started",
+            name="resourceaction_resource_pkey",
         ),
         Index("resourceaction_resource_environment_resource_version_index", "environment", "resource_version"),
         Index("resourceaction_resource_resource_action_id_index", "resource_action_id"),
+        {"postgresql_partition_by": "RANGE (started)"},
     )
 
     environment: Mapped[uuid.UUID] = mapped_column(UUID, primary_key=True, doc="The environment this record belongs to")
     resource_action_id: Mapped[uuid.UUID] = mapped_column(UUID, primary_key=True, doc="The id of the resource action")
     resource_id: Mapped[str] = mapped_column(String, primary_key=True, doc="The id of the resource")
     resource_version: Mapped[int] = mapped_column(Integer, primary_key=True, doc="The version of the resource")
+    started: Mapped[datetime.datetime] = mapped_column(
+        DateTime(True), primary_key=True, doc="The start time of the resource action, used as partition key"
+    )
 
     resource_action: Mapped["Resourceaction"] = relationship("Resourceaction", back_populates="resourceaction_resource")
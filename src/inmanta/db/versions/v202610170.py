@@ -0,0 +1,45 @@
+"""
+Copyright 2026 Inmanta
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Contact: code@inmanta.com
+"""
+
+from asyncpg import Connection
+
+
+async def update(connection: Connection) -> None:
+    """
+    Move the results of a dryrun from the resources jsonb column of the dryrun table to the dryrun_resource table,
+    with one row per resource. This way a result is stored with a plain insert instead of rewriting the document
+    that holds the results of all resources of the dryrun.
+    """
+    schema = """
+    CREATE TABLE public.dryrun_resource(
+        dryrun uuid NOT NULL,
+        resource_version_id character varying NOT NULL,
+        payload jsonb NOT NULL,
+        PRIMARY KEY (dryrun, resource_version_id),
+        FOREIGN KEY (dryrun) REFERENCES public.dryrun(id) ON DELETE CASCADE
+    );
+
+    INSERT INTO public.dryrun_resource(dryrun, resource_version_id, payload)
+    SELECT d.id, r.value->>'id', r.value
+    FROM public.dryrun AS d, jsonb_each(d.resources) AS r
+    WHERE r.value->>'id' IS NOT NULL
+    ON CONFLICT DO NOTHING;
+
+    ALTER TABLE public.dryrun DROP COLUMN resources;
+    """
+    await connection.execute(schema)
@@ -0,0 +1,147 @@
+"""
+Copyright 2026 Inmanta
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Contact: code@inmanta.com
+"""
+
+import datetime
+
+from asyncpg import Connection
+
+# The number of days, after the current one, for which a partition is created upfront
+PARTITIONS_AHEAD = 3
+
+
+async def update(connection: Connection) -> None:
+    """
+    Partition the resourceaction table and the resourceaction_resource table by range on the started column, with one
+    partition per day. This allows the retention of the resource action logs to drop whole partitions instead of deleting
+    rows one by one. The started column is added to the resourceaction_resource table, so that both tables are partitioned
+    in the same way. Rows that don't fit in any daily partition end up in the default partition.
+    """
+    await connection.execute("""
+        CREATE TABLE public.resourceaction_partitioned (
+            action_id uuid NOT NULL,
+            action public.resourceaction_type NOT NULL,
+            started timestamp with time zone NOT NULL,
+            finished timestamp with time zone,
+            messages jsonb[],
+            status public.resourcestate DEFAULT 'available'::public.resourcestate,
+            changes jsonb DEFAULT '{}'::jsonb,
+            change public.change,
+            environment uuid NOT NULL,
+            version integer NOT NULL,
+            resource_version_ids character varying[] NOT NULL
+        ) PARTITION BY RANGE (started);
+
+        CREATE TABLE public.resourceaction_resource_partitioned (
+            environment uuid NOT NULL,
+            resource_action_id uuid NOT NULL,
+            resource_id character varying NOT NULL,
+            resource_version integer NOT NULL,
+            started timestamp with time zone NOT NULL
+        ) PARTITION BY RANGE (started);
+
+        CREATE TABLE public.resourceaction_default PARTITION OF public.resourceaction_partitioned DEFAULT;
+        CREATE TABLE public.resourceaction_resource_default PARTITION OF public.resourceaction_resource_partitioned DEFAULT;
+        """)
+
+    # Create a partition for every day that has resource actions, for the current day and for the days ahead
+    today: datetime.date = await connection.fetchval("SELECT (now() AT TIME ZONE 'UTC')::date")
+    days: set[datetime.date] = {today + datetime.timedelta(days=i) for i in range(PARTITIONS_AHEAD + 1)}
+    days.update(
+        record["day"]
+        for record in await connection.fetch(
+            "SELECT DISTINCT (started AT TIME ZONE 'UTC')::date AS day FROM public.resourceaction"
+        )
+    )
+    for day in sorted(days):
+        suffix = day.strftime("p%Y%m%d")
+        lower = f"{day.isoformat()} 00:00:00+00"
+        upper = f"{(day + datetime.timedelta(days=1)).isoformat()} 00:00:00+00"
+        await connection.execute(f"""
+            CREATE TABLE public.resourceaction_{suffix} PARTITION OF public.resourceaction_partitioned
+                FOR VALUES FROM ('{lower}') TO ('{upper}');
+            CREATE TABLE public.resourceaction_resource_{suffix} PARTITION OF public.resourceaction_resource_partitioned
+                FOR VALUES FROM ('{lower}') TO ('{upper}');
+            """)
+
+    await connection.execute("""
+        INSERT INTO public.resourceaction_partitioned(
+            action_id,
+            action,
+            started,
+            finished,
+            messages,
+            status,
+            changes,
+            change,
+            environment,
+            version,
+            resource_version_ids
+        )
+        SELECT
+            action_id,
+            action,
+            started,
+            finished,
+            messages,
+            status,
+            changes,
+            change,
+            environment,
+            version,
+            resource_version_ids
+        FROM public.resourceaction;
+
+        INSERT INTO public.resourceaction_resource_partitioned(
+            environment,
+            resource_action_id,
+            resource_id,
+            resource_version,
+            started
+        )
+        SELECT rr.environment, rr.resource_action_id, rr.resource_id, rr.resource_version, ra.started
+        FROM public.resourceaction_resource AS rr
+        INNER JOIN public.resourceaction AS ra
+            ON rr.resource_action_id=ra.action_id;
+
+        DROP TABLE public.resourceaction_resource;
+        DROP TABLE public.resourceaction;
+        ALTER TABLE public.resourceaction_partitioned RENAME TO resourceaction;
+        ALTER TABLE public.resourceaction_resource_partitioned RENAME TO resourceaction_resource;
+
+        -- The partition key has to be part of the primary key
+        ALTER TABLE public.resourceaction ADD CONSTRAINT resourceaction_pkey PRIMARY KEY (action_id, started);
+        ALTER TABLE public.resourceaction
+            ADD CONSTRAINT resourceaction_environment_version_fkey FOREIGN KEY (environment, version)
+            REFERENCES public.configurationmodel(environment, version) ON DELETE CASCADE;
+        CREATE INDEX resourceaction_environment_action_started_index
+            ON public.resourceaction USING btree (environment, action, started DESC);
+        CREATE INDEX resourceaction_environment_version_started_index
+            ON public.resourceaction USING btree (environment, version, started DESC);
+        CREATE INDEX resourceaction_started_index ON public.resourceaction USING btree (started);
+
+        ALTER TABLE public.resourceaction_resource
+            ADD CONSTRAINT resourceaction_resource_pkey
+            PRIMARY KEY (environment, resource_id, resource_version, resource_action_id, started);
+        ALTER TABLE public.resourceaction_resource
+            ADD CONSTRAINT resourceaction_resource_resource_action_id_fkey FOREIGN KEY (resource_action_id, started)
+            REFERENCES public.resourceaction(action_id, started) ON DELETE CASCADE;
+        CREATE INDEX resourceaction_resource_environment_resource_version_index
+            ON public.resourceaction_resource USING btree (environment, resource_version);
+        CREATE INDEX resourceaction_resource_resource_action_id_index
+            ON public.resourceaction_resource USING btree (resource_action_id);
+        """)
@@ -17,23 +17,30 @@ Contact: code@inmanta.com
 """
 
 import abc
+import asyncio
+import contextlib
 import datetime
 import logging
 import uuid
+from collections.abc import Awaitable, Callable, Sequence
 from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
 from typing import Any, Mapping, Optional
 from uuid import UUID
 
 from asyncpg import Connection, UniqueViolationError
 
 from inmanta import const, data
+from inmanta.agent import config as cfg
 from inmanta.agent import executor
 from inmanta.const import TRANSIENT_STATES, VALID_STATES_ON_STATE_UPDATE, Change, ResourceState
 from inmanta.data import LogLine
 from inmanta.deploy import state
 from inmanta.protocol import Client
+from inmanta.protocol.exceptions import NotFound
 from inmanta.resources import Id
 from inmanta.types import ResourceIdStr, ResourceVersionIdStr
+from inmanta.vendor import pyformance
 
 LOGGER = logging.getLogger(__name__)
 
@@ -123,12 +130,152 @@ class StateUpdateManager(abc.ABC):
         pass
 
 
+@dataclass(frozen=True, kw_only=True)
+class DeployDoneRecord:
+    """
+    All database updates required to persist the result of a single finished deploy.
+
+    :param resource_id: The resource the deploy was for.
+    :param version: The model version that was deployed.
+    :param action_id: The id of the resource action, as passed to send_in_progress.
+    :param attribute_hash: The attribute hash of the intent that was deployed.
+    :param messages: The log lines to store on the resource action. Empty to leave them untouched.
+    :param changes: The changes to store on the resource action. Empty to leave them untouched.
+    :param non_compliant_diff: The diff to persist for a non-compliant resource, None otherwise.
+    :param last_handler_run: Last handler run to write to the persistent state. None to leave it untouched.
+    :param last_handler_run_compliant: Compliance of the last handler run. None to leave it untouched.
+    :param purge_parameters: Whether to remove the parameters of this resource, i.e. after it was successfully purged.
+    """
+
+    resource_id: ResourceIdStr
+    version: int
+    action_id: UUID
+    attribute_hash: str
+    status: const.ResourceState
+    change: Optional[Change]
+    messages: Sequence[Mapping[str, object]]
+    changes: Mapping[ResourceVersionIdStr, Mapping[str, object]]
+    non_compliant_diff: Optional[Mapping[str, object]]
+    started: datetime.datetime
+    finished: datetime.datetime
+    last_handler_run: Optional[state.HandlerResult]
+    last_handler_run_compliant: Optional[bool]
+    purge_parameters: bool
+
+
+class DeployDoneBatcher:
+    """
+    Group commit for deploy results: all results submitted within a short time window (or until the batch is full) are
+    written to the database by a single call to the flush function, i.e. in a single transaction.
+
+    The submitter waits until the batch holding its result has been committed, so from its point of view the write remains
+    synchronous. A batch contains at most one result per resource. Additional results for the same resource are deferred to
+    a later batch, in the order they were submitted, so the per-resource write order is preserved.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[Sequence[DeployDoneRecord]], Awaitable[Mapping[UUID, Exception]]],
+        *,
+        window: float,
+        max_size: int,
+    ) -> None:
+        """
+        :param flush: Writes a batch of records in a single transaction. Returns the exception for each action id that
+            could not be written. If it raises an exception, none of the records in the batch were written.
+        :param window: The maximum time, in seconds, to wait for more results before writing a batch.
+        :param max_size: The maximum number of results in a single batch.
+        """
+        self._flush = flush
+        self._window = window
+        self._max_size = max_size
+        self._pending: list[tuple[DeployDoneRecord, asyncio.Future[None]]] = []
+        self._batch_full: asyncio.Event = asyncio.Event()
+        # Only runs while there is pending work, a new one is started when required
+        self._flusher: Optional[asyncio.Task[None]] = None
+
+    async def submit(self, record: DeployDoneRecord) -> None:
+        """
+        Add the given record to the next batch and wait until that batch has been written.
+
+        :raises Exception: The exception raised while writing this record.
+        """
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._pending.append((record, future))
+        if len(self._pending) >= self._max_size:
+            self._batch_full.set()
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._run())
+        await future
+
+    async def _run(self) -> None:
+        while self._pending:
+            if len(self._pending) < self._max_size:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._batch_full.wait(), timeout=self._window)
+            self._batch_full.clear()
+            await self._flush_batch(self._take_batch())
+            if len(self._pending) >= self._max_size:
+                self._batch_full.set()
+
+    def _take_batch(self) -> list[tuple[DeployDoneRecord, asyncio.Future[None]]]:
+        """
+        Take the next batch from the pending records: at most max_size records, with at most one record per resource.
+        """
+        batch: list[tuple[DeployDoneRecord, asyncio.Future[None]]] = []
+        remaining: list[tuple[DeployDoneRecord, asyncio.Future[None]]] = []
+        resources_in_batch: set[ResourceIdStr] = set()
+        for record, future in self._pending:
+            if future.done():
+                # The submitter was cancelled before the record was written
+                continue
+            if len(batch) >= self._max_size or record.resource_id in resources_in_batch:
+                remaining.append((record, future))
+            else:
+                batch.append((record, future))
+                resources_in_batch.add(record.resource_id)
+        self._pending = remaining
+        return batch
+
+    async def _flush_batch(self, batch: Sequence[tuple[DeployDoneRecord, asyncio.Future[None]]]) -> None:
+        if not batch:
+            return
+        pyformance.histogram("internal.scheduler.deploy_result_batch.size").add(len(batch))
+        try:
+            with pyformance.timer("internal.scheduler.deploy_result_batch.flush").time():
+                failures: Mapping[UUID, Exception] = await self._flush([record for record, _ in batch])
+        except Exception as e:
+            LOGGER.exception("Failed to write a batch of %d deploy results to the database", len(batch))
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for record, future in batch:
+            if future.done():
+                continue
+            failure: Optional[Exception] = failures.get(record.action_id)
+            if failure is not None:
+                future.set_exception(failure)
+            else:
+                future.set_result(None)
+
+
 class ToDbUpdateManager(StateUpdateManager):
 
     def __init__(self, client: Client, environment: UUID) -> None:
         self.environment = environment
         # TODO: The client is only here temporarily while we fix the dryrun_update
         self.client = client
+        batch_window: float = cfg.scheduler_deploy_result_batch_window.get()
+        self._deploy_done_batcher: Optional[DeployDoneBatcher] = (
+            DeployDoneBatcher(
+                self._write_deploy_done_batch,
+                window=batch_window,
+                max_size=cfg.scheduler_deploy_result_batch_size.get(),
+            )
+            if batch_window > 0
+            else None
+        )
 
     def get_connection(self, connection: Optional[Connection] = None) -> AbstractAsyncContextManager[Connection]:
         return data.Scheduler.get_connection(connection)
@@ -219,6 +366,37 @@ class ToDbUpdateManager(StateUpdateManager):
                 action_id=action_id,
             )
 
+        if self._deploy_done_batcher is not None:
+            await self._deploy_done_batcher.submit(
+                DeployDoneRecord(
+                    resource_id=resource_id_parsed.resource_str(),
+                    version=resource_id_parsed.version,
+                    action_id=action_id,
+                    attribute_hash=attribute_hash,
+                    status=status,
+                    change=change,
+                    messages=[
+                        {
+                            **log.to_dict(),
+                            "timestamp": log.timestamp.astimezone().isoformat(timespec="microseconds"),
+                        }
+                        for log in messages
+                    ],
+                    changes=changes_with_rvid,
+                    non_compliant_diff=(
+                        {attr_name: attr_change.model_dump() for attr_name, attr_change in result.changes.items()}
+                        if status is const.ResourceState.non_compliant
+                        else None
+                    ),
+                    started=started,
+                    finished=finished,
+                    last_handler_run=state.last_handler_run if state is not None else None,
+                    last_handler_run_compliant=state.last_handler_run_compliant if state is not None else None,
+                    purge_parameters=not stale_deploy and change is Change.purged and status == const.ResourceState.deployed,
+                )
+            )
+            return
+
         async with data.Resource.get_connection() as connection:
             async with connection.transaction():
 
@@ -293,6 +471,177 @@ class ToDbUpdateManager(StateUpdateManager):
                         environment=self.environment, resource_id=resource_id_parsed.resource_str(), connection=connection
                     )
 
+    async def _write_deploy_done_batch(self, records: Sequence[DeployDoneRecord]) -> Mapping[UUID, Exception]:
+        """
+        Write the given deploy results in a single transaction, using one set-based statement per table. The batch must
+        contain at most one record per resource.
+
+        Performs the same updates and checks as the unbatched send_deploy_done path. A record that fails a check is skipped,
+        the others are still written.
+
+        :return: The exception for each action id that was not written.
+        """
+        failures: dict[UUID, Exception] = {}
+        async with data.Resource.get_connection() as connection:
+            async with connection.transaction():
+                # Same locking order as the unbatched path: resource actions first, then the persistent state.
+                # Rows are locked in a consistent order to prevent deadlocks with concurrent batches.
+                finished_by_action_id: dict[UUID, Optional[datetime.datetime]] = {
+                    row["action_id"]: row["finished"]
+                    for row in await connection.fetch(
+                        f"""
+                        SELECT action_id, finished
+                        FROM {data.ResourceAction.table_name()}
+                        WHERE environment=$1 AND action_id=ANY($2::uuid[])
+                        ORDER BY action_id
+                        FOR NO KEY UPDATE
+                        """,
+                        self.environment,
+                        [record.action_id for record in records],
+                    )
+                }
+                for record in records:
+                    if record.action_id not in finished_by_action_id:
+                        failures[record.action_id] = ValueError(
+                            f"No resource action exists for action_id {record.action_id}."
+                            " Ensure send_in_progress is called first."
+                        )
+                    elif (already_finished := finished_by_action_id[record.action_id]) is not None:
+                        failures[record.action_id] = ValueError(
+                            f"Resource action with id {record.resource_id},v={record.version} was already marked as done"
+                            f" at {already_finished}."
+                        )
+                records = [record for record in records if record.action_id not in failures]
+
+                known_resources: set[str] = {
+                    row["resource_id"]
+                    for row in await connection.fetch(
+                        f"""
+                        SELECT resource_id
+                        FROM {data.ResourcePersistentState.table_name()}
+                        WHERE environment=$1 AND resource_id=ANY($2::text[])
+                        ORDER BY resource_id
+                        FOR NO KEY UPDATE
+                        """,
+                        self.environment,
+                        [record.resource_id for record in records],
+                    )
+                }
+                for record in records:
+                    if record.resource_id not in known_resources:
+                        failures[record.action_id] = NotFound(
+                            "Unable to find an entry in the resource_persistent_state table "
+                            f"for resource with id {record.resource_id} in environment {self.environment}"
+                        )
+                records = [record for record in records if record.action_id not in failures]
+                if not records:
+                    return failures
+
+                await connection.execute(
+                    f"""
+                    UPDATE {data.ResourceAction.table_name()} AS ra
+                    SET
+                        messages=(
+                            CASE
+                                WHEN v.messages IS NULL THEN ra.messages
+                                ELSE ARRAY(SELECT jsonb_array_elements(v.messages))
+                            END
+                        ),
+                        changes=COALESCE(v.changes, ra.changes),
+                        status=v.status::public.resourcestate,
+                        change=COALESCE(v.change::public.change, ra.change),
+                        finished=v.finished
+                    FROM UNNEST($2::uuid[], $3::jsonb[], $4::jsonb[], $5::text[], $6::text[], $7::timestamptz[])
+                        AS v(action_id, messages, changes, status, change, finished)
+                    WHERE ra.environment=$1 AND ra.action_id=v.action_id
+                    """,
+                    self.environment,
+                    [record.action_id for record in records],
+                    [data.json_encode(record.messages) if record.messages else None for record in records],
+                    [data.json_encode(record.changes) if record.changes else None for record in records],
+                    [record.status.name for record in records],
+                    [record.change.name if record.change is not None else None for record in records],
+                    [record.finished for record in records],
+                )
+
+                diff_ids: dict[UUID, UUID] = {
+                    record.action_id: uuid.uuid4() for record in records if record.non_compliant_diff is not None
+                }
+                if diff_ids:
+                    diff_records: list[DeployDoneRecord] = [record for record in records if record.action_id in diff_ids]
+                    await connection.execute(
+                        """
+                        INSERT INTO public.resource_diff (id, environment, resource_id, created, diff)
+                        SELECT v.id, $1, v.resource_id, v.created, v.diff
+                        FROM UNNEST($2::uuid[], $3::text[], $4::timestamptz[], $5::jsonb[]) AS v(id, resource_id, created, diff)
+                        """,
+                        self.environment,
+                        [diff_ids[record.action_id] for record in diff_records],
+                        [record.resource_id for record in diff_records],
+                        [record.finished for record in diff_records],
+                        [data.json_encode(record.non_compliant_diff) for record in diff_records],
+                    )
+
+                # use start time for last_success because it is used for comparison with dependencies' last_produced_events
+                # use finished time for last_produced_events because it is used for comparison with dependencies' start
+                await connection.execute(
+                    f"""
+                    UPDATE {data.ResourcePersistentState.table_name()} AS rps
+                    SET
+                        is_deploying=FALSE,
+                        last_handler_run_at=v.finished,
+                        last_deployed_version=v.version,
+                        last_deployed_attribute_hash=v.attribute_hash,
+                        last_non_deploying_status=v.status::public.non_deploying_resource_state,
+                        last_handler_run=COALESCE(v.last_handler_run, rps.last_handler_run),
+                        last_handler_run_compliant=COALESCE(v.last_handler_run_compliant, rps.last_handler_run_compliant),
+                        last_success=COALESCE(v.last_success, rps.last_success),
+                        last_produced_events=v.finished,
+                        non_compliant_diff=v.non_compliant_diff
+                    FROM UNNEST(
+                        $2::text[],
+                        $3::int[],
+                        $4::text[],
+                        $5::text[],
+                        $6::text[],
+                        $7::boolean[],
+                        $8::timestamptz[],
+                        $9::timestamptz[],
+                        $10::uuid[]
+                    ) AS v(
+                        resource_id,
+                        version,
+                        attribute_hash,
+                        status,
+                        last_handler_run,
+                        last_handler_run_compliant,
+                        last_success,
+                        finished,
+                        non_compliant_diff
+                    )
+                    WHERE rps.environment=$1 AND rps.resource_id=v.resource_id
+                    """,
+                    self.environment,
+                    [record.resource_id for record in records],
+                    [record.version for record in records],
+                    [record.attribute_hash for record in records],
+                    [const.NonDeployingResourceState(record.status).name for record in records],
+                    [record.last_handler_run.name if record.last_handler_run else None for record in records],
+                    [record.last_handler_run_compliant for record in records],
+                    [record.started if record.status is ResourceState.deployed else None for record in records],
+                    [record.finished for record in records],
+                    [diff_ids.get(record.action_id) for record in records],
+                )
+
+                purged: list[ResourceIdStr] = [record.resource_id for record in records if record.purge_parameters]
+                if purged:
+                    await connection.execute(
+                        f"DELETE FROM {data.Parameter.table_name()} WHERE environment=$1 AND resource_id=ANY($2::text[])",
+                        self.environment,
+                        purged,
+                    )
+        return failures
+
     async def dryrun_update(self, env: UUID, dryrun_result: executor.DryrunReport) -> None:
         await self.client.dryrun_update(
             tid=env,
@@ -18,11 +18,14 @@ Contact: code@inmanta.com
 
 import abc
 import asyncio
+import collections
 import contextlib
 import datetime
 import enum
 import itertools
 import logging
+import os
+import tempfile
 import typing
 import uuid
 from abc import abstractmethod
@@ -34,14 +37,24 @@ from typing import ClassVar, Optional, Self
 import asyncpg
 
 from inmanta import const, data, types
+from inmanta.agent import config as cfg
 from inmanta.agent import executor
-from inmanta.agent.code_manager import CodeManager
+from inmanta.agent.code_manager import CodeManager, CouldNotResolveCode
 from inmanta.const import HandlerResourceState
 from inmanta.data import Environment
 from inmanta.data.model import Discrepancy, SchedulerStatusReport
 from inmanta.deploy import timers, work
 from inmanta.deploy.persistence import ToDbUpdateManager
-from inmanta.deploy.state import AgentStatus, Blocked, Compliance, HandlerResult, ModelState, ResourceIntent, ResourceState
+from inmanta.deploy.state import (
+    AgentStatus,
+    Blocked,
+    Compliance,
+    HandlerResult,
+    ModelState,
+    ModelStateSnapshot,
+    ResourceIntent,
+    ResourceState,
+)
 from inmanta.deploy.tasks import Deploy, DryRun, RefreshFact, Task
 from inmanta.deploy.work import TaskPriority
 from inmanta.protocol import Client
@@ -155,7 +168,8 @@ class ModelVersion:
     modelled as empty sets.
 
     :param version: The version of the model
-    :param resources: Intent of all resources in this model. Scoped to the resources from `resource_sets` for a partial model.
+    :param resources: Intent of all resources in this model. For a partial model, scoped to the resources from `resource_sets`
+        whose intent changed since the previous version.
     :param resource_sets: All resource sets (in the model, or the diff with the previous version for a partial model), with the
         resources that belong to them.
     :param requires: The requires relation of all resources. Resources without requires may be absent.
@@ -189,6 +203,9 @@ class ModelVersion:
             for resource in set_resources:
                 resource_id = ResourceIdStr(resource["resource_id"])
                 sets[resource_set].add(resource_id)
+                if "attribute_hash" not in resource:
+                    # partial version: intent is unchanged since the previous version, only the membership is reported
+                    continue
                 resources[resource_id] = ResourceIntent(
                     resource_id=resource_id,
                     attribute_hash=resource["attribute_hash"],
@@ -377,17 +394,26 @@ class ResourceScheduler(TaskManager):
     The scheduler expects to be notified by the server whenever a new version is released.
     """
 
+    # Name of the model state snapshot file in the state dir
+    SNAPSHOT_FILE: ClassVar[str] = "model_state.snapshot"
+
     def __init__(
-        self, environment: uuid.UUID, executor_manager: executor.ExecutorManager[executor.Executor], client: Client
+        self,
+        environment: uuid.UUID,
+        executor_manager: executor.ExecutorManager[executor.Executor],
+        client: Client,
+        *,
+        state_dir: Optional[str] = None,
     ) -> None:
         """
         :param environment: the environment we work for
         :param executor_manager: the executor manager that will provide us with executors
         :param client: connection to the server
+        :param state_dir: directory to store the model state snapshots in. Snapshots are disabled if not set.
         :param _compliance_reporting_feature_enabled: True iff the compliance_reporting feature is enabled on the server.
         """
         # state and work may be reassigned during initialize
-        self._state: ModelState = ModelState(version=0)
+        self._state: ModelState = ModelState.create(0, compact=cfg.scheduler_compact_model_state.get())
         self._work: work.ScheduledWork = work.ScheduledWork(
             requires=self._state.requires.requires_view(),
             provides=self._state.requires.provides_view(),
@@ -434,6 +460,16 @@ class ResourceScheduler(TaskManager):
         self._deployment_suspended: bool = False
         self._compliance_reporting_feature_enabled: bool = False
 
+        # Latest version to pre-warm executors for and the task doing so, see _prewarm_executors()
+        self._prewarm_version: Optional[int] = None
+        self._prewarm_task: Optional[asyncio.Task[None]] = None
+
+        # Whether a new model version was processed since the last model state snapshot and the task writing the
+        # snapshots, see _write_snapshots()
+        self._state_dir: Optional[str] = state_dir
+        self._snapshot_requested: bool = False
+        self._snapshot_task: Optional[asyncio.Task[None]] = None
+
     async def _reset(self) -> None:
         """
         Clear out all state and start empty
@@ -468,6 +504,8 @@ class ResourceScheduler(TaskManager):
         if not self._running:
             return
         self._running = False
+        if self._snapshot_task is not None:
+            self._snapshot_task.cancel()
         await self._timer_manager.stop()
         # Ensure workers go down
         # First stop them
@@ -545,9 +583,13 @@ class ResourceScheduler(TaskManager):
             )
 
             # Check if we can restore the scheduler state from a previous run
-            restored_state: Optional[ModelState] = (
-                await ModelState.create_from_db(self.environment, connection=con) if not reset_deploy_progress else None
-            )
+            restored_state: Optional[ModelState] = None
+            if not reset_deploy_progress:
+                restored_state = await self._restore_from_snapshot(connection=con)
+                if restored_state is None:
+                    restored_state = await ModelState.create_from_db(
+                        self.environment, connection=con, compact=cfg.scheduler_compact_model_state.get()
+                    )
 
             if restored_state is not None:
                 LOGGER.debug("Scheduler initialization: restoring internal state")
@@ -726,6 +768,29 @@ class ResourceScheduler(TaskManager):
                 deploying=self._deploying_latest,
             )
 
+    async def deploy_resources(self, resources: Mapping[ResourceIdStr, tuple[str, TaskPriority]]) -> None:
+        """
+        Batched version of deploy_resource(), for the resources of which the timer fired at the same time.
+
+        :param resources: The resources to deploy, with the reason and priority for each of them.
+        """
+        by_reason: dict[tuple[str, TaskPriority], set[ResourceIdStr]] = collections.defaultdict(set)
+        async with self._scheduler_lock:
+            for resource, reason_priority in resources.items():
+                resource_state: Optional[ResourceState] = self._state.resource_state.get(resource)
+                if resource_state is None or resource_state.blocked is Blocked.BLOCKED:
+                    # Removed from the model or can't deploy
+                    continue
+                by_reason[reason_priority].add(resource)
+            for (reason, priority), to_deploy in by_reason.items():
+                self._timer_manager.stop_timers(to_deploy)
+                self._work.deploy_with_context(
+                    to_deploy,
+                    reason=reason,
+                    priority=priority,
+                    deploying=self._deploying_latest,
+                )
+
     async def _get_single_model_version_from_db(
         self,
         *,
@@ -773,6 +838,7 @@ class ResourceScheduler(TaskManager):
                     self.environment,
                     since=self._state.version,
                     projection=ResourceRecord.__required_keys__,
+                    skip_unchanged=True,
                     connection=connection,
                 )
             except data.PartialBaseMissing:
@@ -912,7 +978,12 @@ class ResourceScheduler(TaskManager):
                 partial = False
                 resource_sets = dict(model.resource_sets)
 
-            for resource in known_resources - model.resources.keys():
+            # resources in this model version, including those with unchanged intent, which are absent from a partial model's
+            # resources
+            model_resources: Set[ResourceIdStr] = (
+                set().union(*model.resource_sets.values()) if model.partial else model.resources.keys()
+            )
+            for resource in known_resources - model_resources:
                 with contextlib.suppress(KeyError):
                     del intent[resource]
                     del resource_requires[resource]
@@ -1247,6 +1318,117 @@ class ResourceScheduler(TaskManager):
                 self.environment, self._state.version, connection=con
             )
         LOGGER.debug("Finished writing changes for model version %d to the database", model.version)
+        self._request_prewarm(model.version)
+        self._request_snapshot()
+
+    def _request_prewarm(self, version: int) -> None:
+        """
+        Prepare the executors for the given version in the background, ahead of the first deploy. When this is requested
+        for multiple versions while a previous request is still being processed, only the latest version is considered.
+        """
+        if cfg.agent_executor_prewarm_budget.get() == 0:
+            return
+        self._prewarm_version = version
+        if self._prewarm_task is None or self._prewarm_task.done():
+            self._prewarm_task = asyncio.create_task(self._prewarm_executors())
+
+    async def _prewarm_executors(self) -> None:
+        while self._prewarm_version is not None:
+            version: int = self._prewarm_version
+            self._prewarm_version = None
+            try:
+                # Most shared blueprints first
+                agents_per_blueprint: collections.Counter[str] = collections.Counter()
+                blueprints: dict[str, executor.ExecutorBlueprint] = {}
+                for agent in list(self._workers.keys()):
+                    try:
+                        code = await self.code_manager.get_code(
+                            environment=self.environment, model_version=version, agent_name=agent
+                        )
+                    except CouldNotResolveCode:
+                        continue
+                    blueprint = executor.ExecutorBlueprint.from_specs(code)
+                    blueprints[blueprint.blueprint_hash()] = blueprint
+                    agents_per_blueprint[blueprint.blueprint_hash()] += 1
+                await self.executor_manager.prewarm(
+                    [blueprints[blueprint_hash] for blueprint_hash, _ in agents_per_blueprint.most_common()]
+                )
+            except Exception:
+                LOGGER.warning("Failed to pre-warm executors for model version %d", version, exc_info=True)
+
+    def _get_snapshot_path(self) -> Optional[str]:
+        if self._state_dir is None or cfg.scheduler_state_snapshot_interval.get() == 0:
+            return None
+        return os.path.join(self._state_dir, self.SNAPSHOT_FILE)
+
+    async def _restore_from_snapshot(self, *, connection: asyncpg.connection.Connection) -> Optional[ModelState]:
+        """
+        Restore the model state from the snapshot on disk. Returns None if there is no snapshot for the last processed model
+        version.
+        """
+        path: Optional[str] = self._get_snapshot_path()
+        if path is None or not os.path.exists(path):
+            return None
+
+        def load() -> Optional[ModelStateSnapshot]:
+            with open(path, "rb") as fh:
+                return ModelStateSnapshot.load(fh.read())
+
+        try:
+            snapshot: Optional[ModelStateSnapshot] = await asyncio.get_running_loop().run_in_executor(None, load)
+        except OSError:
+            LOGGER.warning("Failed to read the model state snapshot %s", path, exc_info=True)
+            return None
+        if snapshot is None:
+            LOGGER.info("Ignoring model state snapshot %s: unknown format", path)
+            return None
+        result: Optional[ModelState] = await ModelState.create_from_snapshot(
+            self.environment, snapshot, connection=connection, compact=cfg.scheduler_compact_model_state.get()
+        )
+        if result is None:
+            LOGGER.info("Ignoring model state snapshot %s: it doesn't match the last processed model version", path)
+        else:
+            LOGGER.debug("Restored the model state for version %d from snapshot %s", snapshot.version, path)
+        return result
+
+    def _request_snapshot(self) -> None:
+        """
+        Write a snapshot of the model state in the background, after the configured interval. When this is requested while
+        a previous request is still pending, a single snapshot is written for both.
+        """
+        if self._get_snapshot_path() is None:
+            return
+        self._snapshot_requested = True
+        if self._snapshot_task is None or self._snapshot_task.done():
+            self._snapshot_task = asyncio.create_task(self._write_snapshots())
+
+    async def _write_snapshots(self) -> None:
+        while self._snapshot_requested:
+            await asyncio.sleep(cfg.scheduler_state_snapshot_interval.get())
+            path: Optional[str] = self._get_snapshot_path()
+            if path is None or not self._running:
+                return
+            self._snapshot_requested = False
+            async with self._scheduler_lock:
+                snapshot: ModelStateSnapshot = self._state.snapshot(self.environment)
+
+            def write() -> None:
+                # Write to a temporary file first, so a crash never leaves a partially written snapshot behind
+                fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".")
+                try:
+                    with os.fdopen(fd, "wb") as fh:
+                        fh.write(snapshot.dump())
+                    os.replace(tmp_path, path)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, write)
+            except Exception:
+                LOGGER.warning("Failed to write the model state snapshot for version %d", snapshot.version, exc_info=True)
+            else:
+                LOGGER.debug("Wrote the model state snapshot for version %d to %s", snapshot.version, path)
 
     def _create_agent(self, agent: str) -> None:
         """Start processing for the given agent"""
@@ -1796,6 +1978,7 @@ class ResourceScheduler(TaskManager):
                         actual=str(self._state.version),
                     )
                 ],
+                executor_prewarm=self.executor_manager.get_prewarm_status(),
             )
 
         latest_version: int | None
@@ -1804,7 +1987,13 @@ class ResourceScheduler(TaskManager):
                 try:
                     latest_model: ModelVersion = await self._get_single_model_version_from_db(connection=connection)
                 except KeyError:
-                    return SchedulerStatusReport(scheduler_state={}, db_state={}, resource_states={}, discrepancies={})
+                    return SchedulerStatusReport(
+                        scheduler_state={},
+                        db_state={},
+                        resource_states={},
+                        discrepancies={},
+                        executor_prewarm=self.executor_manager.get_prewarm_status(),
+                    )
                 if latest_model.version != self._state.version:
                     return report_model_version_mismatch(latest_model.version)
 
@@ -1821,6 +2010,7 @@ class ResourceScheduler(TaskManager):
                 db_state=latest_model.resources,
                 resource_states=resource_states_in_db,
                 discrepancies=discrepancy_map,
+                executor_prewarm=self.executor_manager.get_prewarm_status(),
             )
 
     async def suspend_deployments(self, reason: str) -> None:
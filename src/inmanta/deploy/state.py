@@ -16,15 +16,17 @@ limitations under the License.
 Contact: code@inmanta.com
 """
 
+import array
 import contextlib
 import dataclasses
 import datetime
 import enum
 import itertools
+import pickle
 import typing
 import uuid
 from collections import defaultdict
-from collections.abc import Mapping, Set
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping, Sequence, Set
 from dataclasses import dataclass
 from enum import StrEnum
 from typing import Optional, Self, cast
@@ -256,6 +258,499 @@ class ResourceState:
                 raise Exception(f"Unable to deduce handler state: {self}")
 
 
+class ResourceIdTable:
+    """
+    Interning table that maps resource ids to dense integer indexes. Used by the compact model state representation to
+    store per-resource state in array-backed columns and the requires-provides relation as integer adjacency lists.
+
+    Indexes of released resource ids are reused for new resource ids.
+    """
+
+    def __init__(self) -> None:
+        self._indexes: dict[ResourceIdStr, int] = {}
+        self._ids: list[Optional[ResourceIdStr]] = []
+        self._free: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+    def __contains__(self, resource: object) -> bool:
+        return resource in self._indexes
+
+    def size(self) -> int:
+        """
+        Returns the number of allocated indexes, i.e. the minimal length of a column to hold a value for each index.
+        """
+        return len(self._ids)
+
+    def get(self, resource: ResourceIdStr) -> Optional[int]:
+        """
+        Returns the index for the given resource id, or None if it is not interned.
+        """
+        return self._indexes.get(resource)
+
+    def intern(self, resource: ResourceIdStr) -> int:
+        """
+        Returns the index for the given resource id, allocating one if it is not interned yet.
+        """
+        index: Optional[int] = self._indexes.get(resource)
+        if index is not None:
+            return index
+        if self._free:
+            index = self._free.pop()
+            self._ids[index] = resource
+        else:
+            index = len(self._ids)
+            self._ids.append(resource)
+        self._indexes[resource] = index
+        return index
+
+    def resource_id(self, index: int) -> ResourceIdStr:
+        """
+        Returns the resource id for the given index.
+        """
+        resource: Optional[ResourceIdStr] = self._ids[index]
+        if resource is None:
+            raise KeyError(index)
+        return resource
+
+    def release(self, resource: ResourceIdStr) -> None:
+        """
+        Release the index of the given resource id, so it can be reused. The caller is responsible for making sure the index
+        is no longer referenced.
+        """
+        index: Optional[int] = self._indexes.pop(resource, None)
+        if index is not None:
+            self._ids[index] = None
+            self._free.append(index)
+
+    def clear(self) -> None:
+        self._indexes.clear()
+        self._ids.clear()
+        self._free.clear()
+
+
+# Codes for the enum columns of CompactResourceStates
+_COMPLIANCE_VALUES: Sequence[Compliance] = list(Compliance)
+_COMPLIANCE_CODES: Mapping[Compliance, int] = {value: code for code, value in enumerate(_COMPLIANCE_VALUES)}
+_HANDLER_RESULT_VALUES: Sequence[HandlerResult] = list(HandlerResult)
+_HANDLER_RESULT_CODES: Mapping[HandlerResult, int] = {value: code for code, value in enumerate(_HANDLER_RESULT_VALUES)}
+_BLOCKED_VALUES: Sequence[Blocked] = list(Blocked)
+_BLOCKED_CODES: Mapping[Blocked, int] = {value: code for code, value in enumerate(_BLOCKED_VALUES)}
+# last_deployed is stored as microseconds since the epoch, this value represents None
+_NOT_DEPLOYED: int = -(2**63)
+_EPOCH: datetime.datetime = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class CompactResourceStates(MutableMapping[ResourceIdStr, ResourceState]):
+    """
+    Mapping from resource id to resource state that stores the state in array-backed columns, indexed by the resource's
+    index in a ResourceIdTable. This avoids the overhead of a ResourceState object per resource.
+
+    Items are returned as CompactResourceState objects: write-through views on the columns.
+    """
+
+    def __init__(self, ids: ResourceIdTable) -> None:
+        self._ids = ids
+        self._len = 0
+        self._present = bytearray()
+        self._compliance = array.array("b")
+        self._last_handler_run = array.array("b")
+        self._blocked = array.array("b")
+        # -1 for None
+        self._last_handler_run_compliant = array.array("b")
+        self._last_deployed = array.array("q")
+
+    def _grow(self, size: int) -> None:
+        missing: int = size - len(self._present)
+        if missing <= 0:
+            return
+        self._present.extend(bytes(missing))
+        for column in (self._compliance, self._last_handler_run, self._blocked, self._last_handler_run_compliant):
+            column.extend(itertools.repeat(0, missing))
+        self._last_deployed.extend(itertools.repeat(_NOT_DEPLOYED, missing))
+
+    def _index(self, resource: ResourceIdStr) -> int:
+        """
+        Returns the index of a resource that is present in this mapping. Raises KeyError otherwise.
+        """
+        index: Optional[int] = self._ids.get(resource)
+        if index is None or index >= len(self._present) or not self._present[index]:
+            raise KeyError(resource)
+        return index
+
+    def __getitem__(self, resource: ResourceIdStr) -> ResourceState:
+        self._index(resource)
+        return CompactResourceState(self, resource)
+
+    def __setitem__(self, resource: ResourceIdStr, state: ResourceState) -> None:
+        values: tuple[Compliance, HandlerResult, Blocked, datetime.datetime | None, bool | None] = (
+            state.compliance,
+            state.last_handler_run,
+            state.blocked,
+            state.last_deployed,
+            state.last_handler_run_compliant,
+        )
+        index: int = self._ids.intern(resource)
+        self._grow(self._ids.size())
+        if not self._present[index]:
+            self._present[index] = 1
+            self._len += 1
+        self._compliance[index] = _COMPLIANCE_CODES[values[0]]
+        self._last_handler_run[index] = _HANDLER_RESULT_CODES[values[1]]
+        self._blocked[index] = _BLOCKED_CODES[values[2]]
+        self._set_last_deployed(index, values[3])
+        self._set_last_handler_run_compliant(index, values[4])
+
+    def __delitem__(self, resource: ResourceIdStr) -> None:
+        index: int = self._index(resource)
+        self._present[index] = 0
+        self._len -= 1
+
+    def __contains__(self, resource: object) -> bool:
+        index: Optional[int] = self._ids.get(typing.cast(ResourceIdStr, resource))
+        return index is not None and index < len(self._present) and bool(self._present[index])
+
+    def __iter__(self) -> Iterator[ResourceIdStr]:
+        return (self._ids.resource_id(index) for index, present in enumerate(self._present) if present)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def clear(self) -> None:
+        self.__init__(self._ids)  # type: ignore[misc]
+
+    def _set_last_deployed(self, index: int, value: datetime.datetime | None) -> None:
+        self._last_deployed[index] = _NOT_DEPLOYED if value is None else (value - _EPOCH) // datetime.timedelta(microseconds=1)
+
+    def _set_last_handler_run_compliant(self, index: int, value: bool | None) -> None:
+        self._last_handler_run_compliant[index] = -1 if value is None else int(value)
+
+
+class CompactResourceState(ResourceState):
+    """
+    Write-through view on the state of a single resource in a CompactResourceStates mapping. Use copy() to get a detached
+    ResourceState object.
+    """
+
+    def __init__(self, states: CompactResourceStates, resource: ResourceIdStr) -> None:
+        # Deliberately don't call the dataclass constructor: the fields are properties backed by the columns
+        self._states = states
+        self._resource = resource
+
+    @property
+    def _column_index(self) -> int:
+        return self._states._index(self._resource)
+
+    @property  # type: ignore[override]
+    def compliance(self) -> Compliance:
+        return _COMPLIANCE_VALUES[self._states._compliance[self._column_index]]
+
+    @compliance.setter
+    def compliance(self, value: Compliance) -> None:
+        self._states._compliance[self._column_index] = _COMPLIANCE_CODES[value]
+
+    @property  # type: ignore[override]
+    def last_handler_run(self) -> HandlerResult:
+        return _HANDLER_RESULT_VALUES[self._states._last_handler_run[self._column_index]]
+
+    @last_handler_run.setter
+    def last_handler_run(self, value: HandlerResult) -> None:
+        self._states._last_handler_run[self._column_index] = _HANDLER_RESULT_CODES[value]
+
+    @property  # type: ignore[override]
+    def blocked(self) -> Blocked:
+        return _BLOCKED_VALUES[self._states._blocked[self._column_index]]
+
+    @blocked.setter
+    def blocked(self, value: Blocked) -> None:
+        self._states._blocked[self._column_index] = _BLOCKED_CODES[value]
+
+    @property  # type: ignore[override]
+    def last_deployed(self) -> datetime.datetime | None:
+        value: int = self._states._last_deployed[self._column_index]
+        return None if value == _NOT_DEPLOYED else _EPOCH + datetime.timedelta(microseconds=value)
+
+    @last_deployed.setter
+    def last_deployed(self, value: datetime.datetime | None) -> None:
+        self._states._set_last_deployed(self._column_index, value)
+
+    @property  # type: ignore[override]
+    def last_handler_run_compliant(self) -> bool | None:
+        value: int = self._states._last_handler_run_compliant[self._column_index]
+        return None if value == -1 else bool(value)
+
+    @last_handler_run_compliant.setter
+    def last_handler_run_compliant(self, value: bool | None) -> None:
+        self._states._set_last_handler_run_compliant(self._column_index, value)
+
+    def copy(self) -> ResourceState:  # type: ignore[override]
+        return ResourceState(**{field.name: getattr(self, field.name) for field in dataclasses.fields(ResourceState)})
+
+    def __copy__(self) -> ResourceState:
+        return self.copy()
+
+    def __deepcopy__(self, memo: dict[int, object]) -> ResourceState:
+        return self.copy()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ResourceState):
+            return NotImplemented
+        return all(getattr(self, field.name) == getattr(other, field.name) for field in dataclasses.fields(ResourceState))
+
+    def __repr__(self) -> str:
+        return repr(self.copy())
+
+
+class _CompactAdjacency:
+    """
+    One direction of a many-to-many relation between resource indexes, in compressed sparse row (CSR) format: the targets
+    of row i are targets[offsets[i]:offsets[i + 1]].
+
+    CSR arrays can not be updated in place, so rows that are modified are kept in an overlay of per-row arrays. The overlay
+    is merged back into the CSR arrays when it grows larger than half the number of rows, so the amortized cost of an update
+    remains proportional to the size of the row.
+    """
+
+    # Don't bother compacting small overlays
+    MIN_COMPACTION_SIZE: int = 1024
+
+    def __init__(self) -> None:
+        self._offsets: array.array[int] = array.array("Q", [0])
+        self._targets: array.array[int] = array.array("I")
+        self._overlay: dict[int, array.array[int]] = {}
+
+    def row(self, index: int) -> Sequence[int]:
+        overlay: Optional[array.array[int]] = self._overlay.get(index)
+        if overlay is not None:
+            return overlay
+        if index + 1 < len(self._offsets):
+            return self._targets[self._offsets[index] : self._offsets[index + 1]]
+        return ()
+
+    def set_row(self, index: int, targets: Iterable[int]) -> None:
+        self._maybe_compact()
+        self._overlay[index] = array.array("I", targets)
+
+    def add(self, index: int, target: int) -> None:
+        self._mutable_row(index).append(target)
+
+    def remove(self, index: int, target: int) -> None:
+        self._mutable_row(index).remove(target)
+
+    def _mutable_row(self, index: int) -> "array.array[int]":
+        overlay: Optional[array.array[int]] = self._overlay.get(index)
+        if overlay is None:
+            self._maybe_compact()
+            overlay = array.array("I", self.row(index))
+            self._overlay[index] = overlay
+        return overlay
+
+    def _maybe_compact(self) -> None:
+        if len(self._overlay) >= max(self.MIN_COMPACTION_SIZE, (len(self._offsets) - 1) // 2):
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Merge the overlay into the CSR arrays.
+        """
+        nb_rows: int = max(len(self._offsets) - 1, max(self._overlay, default=-1) + 1)
+        offsets: array.array[int] = array.array("Q", [0])
+        targets: array.array[int] = array.array("I")
+        for index in range(nb_rows):
+            targets.extend(self.row(index))
+            offsets.append(len(targets))
+        self._offsets = offsets
+        self._targets = targets
+        self._overlay.clear()
+
+    def clear(self) -> None:
+        self.__init__()  # type: ignore[misc]
+
+
+class _CompactRelationView(MutableMapping[ResourceIdStr, Set[ResourceIdStr]]):
+    """
+    Mapping view on one direction of a CompactRequiresProvidesMapping. Updates are applied to both directions.
+    A key is present iff it has at least one target.
+    """
+
+    def __init__(self, ids: ResourceIdTable, forward: _CompactAdjacency, backward: _CompactAdjacency) -> None:
+        self._ids = ids
+        self._forward = forward
+        self._backward = backward
+
+    def _row(self, resource: ResourceIdStr) -> Sequence[int]:
+        index: Optional[int] = self._ids.get(resource)
+        return () if index is None else self._forward.row(index)
+
+    def __getitem__(self, resource: ResourceIdStr) -> Set[ResourceIdStr]:
+        row: Sequence[int] = self._row(resource)
+        if not row:
+            raise KeyError(resource)
+        return frozenset(map(self._ids.resource_id, row))
+
+    def __setitem__(self, resource: ResourceIdStr, values: Set[ResourceIdStr]) -> None:
+        self._set(self._ids.intern(resource), {self._ids.intern(value) for value in values})
+
+    def __delitem__(self, resource: ResourceIdStr) -> None:
+        if not self._row(resource):
+            raise KeyError(resource)
+        self._set(self._ids.intern(resource), set())
+
+    def __contains__(self, resource: object) -> bool:
+        return bool(self._row(typing.cast(ResourceIdStr, resource)))
+
+    def __iter__(self) -> Iterator[ResourceIdStr]:
+        return (self._ids.resource_id(index) for index in range(self._ids.size()) if self._forward.row(index))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def _set(self, index: int, targets: set[int]) -> None:
+        current: Sequence[int] = self._forward.row(index)
+        current_set: set[int] = set(current)
+        if current_set == targets:
+            return
+        for target in targets - current_set:
+            self._backward.add(target, index)
+        for target in current_set - targets:
+            self._backward.remove(target, index)
+        self._forward.set_row(index, sorted(targets))
+
+
+class CompactRequiresProvidesMapping(RequiresProvidesMapping):
+    """
+    Compact RequiresProvidesMapping that stores both directions of the relation as CSR adjacency lists of resource indexes
+    from a ResourceIdTable.
+
+    Values are returned as frozen sets, created on access. Contrary to the default implementation, empty requires sets are
+    not distinguished from absent ones on the provides side.
+    """
+
+    def __init__(self, ids: ResourceIdTable) -> None:
+        # Deliberately don't call the super constructor: this class doesn't use its dicts
+        self._ids = ids
+        self._requires = _CompactAdjacency()
+        self._provides = _CompactAdjacency()
+        self._requires_view = _CompactRelationView(ids, self._requires, self._provides)
+        self._provides_view = _CompactRelationView(ids, self._provides, self._requires)
+        # Whether a resource has a requires entry, possibly empty
+        self._keys = bytearray()
+        self._len = 0
+
+    def _has_key(self, index: Optional[int]) -> bool:
+        return index is not None and index < len(self._keys) and bool(self._keys[index])
+
+    def __getitem__(self, resource: ResourceIdStr) -> Set[ResourceIdStr]:
+        if not self._has_key(self._ids.get(resource)):
+            raise KeyError(resource)
+        return self._requires_view.get(resource, frozenset())
+
+    def __setitem__(self, resource: ResourceIdStr, values: Set[ResourceIdStr]) -> None:
+        self._requires_view[resource] = values
+        index: int = self._ids.intern(resource)
+        if index >= len(self._keys):
+            self._keys.extend(bytes(self._ids.size() - len(self._keys)))
+        if not self._keys[index]:
+            self._keys[index] = 1
+            self._len += 1
+
+    def __delitem__(self, resource: ResourceIdStr) -> None:
+        index: Optional[int] = self._ids.get(resource)
+        if index is None or not self._has_key(index):
+            raise KeyError(resource)
+        self._requires_view[resource] = set()
+        self._keys[index] = 0
+        self._len -= 1
+
+    def __contains__(self, resource: object) -> bool:
+        return self._has_key(self._ids.get(typing.cast(ResourceIdStr, resource)))
+
+    def __iter__(self) -> Iterator[ResourceIdStr]:
+        return (self._ids.resource_id(index) for index, present in enumerate(self._keys) if present)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __repr__(self) -> str:
+        return f"CompactRequiresProvidesMapping(requires={dict(self)!r}, provides={dict(self._provides_view)!r})"
+
+    def __str__(self) -> str:
+        return str(dict(self))
+
+    def clear(self) -> None:
+        self._requires.clear()
+        self._provides.clear()
+        self._keys.clear()
+        self._len = 0
+
+    def reverse_mapping(self) -> "MutableMapping[ResourceIdStr, Set[ResourceIdStr]]":  # type: ignore[override]
+        return self._provides_view
+
+    def get_reverse(self, key: ResourceIdStr, default: Optional[Set[ResourceIdStr]] = None) -> Optional[Set[ResourceIdStr]]:
+        return self._provides_view.get(key, default)
+
+    def set_reverse(self, key: ResourceIdStr, values: Set[ResourceIdStr]) -> None:
+        self._provides_view[key] = values
+
+    def provides_view(self) -> Mapping[ResourceIdStr, Set[ResourceIdStr]]:
+        return self._provides_view
+
+
+# The resource_persistent_state columns required to restore the resource state
+PERSISTENT_STATE_PROJECTION: Sequence[typing.LiteralString] = (
+    "orphaned_after",
+    "is_undefined",
+    "current_intent_attribute_hash",
+    "last_deployed_attribute_hash",
+    "last_handler_run",
+    "last_handler_run_compliant",
+    "blocked",
+    "last_success",
+    "last_handler_run_at",
+    "last_produced_events",
+)
+# The resource attributes required to restore the resource state
+EVENT_ATTRIBUTES: Sequence[str] = (const.RESOURCE_ATTRIBUTE_SEND_EVENTS, const.RESOURCE_ATTRIBUTE_RECEIVE_EVENTS)
+
+
+@dataclass(frozen=True, kw_only=True)
+class ModelStateSnapshot:
+    """
+    Snapshot of the intent of a model state: the resources, their attributes, resource sets and requires for the version.
+    These only change when the scheduler processes a new version. The resource state changes on every deploy, it is
+    restored from the database when the snapshot is loaded, see ModelState.create_from_snapshot.
+
+    :param resources: The resource id, resource set, attribute hash, attributes and requires of each resource.
+    """
+
+    # Version of the serialization format. Snapshots in another format are ignored.
+    FORMAT_VERSION: typing.ClassVar[int] = 1
+
+    environment: uuid.UUID
+    version: int
+    resources: Sequence[tuple[ResourceIdStr, Optional[str], str, Mapping[str, object], Sequence[ResourceIdStr]]]
+
+    def dump(self) -> bytes:
+        # Serialize builtin types only, so the snapshot doesn't depend on the layout of this class
+        return pickle.dumps(
+            (self.FORMAT_VERSION, self.environment, self.version, self.resources), protocol=pickle.HIGHEST_PROTOCOL
+        )
+
+    @classmethod
+    def load(cls, content: bytes) -> Optional["ModelStateSnapshot"]:
+        """
+        Load a snapshot serialized with dump(). Returns None if the content is not a snapshot in the current format.
+        """
+        try:
+            format_version, environment, version, resources = pickle.loads(content)
+        except Exception:
+            return None
+        if format_version != cls.FORMAT_VERSION:
+            return None
+        return cls(environment=environment, version=version, resources=resources)
+
+
 @dataclass(kw_only=True)
 class ModelState:
     """
@@ -274,10 +769,32 @@ class ModelState:
     dirty: set["ResourceIdStr"] = dataclasses.field(default_factory=set)
     # group resources by agent to allow efficient triggering of a deploy for a single agent
     resources_by_agent: dict[str, set["ResourceIdStr"]] = dataclasses.field(default_factory=lambda: defaultdict(set))
+    # interning table shared by the requires and resource_state mappings when the compact representation is used
+    resource_ids: Optional[ResourceIdTable] = None
+
+    @classmethod
+    def create(cls, version: int, *, compact: bool = False) -> "ModelState":
+        """
+        Create a new, empty, model state.
+
+        :param version: The model version.
+        :param compact: Store the requires-provides relation and the resource state in a compact representation, indexed by
+            interned resource ids, rather than in per-resource objects. This considerably reduces the memory footprint for
+            large models, at the cost of slightly slower access.
+        """
+        if not compact:
+            return cls(version=version)
+        ids: ResourceIdTable = ResourceIdTable()
+        return cls(
+            version=version,
+            requires=CompactRequiresProvidesMapping(ids),
+            resource_state=CompactResourceStates(ids),
+            resource_ids=ids,
+        )
 
     @classmethod
     async def create_from_db(
-        cls, environment: uuid.UUID, *, connection: asyncpg.connection.Connection
+        cls, environment: uuid.UUID, *, connection: asyncpg.connection.Connection, compact: bool = False
     ) -> Optional["ModelState"]:
         """
         Create a new instance of the ModelState object, by restoring the model state from the database.
@@ -285,6 +802,7 @@ class ModelState:
         versions in the past or its last seen version has been cleaned up).
 
         :param environment: The environment the model state belongs to.
+        :param compact: Use the compact representation, see `create`.
         """
         from inmanta import data, resources
 
@@ -294,24 +812,12 @@ class ModelState:
         if last_processed_model_version is None:
             return None
 
-        result = ModelState(version=last_processed_model_version)
         model: Optional[tuple[int, inmanta.types.ResourceSets[dict[str, object]]]] = (
             await data.Resource.get_resources_for_version_raw(
                 environment=environment,
                 version=last_processed_model_version,
                 projection=("resource_id", "attributes", "attribute_hash"),
-                projection_persistent=(
-                    "orphaned_after",
-                    "is_undefined",
-                    "current_intent_attribute_hash",
-                    "last_deployed_attribute_hash",
-                    "last_handler_run",
-                    "last_handler_run_compliant",
-                    "blocked",
-                    "last_success",
-                    "last_handler_run_at",
-                    "last_produced_events",
-                ),
+                projection_persistent=PERSISTENT_STATE_PROJECTION,
                 project_attributes=(
                     "requires",
                     const.RESOURCE_ATTRIBUTE_SEND_EVENTS,
@@ -324,15 +830,80 @@ class ModelState:
             # the version does not exist at all (anymore)
             return None
 
-        # build intermediate lookup collection
-        type ResourceSetStr = Optional[str]
-        by_resource_id: Mapping[ResourceIdStr, tuple[ResourceSetStr, Mapping[str, object]]] = {
-            ResourceIdStr(cast(str, r["resource_id"])): (rs, r)
-            for rs, resource_records in model[1].items()
-            for r in resource_records
-        }
+        return cls._create_from_records(
+            last_processed_model_version,
+            {
+                ResourceIdStr(cast(str, r["resource_id"])): (
+                    rs,
+                    r,
+                    {resources.Id.parse_id(req).resource_str() for req in cast(list[str], r["requires"])},
+                )
+                for rs, resource_records in model[1].items()
+                for r in resource_records
+            },
+            compact=compact,
+        )
+
+    @classmethod
+    async def create_from_snapshot(
+        cls,
+        environment: uuid.UUID,
+        snapshot: "ModelStateSnapshot",
+        *,
+        connection: asyncpg.connection.Connection,
+        compact: bool = False,
+    ) -> Optional["ModelState"]:
+        """
+        Create a new instance of the ModelState object from a snapshot of its intent, restoring the resource state from the
+        database. This avoids reading the resources of the model version from the database. Returns None iff the snapshot
+        is not for the last version processed by the scheduler, in which case create_from_db should be used instead.
+
+        :param environment: The environment the model state belongs to.
+        :param snapshot: The snapshot to restore.
+        :param compact: Use the compact representation, see `create`.
+        """
+        from inmanta import data
+
+        if snapshot.environment != environment:
+            return None
+        scheduler: Optional[data.Scheduler] = await data.Scheduler.get_one(environment=environment, connection=connection)
+        assert scheduler is not None
+        if scheduler.last_processed_model_version != snapshot.version:
+            return None
 
-        for resource_id, (resource_set, res) in by_resource_id.items():
+        persistent_state: Mapping[ResourceIdStr, dict[str, object]] = await data.ResourcePersistentState.get_managed_raw(
+            environment, projection=PERSISTENT_STATE_PROJECTION, connection=connection
+        )
+        records: dict[ResourceIdStr, tuple[Optional[str], Mapping[str, object], Set[ResourceIdStr]]] = {}
+        for resource_id, resource_set, attribute_hash, attributes, requires in snapshot.resources:
+            res: Optional[dict[str, object]] = persistent_state.get(resource_id)
+            if res is None:
+                # the database doesn't match the snapshot
+                return None
+            # mirror the attribute projection of create_from_db
+            res.update((key, attributes.get(key)) for key in EVENT_ATTRIBUTES)
+            res["attributes"] = attributes
+            res["attribute_hash"] = attribute_hash
+            records[resource_id] = (resource_set, res, frozenset(requires))
+        return cls._create_from_records(snapshot.version, records, compact=compact)
+
+    @classmethod
+    def _create_from_records(
+        cls,
+        version: int,
+        by_resource_id: Mapping[ResourceIdStr, tuple[Optional[str], Mapping[str, object], Set[ResourceIdStr]]],
+        *,
+        compact: bool,
+    ) -> "ModelState":
+        """
+        Create a new instance of the ModelState object from the resources in the given version.
+
+        :param by_resource_id: The resource set, the resource record and the requires for each resource id. The resource
+            record contains the resource's attributes, attribute_hash, event attributes and the PERSISTENT_STATE_PROJECTION
+            columns.
+        """
+        result = ModelState.create(version, compact=compact)
+        for resource_id, (resource_set, res, requires) in by_resource_id.items():
             # Populate state
 
             compliance_status: Compliance
@@ -346,7 +917,7 @@ class ModelState:
                 # (scheduler is only writer)
                 compliance_status = Compliance.UNDEFINED
             elif (
-                HandlerResult[res["last_handler_run"]] is HandlerResult.NEW
+                HandlerResult[cast(str, res["last_handler_run"])] is HandlerResult.NEW
                 or res["last_deployed_attribute_hash"] is None
                 or res["current_intent_attribute_hash"] != res["last_deployed_attribute_hash"]
             ):
@@ -358,18 +929,18 @@ class ModelState:
 
             resource_state = ResourceState(
                 compliance=compliance_status,
-                last_handler_run=HandlerResult[res["last_handler_run"]],
-                blocked=Blocked[res["blocked"]],
+                last_handler_run=HandlerResult[cast(str, res["last_handler_run"])],
+                blocked=Blocked[cast(str, res["blocked"])],
                 last_deployed=last_deployed,
-                last_handler_run_compliant=res["last_handler_run_compliant"],
+                last_handler_run_compliant=cast(Optional[bool], res["last_handler_run_compliant"]),
             )
             result.resource_state[resource_id] = resource_state
 
             # Populate resources intent
             resource_intent = ResourceIntent(
                 resource_id=resource_id,
-                attribute_hash=res["attribute_hash"],
-                attributes=res["attributes"],
+                attribute_hash=cast(str, res["attribute_hash"]),
+                attributes=cast(Mapping[str, object], res["attributes"]),
             )
             result.intent[resource_id] = resource_intent
 
@@ -380,7 +951,6 @@ class ModelState:
             result.resources_by_agent[resource_intent.id.agent_name].add(resource_id)
 
             # Populate requires
-            requires = {resources.Id.parse_id(req).resource_str() for req in res["requires"]}
             result.requires[resource_id] = requires
 
             # Check whether resource is dirty
@@ -390,11 +960,11 @@ class ModelState:
                     result.dirty.add(resource_intent.id.resource_str())
                 elif res.get(const.RESOURCE_ATTRIBUTE_RECEIVE_EVENTS, True):
                     # Check whether the resource should be deployed because of an outstanding event.
-                    last_success = res["last_success"] or const.DATETIME_MIN_UTC
+                    last_success = cast(Optional[datetime.datetime], res["last_success"]) or const.DATETIME_MIN_UTC
                     for req in requires:
-                        _, req_res = by_resource_id[req]
+                        _, req_res, _ = by_resource_id[req]
                         assert req_res is not None
-                        last_produced_events = req_res["last_produced_events"]
+                        last_produced_events = cast(Optional[datetime.datetime], req_res["last_produced_events"])
                         if (
                             last_produced_events is not None
                             and last_produced_events > last_success
@@ -404,6 +974,31 @@ class ModelState:
                             break
         return result
 
+    def snapshot(self, environment: uuid.UUID) -> "ModelStateSnapshot":
+        """
+        Take a snapshot of the intent of this model state. Must be called while the model state can't be updated, the
+        snapshot itself doesn't share any mutable objects with this model state.
+
+        :param environment: The environment the model state belongs to.
+        """
+        resource_sets: dict[ResourceIdStr, Optional[str]] = {
+            resource: resource_set for resource_set, members in self.resource_sets.items() for resource in members
+        }
+        return ModelStateSnapshot(
+            environment=environment,
+            version=self.version,
+            resources=[
+                (
+                    resource,
+                    resource_sets.get(resource),
+                    intent.attribute_hash,
+                    intent.attributes,
+                    tuple(self.requires.get(resource, ())),
+                )
+                for resource, intent in self.intent.items()
+            ],
+        )
+
     def reset(self) -> None:
         self.version = 0
         self.intent.clear()
@@ -411,6 +1006,8 @@ class ModelState:
         self.resource_state.clear()
         self.resources_by_agent.clear()
         self.dirty = set()
+        if self.resource_ids is not None:
+            self.resource_ids.clear()
 
     def update_resource(
         self,
@@ -517,6 +1114,9 @@ class ModelState:
         if not self.resources_by_agent[resource_intent.id.agent_name]:
             del self.resources_by_agent[resource_intent.id.agent_name]
         self.dirty.discard(resource)
+        if self.resource_ids is not None:
+            # no longer referenced by the requires or the resource state
+            self.resource_ids.release(resource)
 
     def should_skip_for_dependencies(self, resource: "ResourceIdStr") -> bool:
         """
@@ -18,14 +18,18 @@ Contact: code@inmanta.com
 
 import asyncio
 import contextlib
+import heapq
 import logging
+import math
 import time
 import typing
+import zlib
 from collections.abc import Collection
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 
 from inmanta import data, util
+from inmanta.agent import config as cfg
 from inmanta.deploy.state import Blocked, Compliance, ResourceState
 from inmanta.deploy.work import TaskPriority
 from inmanta.types import ResourceIdStr
@@ -124,6 +128,178 @@ class ResourceTimer:
             await self.trigger_deploy
 
 
+class TimingWheel:
+    """
+    Fires the timers of many resources with a single event loop timer. Timers are grouped in buckets of `tick` seconds,
+    and all timers in the buckets that are due are handed to the scheduler as a single batch. A timer fires at most one
+    tick after the time it was set for.
+
+    The buckets are kept in a dict, with a heap of bucket ids to find the next bucket that is due, so adding and
+    cancelling a timer is cheap regardless of how far in the future it is set.
+    """
+
+    # Resolution of the timers, in seconds
+    DEFAULT_TICK: float = 1.0
+
+    def __init__(self, scheduler: "ResourceScheduler", tick: float = DEFAULT_TICK) -> None:
+        """
+        :param scheduler: The scheduler to hand the due resources to.
+        :param tick: The width of a bucket, in seconds.
+        """
+        self.tick = tick
+        self._resource_scheduler = scheduler
+
+        self._buckets: dict[int, dict[ResourceIdStr, "WheelResourceTimer"]] = {}
+        # Ids of the buckets, buckets that are emptied are dropped lazily
+        self._bucket_heap: list[int] = []
+        # Single event loop timer for the first bucket that is due
+        self._handle: asyncio.TimerHandle | None = None
+        self._handle_bucket: int | None = None
+        # Tasks handing batches to the scheduler
+        self._fire_tasks: set[asyncio.Task[None]] = set()
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._buckets.values())
+
+    def add(self, timer: "WheelResourceTimer") -> None:
+        """
+        Add a timer to the bucket for its next_scheduled_time
+        """
+        assert timer.next_scheduled_time is not None
+        self.remove(timer)
+        bucket_id = math.ceil(timer.next_scheduled_time.timestamp() / self.tick)
+        bucket = self._buckets.get(bucket_id)
+        if bucket is None:
+            bucket = {}
+            self._buckets[bucket_id] = bucket
+            heapq.heappush(self._bucket_heap, bucket_id)
+        bucket[timer.resource] = timer
+        timer.bucket = bucket_id
+        if self._handle_bucket is None or bucket_id < self._handle_bucket:
+            self._schedule_next()
+
+    def remove(self, timer: "WheelResourceTimer") -> None:
+        """
+        Remove a timer from its bucket, if it is in one
+        """
+        if timer.bucket is None:
+            return
+        bucket = self._buckets.get(timer.bucket)
+        if bucket is not None and bucket.get(timer.resource) is timer:
+            del bucket[timer.resource]
+            if not bucket:
+                del self._buckets[timer.bucket]
+        timer.bucket = None
+
+    def _schedule_next(self) -> None:
+        """
+        Set the event loop timer for the first bucket that is due
+        """
+        while self._bucket_heap and self._bucket_heap[0] not in self._buckets:
+            heapq.heappop(self._bucket_heap)
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+            self._handle_bucket = None
+        if not self._bucket_heap:
+            return
+        loop = asyncio.get_running_loop()
+        self._handle_bucket = self._bucket_heap[0]
+        # convert time to ioloop mono time
+        time_delta = loop.time() - time.time()
+        # If the call_at timestamp is located in the past, self._fire will be called immediately.
+        self._handle = loop.call_at(self._handle_bucket * self.tick + time_delta, self._fire)
+
+    def _fire(self) -> None:
+        """
+        Hand all timers in the buckets that are due to the scheduler
+        """
+        self._handle = None
+        self._handle_bucket = None
+        # Allow for a small difference between the event loop clock and the wall clock
+        due_until = math.floor((time.time() + 0.001) / self.tick)
+        batch: dict[ResourceIdStr, tuple[str, TaskPriority]] = {}
+        while self._bucket_heap and self._bucket_heap[0] <= due_until:
+            bucket = self._buckets.pop(heapq.heappop(self._bucket_heap), None)
+            if bucket is None:
+                continue
+            for timer in bucket.values():
+                assert timer.reason is not None
+                assert timer.priority is not None
+                batch[timer.resource] = (timer.reason, timer.priority)
+                timer.bucket = None
+                timer.next_scheduled_time = None
+        if batch:
+            task = asyncio.create_task(self._resource_scheduler.deploy_resources(batch))
+            self._fire_tasks.add(task)
+            task.add_done_callback(self._fire_tasks.discard)
+        self._schedule_next()
+
+    def stop(self) -> None:
+        """
+        Stop firing timers
+        """
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle = None
+        self._handle_bucket = None
+
+    def clear(self) -> None:
+        """
+        Stop firing timers and drop all of them
+        """
+        self.stop()
+        for bucket in self._buckets.values():
+            for timer in bucket.values():
+                timer.bucket = None
+                timer.next_scheduled_time = None
+        self._buckets = {}
+        self._bucket_heap = []
+
+    async def join(self) -> None:
+        """
+        Wait for the batches that were handed to the scheduler
+        """
+        await asyncio.gather(*self._fire_tasks)
+
+
+class WheelResourceTimer(ResourceTimer):
+    """
+    Timer for a single resource that is fired by a TimingWheel shared by all resources, instead of by its own event loop
+    timer.
+    """
+
+    def __init__(self, resource: ResourceIdStr, wheel: TimingWheel) -> None:
+        super().__init__(resource, wheel._resource_scheduler)
+        self._wheel = wheel
+        # The bucket of the wheel this timer is in
+        self.bucket: int | None = None
+
+    def set_timer(
+        self,
+        when: datetime,
+        reason: str,
+        priority: TaskPriority,
+    ) -> None:
+        self.reason = reason
+        self.priority = priority
+
+        if self.next_scheduled_time == when:
+            # already good
+            return
+
+        self.next_scheduled_time = when
+        self._wheel.add(self)
+
+    def cancel(self) -> None:
+        self._wheel.remove(self)
+        self.next_scheduled_time = None
+
+    async def join(self) -> None:
+        # The deploy is triggered by the wheel
+        pass
+
+
 class TimerManager:
     """
     This class manages the deploy and repair timers for resources. Two types of timers can be used for each
@@ -143,6 +319,10 @@ class TimerManager:
     acquiring these locks to the ResourceScheduler by calling into the scheduler's reload_all_timers()
     method.
 
+    The per-resource timers are fired by a single TimingWheel, which hands the resources that are due to the scheduler
+    in batches. To spread the load, the per-resource timers can be set up to a fraction of the interval earlier,
+    depending on the resource, see :inmanta.config:option:`scheduler.timer-jitter`.
+
     The initialize() method of this class has to be called for all timers to be configured correctly.
     However, this class supports starting, stopping and updating timers while the initialize() method
     was not yet called. The initialize() method has to be called after the scheduler has been initialized
@@ -169,8 +349,12 @@ class TimerManager:
 
         self._cron_scheduler = util.Scheduler("Resource scheduler")
 
+        self._wheel = TimingWheel(resource_scheduler)
+        self.jitter: float = min(max(cfg.scheduler_timer_jitter.get(), 0.0), 1.0)
+
     async def reset(self) -> None:
         await self.stop()
+        self._wheel.clear()
 
         self._cron_scheduler = util.Scheduler("Resource scheduler")
         self.global_periodic_repair_task = None
@@ -182,11 +366,12 @@ class TimerManager:
     async def stop(self) -> None:
         for timer in self.resource_timers.values():
             timer.cancel()
+        self._wheel.stop()
 
         await self._cron_scheduler.stop()
 
     async def join(self) -> None:
-        await asyncio.gather(*[timer.join() for timer in self.resource_timers.values()])
+        await asyncio.gather(*[timer.join() for timer in self.resource_timers.values()], self._wheel.join())
 
     async def initialize(self) -> None:
         """
@@ -367,14 +552,14 @@ class TimerManager:
 
         def _setup_repair(repair_interval: int) -> None:
             self.resource_timers[resource].set_timer(
-                when=(last_deployed + timedelta(seconds=repair_interval)),
+                when=(last_deployed + timedelta(seconds=repair_interval) - self._get_jitter(resource, repair_interval)),
                 reason=f"previous repair happened more than {repair_interval}s ago",
                 priority=(TaskPriority.INTERVAL_REPAIR),
             )
 
         def _setup_deploy(deploy_interval: int) -> None:
             self.resource_timers[resource].set_timer(
-                when=(last_deployed + timedelta(seconds=deploy_interval)),
+                when=(last_deployed + timedelta(seconds=deploy_interval) - self._get_jitter(resource, deploy_interval)),
                 reason=f"previous deploy happened more than {deploy_interval}s ago",
                 priority=(TaskPriority.INTERVAL_DEPLOY),
             )
@@ -403,9 +588,20 @@ class TimerManager:
                 assert self.periodic_deploy_interval is not None  # mypy
                 _setup_deploy(self.periodic_deploy_interval)
 
+    def _get_jitter(self, resource: ResourceIdStr, interval: int) -> timedelta:
+        """
+        Returns how much earlier than the interval the timer for the given resource is set. The jitter is derived from the
+        resource id, so it is stable for a resource and spread evenly over the resources. Timers are only set earlier, so
+        the interval remains the lowest frequency of the deploys.
+        """
+        if not self.jitter:
+            return timedelta()
+        fraction = zlib.crc32(resource.encode()) / 2**32
+        return timedelta(seconds=fraction * self.jitter * interval)
+
     def _make_resource_timer(self, resource: ResourceIdStr) -> ResourceTimer:
         """Factory method for testing"""
-        return ResourceTimer(resource, self._resource_scheduler)
+        return WheelResourceTimer(resource, self._wheel)
 
     def update_timers(self, resources: Collection[ResourceIdStr]) -> None:
         """
@@ -438,6 +438,7 @@ class Pip(PipCommandBuilder):
         upgrade_strategy: PipUpgradeStrategy = PipUpgradeStrategy.ONLY_IF_NEEDED,
         constraints_files: Optional[list[str]] = None,
         paths: Optional[list[LocalPackagePath]] = None,
+        cache_dir: Optional[str] = None,
     ) -> None:
         """
         Perform a pip install according to the given config
@@ -453,6 +454,7 @@ class Pip(PipCommandBuilder):
 
         :param upgrade: make pip do an upgrade
         :param upgrade_strategy: what upgrade strategy to use
+        :param cache_dir: the directory pip uses to cache downloaded and built wheels
         """
 
         cmd, constraints_files_clean, requirements_files_clean, sub_env = cls._prepare_pip_install_command(
@@ -464,6 +466,7 @@ class Pip(PipCommandBuilder):
             upgrade_strategy,
             constraints_files,
             paths,
+            cache_dir,
         )
         await cls.async_run_pip(cmd, sub_env, constraints_files_clean, requirements_files_clean)
 
@@ -517,6 +520,7 @@ class Pip(PipCommandBuilder):
         upgrade_strategy: PipUpgradeStrategy = PipUpgradeStrategy.ONLY_IF_NEEDED,
         constraints_files: Optional[list[str]] = None,
         paths: Optional[list[LocalPackagePath]] = None,
+        cache_dir: Optional[str] = None,
     ) -> Tuple[list[str], list[str], list[str], dict[str, str]]:
         # What
         requirements = requirements if requirements is not None else []
@@ -556,6 +560,9 @@ class Pip(PipCommandBuilder):
         ]
         # ISOLATION!
         sub_env = config.get_environment_variables()
+        if cache_dir is not None:
+            # Share the wheel cache between installs, independent of the pip configuration files that may be ignored
+            sub_env["PIP_CACHE_DIR"] = cache_dir
         return cmd, clean_constraints_files, clean_requirements_files, sub_env
 
     @classmethod
@@ -968,6 +975,7 @@ import sys
         constraint_files: Optional[list[str]] = None,
         upgrade_strategy: PipUpgradeStrategy = PipUpgradeStrategy.ONLY_IF_NEEDED,
         paths: list[LocalPackagePath] = [],
+        cache_dir: Optional[str] = None,
     ) -> None:
         """
         Perform a pip install in this environment, according to the given config
@@ -978,6 +986,7 @@ import sys
         :param constraint_files: pass along the following constraint files
         :param upgrade_strategy: what upgrade strategy to use
         :param paths: which paths to install
+        :param cache_dir: the directory pip uses to cache downloaded and built wheels. The default pip cache is used when None.
 
         limitation:
          - When upgrade is false, if requirements are already installed constraints from constraint files may not be verified.
@@ -995,6 +1004,7 @@ import sys
             upgrade=upgrade,
             upgrade_strategy=upgrade_strategy,
             paths=paths,
+            cache_dir=cache_dir,
         )
 
     def install_from_index(
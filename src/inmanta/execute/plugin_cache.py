@@ -0,0 +1,270 @@
+"""
+Copyright 2026 Inmanta
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Contact: code@inmanta.com
+"""
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections import abc
+from typing import TYPE_CHECKING, Optional
+
+from inmanta import __version__ as inmanta_version
+from inmanta.const import LogLevel
+from inmanta.execute.proxy import DictProxy, SequenceProxy
+from inmanta.execute.util import NoneValue
+
+if TYPE_CHECKING:
+    from inmanta.plugins import Plugin
+
+LOGGER = logging.getLogger(__name__)
+
+
+class _Uncacheable(Exception):
+    """
+    Raised when a value can not be part of a cache key or a cache entry
+    """
+
+
+def _get_key(value: object) -> object:
+    """
+    Convert a plugin argument, or an element nested in it, to a JSON serializable cache key. The type is part of the key,
+    so that e.g. 1, 1.0 and True are not mixed up.
+
+    :raises _Uncacheable: The value contains an entity, an unknown, a reference or another value that is not plain data.
+    """
+    if value is None or isinstance(value, NoneValue):
+        return None
+    if isinstance(value, (str, bool, int, float)):
+        return [type(value).__name__, value]
+    if isinstance(value, (SequenceProxy, DictProxy)):
+        return _get_key(value._get_instance())
+    if isinstance(value, (list, tuple)):
+        return [type(value).__name__, [_get_key(item) for item in value]]
+    if isinstance(value, dict):
+        if not all(isinstance(key, str) for key in value):
+            raise _Uncacheable()
+        return ["dict", [[key, _get_key(item)] for key, item in value.items()]]
+    raise _Uncacheable()
+
+
+def _is_plain(value: object) -> bool:
+    """
+    Returns True iff the given plugin result only consists of plain data, which can be returned more than once and can be
+    stored on disk as JSON without changing its type.
+    """
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return True
+    if isinstance(value, list):
+        return all(_is_plain(item) for item in value)
+    if isinstance(value, dict):
+        return all(isinstance(key, str) and _is_plain(item) for key, item in value.items())
+    return False
+
+
+@dataclasses.dataclass
+class PluginCacheStats:
+    hits: int = 0
+    misses: int = 0
+    # Calls that could not use the cache because of their arguments or their result
+    bypassed: int = 0
+
+
+@dataclasses.dataclass
+class _PluginCacheTable:
+    """
+    The cached results of a single version of a plugin
+    """
+
+    source_hash: str
+    entries: dict[str, object] = dataclasses.field(default_factory=dict)
+    # Whether entries were added since this table was last written to disk
+    dirty: bool = False
+
+
+class PluginCache:
+    """
+    Memoizes the results of plugins that are registered as cacheable, see :func:`inmanta.plugins.plugin`.
+
+    Results are keyed on the validated argument values and kept in memory for the lifetime of the process, so they are
+    reused within a compile and by later compiles in the same process. When :inmanta.config:option:`compiler.plugin_cache_dir`
+    is set, the results are also stored on disk at the end of each compile, to be reused by later compiles.
+
+    The results of a plugin are invalidated when the source file that defines it changes, or when the compiler is upgraded.
+    Calls that receive entities, unknowns, references or a context, and calls that return anything other than plain data,
+    bypass the cache.
+    """
+
+    def __init__(self) -> None:
+        self.tables: dict[str, _PluginCacheTable] = {}
+        self.stats: dict[str, PluginCacheStats] = {}
+        # The hash of each plugin source file, for the ongoing compile
+        self._source_hashes: dict[str, Optional[str]] = {}
+
+    def _get_source_hash(self, plugin: "Plugin") -> Optional[str]:
+        """
+        Returns the hash of the source file the plugin is defined in, or None if it can not be read.
+        """
+        filename: str = plugin.location.file
+        if filename not in self._source_hashes:
+            try:
+                with open(filename, "rb") as fh:
+                    content = fh.read()
+            except OSError:
+                self._source_hashes[filename] = None
+            else:
+                key = hashlib.sha256()
+                key.update(inmanta_version.encode())
+                key.update(b"\0")
+                key.update(content)
+                self._source_hashes[filename] = key.hexdigest()
+        return self._source_hashes[filename]
+
+    def _get_file_name(self, name: str, source_hash: str) -> Optional[str]:
+        # import loop, ....
+        from inmanta.compiler.config import plugin_cache_dir
+
+        cache_dir: Optional[str] = plugin_cache_dir.get()
+        if not cache_dir:
+            return None
+        key = hashlib.sha256(f"{name}\0{source_hash}".encode()).hexdigest()
+        return os.path.join(cache_dir, key[:2], f"{key}.json")
+
+    def _get_table(self, name: str, source_hash: str) -> _PluginCacheTable:
+        table: Optional[_PluginCacheTable] = self.tables.get(name)
+        if table is not None and table.source_hash == source_hash:
+            return table
+        # A new version of this plugin, drop the results of the previous one
+        table = _PluginCacheTable(source_hash)
+        file_name: Optional[str] = self._get_file_name(name, source_hash)
+        if file_name is not None:
+            try:
+                with open(file_name, "r", encoding="utf-8") as fh:
+                    entries: object = json.load(fh)
+                if not isinstance(entries, dict):
+                    raise ValueError(f"Expected a JSON object in {file_name}")
+                table.entries = entries
+            except FileNotFoundError:
+                pass
+            except Exception:
+                LOGGER.warning(
+                    "Plugin cache loading failure, ignoring cache entry for plugin %s",
+                    name,
+                    exc_info=LOGGER.isEnabledFor(LogLevel.DEBUG.to_int),
+                )
+        self.tables[name] = table
+        return table
+
+    def call(self, plugin: "Plugin", args: abc.Sequence[object], kwargs: abc.Mapping[str, object]) -> object:
+        """
+        Call the given plugin with the given, validated, arguments, or return the cached result of an earlier call with the
+        same arguments.
+        """
+        # import loop, ....
+        from inmanta.compiler.config import plugin_cache_enabled
+
+        name: str = plugin.get_full_name()
+        stats: PluginCacheStats = self.stats.setdefault(name, PluginCacheStats())
+        source_hash: Optional[str] = self._get_source_hash(plugin) if plugin_cache_enabled.get() else None
+        if source_hash is None:
+            stats.bypassed += 1
+            return plugin.call(*args, **kwargs)
+
+        try:
+            key: str = json.dumps([_get_key(args), _get_key(kwargs)])
+        except _Uncacheable:
+            stats.bypassed += 1
+            return plugin.call(*args, **kwargs)
+
+        table: _PluginCacheTable = self._get_table(name, source_hash)
+        try:
+            result: object = table.entries[key]
+        except KeyError:
+            pass
+        else:
+            stats.hits += 1
+            return result
+
+        result = plugin.call(*args, **kwargs)
+        if _is_plain(result):
+            stats.misses += 1
+            table.entries[key] = result
+            table.dirty = True
+        else:
+            stats.bypassed += 1
+        return result
+
+    def _write_table(self, name: str, table: _PluginCacheTable) -> None:
+        file_name: Optional[str] = self._get_file_name(name, table.source_hash)
+        if file_name is None:
+            return
+        try:
+            cache_folder = os.path.dirname(file_name)
+            # The entries are only meant for the user running the compiler
+            os.makedirs(os.path.dirname(cache_folder), mode=0o700, exist_ok=True)
+            os.makedirs(cache_folder, mode=0o700, exist_ok=True)
+            # The cache may be shared by concurrent compiles: write to a temporary file first, so other compiles never
+            # observe a partially written entry
+            fd, tmp_path = tempfile.mkstemp(dir=cache_folder, prefix=".")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    json.dump(table.entries, fh)
+                os.replace(tmp_path, file_name)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            table.dirty = False
+        except Exception:
+            LOGGER.warning(
+                "Plugin cache failure, failed to cache results for plugin %s",
+                name,
+                exc_info=LOGGER.isEnabledFor(LogLevel.DEBUG.to_int),
+            )
+
+    def finish_compile(self) -> None:
+        """
+        Log the hit rate of each cacheable plugin that was called during the compile, store the new results on disk and
+        reset the statistics for the next compile.
+        """
+        for name, stats in sorted(self.stats.items()):
+            calls: int = stats.hits + stats.misses + stats.bypassed
+            LOGGER.info(
+                "Plugin cache for %s observed %d hits, %d misses and %d bypassed calls (%d%% hit rate)",
+                name,
+                stats.hits,
+                stats.misses,
+                stats.bypassed,
+                (100 * stats.hits) / calls,
+            )
+        for name, table in self.tables.items():
+            if table.dirty:
+                self._write_table(name, table)
+        self.stats = {}
+        self._source_hashes = {}
+
+    def clear(self) -> None:
+        """
+        Drop all results held in memory. The results on disk are kept.
+        """
+        self.tables = {}
+        self.stats = {}
+        self._source_hashes = {}
+
+
+plugin_cache = PluginCache()
@@ -0,0 +1,226 @@
+"""
+Copyright 2026 Inmanta
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Contact: code@inmanta.com
+"""
+
+import contextlib
+import dataclasses
+import json
+import logging
+import os
+import time
+from collections import Counter, abc, defaultdict
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from inmanta.ast.type import Type
+    from inmanta.execute.runtime import Waiter
+
+LOGGER = logging.getLogger(__name__)
+
+# The attributes that hold the statement a waiter executes: ExecutionUnit.expression, FunctionUnit.function and the
+# resumer of HangUnit and RawUnit
+_WAITER_STATEMENT_ATTRIBUTES: tuple[str, ...] = ("expression", "function", "resumer")
+
+
+@dataclasses.dataclass
+class CallStats:
+    """
+    The number of calls and the total wall time spent in them, in seconds
+    """
+
+    count: int = 0
+    time: float = 0.0
+
+    def add(self, duration: float) -> None:
+        self.count += 1
+        self.time += duration
+
+
+class CompilerProfiler:
+    """
+    Profiles a compile at the level of the model, rather than at the level of the Python interpreter. It records:
+
+    - the wall time of each phase of the compile
+    - the wall time and the number of calls of each plugin
+    - the number of statements executed, and the time spent in them, per statement type and per source location
+    - the number of instances created per entity, subtypes not included
+    - the number of iterations of the scheduler
+
+    Next to these figures, the self time of every stack of phases, statements and plugins is recorded in the folded stack
+    format, which can be rendered as a flamegraph. The time spent in a statement includes the time spent in the plugins it
+    calls.
+    """
+
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = defaultdict(float)
+        self.plugins: dict[str, CallStats] = defaultdict(CallStats)
+        self.statement_types: dict[str, CallStats] = defaultdict(CallStats)
+        self.statement_locations: dict[str, CallStats] = defaultdict(CallStats)
+        self.instances: Counter[str] = Counter()
+        self.scheduler_iterations: int = 0
+        # The self time per stack of frames
+        self.folded_stacks: dict[tuple[str, ...], float] = defaultdict(float)
+        # The frames that are currently executing, and the time spent in the children of each of them
+        self._stack: list[str] = []
+        self._child_time: list[float] = []
+
+    def _enter(self, frame: str) -> None:
+        self._stack.append(frame)
+        self._child_time.append(0.0)
+
+    def _exit(self, duration: float) -> None:
+        child_time = self._child_time.pop()
+        self.folded_stacks[tuple(self._stack)] += duration - child_time
+        self._stack.pop()
+        if self._child_time:
+            self._child_time[-1] += duration
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> abc.Iterator[None]:
+        """
+        Time a phase of the compile, e.g. parsing, executing or exporting.
+        """
+        self._enter(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            self._exit(duration)
+            self.phases[name] += duration
+
+    @contextlib.contextmanager
+    def plugin_call(self, name: str) -> abc.Iterator[None]:
+        """
+        Time a call to the plugin with the given fully qualified name.
+        """
+        self._enter(f"plugin {name}")
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            self._exit(duration)
+            self.plugins[name].add(duration)
+
+    def execute(self, waiter: "Waiter") -> None:
+        """
+        Execute the given waiter of the scheduler and attribute the time spent to the statement it executes.
+        """
+        statement: object = next(
+            (getattr(waiter, attribute) for attribute in _WAITER_STATEMENT_ATTRIBUTES if hasattr(waiter, attribute)),
+            waiter,
+        )
+        statement_type = type(statement).__name__
+        location = getattr(statement, "location", None)
+        frame = f"{statement_type} ({location})" if location is not None else statement_type
+        self._enter(frame)
+        start = time.perf_counter()
+        try:
+            waiter.execute()
+        finally:
+            duration = time.perf_counter() - start
+            self._exit(duration)
+            self.statement_types[statement_type].add(duration)
+            self.statement_locations[frame].add(duration)
+
+    def record_scheduler_run(self, iterations: int) -> None:
+        self.scheduler_iterations += iterations
+
+    def record_instances(self, types: abc.Mapping[str, "Type"]) -> None:
+        """
+        Count the instances of each entity in the given types. Instances of a subtype are only counted for the subtype.
+        """
+        from inmanta.ast.entity import Entity
+
+        for name, tp in types.items():
+            if isinstance(tp, Entity):
+                count = sum(1 for instance in tp.get_all_instances() if instance.type is tp)
+                if count:
+                    self.instances[name] = count
+
+    def to_dict(self) -> dict[str, object]:
+        def stats_to_list(stats: abc.Mapping[str, CallStats], key: str) -> list[dict[str, object]]:
+            return [
+                {key: name, "count": value.count, "time": value.time}
+                for name, value in sorted(stats.items(), key=lambda item: item[1].time, reverse=True)
+            ]
+
+        return {
+            "phases": dict(self.phases),
+            "scheduler_iterations": self.scheduler_iterations,
+            "plugins": stats_to_list(self.plugins, "plugin"),
+            "statement_types": stats_to_list(self.statement_types, "statement_type"),
+            "statement_locations": stats_to_list(self.statement_locations, "statement"),
+            "instances": dict(self.instances.most_common()),
+        }
+
+    def write(self, path: str) -> None:
+        """
+        Write the profile as json to the given path, and in the folded stack format to the same path with the .folded
+        extension. The values in the folded stack file are in microseconds.
+        """
+        with open(path, "w") as fh:
+            json.dump(self.to_dict(), fh, indent=4)
+        with open(os.path.splitext(path)[0] + ".folded", "w") as fh:
+            for stack, self_time in self.folded_stacks.items():
+                microseconds = round(self_time * 1_000_000)
+                if microseconds > 0:
+                    # The folded stack format uses ; as the frame separator
+                    fh.write(f"{';'.join(frame.replace(';', ',') for frame in stack)} {microseconds}\n")
+        LOGGER.info("Wrote the compiler profile to %s", path)
+
+
+_active_profiler: Optional[CompilerProfiler] = None
+
+
+def get_active_profiler() -> Optional[CompilerProfiler]:
+    """
+    Returns the profiler of the ongoing compile, or None if the compile is not being profiled.
+    """
+    return _active_profiler
+
+
+@contextlib.contextmanager
+def profile(path: Optional[str]) -> abc.Iterator[Optional[CompilerProfiler]]:
+    """
+    Profile the compile that runs within this context, and write the result to the given path. Doesn't profile when
+    the path is None.
+    """
+    global _active_profiler
+    if path is None:
+        yield None
+        return
+    _active_profiler = CompilerProfiler()
+    try:
+        yield _active_profiler
+    finally:
+        profiler = _active_profiler
+        _active_profiler = None
+        profiler.write(path)
+
+
+@contextlib.contextmanager
+def phase(name: str) -> abc.Iterator[None]:
+    """
+    Time a phase of the compile when it is being profiled.
+    """
+    if _active_profiler is None:
+        yield
+    else:
+        with _active_profiler.phase(name):
+            yield
@@ -42,6 +42,7 @@ from inmanta.ast.statements import DefinitionStatement, TypeDefinitionStatement
 from inmanta.ast.statements.define import DefineEntity, DefineImplement, DefineIndex, DefineRelation, DefineTypeConstraint
 from inmanta.ast.type import TYPES, Type
 from inmanta.const import LOG_LEVEL_TRACE
+from inmanta.execute import profiler
 from inmanta.execute.runtime import (
     DelayedResultVariable,
     ExecutionContext,
@@ -408,6 +409,7 @@ class Scheduler:
         # start an evaluation loop
         i = 0
         count = 0
+        active_profiler = profiler.get_active_profiler()
         max_iterations = int(os.getenv("INMANTA_MAX_ITERATIONS", MAX_ITERATIONS))
         while i < max_iterations:
             now = time.time()
@@ -435,7 +437,10 @@ class Scheduler:
             while len(basequeue) > 0:
                 next = basequeue.popleft()
                 try:
-                    next.execute()
+                    if active_profiler is None:
+                        next.execute()
+                    else:
+                        active_profiler.execute(next)
                     queue.remove_from_all(next)
                     count = count + 1
                 except UnsetException as e:
@@ -526,6 +531,9 @@ class Scheduler:
                 now - prev,
             )
 
+        if active_profiler is not None:
+            active_profiler.record_scheduler_run(i)
+
         if i == max_iterations:
             raise CompilerException(f"Could not complete model, max_iterations {max_iterations} reached.")
 
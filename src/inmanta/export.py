@@ -18,8 +18,10 @@ Contact: code@inmanta.com
 
 import argparse
 import base64
+import concurrent.futures
 import itertools
 import logging
+import threading
 import time
 import uuid
 from collections.abc import Sequence
@@ -33,7 +35,7 @@ from inmanta import const, protocol, references
 from inmanta.agent.handler import Commander
 from inmanta.ast import CompilerException, Namespace, UnknownException
 from inmanta.ast.entity import Entity
-from inmanta.config import Option, is_list, is_uuid_opt
+from inmanta.config import Option, is_int, is_list, is_uuid_opt
 from inmanta.data import model
 from inmanta.execute import proxy
 from inmanta.execute.proxy import DynamicProxy, ProxyContext
@@ -55,7 +57,24 @@ cfg_export = Option(
     "The list of exporters to use. This option is ignored when the --export-plugin option is used.",
     is_list,
 )
+cfg_file_upload_parallelism = Option(
+    "config",
+    "file-upload-parallelism",
+    4,
+    "The maximal number of concurrent requests used to upload files to the server during export.",
+    is_int,
+)
+cfg_export_batch_size = Option(
+    "config",
+    "export-batch-size",
+    5000,
+    "Models with more resources than this are uploaded to the server in batches of this size instead of in a single"
+    " request. Set to zero to always upload the model in a single request.",
+    is_int,
+)
 
+# The maximal combined size, in bytes, of the files sent to the server in a single request
+FILE_UPLOAD_BATCH_SIZE: int = 10 * 1024 * 1024
 
 ModelDict = dict[str, Entity]
 ResourceDict = dict[Id, Resource]
@@ -79,16 +98,69 @@ class DependencyCycleException(Exception):
         return "Cycle in dependencies: %s" % self.cycle
 
 
+def upload_files(
+    conn: protocol.SyncClient, file_hashes: Sequence[str], get_content: Callable[[str], bytes]
+) -> dict[str, protocol.Result]:
+    """
+    Upload the given files to the server. The files are sent in batches of at most FILE_UPLOAD_BATCH_SIZE bytes, using at
+    most :inmanta.config:option:`config.file-upload-parallelism` concurrent requests.
+
+    :param file_hashes: The hashes of the files to upload.
+    :param get_content: Returns the content of the file with the given hash.
+    :return: The files that could not be uploaded, mapped to the result of the failed request. When a batch fails, all
+        files in the batch are reported.
+    """
+    batches: list[list[str]] = []
+    batch_size: int = 0
+    for file_hash in file_hashes:
+        size: int = len(get_content(file_hash))
+        if not batches or batch_size + size > FILE_UPLOAD_BATCH_SIZE:
+            batches.append([])
+            batch_size = 0
+        batches[-1].append(file_hash)
+        batch_size += size
+
+    # Clients can't be shared between threads, every worker thread gets its own one
+    worker_state = threading.local()
+
+    def get_client() -> protocol.SyncClient:
+        if not hasattr(worker_state, "client"):
+            worker_state.client = protocol.SyncClient(conn.name, timeout=conn.connection_timeout)
+        return worker_state.client
+
+    def encode(file_hash: str) -> str:
+        return base64.b64encode(get_content(file_hash)).decode("ascii")
+
+    def upload_batch(batch: list[str]) -> dict[str, protocol.Result]:
+        client: protocol.SyncClient = get_client()
+        result = client.upload_files(files={file_hash: encode(file_hash) for file_hash in batch})
+        if result.code == 200:
+            return {}
+        if result.code != 404:
+            return {file_hash: result for file_hash in batch}
+        # Orchestrators that don't support batched uploads
+        failed: dict[str, protocol.Result] = {}
+        for file_hash in batch:
+            result = client.upload_file(id=file_hash, content=encode(file_hash))
+            if result.code != 200:
+                failed[file_hash] = result
+        return failed
+
+    failed: dict[str, protocol.Result] = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=cfg_file_upload_parallelism.get()) as executor:
+        for batch_failed in executor.map(upload_batch, batches):
+            failed.update(batch_failed)
+    return failed
+
+
 def upload_code(conn: protocol.SyncClient, code_manager: "inmanta.loader.CodeManager") -> None:
     res = conn.stat_files(list(code_manager.get_file_hashes()))
     if res is None or res.code != 200:
         raise Exception("Unable to upload handler plugin code to the server (msg: %s)" % res.result)
 
-    for file in res.result["files"]:
-        content = code_manager.get_file_content(file)
-        res = conn.upload_file(id=file, content=base64.b64encode(content).decode("ascii"))
-        if res is None or res.code != 200:
-            raise Exception("Unable to upload handler plugin code to the server (msg: %s)" % res.result)
+    failed: dict[str, protocol.Result] = upload_files(conn, res.result["files"], code_manager.get_file_content)
+    if failed:
+        raise Exception("Unable to upload files to the server (msg: %s)" % next(iter(failed.values())).result)
 
 
 class Exporter:
@@ -576,12 +648,9 @@ class Exporter:
         to_upload = result.result["files"]
 
         LOGGER.info("Only %d files are new and need to be uploaded", len(to_upload))
+        failed: dict[str, protocol.Result] = upload_files(self.client, to_upload, self._file_store.__getitem__)
         for hash_id in to_upload:
-            content = self._file_store[hash_id]
-
-            result = self.client.upload_file(id=hash_id, content=base64.b64encode(content).decode("ascii"))
-
-            if result.code != 200:
+            if hash_id in failed:
                 LOGGER.error("Unable to upload file with hash %s", hash_id)
             else:
                 LOGGER.debug("Uploaded file with hash %s", hash_id)
@@ -599,11 +668,16 @@ class Exporter:
                 else:
                     LOGGER.debug("  %s not in any resource set", rid)
 
+        upload_id: Optional[uuid.UUID] = self._upload_resources_in_batches(tid, resources)
+        resources_in_request: list[dict[str, str]] = resources if upload_id is None else []
+
         def do_put(project_constraints: str | None = None, **kwargs: object) -> protocol.Result:
+            if upload_id is not None:
+                kwargs["upload_id"] = upload_id
             if partial_compile:
                 result = self.client.put_partial(
                     tid=tid,
-                    resources=resources,
+                    resources=resources_in_request,
                     resource_sets=self._resource_sets,
                     unknowns=unknown_parameters,
                     resource_state=self._resource_state,
@@ -618,7 +692,7 @@ class Exporter:
                 result = self.client.put_version(
                     tid=tid,
                     version=version,
-                    resources=resources,
+                    resources=resources_in_request,
                     resource_sets=self._resource_sets,
                     unknowns=unknown_parameters,
                     resource_state=self._resource_state,
@@ -655,6 +729,31 @@ class Exporter:
         else:
             return version
 
+    def _upload_resources_in_batches(self, tid: uuid.UUID, resources: list[dict[str, str]]) -> Optional[uuid.UUID]:
+        """
+        Stage the resources on the server in batches when the model is too large to be sent in a single request.
+
+        :return: The id of the upload session that holds the resources or None if they should be sent in a single request.
+        """
+        batch_size: int = cfg_export_batch_size.get()
+        if batch_size <= 0 or len(resources) <= batch_size:
+            return None
+
+        result = self.client.open_version_upload(tid=tid)
+        if result.code == 404:
+            LOGGER.warning("The orchestrator doesn't support batched uploads, sending all resources in a single request")
+            return None
+        if result.code != 200:
+            raise Exception("Unable to start the upload of the resources (%s)" % result.result["message"])
+        upload_id = uuid.UUID(result.result["data"])
+
+        LOGGER.info("Uploading %d resources in batches of %d", len(resources), batch_size)
+        for batch in itertools.batched(resources, batch_size):
+            result = self.client.upload_version_resources(tid=tid, upload_id=upload_id, resources=list(batch))
+            if result.code != 200:
+                raise Exception("Failed to upload resources (%s)" % result.result["message"])
+        return upload_id
+
     def upload_file(self, content: Union[str, bytes]) -> str:
         """
         Upload a file to the configuration server. This operation is not
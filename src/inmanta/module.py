@@ -2109,15 +2109,19 @@ class Project(ModuleLike[ProjectMetadata], ModuleLikeWithYmlMetadataFile):
     def get_complete_ast(self) -> tuple[list[Statement], list[BasicBlock]]:
         if self._complete_ast is not None:
             return self._complete_ast
+        # import loop
+        from inmanta.compiler.config import parse_workers
+
         start = time()
-        # load ast
-        statements, block = self.get_ast()
-        blocks = [block]
-        statements = [x for x in statements]
+        with plyInmantaParser.parallel_parsing(parse_workers.get()):
+            # load ast
+            statements, block = self.get_ast()
+            blocks = [block]
+            statements = [x for x in statements]
 
-        for _, nstmt, nb in self.load_module_recursive():
-            statements.extend(nstmt)
-            blocks.append(nb)
+            for _, nstmt, nb in self.load_module_recursive():
+                statements.extend(nstmt)
+                blocks.append(nb)
 
         end = time()
         LOGGER.debug("Parsing took %0.03f seconds", end - start)
@@ -2219,6 +2223,20 @@ class Project(ModuleLike[ProjectMetadata], ModuleLikeWithYmlMetadataFile):
             imports.extend(new_imports)
             all_imports.update(new_imports)
 
+        # Top level modules whose files have been submitted to the parallel parser
+        prefetched: set[str] = set()
+
+        def prefetch(module: Module) -> None:
+            """
+            Start parsing all files of a module in parallel, as soon as the module is discovered. Submodules that turn out not
+            to be imported are parsed needlessly, but don't affect the compile.
+            """
+            if plyInmantaParser.parallel_parser is None or module.name in prefetched:
+                return
+            prefetched.add(module.name)
+            for name, file in module.get_submodule_files():
+                plyInmantaParser.parallel_parser.submit(name, file)
+
         # Loop over imports. For each import:
         # 1. Load the top level module.
         # 2. Set up top level module if it has not been set up yet, loading v2 requirements.
@@ -2240,6 +2258,7 @@ class Project(ModuleLike[ProjectMetadata], ModuleLikeWithYmlMetadataFile):
                     allow_v1=True,
                     bypass_module_cache=bypass_module_cache,
                 )
+                prefetch(module)
                 load_sub_module(module, imp)
             except (InvalidModuleException, ModuleNotFoundException) as e:
                 raise ModuleLoadingException(ns, imp, e)
@@ -2627,6 +2646,12 @@ class Module(ModuleLike[TModuleMetadata], ABC):
         """
         Get all submodules of this module
         """
+        return [name for name, _ in self.get_submodule_files()]
+
+    def get_submodule_files(self) -> list[tuple[str, str]]:
+        """
+        Get all submodules of this module, with the file that defines them
+        """
         modules = []
         files = self._get_model_files(self.model_dir)
 
@@ -2639,7 +2664,7 @@ class Module(ModuleLike[TModuleMetadata], ABC):
             parts.insert(0, self.name)
             name = "::".join(parts)
 
-            modules.append(name)
+            modules.append((name, f))
 
         return modules
 
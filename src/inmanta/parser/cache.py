@@ -16,8 +16,12 @@ limitations under the License.
 Contact: code@inmanta.com
 """
 
+import hashlib
+import io
 import logging
 import os
+import pickle
+import tempfile
 from typing import Optional
 
 from inmanta import __version__ as inmanta_version
@@ -29,56 +33,58 @@ from inmanta.parser.pickle import ASTPickler, ASTUnpickler
 LOGGER = logging.getLogger(__name__)
 
 
-class CacheEnvelope:
-    """Every cached file gets the exact modification time of the file it is caching, to have cheap, accurate invalidation"""
-
-    def __init__(self, timestamp: float, statements: list[Statement]) -> None:
-        self.timestamp = timestamp
-        self.statements = statements
+class CacheManager:
+    """
+    Cache for the statements parsed from a source file.
 
+    Entries are keyed on the content of the source file, the namespace it is loaded into and the compiler version, so
+    they remain valid when the file is checked out again or moved to another directory: locations in the cached
+    statements are restored in the file that is being parsed. This also allows a single cache directory to be shared by
+    multiple projects, see :inmanta.config:option:`compiler.cache_dir`.
+    """
 
-class CacheManager:
     def __init__(self) -> None:
         self.hits = 0
         self.misses = 0
         self.failures = 0
 
         # import loop, ....
-        from inmanta.compiler.config import feature_compiler_cache
+        from inmanta.compiler.config import compiler_cache_dir, feature_compiler_cache
 
         self.cache_enabled = feature_compiler_cache
+        self.cache_dir = compiler_cache_dir
         self.root_cache_dir: Optional[str] = None
 
-    def _get_file_name(self, namespace: Namespace, filename: str) -> str:
+    def _get_key(self, namespace_name: str, content: str) -> str:
         """
-        Returns the name for the cached file, based on the name of the original source file
-
-        Also ensures the cache folder exists.
+        Returns the key of the cache entry for the given source
+        """
+        key = hashlib.sha256()
+        for part in (inmanta_version, namespace_name):
+            key.update(part.encode())
+            key.update(b"\0")
+        key.update(content.encode())
+        return key.hexdigest()
+
+    def _get_file_name(self, namespace_name: str, content: str) -> str:
+        """
+        Returns the name for the cached file, based on the content of the original source file
 
-        :param namespace: The namespace this file is part of
-        :param filename: the filename of the source file
+        :param namespace_name: The full name of the namespace this file is part of
+        :param content: the content of the source file
         :return: the filename of the cached file
         """
         # Make mypy happy
         assert self.root_cache_dir is not None
-        # Obtains directory where the cache file will be stored
-        cache_folder = os.path.join(self.root_cache_dir, *namespace.to_path())
-        # create cache folder
-        os.makedirs(cache_folder, exist_ok=True)
-
-        # get file name without extension
-        filepart = os.path.basename(filename).rsplit(".", maxsplit=1)[0]
-
-        # make filename with inmanta version specific extension
-        filename = f"{filepart}.{inmanta_version.replace('.', '_')}.cfc"
-
-        # construct final path
-        return os.path.join(cache_folder, filename)
+        key = self._get_key(namespace_name, content)
+        # Spread the entries over subdirectories, to keep directories small when the cache is shared
+        return os.path.join(self.root_cache_dir, key[:2], f"{key}.cfc")
 
     def attach_to_project(self, project_dir: str) -> None:
         if not os.path.exists(project_dir):
             raise Exception(f"Project directory {project_dir} doesn't exist")
-        self.root_cache_dir = os.path.join(project_dir, CF_CACHE_DIR)
+        shared_cache_dir: Optional[str] = self.cache_dir.get()
+        self.root_cache_dir = shared_cache_dir if shared_cache_dir else os.path.join(project_dir, CF_CACHE_DIR)
 
     def is_attached_to_project(self) -> bool:
         return self.root_cache_dir is not None
@@ -86,33 +92,47 @@ class CacheManager:
     def detach_from_project(self) -> None:
         self.root_cache_dir = None
 
-    def un_cache(self, namespace: Namespace, filename: str) -> Optional[list[Statement]]:
+    def contains(self, namespace_name: str, content: str) -> bool:
+        """
+        Returns True iff the cache contains an entry for the given source.
+
+        :param namespace_name: The full name of the namespace the file is part of
+        :param content: the content of the source file
+        """
+        if not self.cache_enabled.get() or not self.is_attached_to_project():
+            return False
+        return os.path.exists(self._get_file_name(namespace_name, content))
+
+    def un_cache(self, namespace: Namespace, filename: str, content: str) -> Optional[list[Statement]]:
+        """
+        Load the statements for the given source file from the cache.
+
+        :param namespace: The namespace this file is part of
+        :param filename: the filename of the source file
+        :param content: the content of the source file
+        :return: the cached statements or None if the file is not in the cache
+        """
         if not self.cache_enabled.get():
             # cache not enabled
             return None
         if not self.is_attached_to_project():
             return None
         try:
-            cache_filename = self._get_file_name(namespace, filename)
-            if not os.path.exists(cache_filename):
+            cache_filename = self._get_file_name(namespace.get_full_name(), content)
+            try:
+                with open(cache_filename, "rb") as fh:
+                    # Read the entry at once, the unpickler performs many small reads
+                    data = fh.read()
+            except FileNotFoundError:
                 self.misses += 1
                 return None
-            mtime = os.path.getmtime(filename)
-            if os.path.getmtime(filename) > os.path.getmtime(cache_filename):
+            result = ASTUnpickler(io.BytesIO(data), namespace, source_file=filename).load()
+            if not isinstance(result, list):
+                # old cache format
                 self.misses += 1
                 return None
-            with open(cache_filename, "rb") as fh:
-                result = ASTUnpickler(fh, namespace).load()
-                if not isinstance(result, CacheEnvelope):
-                    # old cache format
-                    self.misses += 1
-                    return None
-                if result.timestamp != mtime:
-                    # mtime is not exactly the same
-                    self.misses += 1
-                    return None
-                self.hits += 1
-                return result.statements
+            self.hits += 1
+            return result
         except Exception:
             self.failures += 1
             LOGGER.warning(
@@ -122,18 +142,34 @@ class CacheManager:
             )
             return None
 
-    def cache(self, namespace: Namespace, filename: str, statements: list[Statement]) -> None:
+    def cache(self, namespace: Namespace, filename: str, content: str, statements: list[Statement]) -> None:
+        """
+        Store the statements parsed from the given source file in the cache.
+
+        :param namespace: The namespace this file is part of
+        :param filename: the filename of the source file
+        :param content: the content of the source file
+        :param statements: the statements parsed from the source file
+        """
         if not self.cache_enabled.get():
             # cache not enabled
             return
         if not self.is_attached_to_project():
             return
         try:
-            cache_filename = self._get_file_name(namespace, filename)
-            mtime = os.path.getmtime(filename)
-            cache_entry = CacheEnvelope(mtime, statements)
-            with open(cache_filename, "wb") as fh:
-                ASTPickler(fh, protocol=4).dump(cache_entry)
+            cache_filename = self._get_file_name(namespace.get_full_name(), content)
+            cache_folder = os.path.dirname(cache_filename)
+            os.makedirs(cache_folder, exist_ok=True)
+            # The cache may be shared by concurrent compiles: write to a temporary file first, so other compiles never
+            # observe a partially written entry
+            fd, tmp_path = tempfile.mkstemp(dir=cache_folder, prefix=".")
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    ASTPickler(fh, protocol=pickle.HIGHEST_PROTOCOL, source_file=filename).dump(statements)
+                os.replace(tmp_path, cache_filename)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
         except Exception:
             LOGGER.warning(
                 "Compile cache failure, failed to cache statements for %s",
@@ -152,8 +188,9 @@ class CacheManager:
             return
         if self.hits + self.misses != 0:
             LOGGER.debug(
-                "Compiler cache observed %d hits and %d misses (%d%%)",
+                "Compiler cache observed %d hits, %d misses (%d%%) and %d failures",
                 self.hits,
                 self.misses,
                 (100 * self.hits) / (self.hits + self.misses),
+                self.failures,
             )
@@ -20,19 +20,25 @@ Custom pickler/unpickler for AST Statement objects.
 Namespace objects cannot be pickled (they're tied to runtime compilation context),
 so they are replaced with their fully-qualified name string during pickling and
 restored from the unpickler instance during unpickling.
+
+When a source file is given, locations in that file are stored without the file name
+and restored with the file name given to the unpickler, so pickled statements remain
+valid when the source file is moved.
 """
 
 import contextvars
 import copyreg
 import types
 from pickle import Pickler, Unpickler, UnpicklingError
-from typing import IO, Callable
+from typing import IO, Callable, Optional
 
-from inmanta.ast import Namespace
+from inmanta.ast import Location, Namespace, Range
 
 # Namespace the active ASTUnpickler is restoring into. A ContextVar rather than a
 # thread local so that concurrent and re-entrant unpickling both stay correct.
 current_namespace: contextvars.ContextVar[Namespace] = contextvars.ContextVar("ast_unpickler_namespace")
+# Source file the active ASTPickler or ASTUnpickler is storing or restoring locations for
+current_file: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("ast_pickler_file", default=None)
 
 
 def reduce_namespace(
@@ -60,6 +66,33 @@ def restore_namespace(full_name: str) -> Namespace:
     return namespace
 
 
+def reduce_location(location: object) -> str | tuple[Callable[..., object], tuple[object, ...]]:
+    """Reducer for Location and Range objects, drops the file name when it is the source file being pickled."""
+    assert isinstance(location, Location)
+    if location.file != current_file.get():
+        return location.__reduce_ex__(4)
+    if isinstance(location, Range):
+        return (restore_range, (location.lnr, location.start_char, location.end_lnr, location.end_char))
+    return (restore_location, (location.lnr,))
+
+
+def _get_current_file() -> str:
+    file: Optional[str] = current_file.get()
+    if file is None:
+        raise UnpicklingError("Location restored outside ASTUnpickler context or without source file")
+    return file
+
+
+def restore_location(lnr: int) -> Location:
+    """Restore a Location in the source file of the ASTUnpickler that is currently loading."""
+    return Location(_get_current_file(), lnr)
+
+
+def restore_range(start_lnr: int, start_char: int, end_lnr: int, end_char: int) -> Range:
+    """Restore a Range in the source file of the ASTUnpickler that is currently loading."""
+    return Range(_get_current_file(), start_lnr, start_char, end_lnr, end_char)
+
+
 class ASTPickler(Pickler):
     """Pickler that replaces Namespace objects with their fully-qualified name.
 
@@ -70,7 +103,23 @@ class ASTPickler(Pickler):
     2x faster to read back, and a 5% smaller cache file.
     """
 
-    dispatch_table = types.MappingProxyType({**copyreg.dispatch_table, Namespace: reduce_namespace})
+    dispatch_table = types.MappingProxyType(
+        {**copyreg.dispatch_table, Namespace: reduce_namespace, Location: reduce_location, Range: reduce_location}
+    )
+
+    def __init__(self, file: IO[bytes], protocol: Optional[int] = None, source_file: Optional[str] = None) -> None:
+        """
+        :param source_file: The file the statements were parsed from. Locations in this file are stored without file name.
+        """
+        super().__init__(file, protocol=protocol)
+        self._source_file = source_file
+
+    def dump(self, obj: object) -> None:
+        token = current_file.set(self._source_file)
+        try:
+            super().dump(obj)
+        finally:
+            current_file.reset(token)
 
 
 class ASTUnpickler(Unpickler):
@@ -81,13 +130,19 @@ class ASTUnpickler(Unpickler):
     in the stream through a Python callback, which costs more than it saves.
     """
 
-    def __init__(self, file: IO[bytes], namespace: Namespace) -> None:
+    def __init__(self, file: IO[bytes], namespace: Namespace, source_file: Optional[str] = None) -> None:
+        """
+        :param source_file: The file to restore the locations that were stored without file name in.
+        """
         super().__init__(file)
         self._namespace = namespace
+        self._source_file = source_file
 
     def load(self) -> object:
         token = current_namespace.set(self._namespace)
+        file_token = current_file.set(self._source_file)
         try:
             return super().load()
         finally:
+            current_file.reset(file_token)
             current_namespace.reset(token)
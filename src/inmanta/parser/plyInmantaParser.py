@@ -16,8 +16,13 @@ limitations under the License.
 Contact: code@inmanta.com
 """
 
+import concurrent.futures
+import contextlib
 import functools
+import io
 import logging
+import multiprocessing
+import pickle
 import re
 import string
 from collections import abc
@@ -58,6 +63,7 @@ from inmanta.ast.variables import AttributeReference, Reference
 from inmanta.execute.util import NoneValue
 from inmanta.parser import InvalidNamespaceAccess, ParserException, plyInmantaLex
 from inmanta.parser.cache import CacheManager
+from inmanta.parser.pickle import ASTPickler, ASTUnpickler
 from inmanta.parser.plyInmantaLex import reserved, tokens  # NOQA
 
 # the token map is imported from the lexer. This is required.
@@ -1381,10 +1387,130 @@ def base_parse(ns: Namespace, tfile: str, content: Optional[str]) -> list[Statem
 cache_manager = CacheManager()
 
 
+def _parse_in_worker(namespace_name: str, filename: str, content: str) -> Optional[bytes]:
+    """
+    Parse a file in a worker process of the ParallelParser.
+
+    :return: The pickled statements or None if the file could not be parsed. Parse errors are reported when the file is
+        parsed again by the compiler itself.
+    """
+    namespace = Namespace("__root__")
+    for part in namespace_name.split("::"):
+        namespace = Namespace(part, namespace)
+    try:
+        statements = base_parse(namespace, filename, content)
+        buffer = io.BytesIO()
+        ASTPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL, source_file=filename).dump(statements)
+    except Exception:
+        return None
+    return buffer.getvalue()
+
+
+class ParallelParser:
+    """
+    Parses files in a pool of worker processes ahead of their use by the compiler. The statements are pickled back to
+    the compiler process, so the result is identical to parsing the file in the compiler process.
+    """
+
+    def __init__(self, workers: int) -> None:
+        self.workers = workers
+        self._pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        # Submitted files by namespace and filename, with the content that was submitted
+        self._pending: dict[tuple[str, str], tuple[str, concurrent.futures.Future[Optional[bytes]]]] = {}
+
+    def submit(self, namespace_name: str, filename: str) -> None:
+        """
+        Start parsing the given file, unless it is in the parse cache.
+
+        :param namespace_name: The full name of the namespace the file will be loaded into.
+        :param filename: The file to parse.
+        """
+        key = (namespace_name, filename)
+        if key in self._pending:
+            return
+        try:
+            with open(filename, encoding="utf-8") as fh:
+                content = fh.read()
+        except (OSError, ValueError):
+            # Reported when the file is parsed by the compiler, if it is used at all
+            return
+        if cache_manager.contains(namespace_name, content):
+            return
+        if self._pool is None:
+            # Don't fork the compiler process itself, it may be running threads
+            self._pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("forkserver")
+            )
+        self._pending[key] = (content, self._pool.submit(_parse_in_worker, namespace_name, filename, content))
+
+    def get(self, namespace: Namespace, filename: str, content: str) -> Optional[list[Statement]]:
+        """
+        Get the statements for the given file if it was submitted with the given content.
+
+        :return: The statements or None if the file was not submitted or could not be parsed.
+        """
+        pending = self._pending.pop((namespace.get_full_name(), filename), None)
+        if pending is None:
+            return None
+        submitted_content, future = pending
+        if submitted_content != content:
+            return None
+        try:
+            result = future.result()
+        except Exception:
+            LOGGER.debug("Parallel parsing of %s failed", filename, exc_info=True)
+            return None
+        if result is None:
+            return None
+        statements = ASTUnpickler(io.BytesIO(result), namespace, source_file=filename).load()
+        assert isinstance(statements, list)
+        return statements
+
+    def close(self) -> None:
+        """
+        Discard all pending work and stop the worker processes.
+        """
+        self._pending.clear()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# The parallel parser of the project that is being loaded, see parallel_parsing()
+parallel_parser: Optional[ParallelParser] = None
+
+
+@contextlib.contextmanager
+def parallel_parsing(workers: int) -> abc.Iterator[Optional[ParallelParser]]:
+    """
+    Context manager to parse files in parallel while a project is loaded. Files are submitted to the yielded
+    parser, and are used by parse() when they are requested.
+
+    :param workers: The number of worker processes. Parallel parsing is disabled when smaller than 2.
+    """
+    global parallel_parser
+    if workers < 2 or parallel_parser is not None:
+        yield parallel_parser
+        return
+    parallel_parser = ParallelParser(workers)
+    try:
+        yield parallel_parser
+    finally:
+        parallel_parser.close()
+        parallel_parser = None
+
+
 def parse(namespace: Namespace, filename: str, content: Optional[str] = None) -> list[Statement]:
-    statements = cache_manager.un_cache(namespace, filename)
+    if content is None:
+        # Read the file once, the cache is keyed on its content
+        with open(filename, encoding="utf-8") as fh:
+            content = fh.read()
+    statements = cache_manager.un_cache(namespace, filename, content)
     if statements is not None:
         return statements
-    statements = base_parse(namespace, filename, content)
-    cache_manager.cache(namespace, filename, statements)
+    if parallel_parser is not None:
+        statements = parallel_parser.get(namespace, filename, content)
+    if statements is None:
+        statements = base_parse(namespace, filename, content)
+    cache_manager.cache(namespace, filename, content, statements)
     return statements
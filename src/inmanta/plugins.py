@@ -53,7 +53,8 @@ from inmanta.ast.type import NamedType
 from inmanta.ast.type import Null as Null  # Moved, part of stable api
 from inmanta.ast.type import ReferenceType
 from inmanta.config import Config
-from inmanta.execute import proxy
+from inmanta.execute import profiler, proxy
+from inmanta.execute.plugin_cache import plugin_cache
 from inmanta.execute.proxy import DynamicProxy
 from inmanta.execute.runtime import QueueScheduler, Resolver, ResultVariable
 from inmanta.execute.util import NoneValue, Unknown
@@ -1098,6 +1099,9 @@ class Plugin(NamedType, WithComment, metaclass=PluginMeta):
     def is_accept_unknowns(self) -> bool:
         return self.opts["allow_unknown"]
 
+    def is_cacheable(self) -> bool:
+        return self.opts.get("cacheable", False)
+
     def check_requirements(self) -> None:
         """
         Check if the plug-in has all it requires
@@ -1166,6 +1170,14 @@ class Plugin(NamedType, WithComment, metaclass=PluginMeta):
 
         return value
 
+    def _call_cached(self, processed_args: CheckedArgs) -> object:
+        """
+        Call the plugin function, through the plugin cache if this plugin is cacheable
+        """
+        if self.is_cacheable() and not processed_args.unknowns:
+            return plugin_cache.call(self, processed_args.args, processed_args.kwargs)
+        return self.call(*processed_args.args, **processed_args.kwargs)
+
     def call_in_context(
         self,
         processed_args: CheckedArgs,
@@ -1182,9 +1194,12 @@ class Plugin(NamedType, WithComment, metaclass=PluginMeta):
                 msg += f" It should be replaced by '{self.replaced_by}'."
             warnings.warn(PluginDeprecationWarning(msg))
         self.check_requirements()
-        args = processed_args.args
-        kwargs = processed_args.kwargs
-        value = self.call(*args, **kwargs)
+        active_profiler = profiler.get_active_profiler()
+        if active_profiler is None:
+            value = self._call_cached(processed_args)
+        else:
+            with active_profiler.plugin_call(self.get_full_name()):
+                value = self._call_cached(processed_args)
 
         value = DynamicProxy.unwrap(
             value,
@@ -1234,6 +1249,7 @@ def plugin(
     commands: Optional[list[str]] = None,
     emits_statements: bool = False,
     allow_unknown: bool = False,
+    cacheable: bool = False,
 ) -> Callable[[T_FUNC], T_FUNC]: ...
 
 
@@ -1243,6 +1259,7 @@ def plugin(
     commands: Optional[list[str]] = None,
     emits_statements: bool = False,
     allow_unknown: bool = False,
+    cacheable: bool = False,
 ) -> T_FUNC: ...
 
 
@@ -1252,6 +1269,7 @@ def plugin(
     commands: Optional[list[str]] = None,
     emits_statements: bool = False,
     allow_unknown: bool = False,
+    cacheable: bool = False,
 ) -> T_FUNC | Callable[[T_FUNC], T_FUNC]:
     """
     Python decorator to register functions with inmanta as plugin
@@ -1262,6 +1280,9 @@ def plugin(
     :param emits_statements: Set to true if this plugin emits new statements that the compiler should execute. This is only
                              required for complex plugins such as integrating a template engine.
     :param allow_unknown: Set to true if this plugin accepts Unknown values as valid input.
+    :param cacheable: Set to true if this plugin is pure: its result only depends on its arguments and calling it has no
+                      side effects. The compiler then memoizes its results, keyed on the argument values. Calls that receive
+                      entities or unknowns, and calls that return anything other than plain data, are never cached.
     """
 
     def curry_name(
@@ -1269,6 +1290,7 @@ def plugin(
         commands: Optional[list[str]] = None,
         emits_statements: bool = False,
         allow_unknown: bool = False,
+        cacheable: bool = False,
     ) -> Callable[[T_FUNC], T_FUNC]:
         """
         Function to curry the name of the function
@@ -1303,7 +1325,12 @@ def plugin(
             dictionary["__function_name__"] = name
             dictionary["__fq_plugin_name__"] = fq_plugin_name
 
-            dictionary["opts"] = {"bin": commands, "emits_statements": emits_statements, "allow_unknown": allow_unknown}
+            dictionary["opts"] = {
+                "bin": commands,
+                "emits_statements": emits_statements,
+                "allow_unknown": allow_unknown,
+                "cacheable": cacheable,
+            }
             dictionary["call"] = wrapper
             dictionary["__function__"] = fnc
 
@@ -1314,13 +1341,17 @@ def plugin(
         return call
 
     if function is None:
-        return curry_name(commands=commands, emits_statements=emits_statements, allow_unknown=allow_unknown)
+        return curry_name(
+            commands=commands, emits_statements=emits_statements, allow_unknown=allow_unknown, cacheable=cacheable
+        )
 
     elif isinstance(function, str):
-        return curry_name(function, commands=commands, emits_statements=emits_statements, allow_unknown=allow_unknown)
+        return curry_name(
+            function, commands=commands, emits_statements=emits_statements, allow_unknown=allow_unknown, cacheable=cacheable
+        )
 
     elif function is not None:
-        fnc = curry_name(commands=commands, emits_statements=emits_statements, allow_unknown=allow_unknown)
+        fnc = curry_name(commands=commands, emits_statements=emits_statements, allow_unknown=allow_unknown, cacheable=cacheable)
         return fnc(function)
 
 
@@ -18,11 +18,16 @@ Contact: code@inmanta.com
 
 import asyncio
 import asyncio.subprocess
+import datetime
+import enum
+import hashlib
 import json
 import logging
 import os
 import subprocess
 import time
+import uuid
+from collections import OrderedDict
 from typing import Mapping
 
 from tornado import httpclient
@@ -32,6 +37,8 @@ from inmanta import config, const, data
 from inmanta import tornado as inmanta_tornado
 from inmanta import util
 from inmanta.protocol import common
+from inmanta.vendor import pyformance
+from inmanta.vendor.pyformance.meters.gauge import CallbackGauge
 
 LOGGER = logging.getLogger(__name__)
 
@@ -62,6 +69,68 @@ path_opa_executable = config.Option(
     "Path to the executable that runs the Open Policy Agent.",
     config.is_str,
 )
+decision_cache_size = config.Option(
+    "policy_engine",
+    "decision-cache-size",
+    1024,
+    "The maximum number of access policy decisions the server keeps in memory. Requests with an identical input for"
+    " the policy engine reuse the cached decision instead of querying the policy engine. The decisions for requests with a"
+    " large input, e.g. file uploads, are not cached. Set to 0 to disable the cache.",
+    config.is_int,
+)
+
+
+# The maximum size of the input of a cacheable access policy decision, counted as the number of scalar values plus the length
+# of the strings. The input of e.g. a file upload is larger, it is never cached.
+MAX_DECISION_CACHE_INPUT_SIZE = 4096
+
+
+class _InputTooLarge(Exception):
+    """
+    Raised when the input for the policy engine is too large to be cached
+    """
+
+
+def _get_decision_cache_key(input_data: Mapping[str, object]) -> str | None:
+    """
+    Returns the key to cache the access policy decision for the given input under, or None if the decision should not be
+    cached. The policy can depend on any part of the input, so the complete input is part of the key. Inputs larger than
+    MAX_DECISION_CACHE_INPUT_SIZE are not cached: they are rarely repeated and their key would be expensive to compute. The
+    input is only traversed up to that size, so the cost of this method doesn't depend on the size of the request body.
+    """
+    budget: int = MAX_DECISION_CACHE_INPUT_SIZE
+
+    def consume(size: int) -> None:
+        nonlocal budget
+        budget -= size
+        if budget < 0:
+            raise _InputTooLarge()
+
+    def to_key(value: object) -> object:
+        if value is None or isinstance(value, (bool, int, float)):
+            consume(1)
+            return value
+        if isinstance(value, enum.Enum):
+            return to_key(value.value)
+        if isinstance(value, (str, uuid.UUID, datetime.datetime)):
+            # These values are sent to the policy engine as a string as well
+            as_string: str = str(value)
+            consume(len(as_string) + 1)
+            return as_string
+        if isinstance(value, Mapping):
+            consume(1)
+            return {str(key): to_key(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            consume(1)
+            return [to_key(item) for item in value]
+        # E.g. bytes or a pydantic model
+        raise _InputTooLarge()
+
+    try:
+        key: object = to_key(input_data)
+    except _InputTooLarge:
+        return None
+    return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
 
 
 class PolicyEngine:
@@ -84,6 +153,10 @@ class PolicyEngine:
         self._hostname = "policy_engine"
         inmanta_tornado.LoopResolverWithUnixSocketSuppport.register_unix_socket(self._hostname, self._socket_file)
         self._client = httpclient.AsyncHTTPClient()
+        # Maps the hash of the input of the allow query on its decision, in least recently used order
+        self._decision_cache: OrderedDict[str, bool] = OrderedDict()
+        self._decision_cache_hits = 0
+        self._decision_cache_misses = 0
 
     @classmethod
     def get_path_policy_engine_log_file(cls) -> str:
@@ -141,6 +214,9 @@ class PolicyEngine:
                 log_file_handle.close()
         await self._wait_until_opa_server_is_up()
         await self._synchronize_roles_to_db()
+        # The policy file is only loaded when the policy engine starts
+        self.clear_decision_cache()
+        pyformance.gauge("internal.policy_engine.decision_cache.hit_ratio", CallbackGauge(callback=self._get_hit_ratio))
         self.running = True
 
     async def _wait_until_opa_server_is_up(self) -> None:
@@ -165,6 +241,8 @@ class PolicyEngine:
                 return
 
     async def stop(self) -> None:
+        self.clear_decision_cache()
+        pyformance.global_registry()._gauges.pop("internal.policy_engine.decision_cache.hit_ratio", None)
         if self._process is None or self._process.returncode is not None:
             # Process didn't start or was already terminated.
             self._process = None
@@ -227,10 +305,42 @@ class PolicyEngine:
         if not self.running:
             LOGGER.error("Policy engine is not running. Call OpaServer.start() first.")
             return False
-        response = await self._evaluate_policy(
-            query="allow", error_message="Failed to evaluate access policy", input_data=input_data
-        )
-        return "result" in response and response["result"] is True
+        max_size: int = decision_cache_size.get()
+        cache_key: str | None = _get_decision_cache_key(input_data) if max_size > 0 else None
+        if cache_key is not None and cache_key in self._decision_cache:
+            self._decision_cache.move_to_end(cache_key)
+            self._decision_cache_hits += 1
+            pyformance.counter("internal.policy_engine.decision_cache.hits").inc()
+            return self._decision_cache[cache_key]
+        self._decision_cache_misses += 1
+        pyformance.counter("internal.policy_engine.decision_cache.misses").inc()
+
+        with pyformance.timer("internal.policy_engine.evaluate").time():
+            response = await self._evaluate_policy(
+                query="allow", error_message="Failed to evaluate access policy", input_data=input_data
+            )
+        if "result" not in response:
+            # The evaluation failed or the policy didn't define the allow rule, don't cache failures
+            return False
+        decision: bool = response["result"] is True
+        if cache_key is not None:
+            self._decision_cache[cache_key] = decision
+            while len(self._decision_cache) > max_size:
+                self._decision_cache.popitem(last=False)
+        return decision
+
+    def clear_decision_cache(self) -> None:
+        """
+        Drop all cached access policy decisions. To be called when something that the decisions depend on changes.
+        """
+        self._decision_cache.clear()
+
+    def _get_hit_ratio(self) -> float:
+        """
+        Return the fraction of the access policy decisions that were served from the decision cache.
+        """
+        total = self._decision_cache_hits + self._decision_cache_misses
+        return self._decision_cache_hits / total if total else 0.0
 
     async def _get_roles(self) -> list[str]:
         """
@@ -49,6 +49,11 @@ class AuthorizationProvider(ABC):
         """
         self.running = False
 
+    def invalidate_cache(self) -> None:
+        """
+        Drop any cached authorization decisions. Called when the users or their roles change.
+        """
+
     async def authorize_request(self, call_arguments: "rest.CallArguments") -> None:
         """
         Main entrypoint to validate whether an API call is authorized or not.
@@ -175,6 +180,9 @@ class PolicyEngineAuthorizationProvider(AuthorizationProvider):
         await self._policy_engine.stop()
         await self._legacy_authorization_provider.stop()
 
+    def invalidate_cache(self) -> None:
+        self._policy_engine.clear_decision_cache()
+
     async def _do_authorize_request(
         self,
         auth_token: auth.claim_type | None,
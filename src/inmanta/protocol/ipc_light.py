@@ -18,10 +18,10 @@ Contact: code@inmanta.com
 
 import abc
 import asyncio
-import functools
 import logging
 import pickle
 import struct
+import threading
 import traceback
 import typing
 import uuid
@@ -30,6 +30,8 @@ from dataclasses import dataclass
 from pickle import PicklingError
 from typing import Optional
 
+from inmanta.vendor import pyformance
+
 
 class IPCException(Exception):
     pass
@@ -87,6 +89,24 @@ class IPCLogRecord(IPCFrame):
     msg: str
 
 
+@dataclass
+class IPCLogRecordBatch(IPCFrame):
+    """
+    Multiple log records shipped in a single frame. Only sent to peers that announced the LOG_BATCH feature.
+    """
+
+    records: list[IPCLogRecord]
+
+
+# Optional protocol features, announced to the peer when the connection is made
+LOG_BATCH = "log_batch"
+
+# Marker for the feature announcement frame. The announcement only consists of builtin types, so that a peer that doesn't
+# support feature negotiation can still decode it. Such a peer logs the frame as unhandled and otherwise ignores it, and
+# it never announces any features itself, so both sides keep using the base protocol.
+HANDSHAKE_MARKER = "inmanta.ipc.features"
+
+
 class IPCFrameProtocol(Protocol):
     """
     Simple protocol which sends
@@ -98,57 +118,68 @@ class IPCFrameProtocol(Protocol):
 
     This protocol is only suited for local interprocess communications, when both ends are trusted.
     This protocol is based on pickle for speed, so it is as insecure as pickle.
+
+    When the connection is made, both sides announce the optional protocol features they support (see `features`).
+    Optional features are only used once the peer has announced them, so peers of different versions interoperate.
     """
 
+    # Optional features supported by this side of the connection, extended by subclasses
+    features: typing.ClassVar[frozenset[str]] = frozenset()
+
     def __init__(self, name: str) -> None:
         # Expected size of frame
         # -1 if no frame in flight
         self.frame_size = -1
 
         # Buffer with all data we have received and not dispatched
-        # We could sqeeze out some more performance by using memoryview instead of an array
-        self.frame_buffer: Optional[bytes] = None
+        self.frame_buffer: bytearray = bytearray()
 
         # Our transport
         self.transport: Optional[transports.Transport] = None
 
+        # Optional features supported by the remote side, empty until it has announced them
+        self.peer_features: frozenset[str] = frozenset()
+
         self.name = name
         self.logger = logging.getLogger(f"ipc.{name}")
 
     def connection_made(self, transport: transports.Transport) -> None:
         # Capture the transport
         self.transport = transport
+        if self.features:
+            self._send_block(pickle.dumps((HANDSHAKE_MARKER, sorted(self.features)), protocol=pickle.HIGHEST_PROTOCOL))
 
     def data_received(self, data: bytes) -> None:
         # Get a block of data
         # Append to frame buffer
-        if self.frame_buffer is not None:
-            self.frame_buffer += data
-        else:
-            self.frame_buffer = data
+        self.frame_buffer += data
+        # Dispatch all complete frames, then drop them from the buffer at once
+        offset = 0
         while True:
             # Eat up frames
             if self.frame_size == -1:
-                if len(self.frame_buffer) < 4:
+                if len(self.frame_buffer) - offset < 4:
                     # incomplete length field, wait for data
                     break
 
                 # new frame length received
-                length = struct.unpack_from("!L", self.frame_buffer)[0]
+                length = struct.unpack_from("!L", self.frame_buffer, offset)[0]
                 self.frame_size = length
-            if len(self.frame_buffer) >= self.frame_size + 4:
+            if len(self.frame_buffer) - offset >= self.frame_size + 4:
                 # Fill frame in buffer, dispatch
-                self._block_received(self.frame_buffer[4 : self.frame_size + 4])
-                # Truncate buffer
-                self.frame_buffer = self.frame_buffer[self.frame_size + 4 :]
+                self._block_received(bytes(self.frame_buffer[offset + 4 : offset + self.frame_size + 4]))
+                offset += self.frame_size + 4
                 # Reset frame size
                 self.frame_size = -1
             else:
                 # Not full frame anymore, wait for data
                 break
+        # Truncate buffer
+        del self.frame_buffer[:offset]
 
     def _block_received(self, block: bytes) -> None:
         """Interception point for tests of block handling"""
+        pyformance.histogram("internal.ipc.frame_size.received").add(len(block))
         try:
             frame = pickle.loads(block)
         except Exception:
@@ -157,6 +188,9 @@ class IPCFrameProtocol(Protocol):
             self.transport.close()
             return
         try:
+            if isinstance(frame, tuple) and len(frame) == 2 and frame[0] == HANDSHAKE_MARKER:
+                self.peer_features = frozenset(frame[1])
+                return
             self.frame_received(frame)
         except Exception:
             # Failed to unpickle, drop frame
@@ -169,14 +203,18 @@ class IPCFrameProtocol(Protocol):
         if self.transport.is_closing():
             raise ConnectionLost()
         try:
-            buffer = pickle.dumps(frame)
+            buffer = pickle.dumps(frame, protocol=pickle.HIGHEST_PROTOCOL)
         except PicklingError:
             raise
         except Exception as e:
             # Pickle tends to raise other exceptions as well...
             raise PicklingError() from e
-        size = struct.pack("!L", len(buffer))
-        self.transport.write(size + buffer)
+        self._send_block(buffer)
+
+    def _send_block(self, buffer: bytes) -> None:
+        pyformance.histogram("internal.ipc.frame_size.sent").add(len(buffer))
+        # Write header and payload separately, to avoid copying the payload into a new buffer
+        self.transport.writelines((struct.pack("!L", len(buffer)), buffer))
 
     def frame_received(self, frame: IPCFrame) -> None:
         """
@@ -313,18 +351,29 @@ class LogReceiver(IPCFrameProtocol):
     When installing the LogShipper and LogReceiver in the same process, this will create an infinite loop
     """
 
+    features = IPCFrameProtocol.features | {LOG_BATCH}
+
     def frame_received(self, frame: IPCFrame) -> None:
         if isinstance(frame, IPCLogRecord):
-            # calling log here is safe because if there are no arguments, formatter is never called
-            logging.getLogger(frame.name).log(frame.levelno, frame.msg)
+            self._log(frame)
+        elif isinstance(frame, IPCLogRecordBatch):
+            for record in frame.records:
+                self._log(record)
         else:
             super().frame_received(frame)
 
+    def _log(self, record: IPCLogRecord) -> None:
+        # calling log here is safe because if there are no arguments, formatter is never called
+        logging.getLogger(record.name).log(record.levelno, record.msg)
+
 
 class LogShipper(logging.Handler):
     """
     Log sender associated with the log receiver
 
+    All records emitted before the event loop gets to send them are coalesced into a single frame, if the receiving side
+    supports it.
+
     This sender is threadsafe
     """
 
@@ -333,34 +382,52 @@ class LogShipper(logging.Handler):
         self.eventloop = eventloop
         self.logger_name = "inmanta.ipc.logs"
         self.logger = logging.getLogger(self.logger_name)
+        # Records waiting to be sent, a flush is scheduled on the event loop iff this is not empty
+        self._pending: list[IPCLogRecord] = []
+        self._pending_lock = threading.Lock()
         super().__init__()
 
-    def _send_frame(self, record: IPCLogRecord) -> None:
+    def _send_frame(self, frame: IPCLogRecord | IPCLogRecordBatch) -> None:
         try:
-            self.protocol.send_frame(record)
+            self.protocol.send_frame(frame)
         except ConnectionLost:
             # Stop exception here
             # Log in own logger to prevent loops
-            self.logger.debug("Could not send log line, connection lost %s", record.msg, exc_info=True)
+            self.logger.debug("Could not send log line, connection lost %s", self._describe(frame), exc_info=True)
             return
         except Exception:
             # Stop exception here
             # Log in own logger to prevent loops
-            self.logger.info("Could not send log line %s", record.msg, exc_info=True)
+            self.logger.info("Could not send log line %s", self._describe(frame), exc_info=True)
             return
 
+    @staticmethod
+    def _describe(frame: IPCLogRecord | IPCLogRecordBatch) -> str:
+        if isinstance(frame, IPCLogRecord):
+            return frame.msg
+        return "\n".join(record.msg for record in frame.records)
+
+    def _flush(self) -> None:
+        with self._pending_lock:
+            records, self._pending = self._pending, []
+        if LOG_BATCH in self.protocol.peer_features and len(records) > 1:
+            self._send_frame(IPCLogRecordBatch(records))
+        else:
+            for record in records:
+                self._send_frame(record)
+
     def emit(self, record: logging.LogRecord) -> None:
         if record.name == self.logger_name:
             # avoid loops
             # When we fail to send, we produce a log line on this logger
             return
-        self.eventloop.call_soon_threadsafe(
-            functools.partial(
-                self._send_frame,
-                IPCLogRecord(
-                    record.name,
-                    record.levelno,
-                    self.format(record),
-                ),
-            )
+        ipc_record = IPCLogRecord(
+            record.name,
+            record.levelno,
+            self.format(record),
         )
+        with self._pending_lock:
+            self._pending.append(ipc_record)
+            flush_scheduled: bool = len(self._pending) > 1
+        if not flush_scheduled:
+            self.eventloop.call_soon_threadsafe(self._flush)
@@ -334,6 +334,23 @@ def upload_file(id: str, content: str):
     """
 
 
+@auth(auth_label=const.CoreAuthorizationLabel.FILE_WRITE, read_only=False)
+@method(
+    path="/files",
+    operation="PUT",
+    agent_server=True,
+    api=True,
+    client_types=[const.ClientType.api, const.ClientType.agent, const.ClientType.compiler],
+    arg_options={"files": ArgOption(getter=ignore_env)},
+)
+def upload_files(files: dict[str, str]):
+    """
+    Upload multiple files in a single request
+
+    :param files: A dictionary that maps the sha1 hash of the content of each file to its base64 encoded content
+    """
+
+
 @auth(auth_label=const.CoreAuthorizationLabel.FILE_READ, read_only=True)
 @method(
     path="/file/<id>",
@@ -478,6 +495,7 @@ def put_version(
     resource_sets: dict[inmanta.types.ResourceIdStr, str | None] = {},
     pip_config: PipConfig | None = None,
     project_constraints: str | None = None,
+    upload_id: uuid.UUID | None = None,
 ):
     """
     Store a new version of the configuration model
@@ -496,6 +514,8 @@ def put_version(
     :param module_version_info: Map of (module name, module version) to InmantaModule
     :param project_constraints: String of all the constraints set at the project level (if any) to be enforced during agent
         code install
+    :param upload_id: Optional. The id of an upload session, opened with open_version_upload, whose staged resources are
+        added to the resources of this version. The session is closed by this call.
 
     """
 
@@ -58,6 +58,7 @@ def put_partial(
     removed_resource_sets: Optional[Sequence[str]] = None,
     pip_config: Optional[PipConfig] = None,
     allow_handler_code_update: bool = False,
+    upload_id: Optional[uuid.UUID] = None,
     **kwargs: object,  # bypass the type checking for the resources and version_info argument
 ) -> ReturnValue[int]:
     """
@@ -86,11 +87,59 @@ def put_partial(
     :param allow_handler_code_update: [Expert] Allow handler code update during partial compile. This is otherwise
         only allowed for full compiles. Use with extreme caution, and only when confident that all code is compatible
         with previous versions.
+    :param upload_id: The id of an upload session, opened with open_version_upload, whose staged resources are added to the
+        resources of this partial export. The session is closed by this call.
 
     :return: The newly stored version number.
     """
 
 
+@auth(auth_label=const.CoreAuthorizationLabel.DESIRED_STATE_WRITE, read_only=False, environment_param="tid")
+@typedmethod(
+    path="/version/upload",
+    operation="POST",
+    arg_options=methods.ENV_OPTS,
+    client_types=[ClientType.compiler],
+    api_version=2,
+)
+def open_version_upload(tid: uuid.UUID) -> uuid.UUID:
+    """
+    Open an upload session to send the resources of a new version of the configuration model in batches. The resources are
+    staged on the server until the session is committed by passing its id as the upload_id argument of put_version or
+    put_partial. Sessions that remain idle for longer than :inmanta.config:option:`server.version-upload-timeout` are
+    discarded.
+
+    :param tid: The id of the environment
+    :return: The id of the upload session.
+    """
+
+
+@auth(auth_label=const.CoreAuthorizationLabel.DESIRED_STATE_WRITE, read_only=False, environment_param="tid")
+@typedmethod(
+    path="/version/upload/<upload_id>",
+    operation="PUT",
+    arg_options=methods.ENV_OPTS,
+    client_types=[ClientType.compiler],
+    api_version=2,
+    varkw=True,
+)
+def upload_version_resources(
+    tid: uuid.UUID,
+    upload_id: uuid.UUID,
+    **kwargs: object,  # bypass the type checking for the resources argument
+) -> None:
+    """
+    Stage a batch of resources in an upload session.
+
+    :param tid: The id of the environment
+    :param upload_id: The id of the upload session, as returned by open_version_upload.
+    :param **kwargs: The following arguments are supported:
+              * resources: a list of resource objects, in the same format as for put_version or put_partial.
+
+    :raise NotFound: The upload session doesn't exist or has expired.
+    """
+
+
 # Method for working with projects
 @auth(auth_label=const.CoreAuthorizationLabel.PROJECT_CREATE, read_only=False)
 @typedmethod(path="/project", operation="PUT", client_types=[ClientType.api], api_version=2)
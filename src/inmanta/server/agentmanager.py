@@ -26,7 +26,7 @@ import time
 import typing
 import uuid
 from asyncio import subprocess
-from collections.abc import Iterable, Mapping, Sequence, Set
+from collections.abc import Collection, Iterable, Mapping, Sequence, Set
 from dataclasses import dataclass
 from datetime import datetime
 from functools import reduce
@@ -541,6 +541,16 @@ class AgentManager(ServerSlice, websocket.SessionListener):
             else:
                 return await self._create_default_agent(env, nodename, connection=connection)
 
+    @tracing.instrument("AgentManager.ensure_agents_registered")
+    async def ensure_agents_registered(
+        self, env: data.Environment, nodenames: Collection[str], *, connection: Optional[asyncpg.connection.Connection] = None
+    ) -> None:
+        """
+        Make sure that all given agents have been created in the database, using a single query.
+        """
+        async with self.session_lock:
+            await data.Agent.insert_many_if_not_exist(env.id, nodenames, connection=connection)
+
     async def _create_default_agent(
         self, env: data.Environment, nodename: str, *, connection: Optional[asyncpg.connection.Connection] = None
     ) -> data.Agent:
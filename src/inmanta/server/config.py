@@ -18,6 +18,7 @@ Contact: code@inmanta.com
 
 import enum
 import logging
+import typing
 import warnings
 from typing import Optional
 
@@ -347,6 +348,41 @@ server_purge_version_interval = Option(
     is_time,
 )
 
+server_purge_version_time_budget = Option(
+    "server",
+    "purge-versions-time-budget",
+    300,
+    "The maximal number of seconds a single run of the version purging may take. The versions that were not purged yet are"
+    " purged in the next run. Set to 0 to disable this limit.",
+    is_time,
+)
+
+server_version_upload_timeout = Option(
+    "server",
+    "version-upload-timeout",
+    3600,
+    """The number of seconds a version upload session can remain idle before the server discards it together with
+    the resources staged for it.""",
+    is_time,
+)
+
+server_version_upload_max_sessions = Option(
+    "server",
+    "version-upload-max-sessions",
+    10,
+    "The maximum number of version upload sessions an environment can have open at the same time.",
+    is_lower_bounded_int(1),
+)
+
+server_version_upload_max_size = Option(
+    "server",
+    "version-upload-max-size",
+    1024 * 1024 * 1024,
+    """The maximum number of bytes an environment can have staged on disk, over all its open version upload sessions.
+    The resources are staged compressed. A batch that would exceed this limit is rejected.""",
+    is_lower_bounded_int(1),
+)
+
 server_compiler_report_retention = Option(
     "server",
     "compiler-report-retention",
@@ -365,6 +401,26 @@ server_cleanup_compiler_reports_interval = Option(
     is_time,
 )
 
+server_compiler_worker = Option(
+    "server",
+    "compiler-worker",
+    False,
+    """Keep a compiler worker process per environment that has the project and its plugins loaded, and run every
+    server-side compile in a child forked from it, instead of in a new process. This saves the startup time of the compiler
+    for environments that are recompiled often. The worker is replaced when the project, its modules, the compiler venv or
+    the environment variables of the compile change. Its log is written to the log directory.""",
+    is_bool,
+)
+
+server_compiler_worker_startup_timeout = Option(
+    "server",
+    "compiler-worker-startup-timeout",
+    300,
+    """How long, in seconds, a compiler worker (see :inmanta.config:option:`server.compiler-worker`) may take to load the
+    project. A worker that is not ready in time is killed and the compile runs in a new process instead.""",
+    is_time,
+)
+
 server_token_retention = Option(
     "server",
     "token-retention",
@@ -413,6 +469,25 @@ server_resource_action_log_prefix: Option[str] = Option(
     is_str,
 )
 
+server_resource_action_log_queue_size = Option(
+    "server",
+    "resource-action-log-queue-size",
+    10000,
+    "The maximum number of resource action log records that wait to be written to the resource action logs. The records"
+    " are written from a background thread. When the queue is full, new records wait for room in the queue for at most"
+    " server.resource-action-log-queue-timeout seconds before they are dropped.",
+    is_int,
+)
+
+server_resource_action_log_queue_timeout = Option(
+    "server",
+    "resource-action-log-queue-timeout",
+    5.0,
+    "The number of seconds a resource action log record waits for room in the full resource action log queue before it is"
+    " dropped.",
+    is_float,
+)
+
 server_enabled_extensions: Option[list[str]] = Option(
     "server",
     "enabled_extensions",
@@ -432,6 +507,54 @@ server_access_control_allow_origin = Option(
 )
 
 
+class PageCountStrategy(enum.Enum):
+    """
+    An enum that contains the strategies to calculate the page counts of the paged API endpoints.
+    """
+
+    # Count the matching records on every request
+    exact = "exact"
+    # Estimate the counts from the statistics of the query planner
+    estimated = "estimated"
+    # Count the matching records, but reuse the counts of identical requests for a short time
+    cached = "cached"
+
+
+def _is_page_count_strategy_map(value: str | typing.Mapping[str, str]) -> typing.Mapping[str, PageCountStrategy]:
+    """
+    List of comma-separated view=strategy pairs, valid strategies: exact, estimated or cached
+    """
+    result: dict[str, PageCountStrategy] = {}
+    for view, strategy in is_map(value).items():
+        try:
+            result[view] = PageCountStrategy(strategy)
+        except ValueError:
+            raise ValueError(f"Invalid page count strategy for {view}: {strategy}. Valid values: exact, estimated or cached")
+    return result
+
+
+server_page_count_strategy: Option[typing.Mapping[str, PageCountStrategy]] = Option(
+    "server",
+    "page-count-strategy",
+    "",
+    """The strategy used to calculate the total number of records and the number of records before and after the
+    requested page for the paged API endpoints, as a comma-separated list of view=strategy pairs. The view is the name of
+    the listing, e.g. resource_logs or resource_history. The strategy is one of exact (the default), estimated or cached.
+    Estimated counts are taken from the statistics of the query planner, they are cheap but can be far off. Cached counts
+    are exact counts that are reused for :inmanta.config:option:`server.page-count-cache-ttl` seconds by identical
+    requests. When the counts are not exact, the strategy is reported in the count_strategy field of the metadata.""",
+    _is_page_count_strategy_map,
+)
+
+server_page_count_cache_ttl = Option(
+    "server",
+    "page-count-cache-ttl",
+    10,
+    "The number of seconds the page counts of the listings that use the cached page count strategy are reused.",
+    is_time,
+)
+
+
 def default_hangtime() -> int:
     """:inmanta.config:option:`server.agent-timeout` *3/4"""
     return int(agent_timeout.get() * 3 / 4)
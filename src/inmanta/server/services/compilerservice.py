@@ -57,12 +57,22 @@ from inmanta.server import SLICE_COMPILER, SLICE_DATABASE, SLICE_ENVIRONMENT, SL
 from inmanta.server import config as opt
 from inmanta.server.protocol import ServerSlice
 from inmanta.server.services import environmentservice
+from inmanta.server.services.compilerworker import (
+    CompilerWorker,
+    CompilerWorkerException,
+    CompilerWorkerPool,
+    get_project_fingerprint,
+)
 from inmanta.server.validate_filter import InvalidFilter
 from inmanta.types import Apireturn, ArgumentTypes, JsonType, Warnings
 from inmanta.util import TaskMethod, ensure_directory_exist
 
 RETURNCODE_INTERNAL_ERROR = -1
 BUFFER_SIZE: int = 8192
+# The output of a compile stage is written to the database when this many characters are buffered
+STREAM_FLUSH_SIZE: int = 64 * 1024
+# or when output has been buffered for this many seconds
+STREAM_FLUSH_INTERVAL: float = 1.0
 
 # Default environment variables that make git non-interactive. The compiler runs git in a subprocess
 # whose stdin is not a terminal, so git can never read an answer to a credential prompt. Without these,
@@ -98,11 +108,95 @@ class CompileStateListener:
         return False
 
 
+class StreamBuffer:
+    """
+    Buffers the output of a compile stage for a single stream, to write it to the report in large chunks. Every write to
+    the report rewrites the complete stream column in the database, so writing every chunk read from the subprocess
+    separately is expensive for compiles that produce a lot of output.
+
+    The buffer is written to the report when it exceeds a size threshold, when output has been buffered for a certain
+    time, so the output of a running compile remains visible, and when the buffer is closed.
+    """
+
+    def __init__(
+        self,
+        report: data.Report,
+        stream: str,
+        flush_size: int = STREAM_FLUSH_SIZE,
+        flush_interval: float = STREAM_FLUSH_INTERVAL,
+    ) -> None:
+        """
+        :param report: The report to write the output to.
+        :param stream: The stream to write to, either "out" or "err".
+        :param flush_size: Write the buffer to the report when it contains this many characters.
+        :param flush_interval: Write the buffer to the report when it contains output that is this old (in seconds).
+        """
+        assert stream in ("out", "err")
+        self.report = report
+        self.stream = stream
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+
+        self._parts: list[str] = []
+        self._size = 0
+        # Serializes the writes to the report, so the output is written in order
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._background_flush: Optional[asyncio.Task[None]] = None
+
+    async def write(self, part: str) -> None:
+        if not part:
+            return
+        self._parts.append(part)
+        self._size += len(part)
+        if self._size >= self.flush_size:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.flush_interval, self._start_background_flush)
+
+    def _start_background_flush(self) -> None:
+        self._timer = None
+        self._background_flush = asyncio.create_task(self._flush_in_background())
+
+    async def _flush_in_background(self) -> None:
+        try:
+            await self.flush()
+        except Exception:
+            LOGGER.warning("Failed to write compile output to the report", exc_info=True)
+
+    async def flush(self) -> None:
+        """
+        Write all buffered output to the report.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        async with self._lock:
+            if not self._parts:
+                return
+            content = "".join(self._parts)
+            self._parts = []
+            self._size = 0
+            await self.report.update_streams(**{self.stream: content})
+
+    async def close(self) -> None:
+        """
+        Write all buffered output to the report and wait for the writes in progress.
+        """
+        await self.flush()
+        if self._background_flush is not None:
+            await self._background_flush
+            self._background_flush = None
+
+
 class CompileRun:
     """Class encapsulating running the compiler."""
 
-    def __init__(self, request: data.Compile, project_dir: str) -> None:
+    def __init__(
+        self, request: data.Compile, project_dir: str, compiler_worker_pool: Optional[CompilerWorkerPool] = None
+    ) -> None:
         self.request = request
+        self._compiler_worker_pool = compiler_worker_pool
         self.stage: Optional[data.Report] = None
         self._project_dir = os.path.abspath(project_dir)
         # When set, used to collect tail of std out
@@ -161,30 +255,40 @@ class CompileRun:
         """Drain stdout from the subprocess and forward it to the stage.
 
         Uses an incremental decoder because a multi-byte UTF-8 character may be split across
-        consecutive 8192-byte reads.
+        consecutive 8192-byte reads. The output is buffered and written to the stage in large chunks,
+        all output is written when this method returns.
         """
+        assert self.stage is not None
+        buffer = StreamBuffer(self.stage, "out")
 
         async def log_part(part: str) -> None:
             self._add_to_tail(part)
             COMPILER_LOGGER.log(const.LOG_LEVEL_TRACE, "%s %s Out:", self.request.id, part)
-            assert self.stage is not None
-            await self.stage.update_streams(out=part)
+            await buffer.write(part)
 
-        await self._drain(stream, log_part)
+        try:
+            await self._drain(stream, log_part)
+        finally:
+            await buffer.close()
 
     async def drain_err(self, stream: asyncio.StreamReader) -> None:
         """Drain stderr from the subprocess and forward it to the stage.
 
         Uses an incremental decoder because a multi-byte UTF-8 character may be split across
-        consecutive 8192-byte reads.
+        consecutive 8192-byte reads. The output is buffered and written to the stage in large chunks,
+        all output is written when this method returns.
         """
+        assert self.stage is not None
+        buffer = StreamBuffer(self.stage, "err")
 
         async def log_part(part: str) -> None:
             COMPILER_LOGGER.log(const.LOG_LEVEL_TRACE, "%s %s Err:", self.request.id, part)
-            assert self.stage is not None
-            await self.stage.update_streams(err=part)
+            await buffer.write(part)
 
-        await self._drain(stream, log_part)
+        try:
+            await self._drain(stream, log_part)
+        finally:
+            await buffer.close()
 
     async def drain(self, sub_process: asyncio.subprocess.Process) -> int:
         with tracing.span("drain"):
@@ -263,6 +367,63 @@ class CompileRun:
                 # The process is still running, kill it
                 sub_process.kill()
 
+    async def _run_compile_stage_in_worker(
+        self, name: str, worker: CompilerWorker, inmanta_args: list[str], env: dict[str, str]
+    ) -> data.Report:
+        await self._start_stage(name, " ".join(inmanta_args))
+        try:
+            env_all = {**GIT_NON_INTERACTIVE_ENV, **env}
+            with tracing.span("drain"):
+                returncode = await worker.run(inmanta_args, env_all, self.drain_out, self.drain_err)
+            return await self._end_stage(returncode)
+        except CancelledError:
+            """Propagate Cancel"""
+            raise
+        except Exception as e:
+            await self._error("".join(traceback.format_exception(type(e), e, e.__traceback__)))
+            return await self._end_stage(RETURNCODE_INTERNAL_ERROR)
+
+    async def _get_compiler_worker(
+        self, venv_dir: str, env: dict[str, str], config_args: list[str]
+    ) -> Optional[CompilerWorker]:
+        """
+        Returns a compiler worker that has loaded the current state of the project, starting one if required. Returns None
+        if the compile should run in a new process.
+
+        Expected to be called after the setup stages, starts its own stage when it starts a worker.
+        """
+        if self._compiler_worker_pool is None:
+            return None
+        environment_id = self.request.environment
+        loop = asyncio.get_running_loop()
+        fingerprint: str = await loop.run_in_executor(
+            None,
+            get_project_fingerprint,
+            self._project_dir,
+            venv_dir,
+            self.request.used_environment_variables or {},
+        )
+        worker: Optional[CompilerWorker] = await self._compiler_worker_pool.get_worker(environment_id, fingerprint)
+        if worker is not None or self._compiler_worker_pool.has_failed(environment_id, fingerprint):
+            return worker
+
+        await self._start_stage("Starting compiler worker", "")
+        try:
+            worker = await self._compiler_worker_pool.start_worker(
+                environment_id,
+                fingerprint,
+                PythonEnvironment.get_python_path_for_env_path(venv_dir),
+                self._project_dir,
+                env,
+                config_args,
+            )
+        except CompilerWorkerException as e:
+            await self._warning(f"{e}. Compiling in a new process instead.")
+            await self._end_stage(0)
+            return None
+        await self._end_stage(0)
+        return worker
+
     async def ensure_compiler_venv(self) -> None:
         """ "
         Ensure we have a compiler venv in the project
@@ -380,15 +541,17 @@ class CompileRun:
             server_address = opt.internal_server_address.get()
             server_port = opt.server_bind_port.get()
 
-            app_cli_args = ["-vvv"]
+            config_args: list[str] = []
 
             if Config._min_c_config_file is not None:
-                app_cli_args.append("-c")
-                app_cli_args.append(Config._min_c_config_file)
+                config_args.append("-c")
+                config_args.append(Config._min_c_config_file)
 
             if Config._config_dir is not None:
-                app_cli_args.append("--config-dir")
-                app_cli_args.append(Config._config_dir)
+                config_args.append("--config-dir")
+                config_args.append(Config._config_dir)
+
+            app_cli_args = ["-vvv", *config_args]
 
             export_command = [
                 "export",
@@ -577,10 +740,18 @@ class CompileRun:
                 if stage_result and (stage_result.returncode is None or stage_result.returncode > 0):
                     return False, None
 
+            compiler_worker: Optional[CompilerWorker] = await self._get_compiler_worker(venv_dir, env_vars_compile, config_args)
+
             self.tail_stdout = ""
-            result: data.Report = await run_compile_stage_in_venv(
-                "Recompiling configuration model", cmd, cwd=project_dir, env=env_vars_compile
-            )
+            result: data.Report
+            if compiler_worker is not None:
+                result = await self._run_compile_stage_in_worker(
+                    "Recompiling configuration model", compiler_worker, cmd, {**env_vars_compile, **tracing.get_context()}
+                )
+            else:
+                result = await run_compile_stage_in_venv(
+                    "Recompiling configuration model", cmd, cwd=project_dir, env=env_vars_compile
+                )
             success = result.returncode == 0
             if not success:
                 if self.request.do_export:
@@ -679,6 +850,9 @@ class CompilerService(ServerSlice, inmanta.server.services.environmentlistener.E
         self._queue_count_cache: int = 0
         self._queue_count_cache_lock = asyncio.locks.Lock()
 
+        # Warm compiler processes, see the server.compiler-worker option
+        self._compiler_worker_pool: Optional[CompilerWorkerPool] = None
+
     async def get_status(self) -> Mapping[str, ArgumentTypes]:
         return {"task_queue": self._queue_count_cache, "listeners": len(self.async_listeners) + len(self.blocking_listeners)}
 
@@ -701,9 +875,18 @@ class CompilerService(ServerSlice, inmanta.server.services.environmentlistener.E
 
     async def start(self) -> None:
         await super().start()
+        if opt.server_compiler_worker.get():
+            self._compiler_worker_pool = CompilerWorkerPool(
+                config.log_dir.get(), opt.server_compiler_worker_startup_timeout.get()
+            )
         await self._recover()
         self.schedule(self._cleanup, opt.server_cleanup_compiler_reports_interval.get(), initial_delay=0, cancel_on_stop=False)
 
+    async def stop(self) -> None:
+        await super().stop()
+        if self._compiler_worker_pool is not None:
+            await self._compiler_worker_pool.stop()
+
     async def _cleanup(self) -> None:
         oldest_retained_date = datetime.datetime.now().astimezone() - datetime.timedelta(
             seconds=opt.server_compiler_report_retention.get()
@@ -1224,7 +1407,7 @@ class CompilerService(ServerSlice, inmanta.server.services.environmentlistener.E
         await self._process_next_compile_in_queue(environment=compile.environment, finish_current_compile=True)
 
     def _get_compile_runner(self, compile: data.Compile, project_dir: str) -> CompileRun:
-        return CompileRun(compile, project_dir)
+        return CompileRun(compile, project_dir, self._compiler_worker_pool)
 
     @protocol.handle(methods.get_reports, env="tid")
     async def get_reports(
@@ -1323,6 +1506,8 @@ class CompilerService(ServerSlice, inmanta.server.services.environmentlistener.E
         :param env: The environment that is deleted
         """
         await self.recalculate_queue_count_cache()
+        if self._compiler_worker_pool is not None:
+            await self._compiler_worker_pool.stop_worker(env.id)
 
     async def recalculate_queue_count_cache(self) -> None:
         async with self._queue_count_cache_lock:
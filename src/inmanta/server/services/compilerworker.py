@@ -0,0 +1,458 @@
+"""
+Copyright 2026 Inmanta
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Contact: code@inmanta.com
+"""
+
+import argparse
+import asyncio
+import contextlib
+import glob
+import hashlib
+import json
+import logging
+import os
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import traceback
+import uuid
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from typing import NoReturn, Optional
+
+from inmanta import config
+from inmanta.const import CF_CACHE_DIR
+
+LOGGER = logging.getLogger(__name__)
+
+# Requests and replies are single datagrams on a SOCK_SEQPACKET socket
+MAX_MESSAGE_SIZE: int = 1024 * 1024
+# How often to check whether a worker that is starting is ready to accept compiles, in seconds
+WORKER_READY_POLL_INTERVAL: float = 0.1
+# Default time a worker gets to load the project, in seconds
+WORKER_STARTUP_TIMEOUT: float = 300.0
+# Time a worker gets to stop before it is killed, in seconds
+WORKER_STOP_TIMEOUT: float = 5.0
+
+
+class CompilerWorkerException(Exception):
+    """
+    Raised when a compiler worker can not be started, or a compile can not be handed over to it.
+    """
+
+
+def get_project_fingerprint(project_dir: str, venv_dir: str, environment_variables: Mapping[str, str]) -> str:
+    """
+    Returns a fingerprint of everything a compiler worker loads up front: the sources of the project and its v1 modules,
+    the packages installed in the venv and the environment variables passed to the compile.
+
+    This only looks at the names, sizes and modification times of the files, not at their content.
+    """
+    fingerprint = hashlib.sha256()
+
+    def add(*parts: object) -> None:
+        fingerprint.update("\0".join(str(part) for part in parts).encode())
+        fingerprint.update(b"\n")
+
+    for name, value in sorted(environment_variables.items()):
+        add("env", name, value)
+
+    for root, dirs, files in os.walk(project_dir):
+        dirs[:] = sorted(
+            directory
+            for directory in dirs
+            if directory != "__pycache__"
+            and not (root == project_dir and (directory in (".git", CF_CACHE_DIR) or directory.startswith(".env")))
+        )
+        for file_name in sorted(files):
+            path = os.path.join(root, file_name)
+            with contextlib.suppress(FileNotFoundError):
+                stat = os.stat(path)
+                add("file", os.path.relpath(path, project_dir), stat.st_size, stat.st_mtime_ns)
+
+    # Installing, upgrading or removing a package changes the entries of site-packages
+    venv_path = os.path.realpath(venv_dir)
+    add("venv", venv_path)
+    for site_packages in sorted(glob.glob(os.path.join(venv_path, "lib", "python*", "site-packages"))):
+        with os.scandir(site_packages) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                add("package", entry.name, entry.stat(follow_symlinks=False).st_mtime_ns)
+
+    return fingerprint.hexdigest()
+
+
+async def _open_pipe(fd: int) -> tuple[asyncio.StreamReader, asyncio.BaseTransport]:
+    """
+    Returns a StreamReader for the read end of a pipe.
+    """
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    transport, _ = await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), os.fdopen(fd, "rb", 0))
+    return reader, transport
+
+
+class CompilerWorker:
+    """
+    The server side of a compiler worker process for a single environment.
+    """
+
+    def __init__(
+        self,
+        environment: uuid.UUID,
+        fingerprint: str,
+        python_path: str,
+        project_dir: str,
+        socket_path: str,
+        log_file: str,
+    ) -> None:
+        self.environment = environment
+        self.fingerprint = fingerprint
+        self.python_path = python_path
+        self.project_dir = project_dir
+        self.socket_path = socket_path
+        self.log_file = log_file
+        self._process: Optional[asyncio.subprocess.Process] = None
+
+    def is_running(self) -> bool:
+        return self._process is not None and self._process.returncode is None
+
+    async def start(
+        self, env: Mapping[str, str], config_args: Sequence[str], startup_timeout: float = WORKER_STARTUP_TIMEOUT
+    ) -> None:
+        """
+        Start the worker process and wait until it has loaded the project.
+
+        :param env: The environment variables for the worker process.
+        :param config_args: The arguments that point the worker to the configuration of the server.
+        :param startup_timeout: The time the worker gets to load the project, in seconds. The worker is killed when it is
+            not ready in time.
+        :raises CompilerWorkerException: The worker failed to load the project, or didn't load it in time.
+        """
+        loop = asyncio.get_running_loop()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.socket_path)
+        with open(self.log_file, "ab") as log:
+            self._process = await asyncio.create_subprocess_exec(
+                self.python_path,
+                "-m",
+                __name__,
+                "--socket",
+                self.socket_path,
+                *config_args,
+                cwd=self.project_dir,
+                env=dict(env),
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+            )
+        deadline: float = loop.time() + startup_timeout
+        while not os.path.exists(self.socket_path):
+            if loop.time() >= deadline:
+                self._process.kill()
+                await self._process.wait()
+                raise CompilerWorkerException(
+                    f"The compiler worker did not load the project within {startup_timeout} seconds, see {self.log_file}"
+                )
+            try:
+                returncode = await asyncio.wait_for(self._process.wait(), WORKER_READY_POLL_INTERVAL)
+            except TimeoutError:
+                continue
+            raise CompilerWorkerException(
+                f"The compiler worker exited with code {returncode} while loading the project, see {self.log_file}"
+            )
+        LOGGER.info("Started compiler worker for environment %s with pid %d", self.environment, self._process.pid)
+
+    async def run(
+        self,
+        inmanta_args: Sequence[str],
+        env: Mapping[str, str],
+        drain_out: Callable[[asyncio.StreamReader], Awaitable[None]],
+        drain_err: Callable[[asyncio.StreamReader], Awaitable[None]],
+    ) -> int:
+        """
+        Run the compiler with the given arguments in a child of the worker and return its exit code.
+
+        :param inmanta_args: The arguments for the compiler, as they would be passed to `python -m inmanta.app`.
+        :param env: The environment variables for the compile.
+        :param drain_out: Consumes the stdout of the compile.
+        :param drain_err: Consumes the stderr of the compile.
+        :raises CompilerWorkerException: The compile could not be handed over to the worker, or the worker stopped before
+            the compile finished.
+        """
+        loop = asyncio.get_running_loop()
+        with contextlib.ExitStack() as stack:
+            stdout_read, stdout_write = os.pipe()
+            stderr_read, stderr_write = os.pipe()
+            connection = stack.enter_context(socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET))
+            connection.setblocking(False)
+            try:
+                await loop.sock_connect(connection, self.socket_path)
+                request = json.dumps({"args": list(inmanta_args), "cwd": self.project_dir, "env": dict(env)}).encode()
+                socket.send_fds(connection, [request], [stdout_write, stderr_write])
+                reply = await loop.sock_recv(connection, MAX_MESSAGE_SIZE)
+                pid: int = json.loads(reply)["pid"]
+            except (OSError, ValueError, KeyError) as e:
+                os.close(stdout_read)
+                os.close(stderr_read)
+                raise CompilerWorkerException(f"Failed to hand over the compile to the compiler worker: {e}") from e
+            finally:
+                # The child has its own copy of the write ends, the pipes are closed when it exits
+                os.close(stdout_write)
+                os.close(stderr_write)
+
+            stdout, stdout_transport = await _open_pipe(stdout_read)
+            stack.callback(stdout_transport.close)
+            stderr, stderr_transport = await _open_pipe(stderr_read)
+            stack.callback(stderr_transport.close)
+
+            finished = False
+
+            async def wait() -> int:
+                nonlocal finished
+                reply = await loop.sock_recv(connection, MAX_MESSAGE_SIZE)
+                if not reply:
+                    raise CompilerWorkerException("The compiler worker stopped before the compile finished")
+                finished = True
+                return json.loads(reply)["returncode"]
+
+            try:
+                _, _, returncode = await asyncio.gather(drain_out(stdout), drain_err(stderr), wait())
+                return returncode
+            finally:
+                if not finished:
+                    # Cancelled or failed, don't leave the compile running
+                    with contextlib.suppress(ProcessLookupError):
+                        os.kill(pid, signal.SIGKILL)
+
+    async def stop(self) -> None:
+        if self._process is not None and self._process.returncode is None:
+            self._process.terminate()
+            try:
+                await asyncio.wait_for(self._process.wait(), WORKER_STOP_TIMEOUT)
+            except TimeoutError:
+                self._process.kill()
+                await self._process.wait()
+            LOGGER.info("Stopped compiler worker for environment %s", self.environment)
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.socket_path)
+
+
+class CompilerWorkerPool:
+    """
+    Keeps a compiler worker per environment, for the state of the project that was compiled last.
+
+    A compiler worker is a long-lived process, running in the compiler venv of the environment, that has imported the
+    compiler and loaded the project, including its plugins. For every compile, it forks a child that runs the export command
+    on this pre-loaded state, so the compile doesn't pay for the startup of the compiler and the loading of the project.
+
+    The compile is handed over on a unix socket, together with the write ends of the pipes for its stdout and stderr. The
+    child writes its output to these pipes directly, and the worker reports the pid of the child and, when it is done, its
+    exit code back over the socket.
+
+    A worker is only valid for the state of the project it loaded: it is replaced when the fingerprint of the project
+    directory, the venv or the environment variables of the compile changes, see :py:func:`get_project_fingerprint`.
+    """
+
+    def __init__(self, log_dir: str, startup_timeout: float = WORKER_STARTUP_TIMEOUT) -> None:
+        self.log_dir = log_dir
+        self.startup_timeout = startup_timeout
+        self._workers: dict[uuid.UUID, CompilerWorker] = {}
+        # The fingerprint for which starting a worker failed last, per environment, to not retry it for every compile
+        self._failed: dict[uuid.UUID, str] = {}
+        # Unix socket paths are limited in length, keep them in a short temporary directory
+        self._socket_dir: Optional[str] = None
+
+    def has_failed(self, environment: uuid.UUID, fingerprint: str) -> bool:
+        return self._failed.get(environment) == fingerprint
+
+    async def get_worker(self, environment: uuid.UUID, fingerprint: str) -> Optional[CompilerWorker]:
+        """
+        Returns the worker for the given environment if it is running and loaded the project with the given fingerprint.
+        Stops the worker if it loaded another state of the project.
+        """
+        worker: Optional[CompilerWorker] = self._workers.get(environment)
+        if worker is None:
+            return None
+        if worker.fingerprint == fingerprint and worker.is_running():
+            return worker
+        await self.stop_worker(environment)
+        return None
+
+    async def start_worker(
+        self,
+        environment: uuid.UUID,
+        fingerprint: str,
+        python_path: str,
+        project_dir: str,
+        env: Mapping[str, str],
+        config_args: Sequence[str],
+    ) -> CompilerWorker:
+        """
+        Start a worker for the given environment, replacing the current one.
+
+        :raises CompilerWorkerException: The worker failed to start.
+        """
+        await self.stop_worker(environment)
+        if self._socket_dir is None:
+            self._socket_dir = tempfile.mkdtemp(prefix="inmanta-compiler-")
+        os.makedirs(self.log_dir, exist_ok=True)
+        worker = CompilerWorker(
+            environment,
+            fingerprint,
+            python_path,
+            project_dir,
+            socket_path=os.path.join(self._socket_dir, f"{environment}.sock"),
+            log_file=os.path.join(self.log_dir, f"compiler-worker-{environment}.log"),
+        )
+        try:
+            await worker.start(env, config_args, self.startup_timeout)
+        except Exception:
+            self._failed[environment] = fingerprint
+            await worker.stop()
+            raise
+        self._failed.pop(environment, None)
+        self._workers[environment] = worker
+        return worker
+
+    async def stop_worker(self, environment: uuid.UUID) -> None:
+        """
+        Stop the worker for the given environment and forget that starting one failed, so the next compile tries again.
+        """
+        self._failed.pop(environment, None)
+        worker: Optional[CompilerWorker] = self._workers.pop(environment, None)
+        if worker is not None:
+            await worker.stop()
+
+    async def stop(self) -> None:
+        await asyncio.gather(*(self.stop_worker(environment) for environment in list(self._workers)))
+        if self._socket_dir is not None:
+            shutil.rmtree(self._socket_dir, ignore_errors=True)
+            self._socket_dir = None
+
+
+def _run_compile(request: Mapping[str, object], fds: Sequence[int]) -> NoReturn:
+    """
+    Run a compile in a child of the worker, with the output going to the given file descriptors. Never returns.
+    """
+    returncode = 1
+    try:
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        for source, target in ((devnull, 0), (fds[0], 1), (fds[1], 2)):
+            os.dup2(source, target)
+            os.close(source)
+        os.chdir(str(request["cwd"]))
+        os.environ.clear()
+        os.environ.update(request["env"])  # type: ignore[arg-type]
+        # The compile configures logging itself
+        root_logger = logging.getLogger()
+        for handler in list(root_logger.handlers):
+            root_logger.removeHandler(handler)
+        sys.argv = [sys.argv[0], *request["args"]]  # type: ignore[misc]
+
+        from inmanta import app
+
+        app.app()
+        returncode = 0
+    except SystemExit as e:
+        returncode = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        with contextlib.suppress(Exception):
+            sys.stdout.flush()
+            sys.stderr.flush()
+        os._exit(returncode)
+
+
+def serve(socket_path: str) -> NoReturn:
+    """
+    Accept compiles on the given socket and run each of them in a child of this process, one at a time.
+    """
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    # Only make the socket visible once it accepts connections: the server waits for it to appear
+    tmp_path = f"{socket_path}.tmp"
+    listener.bind(tmp_path)
+    listener.listen()
+    os.rename(tmp_path, socket_path)
+    LOGGER.info("Compiler worker ready")
+
+    while True:
+        connection, _ = listener.accept()
+        with connection:
+            try:
+                message, fds, _, _ = socket.recv_fds(connection, MAX_MESSAGE_SIZE, 2)
+            except OSError:
+                LOGGER.exception("Failed to receive a compile request")
+                continue
+            try:
+                request = json.loads(message)
+                if len(fds) != 2:
+                    raise ValueError(f"expected 2 file descriptors, got {len(fds)}")
+            except ValueError:
+                LOGGER.exception("Received an invalid compile request")
+                for fd in fds:
+                    os.close(fd)
+                continue
+
+            # Don't let the child inherit buffered output
+            sys.stdout.flush()
+            sys.stderr.flush()
+            pid = os.fork()
+            if pid == 0:
+                listener.close()
+                connection.close()
+                _run_compile(request, fds)
+            for fd in fds:
+                os.close(fd)
+            LOGGER.info("Started compile with pid %d", pid)
+
+            with contextlib.suppress(OSError):
+                connection.send(json.dumps({"pid": pid}).encode())
+            _, status = os.waitpid(pid, 0)
+            returncode = os.waitstatus_to_exitcode(status)
+            LOGGER.info("Compile with pid %d finished with exit code %d", pid, returncode)
+            with contextlib.suppress(OSError):
+                connection.send(json.dumps({"returncode": returncode}).encode())
+
+
+def main() -> None:
+    """
+    Entry point of the compiler worker process
+    """
+    parser = argparse.ArgumentParser(description="Compiler worker for server-side compiles")
+    parser.add_argument("--socket", dest="socket", required=True, help="The unix socket to accept compiles on")
+    parser.add_argument("-c", "--config", dest="config_file", help="Use this config file")
+    parser.add_argument("--config-dir", dest="config_dir", help="The directory containing the Inmanta configuration files")
+    parser.add_argument("-f", dest="main_file", help="Main file", default="main.cf")
+    options = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)-40s%(levelname)-8s%(message)s")
+    config.Config.load_config(min_c_config_file=options.config_file, config_dir=options.config_dir)
+
+    # Import the compiler once for all compiles
+    from inmanta import app, module  # noqa: F401
+
+    LOGGER.info("Loading project in %s", os.getcwd())
+    project = module.Project.get(options.main_file)
+    project.load()
+
+    serve(options.socket)
+
+
+if __name__ == "__main__":
+    main()
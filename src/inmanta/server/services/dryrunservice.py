@@ -16,7 +16,6 @@ limitations under the License.
 Contact: code@inmanta.com
 """
 
-import asyncio
 import logging
 import uuid
 from typing import Optional, cast
@@ -49,7 +48,6 @@ class DyrunService(protocol.ServerSlice):
 
     def __init__(self) -> None:
         super().__init__(SLICE_DRYRUN)
-        self.dryrun_lock = asyncio.Lock()
 
     def get_dependencies(self) -> list[str]:
         return [SLICE_DATABASE, SLICE_AGENT_MANAGER, SLICE_AUTOSTARTED_AGENT_MANAGER]
@@ -70,7 +68,18 @@ class DyrunService(protocol.ServerSlice):
 
         dryrun = await self.create_dryrun(env, version_id, model)
 
-        return 200, {"dryrun": dryrun}
+        return 200, {"dryrun": await self._dryrun_to_dict(dryrun)}
+
+    async def _dryrun_to_dict(self, dryrun: data.DryRun) -> JsonType:
+        """
+        Return the v1 API representation of the given dryrun, including the changes for each of its resources.
+        """
+        return {
+            **dryrun.to_dict(),
+            "resources": {
+                resource_version_id: payload async for resource_version_id, payload in data.DryRun.get_resources(dryrun.id)
+            },
+        }
 
     async def create_dryrun(self, env: data.Environment, version_id: int, model: data.ConfigurationModel) -> data.DryRun:
         if env.halted:
@@ -93,39 +102,38 @@ class DyrunService(protocol.ServerSlice):
         paused_agents = {agent.name for agent in await data.Agent.get_list(environment=env.id, paused=True)}
 
         # Mark the resources in an undeployable state as done
-        async with self.dryrun_lock:
-            undeployable_ids = model.get_undeployable()
-            undeployable_version_ids = [ResourceVersionIdStr(rid + ",v=%s" % version_id) for rid in undeployable_ids]
-            undeployable = await data.Resource.get_resources(environment=env.id, resource_version_ids=undeployable_version_ids)
-            await self._save_resources_without_changes_to_dryrun(
-                dryrun_id=dryrun.id, resources=undeployable, version=version_id, diff_status=ResourceDiffStatus.undefined
-            )
+        undeployable_ids = model.get_undeployable()
+        undeployable_version_ids = [ResourceVersionIdStr(rid + ",v=%s" % version_id) for rid in undeployable_ids]
+        undeployable = await data.Resource.get_resources(environment=env.id, resource_version_ids=undeployable_version_ids)
+        await self._save_resources_without_changes_to_dryrun(
+            dryrun_id=dryrun.id, resources=undeployable, version=version_id, diff_status=ResourceDiffStatus.undefined
+        )
 
-            skip_undeployable_ids = model.get_skipped_for_undeployable()
-            skip_undeployable_version_ids = [ResourceVersionIdStr(rid + ",v=%s" % version_id) for rid in skip_undeployable_ids]
-            skipundeployable = await data.Resource.get_resources(
-                environment=env.id, resource_version_ids=skip_undeployable_version_ids
-            )
-            await self._save_resources_without_changes_to_dryrun(
-                dryrun_id=dryrun.id,
-                resources=skipundeployable,
-                version=version_id,
-                diff_status=ResourceDiffStatus.skipped_for_undefined,
-            )
+        skip_undeployable_ids = model.get_skipped_for_undeployable()
+        skip_undeployable_version_ids = [ResourceVersionIdStr(rid + ",v=%s" % version_id) for rid in skip_undeployable_ids]
+        skipundeployable = await data.Resource.get_resources(
+            environment=env.id, resource_version_ids=skip_undeployable_version_ids
+        )
+        await self._save_resources_without_changes_to_dryrun(
+            dryrun_id=dryrun.id,
+            resources=skipundeployable,
+            version=version_id,
+            diff_status=ResourceDiffStatus.skipped_for_undefined,
+        )
 
-            resources_with_agents_down = [
-                res
-                for res in rvs
-                if res.resource_id not in undeployable_ids
-                and res.resource_id not in skip_undeployable_ids
-                and res.agent in paused_agents
-            ]
-            await self._save_resources_without_changes_to_dryrun(
-                dryrun_id=dryrun.id,
-                resources=resources_with_agents_down,
-                version=version_id,
-                diff_status=ResourceDiffStatus.agent_down,
-            )
+        resources_with_agents_down = [
+            res
+            for res in rvs
+            if res.resource_id not in undeployable_ids
+            and res.resource_id not in skip_undeployable_ids
+            and res.agent in paused_agents
+        ]
+        await self._save_resources_without_changes_to_dryrun(
+            dryrun_id=dryrun.id,
+            resources=resources_with_agents_down,
+            version=version_id,
+            diff_status=ResourceDiffStatus.agent_down,
+        )
 
         return dryrun
 
@@ -136,6 +144,7 @@ class DyrunService(protocol.ServerSlice):
         version: int,
         diff_status: Optional[ResourceDiffStatus] = None,
     ) -> None:
+        dryrun_data: dict[ResourceVersionIdStr, JsonType] = {}
         for res in resources:
             parsed_id = Id.parse_id(res.resource_id)
             parsed_id.set_version(version)
@@ -150,7 +159,8 @@ class DyrunService(protocol.ServerSlice):
                 "id": parsed_id.resource_version_str(),
             }
             payload = {**payload, "diff_status": diff_status} if diff_status else payload
-            await data.DryRun.update_resource(dryrun_id, parsed_id.resource_version_str(), payload)
+            dryrun_data[parsed_id.resource_version_str()] = payload
+        await data.DryRun.update_resources(dryrun_id, dryrun_data)
 
     @handle(methods_v2.dryrun_trigger, env="tid")
     async def dryrun_trigger(self, env: data.Environment, version: int) -> uuid.UUID:
@@ -197,25 +207,20 @@ class DyrunService(protocol.ServerSlice):
         if dryrun is None:
             raise NotFound("The given dryrun does not exist!")
 
-        return 200, {"dryrun": dryrun}
+        return 200, {"dryrun": await self._dryrun_to_dict(dryrun)}
 
     @handle(methods_v2.get_dryrun_diff, env="tid")
     async def dryrun_diff(self, env: data.Environment, version: int, report_id: uuid.UUID) -> DryRunReport:
         dryrun = await data.DryRun.get_one(environment=env.id, model=version, id=report_id)
         if dryrun is None:
             raise NotFound("The given dryrun does not exist!")
-        resources = dryrun.to_dict()["resources"]
         from_resources = {}
         to_resources = {}
-        resources_with_already_known_status = {
-            resource_version_id: resource for resource_version_id, resource in resources.items() if resource.get("diff_status")
-        }
-        resources_to_diff = {
-            resource_version_id: resource
-            for resource_version_id, resource in resources.items()
-            if resource_version_id not in resources_with_already_known_status.keys()
-        }
-        for resource_version_id, resource in resources_to_diff.items():
+        resources_with_already_known_status: dict[ResourceVersionIdStr, JsonType] = {}
+        async for resource_version_id, resource in data.DryRun.get_resources(dryrun.id):
+            if resource.get("diff_status"):
+                resources_with_already_known_status[resource_version_id] = resource
+                continue
             resource_id = Id.parse_id(resource_version_id).resource_str()
 
             from_attributes = self.get_attributes_from_changes(resource["changes"], "current")
@@ -254,8 +259,7 @@ class DyrunService(protocol.ServerSlice):
     async def dryrun_update(
         self, env: data.Environment, dryrun_id: uuid.UUID, resource: ResourceVersionIdStr, changes: JsonType
     ) -> Apireturn:
-        async with self.dryrun_lock:
-            payload = {"changes": changes, "id_fields": Id.parse_id(resource).to_dict(), "id": resource}
-            await data.DryRun.update_resource(dryrun_id, resource, payload)
+        payload = {"changes": changes, "id_fields": Id.parse_id(resource).to_dict(), "id": resource}
+        await data.DryRun.update_resource(dryrun_id, resource, payload)
 
         return 200
@@ -19,11 +19,9 @@ Contact: code@inmanta.com
 import base64
 import difflib
 import logging
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from typing import Optional
 
-from asyncpg.exceptions import UniqueViolationError
-
 from inmanta.data import File
 from inmanta.protocol import handle, methods
 from inmanta.protocol.exceptions import BadRequest, NotFound
@@ -55,14 +53,23 @@ class FileService(protocol.ServerSlice):
         return 200
 
     async def upload_file_internal(self, file_hash: str, content: bytes) -> None:
-        if hash_file(content) != file_hash:
-            raise BadRequest("The hash does not match the content")
+        await self.upload_files_internal({file_hash: content})
 
-        try:
-            await File(content_hash=file_hash, content=content).insert()
-        except UniqueViolationError:
-            # Silently ignore attempts to upload the same file twice
-            pass
+    @handle(methods.upload_files)
+    async def upload_files(self, files: dict[str, str]) -> Apireturn:
+        await self.upload_files_internal({file_hash: base64.b64decode(content) for file_hash, content in files.items()})
+        return 200
+
+    async def upload_files_internal(self, files: Mapping[str, bytes]) -> None:
+        """
+        Store the given files, by hash, with a single query
+        """
+        for file_hash, content in files.items():
+            if hash_file(content) != file_hash:
+                raise BadRequest("The hash does not match the content")
+
+        # Attempts to upload the same file twice are silently ignored
+        await File.insert_many_if_not_exist(files)
 
     @handle(methods.stat_file, file_hash="id")
     async def stat_file(self, file_hash: str) -> Apireturn:
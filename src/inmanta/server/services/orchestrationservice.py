@@ -16,8 +16,18 @@ limitations under the License.
 Contact: code@inmanta.com
 """
 
+import asyncio
+import contextlib
 import datetime
+import functools
+import glob
+import gzip
+import itertools
+import json
 import logging
+import os
+import shutil
+import time
 import uuid
 from collections import abc, defaultdict
 from collections.abc import Mapping, Sequence
@@ -30,7 +40,7 @@ import pydantic
 
 import inmanta.exceptions
 import inmanta.util
-from inmanta import const, data
+from inmanta import config, const, data
 from inmanta.const import ResourceState
 from inmanta.data import APILIMIT, AVAILABLE_VERSIONS_TO_KEEP, InvalidSort, ResourcePersistentState, RowLockMode
 from inmanta.data.dataview import DesiredStateVersionView
@@ -58,10 +68,14 @@ from inmanta.server import diff, protocol
 from inmanta.server.services import resourceservice
 from inmanta.server.validate_filter import InvalidFilter
 from inmanta.types import Apireturn, JsonType, PrimitiveTypes, ResourceIdStr, ResourceVersionIdStr, ReturnTupple
+from inmanta.vendor import pyformance
 
 LOGGER = logging.getLogger(__name__)
 PLOGGER = logging.getLogger("performance")
 
+# The number of versions that are deleted together by the version purging
+PURGE_VERSIONS_BATCH_SIZE = 100
+
 
 PERFORM_CLEANUP: bool = True
 # Kill switch for cleanup, for use when working with historical data
@@ -372,6 +386,110 @@ class PartialUpdateMerger:
         return [*old_unresolved_unknowns_to_keep, *unknowns_in_partial_compile]
 
 
+class VersionUpload:
+    """
+    An upload session for the resources of a new version of the configuration model. Every batch of resources is staged on
+    disk as a gzipped file with one json document per line, so that neither the batches nor the final commit have to hold the
+    serialized model in memory.
+    """
+
+    def __init__(self, environment: uuid.UUID, path: str) -> None:
+        """
+        :param environment: The environment the version is uploaded to.
+        :param path: The directory that holds the staged batches. It is created by this constructor.
+        """
+        self.environment = environment
+        self.path = path
+        self.nr_of_batches = 0
+        self.nr_of_resources = 0
+        # The number of bytes staged on disk
+        self.size = 0
+        self.last_activity = time.monotonic()
+        # Batches are written one at a time, so that they are read back in the order in which they were uploaded. The lock
+        # is also held while the batches are read, so that the session is not removed while it is being committed.
+        self._lock = asyncio.Lock()
+        self._removed = False
+        os.makedirs(self.path)
+
+    def _get_batch_file(self, index: int) -> str:
+        return os.path.join(self.path, f"{index:08d}.ndjson.gz")
+
+    def _write_batch(self, index: int, resources: abc.Sequence[JsonType], max_size: int) -> int:
+        """
+        Write the batch with the given index and return its size on disk. The batch is removed again when the session would
+        exceed the given size with it.
+
+        :raises BadRequest: The size of the session would exceed max_size.
+        """
+        file_name: str = self._get_batch_file(index)
+        with gzip.open(file_name, "wt", encoding="utf-8") as fh:
+            for resource in resources:
+                fh.write(json.dumps(resource))
+                fh.write("\n")
+        size: int = os.path.getsize(file_name)
+        if self.size + size > max_size:
+            os.unlink(file_name)
+            raise BadRequest(
+                f"The batch can not be staged, the version uploads of environment {self.environment} would exceed the limit"
+                f" of {opt.server_version_upload_max_size.get()} bytes (server.version-upload-max-size)."
+            )
+        return size
+
+    def _read_batch(self, index: int) -> list[JsonType]:
+        with gzip.open(self._get_batch_file(index), "rt", encoding="utf-8") as fh:
+            return [json.loads(line) for line in fh]
+
+    async def add_batch(self, resources: abc.Sequence[JsonType], max_size: int) -> None:
+        """
+        Stage the given batch of resources. The batch is encoded, compressed and written on a thread, to not block the
+        event loop.
+
+        :param max_size: The number of bytes this session can have staged on disk, including this batch.
+        :raises BadRequest: The batch would make the session exceed max_size.
+        """
+        async with self._lock:
+            self._ensure_not_removed()
+            self.size += await asyncio.get_running_loop().run_in_executor(
+                None, self._write_batch, self.nr_of_batches, resources, max_size
+            )
+            self.nr_of_batches += 1
+            self.nr_of_resources += len(resources)
+            self.last_activity = time.monotonic()
+
+    async def read_batches(self) -> abc.AsyncIterator[list[JsonType]]:
+        """
+        Yield the staged batches in the order in which they were uploaded. Only one batch is read at a time, so that the
+        staged resources are never all in memory at once. Each batch is read and decoded on a thread, to not block the event
+        loop.
+        """
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            self._ensure_not_removed()
+            self.last_activity = time.monotonic()
+            for index in range(self.nr_of_batches):
+                yield await loop.run_in_executor(None, self._read_batch, index)
+            # Give a commit that fails after this point the full timeout to be retried
+            self.last_activity = time.monotonic()
+
+    def _ensure_not_removed(self) -> None:
+        if self._removed:
+            raise NotFound("The version upload doesn't exist or has expired.")
+
+    def is_expired(self, timeout: float) -> bool:
+        # A session that is being written or read is in use
+        return not self._lock.locked() and time.monotonic() - self.last_activity > timeout
+
+    async def remove(self) -> None:
+        """
+        Remove the staged resources from disk, once the batches are no longer being written or read.
+        """
+        async with self._lock:
+            self._removed = True
+            await asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(shutil.rmtree, self.path, ignore_errors=True)
+            )
+
+
 class OrchestrationService(protocol.ServerSlice):
     """Resource Manager service"""
 
@@ -381,6 +499,8 @@ class OrchestrationService(protocol.ServerSlice):
 
     def __init__(self) -> None:
         super().__init__(SLICE_ORCHESTRATION)
+        # Open version upload sessions, by upload id
+        self._version_uploads: dict[uuid.UUID, VersionUpload] = {}
 
     def get_dependencies(self) -> list[str]:
         return [SLICE_RESOURCE, SLICE_AGENT_MANAGER, SLICE_DATABASE]
@@ -400,34 +520,60 @@ class OrchestrationService(protocol.ServerSlice):
         if PERFORM_CLEANUP:
             self.schedule(self._purge_versions, opt.server_purge_version_interval.get(), cancel_on_stop=False)
             self.add_background_task(self._purge_versions())
+        # Upload sessions don't survive a restart, drop the resources staged for them
+        for path in glob.glob(os.path.join(config.state_dir.get(), "server", "*", "version_uploads")):
+            shutil.rmtree(path, ignore_errors=True)
+        self.schedule(self._expire_version_uploads, 60)
         await super().start()
 
+    async def stop(self) -> None:
+        await super().stop()
+        uploads: list[VersionUpload] = list(self._version_uploads.values())
+        self._version_uploads.clear()
+        await asyncio.gather(*(upload.remove() for upload in uploads))
+
+    async def _expire_version_uploads(self) -> None:
+        """
+        Discard the upload sessions that have been idle for too long
+        """
+        timeout: int = opt.server_version_upload_timeout.get()
+        for upload_id, upload in list(self._version_uploads.items()):
+            if upload.is_expired(timeout):
+                LOGGER.info(
+                    "Discarding version upload %s for environment %s after %d seconds", upload_id, upload.environment, timeout
+                )
+                del self._version_uploads[upload_id]
+                await upload.remove()
+
     async def _purge_versions(self) -> None:
         """
         Purge versions from the database
+
+        The versions are deleted in batches of PURGE_VERSIONS_BATCH_SIZE. When the time budget of a run is exhausted,
+        the remaining versions are left for the next run.
         """
-        # TODO: move to data and use queries for delete
+        time_budget: int = opt.server_purge_version_time_budget.get()
+        deadline: Optional[float] = time.monotonic() + time_budget if time_budget > 0 else None
         async with data.Environment.get_connection() as connection:
             envs = await data.Environment.get_list(halted=False, connection=connection)
             for env_item in envs:
+                if deadline is not None and time.monotonic() > deadline:
+                    LOGGER.info("The time budget for version purging was exhausted, resuming in the next run")
+                    break
                 # get available versions
                 n_versions = await env_item.get(AVAILABLE_VERSIONS_TO_KEEP, connection=connection)
                 assert isinstance(n_versions, int)
-                versions = await data.ConfigurationModel.get_list(
-                    environment=env_item.id, connection=connection, order_by_column="version", order="DESC"
+                delete_list = await data.ConfigurationModel.get_versions_to_purge(
+                    env_item.id, n_versions, connection=connection
                 )
-                if len(versions) > n_versions:
-                    version_dict = {x.version: x for x in versions}
-                    latest_released_version: Optional[int] = next((v.version for v in versions if v.released), None)
-                    if latest_released_version is not None:
-                        # Never cleanup the latest released version
-                        del version_dict[latest_released_version]
-                    delete_list = sorted(version_dict.keys())
-                    delete_list = delete_list[:-n_versions]
-                    if delete_list:
-                        LOGGER.info("Removing %s available versions from environment %s", len(delete_list), env_item.id)
-                    for v in delete_list:
-                        await version_dict[v].delete_cascade(connection=connection)
+                if delete_list:
+                    LOGGER.info("Removing %s available versions from environment %s", len(delete_list), env_item.id)
+                    for batch in itertools.batched(delete_list, PURGE_VERSIONS_BATCH_SIZE):
+                        await data.ConfigurationModel.delete_versions(env_item.id, batch, connection=connection)
+                        if deadline is not None and time.monotonic() > deadline:
+                            break
+                    # Delete facts when the resources in these versions were the only ones
+                    await data.ConfigurationModel.delete_orphaned_facts(env_item.id, connection=connection)
 
                 await ResourcePersistentState.trim(env_item.id, connection=connection)
             # Cleanup old agents from agent table in db
@@ -527,6 +673,92 @@ class OrchestrationService(protocol.ServerSlice):
     async def reserve_version(self, env: data.Environment) -> int:
         return await env.get_next_version()
 
+    def _get_version_upload(self, env: data.Environment, upload_id: uuid.UUID) -> VersionUpload:
+        upload: VersionUpload | None = self._version_uploads.get(upload_id)
+        if upload is None or upload.environment != env.id:
+            raise NotFound(f"The version upload with id {upload_id} doesn't exist or has expired.")
+        return upload
+
+    async def _create_dto_resources_to_put(
+        self,
+        env: data.Environment,
+        resources: list[JsonType],
+        upload_id: uuid.UUID | None,
+        resource_state: dict[ResourceIdStr, Literal[ResourceState.available, ResourceState.undefined]],
+        resource_sets: dict[ResourceIdStr, Optional[str]],
+        *,
+        partial: bool = False,
+    ) -> dict[ResourceIdStr, ResourceDTO]:
+        """
+        This method converts the resources sent to the put_version or put_partial endpoint, followed by the ones staged in
+        the given upload session, to DTO Resource objects. The staged batches are converted one at a time on a thread.
+
+        An exception will be raised when one of the following constraints is not satisfied:
+            * A resource present in the resource_sets parameter is not present in the resources dictionary.
+            * The dependency graph of the provided resources is not closed.
+        """
+        rid_to_resource: dict[ResourceIdStr, ResourceDTO] = {}
+        all_requires: set[ResourceIdStr] = set()
+        self._add_dto_resources(
+            env.id, resources, resource_state, resource_sets, rid_to_resource, all_requires, partial=partial
+        )
+        if upload_id is not None:
+            loop = asyncio.get_running_loop()
+            upload: VersionUpload = self._get_version_upload(env, upload_id)
+            async with contextlib.aclosing(upload.read_batches()) as batches:
+                async for batch in batches:
+                    await loop.run_in_executor(
+                        None,
+                        functools.partial(
+                            self._add_dto_resources,
+                            env.id,
+                            batch,
+                            resource_state,
+                            resource_sets,
+                            rid_to_resource,
+                            all_requires,
+                            partial=partial,
+                        ),
+                    )
+        self._check_dto_resources(rid_to_resource, all_requires, resource_sets)
+        return rid_to_resource
+
+    async def _close_version_upload(self, upload_id: uuid.UUID | None) -> None:
+        if upload_id is None:
+            return
+        upload: VersionUpload | None = self._version_uploads.pop(upload_id, None)
+        if upload is not None:
+            await upload.remove()
+
+    def _get_version_uploads_for_environment(self, env_id: uuid.UUID) -> list[VersionUpload]:
+        return [upload for upload in self._version_uploads.values() if upload.environment == env_id]
+
+    @handle(methods_v2.open_version_upload, env="tid")
+    async def open_version_upload(self, env: data.Environment) -> uuid.UUID:
+        max_sessions: int = opt.server_version_upload_max_sessions.get()
+        if len(self._get_version_uploads_for_environment(env.id)) >= max_sessions:
+            raise BadRequest(
+                f"Environment {env.id} already has {max_sessions} open version uploads, which is the maximum"
+                " (server.version-upload-max-sessions). Commit them or wait for them to expire."
+            )
+        upload_id: uuid.UUID = uuid.uuid4()
+        path: str = os.path.join(config.state_dir.get(), "server", str(env.id), "version_uploads", str(upload_id))
+        self._version_uploads[upload_id] = VersionUpload(env.id, path)
+        return upload_id
+
+    @handle(methods_v2.upload_version_resources, env="tid")
+    async def upload_version_resources(self, env: data.Environment, upload_id: uuid.UUID, resources: object) -> None:
+        upload: VersionUpload = self._get_version_upload(env, upload_id)
+        try:
+            pydantic.TypeAdapter(abc.Sequence[ResourceMinimal]).validate_python(resources)
+        except pydantic.ValidationError:
+            raise BadRequest("Type validation failed for resources argument. Expected an argument of type List[Dict[str, Any]]")
+        # The space left for this session is what the other sessions of the environment don't use
+        staged_elsewhere: int = sum(
+            other.size for other in self._get_version_uploads_for_environment(env.id) if other is not upload
+        )
+        await upload.add_batch(cast(list[JsonType], resources), opt.server_version_upload_max_size.get() - staged_elsewhere)
+
     @handle(methods_v2.get_pip_config, env="tid")
     async def get_pip_config(
         self,
@@ -539,26 +771,28 @@ class OrchestrationService(protocol.ServerSlice):
         out = version_object.pip_config
         return out
 
-    def _create_dto_resources_from_api_resources(
+    def _add_dto_resources(
         self,
         env_id: uuid.UUID,
-        resources: list[JsonType],
+        resources: abc.Iterable[JsonType],
         resource_state: dict[ResourceIdStr, Literal[ResourceState.available, ResourceState.undefined]],
         resource_sets: dict[ResourceIdStr, Optional[str]],
-    ) -> dict[ResourceIdStr, ResourceDTO]:
+        rid_to_resource: dict[ResourceIdStr, ResourceDTO],
+        all_requires: set[ResourceIdStr],
+        *,
+        partial: bool = False,
+    ) -> None:
         """
-        This method converts the resources sent to the put_version or put_partial endpoint to DTO Resource objects.
+        Convert the given resources to DTO Resource objects and add them to rid_to_resource. The resources they require are
+        added to all_requires.
 
-        An exception will be raised when one of the following constraints is not satisfied:
-            * A resource present in the resource_sets parameter is not present in the resources dictionary.
-            * The dependency graph of the provided resources is not closed.
+        :param partial: The resources are part of a partial export, they should not contain version information.
         """
-        rid_to_resource = {}
-        # The content of the requires attribute for all the resources
-        all_requires: set[ResourceIdStr] = set()
         for res_dict in resources:
             # Verify that the version field and the version in the resource version id field match
             resource_version_id = Id.parse_id(res_dict["id"])
+            if partial and resource_version_id.get_version() != 0:
+                raise BadRequest("Resources for partial export should not contain version information")
             resource_id = resource_version_id.resource_str()
 
             res_set_name = resource_sets.get(resource_id, None)
@@ -601,6 +835,15 @@ class OrchestrationService(protocol.ServerSlice):
                 resource_set=res_set_name,
             )
 
+    def _check_dto_resources(
+        self,
+        rid_to_resource: dict[ResourceIdStr, ResourceDTO],
+        all_requires: set[ResourceIdStr],
+        resource_sets: dict[ResourceIdStr, Optional[str]],
+    ) -> None:
+        """
+        Verify that all resources in resource_sets and all required resources are present in rid_to_resource.
+        """
         rids = set(rid_to_resource.keys())
 
         # Sanity checks
@@ -616,8 +859,6 @@ class OrchestrationService(protocol.ServerSlice):
                 f" {all_requires - rids}"
             )
 
-        return rid_to_resource
-
     def _get_skipped_for_undeployable(
         self, resources: abc.Sequence[ResourceDTO], undeployable_ids: abc.Sequence[ResourceIdStr]
     ) -> abc.Sequence[ResourceIdStr]:
@@ -772,7 +1013,7 @@ class OrchestrationService(protocol.ServerSlice):
         module_version_info: Mapping[InmantaModuleName, InmantaModuleDTO],
         allow_handler_code_update: bool = False,
         project_constraints: str | None = None,
-    ) -> None:
+    ) -> data.ResourceAction | None:
         """
         :param rid_to_resource: This parameter should contain all the resources when a full compile is done.
                                 When a partial compile is done, it should contain all the resources that belong to the
@@ -812,8 +1053,12 @@ class OrchestrationService(protocol.ServerSlice):
                                         sets the is_suitable_for_partial_compiles field appropriately, indicating whether
                                         this version is eligible to be used as a base version for a future partial compile.
             * In case of a partial export: Verifies that no resources moved resource sets.
+
+        :return: The store action of the new version, if it has any resources. Its log line has to be written with
+            :py:meth:`_log_store_action` once the transaction is committed.
         """
         is_partial_update = partial_base_version is not None
+        store_action: data.ResourceAction | None = None
 
         if resource_sets is None:
             resource_sets = {}
@@ -848,98 +1093,117 @@ class OrchestrationService(protocol.ServerSlice):
         ]
         updated_resource_sets_no_shared: abc.Set[str] = {sr for sr in resource_sets.values() if sr is not None}
         deleted_resource_sets_as_set: abc.Set[str] = set(removed_resource_sets)
-        async with connection.transaction():
-            try:
-                if is_partial_update:
-                    # Make mypy happy
-                    assert partial_base_version is not None
-                    cm = await data.ConfigurationModel.create_for_partial_compile(
-                        env_id=env.id,
-                        version=version,
-                        # When a partial compile is done, the total will be updated in cm.recalculate_total()
-                        # with all the resources that belong to a resource set that was not updated.
-                        total=len(rid_to_resource),
-                        version_info=version_info,
-                        undeployable=undeployable_ids,
-                        skipped_for_undeployable=sorted(
-                            self._get_skipped_for_undeployable(list(rid_to_resource.values()), undeployable_ids)
-                        ),
-                        partial_base=partial_base_version,
-                        pip_config=pip_config,
-                        updated_resource_sets=updated_resource_sets_no_shared,
-                        deleted_resource_sets=deleted_resource_sets_as_set,
+        # The time spent in each phase is reported through the internal.put_version.* timers
+        with pyformance.timer("internal.put_version").time():
+            async with connection.transaction():
+                with pyformance.timer("internal.put_version.create_model").time():
+                    try:
+                        if is_partial_update:
+                            # Make mypy happy
+                            assert partial_base_version is not None
+                            cm = await data.ConfigurationModel.create_for_partial_compile(
+                                env_id=env.id,
+                                version=version,
+                                # When a partial compile is done, the total will be updated in cm.recalculate_total()
+                                # with all the resources that belong to a resource set that was not updated.
+                                total=len(rid_to_resource),
+                                version_info=version_info,
+                                undeployable=undeployable_ids,
+                                skipped_for_undeployable=sorted(
+                                    self._get_skipped_for_undeployable(list(rid_to_resource.values()), undeployable_ids)
+                                ),
+                                partial_base=partial_base_version,
+                                pip_config=pip_config,
+                                updated_resource_sets=updated_resource_sets_no_shared,
+                                deleted_resource_sets=deleted_resource_sets_as_set,
+                                connection=connection,
+                                project_constraints=project_constraints,
+                            )
+                        else:
+                            cm = data.ConfigurationModel(
+                                environment=env.id,
+                                version=version,
+                                date=datetime.datetime.now().astimezone(),
+                                total=len(rid_to_resource),
+                                version_info=version_info,
+                                undeployable=undeployable_ids,
+                                skipped_for_undeployable=sorted(
+                                    self._get_skipped_for_undeployable(list(rid_to_resource.values()), undeployable_ids)
+                                ),
+                                pip_config=pip_config,
+                                is_suitable_for_partial_compiles=not resource_set_validator.has_cross_resource_set_dependency(),
+                                project_constraints=project_constraints,
+                            )
+                            await cm.insert(connection=connection)
+                    except asyncpg.exceptions.UniqueViolationError:
+                        raise ServerError("The given version is already defined. Versions should be unique.")
+
+                all_ids: set[Id] = {Id.parse_id(rid, version) for rid in rid_to_resource.keys()}
+                with pyformance.timer("internal.put_version.insert_resources").time():
+                    try:
+                        await data.ResourceSet.insert_sets_and_resources(
+                            environment=env.id,
+                            updated_resources=list(rid_to_resource.values()),
+                            target_version=version,
+                            base_version=partial_base_version,
+                            deleted_resource_sets=deleted_resource_sets_as_set,
+                            connection=connection,
+                        )
+                    except data.InvalidResourceSetMigration as e:
+                        raise BadRequest(e.message)
+                    await cm.recalculate_total(connection=connection)
+                    await data.UnknownParameter.insert_many(unknowns, connection=connection)
+
+                all_agents: set[str] = {res.agent for res in rid_to_resource.values()}
+                all_agents.add(const.AGENT_SCHEDULER_ID)
+
+                with pyformance.timer("internal.put_version.register_agents").time():
+                    await self.agentmanager_service.ensure_agents_registered(env, all_agents, connection=connection)
+
+                with pyformance.timer("internal.put_version.register_code").time():
+                    await self._register_agent_code(
+                        partial_base_version,
+                        version,
+                        env.id,
+                        module_version_info,
+                        allow_handler_code_update=allow_handler_code_update,
                         connection=connection,
-                        project_constraints=project_constraints,
-                    )
-                else:
-                    cm = data.ConfigurationModel(
-                        environment=env.id,
-                        version=version,
-                        date=datetime.datetime.now().astimezone(),
-                        total=len(rid_to_resource),
-                        version_info=version_info,
-                        undeployable=undeployable_ids,
-                        skipped_for_undeployable=sorted(
-                            self._get_skipped_for_undeployable(list(rid_to_resource.values()), undeployable_ids)
-                        ),
-                        pip_config=pip_config,
-                        is_suitable_for_partial_compiles=not resource_set_validator.has_cross_resource_set_dependency(),
-                        project_constraints=project_constraints,
                     )
-                    await cm.insert(connection=connection)
-            except asyncpg.exceptions.UniqueViolationError:
-                raise ServerError("The given version is already defined. Versions should be unique.")
-
-            all_ids: set[Id] = {Id.parse_id(rid, version) for rid in rid_to_resource.keys()}
-            try:
-                await data.ResourceSet.insert_sets_and_resources(
-                    environment=env.id,
-                    updated_resources=list(rid_to_resource.values()),
-                    target_version=version,
-                    base_version=partial_base_version,
-                    deleted_resource_sets=deleted_resource_sets_as_set,
-                    connection=connection,
-                )
-            except data.InvalidResourceSetMigration as e:
-                raise BadRequest(e.message)
-            await cm.recalculate_total(connection=connection)
-            await data.UnknownParameter.insert_many(unknowns, connection=connection)
-
-            all_agents: set[str] = {res.agent for res in rid_to_resource.values()}
-            all_agents.add(const.AGENT_SCHEDULER_ID)
-
-            for agent in all_agents:
-                await self.agentmanager_service.ensure_agent_registered(env, agent, connection=connection)
-
-            await self._register_agent_code(
-                partial_base_version,
-                version,
-                env.id,
-                module_version_info,
-                allow_handler_code_update=allow_handler_code_update,
-                connection=connection,
-            )
 
-            # Don't log ResourceActions without resource_version_ids, because
-            # no API call exists to retrieve them.
-            all_rvids = [i.resource_version_str() for i in all_ids]
-            if all_rvids:
-                now = datetime.datetime.now().astimezone()
-                log_line = data.LogLine.log(logging.INFO, "Successfully stored version %(version)d", version=version)
-                self.resource_service.log_resource_action(env.id, list(all_rvids), logging.INFO, now, log_line.msg)
-                ra = data.ResourceAction(
-                    environment=env.id,
-                    version=version,
-                    resource_version_ids=all_rvids,
-                    action_id=uuid.uuid4(),
-                    action=const.ResourceAction.store,
-                    started=started,
-                    finished=now,
-                    messages=[log_line],
-                )
-                await ra.insert(connection=connection)
+                # Don't log ResourceActions without resource_version_ids, because
+                # no API call exists to retrieve them.
+                all_rvids = [i.resource_version_str() for i in all_ids]
+                if all_rvids:
+                    with pyformance.timer("internal.put_version.log_store_action").time():
+                        now = datetime.datetime.now().astimezone()
+                        log_line = data.LogLine.log(logging.INFO, "Successfully stored version %(version)d", version=version)
+                        store_action = data.ResourceAction(
+                            environment=env.id,
+                            version=version,
+                            resource_version_ids=all_rvids,
+                            action_id=uuid.uuid4(),
+                            action=const.ResourceAction.store,
+                            started=started,
+                            finished=now,
+                            messages=[log_line],
+                        )
+                        await store_action.insert(connection=connection)
 
         LOGGER.debug("Successfully stored version %d", version)
+        return store_action
+
+    async def _log_store_action(self, env: data.Environment, store_action: data.ResourceAction | None) -> None:
+        """
+        Write the log line of the store action returned by _put_version to the resource action log. This must be called
+        after the transaction that stored the version, because it waits for room when the resource action log queue is full.
+        """
+        if store_action is None:
+            return
+        assert store_action.finished is not None
+        for log_line in cast(list[data.LogLine], store_action.messages):
+            await self.resource_service.log_resource_action(
+                env.id, store_action.resource_version_ids, logging.INFO, store_action.finished, log_line.msg
+            )
 
     async def _trigger_auto_deploy(
         self,
@@ -995,6 +1259,7 @@ class OrchestrationService(protocol.ServerSlice):
         resource_sets: dict[ResourceIdStr, str | None] | None = None,
         pip_config: PipConfig | None = None,
         project_constraints: str | None = None,
+        upload_id: uuid.UUID | None = None,
     ) -> Apireturn:
         """
         :param unknowns: dict with the following structure
@@ -1008,11 +1273,8 @@ class OrchestrationService(protocol.ServerSlice):
             resource_sets = {}
 
         unknowns_objs = self._create_unknown_parameter_daos_from_api_unknowns(env.id, version, unknowns)
-        rid_to_resource: dict[ResourceIdStr, ResourceDTO] = self._create_dto_resources_from_api_resources(
-            env_id=env.id,
-            resources=resources,
-            resource_state=resource_state,
-            resource_sets=resource_sets,
+        rid_to_resource: dict[ResourceIdStr, ResourceDTO] = await self._create_dto_resources_to_put(
+            env, resources, upload_id, resource_state, resource_sets
         )
 
         async with data.Resource.get_connection() as con:
@@ -1021,7 +1283,7 @@ class OrchestrationService(protocol.ServerSlice):
             async with con.transaction():
                 # Acquire a lock that conflicts with the lock acquired by put_partial but not with itself
                 await env.put_version_lock(shared=True, connection=con)
-                await self._put_version(
+                store_action: data.ResourceAction | None = await self._put_version(
                     env,
                     version,
                     rid_to_resource,
@@ -1033,6 +1295,9 @@ class OrchestrationService(protocol.ServerSlice):
                     module_version_info=module_version_info or {},
                     project_constraints=project_constraints,
                 )
+            await self._log_store_action(env, store_action)
+            # The session is only closed once the version is stored, so that a failed call can be retried
+            await self._close_version_upload(upload_id)
             # This must be outside all transactions, as it relies on the result of _put_version
             # and it starts a background task, so it can't re-use this connection
             await self._trigger_auto_deploy(env, version)
@@ -1052,6 +1317,7 @@ class OrchestrationService(protocol.ServerSlice):
         pip_config: Optional[PipConfig] = None,
         module_version_info: dict[str, InmantaModuleDTO] | None = None,
         allow_handler_code_update: bool = False,
+        upload_id: uuid.UUID | None = None,
     ) -> ReturnValue[int]:
         """
         :param unknowns: dict with the following structure
@@ -1082,10 +1348,9 @@ class OrchestrationService(protocol.ServerSlice):
             resources = cast(list[JsonType], resources)
 
         # validate resources before any side effects take place
-        for r in resources:
-            rid = Id.parse_id(r["id"])
-            if rid.get_version() != 0:
-                raise BadRequest("Resources for partial export should not contain version information")
+        rid_to_resource: dict[ResourceIdStr, ResourceDTO] = await self._create_dto_resources_to_put(
+            env, resources, upload_id, resource_state, resource_sets, partial=True
+        )
 
         intersection: set[str] = set(resource_sets.values()).intersection(set(removed_resource_sets))
         if intersection:
@@ -1129,13 +1394,6 @@ class OrchestrationService(protocol.ServerSlice):
                             base_version,
                         )
 
-                rid_to_resource: dict[ResourceIdStr, ResourceDTO] = self._create_dto_resources_from_api_resources(
-                    env_id=env.id,
-                    resources=resources,
-                    resource_state=resource_state,
-                    resource_sets=resource_sets,
-                )
-
                 updated_resource_sets: abc.Set[str] = {sr_name for sr_name in resource_sets.values() if sr_name is not None}
                 partial_update_merger = await PartialUpdateMerger.create(
                     env_id=env.id,
@@ -1153,7 +1411,7 @@ class OrchestrationService(protocol.ServerSlice):
                     unknowns_in_partial_compile=self._create_unknown_parameter_daos_from_api_unknowns(env.id, version, unknowns)
                 )
 
-                await self._put_version(
+                store_action: data.ResourceAction | None = await self._put_version(
                     env,
                     version,
                     merged_resources,
@@ -1169,6 +1427,8 @@ class OrchestrationService(protocol.ServerSlice):
                     project_constraints=base_constraints if base_constraints else None,
                 )
 
+            await self._log_store_action(env, store_action)
+            await self._close_version_upload(upload_id)
             returnvalue: ReturnValue[int] = ReturnValue[int](200, response=version)
             await self._trigger_auto_deploy(env, version)
 
@@ -1372,13 +1632,22 @@ class OrchestrationService(protocol.ServerSlice):
     ) -> list[ResourceDiff]:
         await self._validate_version_parameters(env.id, from_version, to_version)
 
-        from_version_resources = await data.Resource.get_resources_for_version(environment=env.id, version=from_version)
-        to_version_resources = await data.Resource.get_resources_for_version(environment=env.id, version=to_version)
-
-        from_state = diff.Version(self.convert_resources(from_version_resources))
-        to_state = diff.Version(self.convert_resources(to_version_resources))
-
-        version_diff = to_state.generate_diff(from_state)
+        # The resources that are unchanged according to their attribute hash are already filtered out by the database,
+        # only the remaining ones are compared attribute by attribute.
+        version_diff: list[ResourceDiff] = []
+        async for resource_id, from_attributes, to_attributes in data.Resource.get_changed_resources_between_versions(
+            env.id, from_version, to_version
+        ):
+            resource_diff: Optional[ResourceDiff]
+            if from_attributes is None:
+                assert to_attributes is not None
+                resource_diff = diff.Resource(resource_id, to_attributes).added()
+            elif to_attributes is None:
+                resource_diff = diff.Resource(resource_id, from_attributes).removed()
+            else:
+                resource_diff = diff.Resource(resource_id, to_attributes).compare(diff.Resource(resource_id, from_attributes))
+            if resource_diff is not None:
+                version_diff.append(resource_diff)
 
         return version_diff
 
@@ -1414,9 +1683,6 @@ class OrchestrationService(protocol.ServerSlice):
             resp = SchedulerStatusReport.model_validate(result["data"])
             return resp
 
-    def convert_resources(self, resources: list[data.Resource]) -> dict[ResourceIdStr, diff.Resource]:
-        return {res.resource_id: diff.Resource(resource_id=res.resource_id, attributes=res.attributes) for res in resources}
-
     async def _validate_version_parameters(self, env: uuid.UUID, first_version: int, other_version: int) -> None:
         if first_version >= other_version:
             raise BadRequest(
@@ -16,8 +16,11 @@ limitations under the License.
 Contact: code@inmanta.com
 """
 
+import asyncio
 import datetime
 import logging
+import queue
+import threading
 import typing
 import uuid
 from collections.abc import Sequence
@@ -57,6 +60,8 @@ from inmanta.server import config as opt
 from inmanta.server import extensions, protocol
 from inmanta.server.validate_filter import InvalidFilter
 from inmanta.types import Apireturn, JsonType, PrimitiveTypes, ResourceIdStr, ResourceType, ResourceVersionIdStr
+from inmanta.vendor import pyformance
+from inmanta.vendor.pyformance.meters.gauge import CallbackGauge
 
 resource_discovery = extensions.BoolFeature(
     slice=SLICE_RESOURCE,
@@ -107,6 +112,104 @@ class ResourceActionLogLine(logging.LogRecord):
         self.relativeCreated = (self.created - logging._startTime) * 1000
 
 
+class ResourceActionLogWriter:
+    """
+    Writes resource action log records from a background thread, so that the blocking writes of the log handlers don't
+    happen on the event loop. The records are taken from the queue in batches and written grouped per environment.
+
+    When the queue is full, the producers wait for the background thread to make room. A record is only dropped when no room
+    was made within the put timeout.
+    """
+
+    MAX_BATCH_SIZE = 1000
+
+    def __init__(self, max_queue_size: int, put_timeout: float) -> None:
+        """
+        :param max_queue_size: The maximum number of records that wait to be written.
+        :param put_timeout: The number of seconds to wait for room in the queue before a record is dropped.
+        """
+        self._queue: queue.SimpleQueue[Optional[logging.LogRecord]] = queue.SimpleQueue()
+        # The room left in the queue. It is released by the background thread once a record was written.
+        self._capacity = asyncio.Semaphore(max_queue_size)
+        self._put_timeout = put_timeout
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # The number of records that were dropped because the queue stayed full
+        self.dropped: int = 0
+        self._dropping: bool = False
+
+    def start(self) -> None:
+        """
+        Start the background thread. Must be called from the event loop.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._thread = threading.Thread(target=self._run, name="resource-action-log-writer", daemon=True)
+        self._thread.start()
+        pyformance.gauge("internal.resource_action_log.queue_depth", CallbackGauge(callback=self._queue.qsize))
+
+    async def stop(self) -> None:
+        """
+        Write the records that are still in the queue and stop the background thread.
+        """
+        thread = self._thread
+        if thread is None:
+            return
+        # Records that are logged from now on are written directly
+        self._thread = None
+        pyformance.global_registry()._gauges.pop("internal.resource_action_log.queue_depth", None)
+        self._queue.put(None)
+        await asyncio.get_running_loop().run_in_executor(None, thread.join)
+
+    async def write(self, record: logging.LogRecord) -> None:
+        """
+        Queue the given record to be written by the background thread. Waits for room in the queue when it is full.
+        """
+        if self._thread is None:
+            logging.getLogger(record.name).handle(record)
+            return
+        try:
+            async with asyncio.timeout(self._put_timeout):
+                await self._capacity.acquire()
+        except TimeoutError:
+            if not self._dropping:
+                LOGGER.warning("The resource action log queue is full, dropping resource action log records")
+                self._dropping = True
+            self.dropped += 1
+            pyformance.counter("internal.resource_action_log.dropped").inc()
+            return
+        self._dropping = False
+        self._queue.put(record)
+
+    def _release(self, nr_of_records: int) -> None:
+        for _ in range(nr_of_records):
+            self._capacity.release()
+
+    def _run(self) -> None:
+        assert self._loop is not None
+        stop: bool = False
+        while not stop:
+            batch: list[Optional[logging.LogRecord]] = [self._queue.get()]
+            while len(batch) < self.MAX_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            # Each environment has its own logger and log file
+            records_per_logger: dict[str, list[logging.LogRecord]] = {}
+            for record in batch:
+                if record is None:
+                    stop = True
+                else:
+                    records_per_logger.setdefault(record.name, []).append(record)
+            for logger_name, records in records_per_logger.items():
+                logger = logging.getLogger(logger_name)
+                for record in records:
+                    logger.handle(record)
+            nr_of_records: int = sum(len(records) for records in records_per_logger.values())
+            if nr_of_records and not self._loop.is_closed():
+                self._loop.call_soon_threadsafe(self._release, nr_of_records)
+
+
 class ResourceService(protocol.ServerSlice):
     """Resource Manager service"""
 
@@ -115,6 +218,7 @@ class ResourceService(protocol.ServerSlice):
     def __init__(self) -> None:
         super().__init__(SLICE_RESOURCE)
         self._resource_action_logger = logging.getLogger(const.NAME_RESOURCE_ACTION_LOGGER)
+        self._resource_action_log_writer: Optional[ResourceActionLogWriter] = None
 
     def get_dependencies(self) -> list[str]:
         return [SLICE_DATABASE, SLICE_AGENT_MANAGER]
@@ -130,6 +234,8 @@ class ResourceService(protocol.ServerSlice):
         self.agentmanager_service = cast("agentmanager.AgentManager", server.get_slice(SLICE_AGENT_MANAGER))
 
     async def start(self) -> None:
+        # The partitions for the upcoming days are created again with every purge of the resource action logs
+        await data.ResourceAction.create_partitions()
         self.schedule(
             data.ResourceAction.purge_logs, opt.server_purge_resource_action_logs_interval.get(), cancel_on_stop=False
         )
@@ -138,10 +244,16 @@ class ResourceService(protocol.ServerSlice):
             opt.server_purge_resource_action_logs_interval.get(),
             cancel_on_stop=False,
         )
+        self._resource_action_log_writer = ResourceActionLogWriter(
+            opt.server_resource_action_log_queue_size.get(), opt.server_resource_action_log_queue_timeout.get()
+        )
+        self._resource_action_log_writer.start()
         await super().start()
 
     async def stop(self) -> None:
         await super().stop()
+        if self._resource_action_log_writer is not None:
+            await self._resource_action_log_writer.stop()
 
     def get_resource_action_logger(self, environment: uuid.UUID) -> logging.Logger:
         """Get the resource action logger for the given environment.
@@ -150,7 +262,7 @@ class ResourceService(protocol.ServerSlice):
         """
         return self._resource_action_logger.getChild(str(environment))
 
-    def log_resource_action(
+    async def log_resource_action(
         self, env: uuid.UUID, resource_ids: Sequence[str], log_level: int, ts: datetime.datetime, message: str
     ) -> None:
         """Write the given log to the correct resource action logger"""
@@ -162,7 +274,10 @@ class ResourceService(protocol.ServerSlice):
         else:
             message = resource_ids[0] + ": " + message
         log_record = ResourceActionLogLine(logger.name, log_level, message, ts)
-        logger.handle(log_record)
+        if self._resource_action_log_writer is not None:
+            await self._resource_action_log_writer.write(log_record)
+        else:
+            logger.handle(log_record)
 
     @handle(methods.get_resource, resource_id="id", env="tid")
     async def get_resource(
@@ -177,6 +177,19 @@ class UserService(server_protocol.ServerSlice):
 
     def __init__(self) -> None:
         super().__init__(SLICE_USER)
+        self._server: server_protocol.Server | None = None
+
+    async def prestart(self, server: server_protocol.Server) -> None:
+        await super().prestart(server)
+        self._server = server
+
+    def _invalidate_authorization_cache(self) -> None:
+        """
+        Drop the cached authorization decisions, because the users or their roles have changed.
+        """
+        authorization_provider = self._server.get_authorization_provider() if self._server is not None else None
+        if authorization_provider is not None:
+            authorization_provider.invalidate_cache()
 
     def get_dependencies(self) -> list[str]:
         return [SLICE_DATABASE]
@@ -219,6 +232,7 @@ class UserService(server_protocol.ServerSlice):
             raise exceptions.NotFound(f"User with name {username} does not exist.")
 
         await user.delete()
+        self._invalidate_authorization_cache()
 
     @protocol.handle(protocol.methods_v2.set_password)
     async def set_password(
@@ -369,6 +383,7 @@ class UserService(server_protocol.ServerSlice):
             raise exceptions.BadRequest(f"Role {name} cannot be delete because it's still assigned to a user.")
         except KeyError:
             raise exceptions.BadRequest(f"Role {name} doesn't exist.")
+        self._invalidate_authorization_cache()
 
     @protocol.handle(protocol.methods_v2.list_roles_for_user)
     async def list_roles_for_user(self, username: str) -> model.RoleAssignmentsPerEnvironment:
@@ -384,6 +399,7 @@ class UserService(server_protocol.ServerSlice):
                 f"Cannot assign role {role} to user {username}."
                 f" Role {role}, environment {environment} or user {username} doesn't exist."
             )
+        self._invalidate_authorization_cache()
 
     @protocol.handle(protocol.methods_v2.unassign_role)
     async def unassign_role(self, username: str, environment: uuid.UUID, role: str) -> None:
@@ -392,6 +408,7 @@ class UserService(server_protocol.ServerSlice):
             await data.Role.unassign_role_from_user(username, environment=environment, role=role)
         except KeyError:
             raise exceptions.BadRequest(f"Role {role} (environment={environment}) is not assigned to user {username}")
+        self._invalidate_authorization_cache()
 
     @protocol.handle(protocol.methods_v2.set_is_admin)
     async def set_is_admin(self, username: str, is_admin: bool) -> None:
@@ -400,3 +417,4 @@ class UserService(server_protocol.ServerSlice):
             await data.User.set_is_admin(username=username, is_admin=is_admin)
         except KeyError:
             raise exceptions.BadRequest(f"No user exists with username {username}.")
+        self._invalidate_authorization_cache()
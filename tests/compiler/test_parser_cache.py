@@ -21,7 +21,6 @@ import os.path
 import pickle
 from pathlib import Path
 from pickle import UnpicklingError
-from time import sleep
 from typing import Callable
 
 import pytest
@@ -68,22 +67,60 @@ a=1
     assert parser.cache_manager.failures == 0
     assert parser.cache_manager.hits == 2  # main.cf and std::init
 
+    # Entries are keyed on the content, touching the file doesn't invalidate them
     main_file = os.path.join(snippetcompiler.project_dir, "main.cf")
-    root_ns = snippetcompiler.project.root_ns
-    cached_main = parser.cache_manager._get_file_name(root_ns.get_child_or_create("main.cf"), main_file)
     Path(main_file).touch()
-    # make the cache a tiny bit newer
-    sleep(0.001)
-    Path(cached_main).touch()
 
     # reset counts
     parser.cache_manager.reset_stats()
     # reset project ast cache
     snippetcompiler._load_project(autostd=True, install_project=True)
 
-    assert parser.cache_manager.misses == 1  # std::init
+    assert parser.cache_manager.misses == 0
+    assert parser.cache_manager.failures == 0
+    assert parser.cache_manager.hits == 2
+
+    with open(main_file, "a") as fh:
+        fh.write("b=2\n")
+
+    # reset counts
+    parser.cache_manager.reset_stats()
+    # reset project ast cache
+    snippetcompiler._load_project(autostd=True, install_project=True)
+
+    assert parser.cache_manager.misses == 1  # main.cf
     assert parser.cache_manager.failures == 0
-    assert parser.cache_manager.hits == 1  # main.cf
+    assert parser.cache_manager.hits == 1  # std::init
+
+
+def test_cache_relocatable(tmp_path):
+    """
+    A cache entry is used for a file with the same content in another location, with the locations of the statements
+    restored in the new file.
+    """
+    ns = make_namespace("__config__")
+    source = 'x = 1\ny = "hello"\n'
+    old_file = str(tmp_path / "old" / "main.cf")
+    new_file = str(tmp_path / "new" / "main.cf")
+
+    parser.cache_manager.attach_to_project(str(tmp_path))
+    try:
+        parser.cache_manager.reset_stats()
+        parser.parse(ns, old_file, source)
+        assert (parser.cache_manager.hits, parser.cache_manager.misses) == (0, 1)
+
+        statements = parser.parse(ns, new_file, source)
+        assert (parser.cache_manager.hits, parser.cache_manager.misses) == (1, 1)
+        assert [stmt.location.file for stmt in statements] == [new_file, new_file]
+        assert statements[1].location.lnr == 2
+
+        # Other content or another namespace is another entry
+        parser.parse(ns, new_file, source + "z = 3\n")
+        parser.parse(make_namespace("other"), new_file, source)
+        assert (parser.cache_manager.hits, parser.cache_manager.misses) == (1, 3)
+        assert parser.cache_manager.failures == 0
+    finally:
+        parser.cache_manager.detach_from_project()
 
 
 def test_pickle_roundtrip():
@@ -159,3 +196,41 @@ def test_pickle_namespace_released_after_load():
 
     with pytest.raises(UnpicklingError, match="outside ASTUnpickler"):
         pickle.Unpickler(io.BytesIO(blob)).load()
+
+
+def test_parallel_parsing(tmp_path):
+    """Files parsed by the parallel parser result in the same statements as files parsed by the compiler itself."""
+    root = Namespace("__root__")
+    mod = Namespace("mod", root)
+    sub = Namespace("sub", mod)
+
+    init_file = tmp_path / "_init.cf"
+    init_file.write_text('import mod::sub\nentity A:\n    string a = "x"\nend\nimplement A using std::none\n')
+    sub_file = tmp_path / "sub.cf"
+    sub_file.write_text("x = 1\ny = [x, 2]\n")
+    broken_file = tmp_path / "broken.cf"
+    broken_file.write_text("x = = 1\n")
+
+    with parser.parallel_parsing(2) as parallel:
+        assert parallel is parser.parallel_parser
+        parallel.submit("mod", str(init_file))
+        parallel.submit("mod::sub", str(sub_file))
+        parallel.submit("mod::broken", str(broken_file))
+
+        for ns, file in [(mod, init_file), (sub, sub_file)]:
+            statements = parallel.get(ns, str(file), file.read_text())
+            expected = parser.base_parse(ns, str(file), file.read_text())
+            assert statements is not None
+            assert [str(s) for s in statements] == [str(s) for s in expected]
+            assert [s.location for s in statements] == [s.location for s in expected]
+            assert all(s.namespace is ns for s in statements)
+
+        # Parse errors are reported by the compiler process
+        assert parallel.get(Namespace("broken", mod), str(broken_file), broken_file.read_text()) is None
+        # A file that was not submitted is parsed by the compiler process
+        assert parallel.get(mod, str(sub_file), sub_file.read_text()) is None
+
+    assert parser.parallel_parser is None
+    # Parallel parsing is disabled for a single worker
+    with parser.parallel_parsing(1) as parallel:
+        assert parallel is None
@@ -16,9 +16,11 @@ limitations under the License.
 Contact: code@inmanta.com
 """
 
+import json
 import logging
 import os
 import re
+import stat
 import typing
 
 import pytest
@@ -34,7 +36,9 @@ from inmanta.ast import (
     RuntimeException,
     WrappingRuntimeException,
 )
+from inmanta.config import Config
 from inmanta.const import LOG_LEVEL_TRACE
+from inmanta.execute.plugin_cache import plugin_cache
 from utils import log_contains
 
 if typing.TYPE_CHECKING:
@@ -702,3 +706,69 @@ end
     with pytest.raises(InvalidTypeAnnotation) as exc_info:
         compiler.do_compile()
     assert "Union type must be subscripted, got typing.Union" in str(exc_info.value)
+
+
+def test_plugin_cache(snippetcompiler, caplog, tmp_path) -> None:
+    """
+    Verify that the results of cacheable plugins are memoized within a compile and, through the on-disk cache, across
+    compiles, and that calls that receive an entity bypass the cache.
+    """
+    plugin_cache.clear()
+    Config.set("compiler", "plugin_cache_dir", str(tmp_path))
+
+    def compile_and_get_calls() -> dict[str, int]:
+        snippetcompiler.setup_for_snippet(
+            """
+import tests
+
+entity A:
+end
+
+implementation none for A:
+end
+
+implement A using none
+
+x1 = tests::cached_join(["a", "b"])
+x2 = tests::cached_join(["a", "b"])
+x3 = tests::cached_join(["a", "b"], separator="-")
+y1 = tests::cached_type_name(A())
+y2 = tests::cached_type_name(A())
+            """,
+        )
+        with caplog.at_level(logging.INFO):
+            _, scopes = compiler.do_compile()
+        root: Namespace = scopes.get_child("__config__")
+        assert root.lookup("x1").get_value() == "a,b"
+        assert root.lookup("x2").get_value() == "a,b"
+        assert root.lookup("x3").get_value() == "a-b"
+        assert root.lookup("y1").get_value() == "DynamicProxy"
+
+        import inmanta_plugins.tests
+
+        calls = dict(inmanta_plugins.tests.cached_calls)
+        inmanta_plugins.tests.cached_calls.clear()
+        return calls
+
+    assert compile_and_get_calls() == {"cached_join": 2, "cached_type_name": 2}
+    log_contains(
+        caplog,
+        "inmanta.execute.plugin_cache",
+        logging.INFO,
+        "Plugin cache for tests::cached_join observed 1 hits, 2 misses and 0 bypassed calls (33% hit rate)",
+    )
+    log_contains(
+        caplog,
+        "inmanta.execute.plugin_cache",
+        logging.INFO,
+        "Plugin cache for tests::cached_type_name observed 0 hits, 0 misses and 2 bypassed calls (0% hit rate)",
+    )
+    cache_files = list(tmp_path.glob("*/*.json"))
+    assert len(cache_files) == 1
+    assert stat.S_IMODE(cache_files[0].parent.stat().st_mode) == 0o700
+    assert "a,b" in json.loads(cache_files[0].read_text()).values()
+
+    # The results are loaded from disk when they are not in memory
+    plugin_cache.clear()
+    assert compile_and_get_calls() == {"cached_type_name": 2}
+    plugin_cache.clear()
@@ -0,0 +1,98 @@
+"""
+Copyright 2026 Inmanta
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Contact: code@inmanta.com
+"""
+
+import json
+from pathlib import Path
+
+import inmanta.compiler as compiler
+from inmanta.execute import profiler
+
+
+def test_profile_model(snippetcompiler, tmp_path: Path) -> None:
+    """
+    Verify that the model level profiler records plugins, statements, instances and scheduler iterations.
+    """
+    snippetcompiler.setup_for_snippet(
+        """
+entity A:
+    string name
+end
+
+entity B extends A:
+end
+
+implement A using std::none
+implement B using std::none
+
+for i in std::sequence(3):
+    A(name=std::replace("a{{i}}", old="a", new="b"))
+end
+B(name="b")
+        """,
+        autostd=True,
+    )
+    path = tmp_path / "profile.json"
+
+    assert profiler.get_active_profiler() is None
+    with profiler.profile(str(path)) as active_profiler:
+        assert profiler.get_active_profiler() is active_profiler
+        compiler.do_compile()
+    assert profiler.get_active_profiler() is None
+
+    with path.open() as fh:
+        profile = json.load(fh)
+
+    assert set(profile["phases"].keys()) == {"parse", "execute"}
+    assert profile["scheduler_iterations"] > 0
+
+    plugins = {plugin["plugin"]: plugin for plugin in profile["plugins"]}
+    assert plugins["std::replace"]["count"] == 3
+    assert plugins["std::sequence"]["count"] == 1
+
+    statement_types = {statement["statement_type"] for statement in profile["statement_types"]}
+    assert {"Constructor", "FunctionCall"} <= statement_types
+    assert any("main.cf:13" in statement["statement"] for statement in profile["statement_locations"])
+
+    # Instances of a subtype are only counted for the subtype
+    assert profile["instances"]["__config__::A"] == 3
+    assert profile["instances"]["__config__::B"] == 1
+
+    folded = tmp_path / "profile.folded"
+    lines = folded.read_text().splitlines()
+    assert lines
+    for line in lines:
+        stack, value = line.rsplit(" ", maxsplit=1)
+        assert stack.split(";")[0] in {"parse", "execute"}
+        assert int(value) > 0
+    assert any(";plugin std::replace" in line for line in lines)
+
+
+def test_profile_model_disabled(snippetcompiler) -> None:
+    """
+    Verify that nothing is recorded when no profile file is configured.
+    """
+    snippetcompiler.setup_for_snippet(
+        """
+x = std::replace("a", old="a", new="b")
+        """,
+        autostd=True,
+    )
+    with profiler.profile(None) as active_profiler:
+        assert active_profiler is None
+        assert profiler.get_active_profiler() is None
+        compiler.do_compile()
@@ -189,6 +189,7 @@ TABLES_TO_KEEP = [x.table_name() for x in data._classes] + [
     "module_files",
     "role_assignment",
     "resource_diff",
+    "dryrun_resource",
     "token",  # Managed via the SQLAlchemy ORM (TokenRepository), not a BaseDocument
 ]  # Join table
 
@@ -447,7 +448,11 @@ async def clean_db(create_db, postgresql_client):
     """
     yield
 
-    tables_in_db = await postgresql_client.fetch("SELECT table_name FROM information_schema.tables WHERE table_schema='public'")
+    # Partitions are truncated together with their partitioned table
+    tables_in_db = await postgresql_client.fetch(
+        "SELECT table_name FROM information_schema.tables WHERE table_schema='public' "
+        "AND table_name NOT IN (SELECT relname FROM pg_catalog.pg_class WHERE relispartition)"
+    )
     tables_in_db = [x["table_name"] for x in tables_in_db]
     tables_to_preserve = TABLES_TO_KEEP
     tables_to_preserve.append(SCHEMA_VERSION_TABLE)
@@ -100,3 +100,18 @@ def context_tester(
     resource.requires
     # return
     return "test"
+
+
+cached_calls = defaultdict(lambda: 0)
+
+
+@plugin(cacheable=True)
+def cached_join(items: "string[]", separator: "string" = ",") -> "string":
+    cached_calls["cached_join"] += 1
+    return separator.join(items)
+
+
+@plugin(cacheable=True)
+def cached_type_name(value: "any") -> "string":
+    cached_calls["cached_type_name"] += 1
+    return type(value).__name__
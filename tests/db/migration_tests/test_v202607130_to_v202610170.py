@@ -0,0 +1,50 @@
+"""
+Copyright 2026 Inmanta
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Contact: code@inmanta.com
+"""
+
+import os
+import re
+from collections import abc
+
+import asyncpg
+import pytest
+
+file_name_regex = re.compile("test_v([0-9]{9})_to_v[0-9]{9}")
+part = file_name_regex.match(__name__)[1]
+
+
+@pytest.mark.db_restore_dump(os.path.join(os.path.dirname(__file__), f"dumps/v{part}.sql"))
+async def test_move_dryrun_resources_to_separate_table(
+    postgresql_client: asyncpg.Connection,
+    migrate_db_from: abc.Callable[[], abc.Awaitable[None]],
+    get_columns_in_db_table: abc.Callable[[str], abc.Awaitable[list[str]]],
+) -> None:
+    dryrun_resources_before = {
+        (record["id"], resource["id"]): resource
+        for record in await postgresql_client.fetch("SELECT id, resources FROM public.dryrun")
+        for resource in record["resources"].values()
+    }
+    assert dryrun_resources_before
+
+    await migrate_db_from()
+
+    assert "resources" not in await get_columns_in_db_table("dryrun")
+    dryrun_resources_after = {
+        (record["dryrun"], record["resource_version_id"]): record["payload"]
+        for record in await postgresql_client.fetch("SELECT dryrun, resource_version_id, payload FROM public.dryrun_resource")
+    }
+    assert dryrun_resources_after == dryrun_resources_before
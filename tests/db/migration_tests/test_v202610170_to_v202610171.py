@@ -0,0 +1,84 @@
+"""
+Copyright 2026 Inmanta
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Contact: code@inmanta.com
+"""
+
+import datetime
+import os
+import re
+from collections import abc
+
+import asyncpg
+import pytest
+
+file_name_regex = re.compile("test_v([0-9]{9})_to_v[0-9]{9}")
+part = file_name_regex.match(__name__)[1]
+
+
+@pytest.mark.db_restore_dump(os.path.join(os.path.dirname(__file__), f"dumps/v{part}.sql"))
+async def test_partition_resource_action_tables(
+    postgresql_client: asyncpg.Connection,
+    migrate_db_from: abc.Callable[[], abc.Awaitable[None]],
+    get_columns_in_db_table: abc.Callable[[str], abc.Awaitable[list[str]]],
+) -> None:
+    resource_actions_before = await postgresql_client.fetch("SELECT * FROM public.resourceaction ORDER BY action_id")
+    links_before = await postgresql_client.fetch(
+        "SELECT environment, resource_action_id, resource_id, resource_version FROM public.resourceaction_resource"
+    )
+    assert resource_actions_before
+    assert links_before
+
+    await migrate_db_from()
+
+    async def get_partitions(table_name: str) -> set[str]:
+        result = await postgresql_client.fetch(
+            "SELECT c.relname FROM pg_catalog.pg_inherits AS i INNER JOIN pg_catalog.pg_class AS c ON c.oid=i.inhrelid "
+            f"WHERE i.inhparent='public.{table_name}'::regclass"
+        )
+        return {record["relname"] for record in result}
+
+    today = (await postgresql_client.fetchval("SELECT (now() AT TIME ZONE 'UTC')::date")).strftime("p%Y%m%d")
+    days_in_dump = {
+        record["started"].astimezone(datetime.timezone.utc).strftime("p%Y%m%d") for record in resource_actions_before
+    }
+    for table_name in ["resourceaction", "resourceaction_resource"]:
+        partitions = await get_partitions(table_name)
+        assert f"{table_name}_default" in partitions
+        # A partition is created for every day on which a resource action in the dump was started
+        assert {f"{table_name}_{day}" for day in days_in_dump} <= partitions
+        assert f"{table_name}_{today}" in partitions
+
+    assert "started" in await get_columns_in_db_table("resourceaction_resource")
+    resource_actions_after = await postgresql_client.fetch("SELECT * FROM public.resourceaction ORDER BY action_id")
+    assert [dict(r) for r in resource_actions_after] == [dict(r) for r in resource_actions_before]
+    assert not await postgresql_client.fetch("SELECT * FROM public.resourceaction_default")
+
+    links_after = await postgresql_client.fetch(
+        "SELECT rr.environment, rr.resource_action_id, rr.resource_id, rr.resource_version, rr.started=ra.started AS match"
+        " FROM public.resourceaction_resource AS rr"
+        " INNER JOIN public.resourceaction AS ra ON rr.resource_action_id=ra.action_id"
+    )
+    assert all(record["match"] for record in links_after)
+    assert sorted(tuple(record.values())[:4] for record in links_after) == sorted(
+        tuple(record.values()) for record in links_before
+    )
+
+    # The link table follows the deletion of a resource action
+    action_id = resource_actions_before[0]["action_id"]
+    await postgresql_client.execute("DELETE FROM public.resourceaction WHERE action_id=$1", action_id)
+    assert not await postgresql_client.fetch(
+        "SELECT * FROM public.resourceaction_resource WHERE resource_action_id=$1", action_id
+    )
@@ -34,6 +34,7 @@ from sqlalchemy import (
     Table,
     TextClause,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.engine.interfaces import Dialect
@@ -511,6 +512,9 @@ class DatabaseSchemaComparison:
 async def get_database_schema(host: str, port: int, username: str, password: str | None, database: str) -> MetaData:
     """
     Load the schema of the given database into a new MetaData object.
+
+    The partitions of a partitioned table are left out, they are managed by the server instead of by the models. So are
+    the copies of a foreign key that PostgreSQL adds for every partition of the table it references.
     """
     url = URL.create(
         drivername="postgresql+asyncpg",
@@ -524,7 +528,18 @@ async def get_database_schema(host: str, port: int, username: str, password: str
     try:
         metadata = MetaData()
         async with engine.connect() as connection:
-            await connection.run_sync(metadata.reflect)
+            partitions: set[str] = set(
+                await connection.scalars(
+                    text("SELECT relname FROM pg_catalog.pg_class WHERE relispartition AND relnamespace='public'::regnamespace")
+                )
+            )
+            await connection.run_sync(metadata.reflect, only=lambda name, _: name not in partitions, resolve_fks=False)
+        for table in metadata.tables.values():
+            for constraint in list(table.constraints):
+                if isinstance(constraint, ForeignKeyConstraint) and any(
+                    element.target_fullname.split(".")[0] in partitions for element in constraint.elements
+                ):
+                    table.constraints.remove(constraint)
         return metadata
     finally:
         await engine.dispose()
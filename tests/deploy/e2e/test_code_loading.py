@@ -21,7 +21,7 @@ import base64
 import logging
 import pathlib
 import uuid
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence, Set
 from logging import DEBUG
 
 import py
@@ -30,7 +30,7 @@ import pytest
 from inmanta import data, protocol
 from inmanta.agent import executor
 from inmanta.agent.agent_new import Agent
-from inmanta.agent.code_manager import CodeManager, CouldNotResolveCode
+from inmanta.agent.code_manager import BlobCache, CodeManager, CouldNotResolveCode
 from inmanta.agent.in_process_executor import InProcessExecutorManager
 from inmanta.data import AgentModules, InmantaModule, ModuleFiles, PipConfig
 from inmanta.data.model import ModuleSourceMetadata
@@ -173,6 +173,7 @@ async def test_agent_installs_dependency_containing_extras(
 async def test_get_code(
     server,
     client,
+    monkeypatch,
 ) -> None:
     """
     Test the code_manager get_code method.
@@ -318,6 +319,42 @@ async def test_get_code(
             actual_content = set([module_source.source.decode() for module_source in spec.blueprint.sources])
             assert actual_content == expected_content
 
+    # File contents are fetched once and shared by all agents and versions
+    sources_by_hash: dict[str, list[bytes]] = {}
+    for version in model_versions:
+        for agent_name in agents:
+            for spec in await codemanager.get_code(environment=env_id, model_version=version, agent_name=agent_name):
+                for module_source in spec.blueprint.sources:
+                    sources_by_hash.setdefault(module_source.metadata.hash_value, []).append(module_source.source)
+    assert set(sources_by_hash.keys()) == set(files_hashes)
+    for sources in sources_by_hash.values():
+        assert all(source is sources[0] for source in sources)
+
+    # The content of a file is removed after the module files were resolved, e.g. by a concurrent cleanup
+    async def get_no_file_contents(content_hashes: Set[str]) -> Mapping[str, bytes]:
+        return {}
+
+    codemanager = CodeManager()
+    monkeypatch.setattr(codemanager, "_get_file_contents", get_no_file_contents)
+    with pytest.raises(CouldNotResolveCode, match="was not found"):
+        await codemanager.get_code(environment=env_id, model_version=model_versions[0], agent_name="agent_1")
+
+
+def test_blob_cache() -> None:
+    cache = BlobCache(max_size=10)
+    cache.put("a", b"aaaa")
+    cache.put("b", b"bbbb")
+    # Use a, so b becomes the least recently used blob
+    assert cache.get("a") == b"aaaa"
+    cache.put("c", b"cccc")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"aaaa"
+    assert cache.get("c") == b"cccc"
+    # Blobs larger than the cache are not cached
+    cache.put("d", b"d" * 11)
+    assert cache.get("d") is None
+    assert cache.get("a") == b"aaaa"
+
 
 async def test_agent_code_loading_with_failure(
     caplog,
@@ -17,8 +17,11 @@ Contact: code@inmanta.com
 """
 
 import asyncio
+import copy
+import dataclasses
 import datetime
 import logging
+import os
 import uuid
 from collections.abc import Mapping
 
@@ -28,7 +31,7 @@ import inmanta.server
 import utils
 from inmanta import config, const, data
 from inmanta.agent.agent_new import Agent
-from inmanta.deploy.state import Blocked, Compliance, HandlerResult, ResourceState
+from inmanta.deploy.state import Blocked, Compliance, HandlerResult, ModelState, ModelStateSnapshot, ResourceState
 
 
 @pytest.fixture
@@ -461,3 +464,67 @@ async def test_scheduler_initialize_multiple_versions(
     rps2 = await data.ResourcePersistentState.get_one(environment=env_uuid, resource_id=rid2)
     assert rps1.orphaned_after is None
     assert rps2.orphaned_after == version1
+
+
+async def test_scheduler_initialization_from_snapshot(
+    agent, resource_container, clienthelper, server, client, environment, caplog
+) -> None:
+    """
+    Verify that the scheduler writes a snapshot of its model state after processing a version and that it restores its
+    state from that snapshot when it is restarted.
+    """
+    caplog.set_level(logging.DEBUG)
+    config.Config.set("scheduler", "state-snapshot-interval", "1")
+    resource_container.Provider.reset()
+
+    version = await clienthelper.get_version()
+    resources = [
+        {
+            "key": f"key{i}",
+            "value": f"val{i}",
+            "id": f"test::Resource[agent1,key=key{i}],v={version}",
+            "requires": [f"test::Resource[agent1,key=key{i - 1}],v={version}"] if i > 1 else [],
+            "purged": False,
+            "send_event": False,
+        }
+        for i in range(1, 4)
+    ]
+    await clienthelper.put_version_simple(resources, version)
+    result = await client.release_version(environment, version)
+    assert result.code == 200
+    await clienthelper.wait_for_deployed()
+
+    snapshot_path = agent.scheduler._get_snapshot_path()
+    assert snapshot_path is not None
+    await utils.retry_limited(lambda: os.path.exists(snapshot_path), timeout=10)
+    with open(snapshot_path, "rb") as fh:
+        snapshot = ModelStateSnapshot.load(fh.read())
+    assert snapshot is not None
+    assert snapshot.version == version
+    assert len(snapshot.resources) == 3
+
+    # A snapshot for another version is not used
+    async with data.Scheduler.get_connection() as connection:
+        assert (
+            await ModelState.create_from_snapshot(
+                uuid.UUID(environment), dataclasses.replace(snapshot, version=version - 1), connection=connection
+            )
+            is None
+        )
+
+    state_before = copy.deepcopy(dict(agent.scheduler._state.resource_state))
+    requires_before = dict(agent.scheduler._state.requires)
+    intent_before = dict(agent.scheduler._state.intent)
+
+    await agent.scheduler.stop()
+    await agent.scheduler.join()
+    await agent.scheduler.start()
+
+    utils.log_contains(
+        caplog, "inmanta.deploy.scheduler", logging.DEBUG, f"Restored the model state for version {version} from snapshot"
+    )
+    assert agent.scheduler._state.version == version
+    assert dict(agent.scheduler._state.resource_state) == state_before
+    assert dict(agent.scheduler._state.requires) == requires_before
+    assert dict(agent.scheduler._state.intent) == intent_before
+    assert not agent.scheduler._state.dirty
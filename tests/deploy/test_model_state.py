@@ -0,0 +1,198 @@
+"""
+Copyright 2026 Inmanta
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Contact: code@inmanta.com
+
+"""
+
+import copy
+import datetime
+import gc
+import logging
+import pickle
+import tracemalloc
+import uuid
+
+import inmanta.deploy.state
+from inmanta.deploy.state import (
+    Blocked,
+    Compliance,
+    HandlerResult,
+    ModelState,
+    ModelStateSnapshot,
+    ResourceIntent,
+    ResourceState,
+)
+from inmanta.types import ResourceIdStr
+
+LOGGER = logging.getLogger(__name__)
+
+DEPLOYED: datetime.datetime = datetime.datetime(2026, 1, 1, 12, 30, 15, 123456).astimezone()
+
+
+def rid(i: int) -> ResourceIdStr:
+    return ResourceIdStr(f"test::Resource[agent{i % 5},name=r{i}]")
+
+
+def make_intents(nb_resources: int) -> dict[ResourceIdStr, ResourceIntent]:
+    return {rid(i): ResourceIntent(resource_id=rid(i), attribute_hash=f"hash{i}", attributes={}) for i in range(nb_resources)}
+
+
+def load_model(
+    state: ModelState, intents: dict[ResourceIdStr, ResourceIntent], *, undefined: set[ResourceIdStr] = set()
+) -> tuple[set[ResourceIdStr], set[ResourceIdStr]]:
+    """
+    Load a model where each resource requires the two resources before it, and at least two resources are undefined.
+    """
+    for i, intent in enumerate(intents.values()):
+        state.update_resource(
+            intent,
+            undefined=intent.resource_id in undefined,
+            known_compliant=i % 3 == 0 and intent.resource_id not in undefined,
+            last_deployed=DEPLOYED if i % 3 == 0 else None,
+        )
+    for i, resource in enumerate(intents):
+        state.update_requires(resource, {rid(j) for j in range(max(0, i - 2), i)})
+    return state.update_transitive_state(new_undefined=undefined, verify_blocked=set(intents), verify_unblocked=set())
+
+
+def test_compact_model_state(monkeypatch) -> None:
+    """
+    Verify that the compact model state representation behaves the same as the default one.
+    """
+    # Merge modified adjacency rows early to exercise the compaction
+    monkeypatch.setattr(inmanta.deploy.state._CompactAdjacency, "MIN_COMPACTION_SIZE", 8)
+    intents: dict[ResourceIdStr, ResourceIntent] = make_intents(100)
+    default: ModelState = ModelState.create(1)
+    compact: ModelState = ModelState.create(1, compact=True)
+
+    def assert_equal_states() -> None:
+        assert compact.resource_state == default.resource_state
+        assert dict(compact.requires) == dict(default.requires)
+        assert {k: v for k, v in default.requires.provides_view().items() if v} == dict(compact.requires.provides_view())
+        assert compact.dirty == default.dirty
+
+    undefined: set[ResourceIdStr] = {rid(10), rid(50)}
+    assert load_model(compact, intents, undefined=undefined) == load_model(default, intents, undefined=undefined)
+    assert_equal_states()
+    assert compact.resource_state[rid(90)].blocked is Blocked.BLOCKED
+    assert compact.resource_state[rid(9)].blocked is Blocked.NOT_BLOCKED
+    assert compact.requires[rid(0)] == set()
+    assert compact.requires[rid(5)] == {rid(3), rid(4)}
+    assert compact.requires.provides_view()[rid(5)] == {rid(6), rid(7)}
+
+    # Resource state objects write through to the columns and can be copied
+    resource_state: ResourceState = compact.resource_state[rid(3)]
+    assert resource_state.compliance is Compliance.COMPLIANT
+    assert resource_state.last_deployed == default.resource_state[rid(3)].last_deployed
+    for state in (compact, default):
+        state.resource_state[rid(3)].last_handler_run = HandlerResult.FAILED
+        state.resource_state[rid(3)].last_handler_run_compliant = False
+    snapshot: ResourceState = copy.deepcopy(resource_state)
+    assert type(snapshot) is ResourceState
+    assert snapshot == resource_state
+    resource_state.compliance = Compliance.NON_COMPLIANT
+    assert compact.resource_state[rid(3)].compliance is Compliance.NON_COMPLIANT
+    assert snapshot.compliance is Compliance.COMPLIANT
+    resource_state.compliance = Compliance.COMPLIANT
+    assert compact.should_skip_for_dependencies(rid(4))
+    assert compact.should_skip_for_dependencies(rid(5))
+    assert not compact.should_skip_for_dependencies(rid(6))
+    assert_equal_states()
+
+    # Make the undefined resources defined again and drop some requires
+    for state in (compact, default):
+        for resource in undefined:
+            state.update_resource(intents[resource])
+        state.update_requires(rid(20), set())
+        state.update_requires(rid(21), {rid(20)})
+    assert compact.update_transitive_state(
+        new_undefined=set(), verify_blocked=set(), verify_unblocked=undefined | {rid(20), rid(21)}
+    ) == default.update_transitive_state(
+        new_undefined=set(), verify_blocked=set(), verify_unblocked=undefined | {rid(20), rid(21)}
+    )
+    assert_equal_states()
+    assert not any(state.blocked is Blocked.BLOCKED for state in compact.resource_state.values())
+
+    # Dropping resources releases their index for reuse
+    for state in (compact, default):
+        for resource in (rid(98), rid(99)):
+            state.drop(resource)
+        state.update_resource(intents[rid(99)])
+        state.update_requires(rid(99), {rid(97)})
+    assert_equal_states()
+    assert compact.resource_ids is not None
+    assert len(compact.resource_ids) == compact.resource_ids.size() - 1 == 99
+    assert rid(98) not in compact.resource_state
+    assert rid(98) not in compact.requires
+
+    compact.reset()
+    assert len(compact.resource_state) == len(compact.requires) == len(compact.resource_ids) == 0
+
+
+def test_compact_model_state_memory() -> None:
+    """
+    Compare the memory footprint of both model state representations for a large model.
+    """
+    nb_resources: int = 20000
+    intents: dict[ResourceIdStr, ResourceIntent] = make_intents(nb_resources)
+
+    def measure(compact: bool) -> int:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            state: ModelState = ModelState.create(1, compact=compact)
+            load_model(state, intents)
+            gc.collect()
+            size, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert len(state.resource_state) == nb_resources
+        return size
+
+    default_size: int = measure(compact=False)
+    compact_size: int = measure(compact=True)
+    LOGGER.info(
+        "Model state for %d resources: %d bytes in the default representation, %d bytes in the compact one",
+        nb_resources,
+        default_size,
+        compact_size,
+    )
+    assert compact_size < default_size / 2
+
+
+def test_model_state_snapshot() -> None:
+    """
+    Verify the serialization of model state snapshots.
+    """
+    environment: uuid.UUID = uuid.uuid4()
+    intents: dict[ResourceIdStr, ResourceIntent] = make_intents(10)
+    state: ModelState = ModelState.create(5)
+    load_model(state, intents)
+    state.resource_sets = {None: set(list(intents)[:5]), "set1": set(list(intents)[5:])}
+
+    snapshot: ModelStateSnapshot | None = ModelStateSnapshot.load(state.snapshot(environment).dump())
+    assert snapshot is not None
+    assert snapshot.environment == environment
+    assert snapshot.version == 5
+    assert [resource for resource, *_ in snapshot.resources] == list(intents)
+    resource, resource_set, attribute_hash, attributes, requires = snapshot.resources[6]
+    assert (resource, resource_set, attribute_hash, attributes) == (rid(6), "set1", "hash6", {})
+    assert set(requires) == {rid(4), rid(5)}
+    assert snapshot.resources[0][1] is None
+
+    # Snapshots in another format or corrupt files are ignored
+    assert ModelStateSnapshot.load(pickle.dumps((ModelStateSnapshot.FORMAT_VERSION + 1, environment, 5, []))) is None
+    assert ModelStateSnapshot.load(b"garbage") is None
@@ -31,9 +31,10 @@ import pytest
 from deploy.scheduler_mocks import FAIL_DEPLOY, NON_COMPLIANT_DEPLOY, DummyManager, TestScheduler
 from deploy.test_scheduler_agent import retry_limited_fast
 from inmanta import const, data
+from inmanta.agent import config as agent_config
 from inmanta.deploy import state
 from inmanta.deploy.scheduler import ModelVersion
-from inmanta.deploy.timers import ResourceTimer, TimerManager
+from inmanta.deploy.timers import ResourceTimer, TimerManager, TimingWheel, WheelResourceTimer
 from inmanta.deploy.work import TaskPriority
 from inmanta.protocol.common import custom_json_encoder
 from inmanta.types import ResourceIdStr
@@ -148,6 +149,74 @@ async def test_time_manager_basics():
     assert_fired(*t6)
 
 
+async def test_timing_wheel() -> None:
+    """
+    Verify that the timers of the TimingWheel are handed to the scheduler in batches.
+    """
+
+    class BatchRecorder:
+        def __init__(self) -> None:
+            self.batches: list[dict[ResourceIdStr, tuple[str, TaskPriority]]] = []
+            self.event = Event()
+
+        async def deploy_resources(self, resources: dict[ResourceIdStr, tuple[str, TaskPriority]]) -> None:
+            self.batches.append(dict(resources))
+            self.event.set()
+
+    recorder = BatchRecorder()
+    wheel = TimingWheel(recorder, tick=0.05)
+    timers = {rid: WheelResourceTimer(rid, wheel) for rid in ("r1", "r2", "r3", "r4")}
+    now = datetime.datetime.now().astimezone()
+
+    timers["r1"].set_timer(now + timedelta(milliseconds=100), "repair", TaskPriority.INTERVAL_REPAIR)
+    timers["r2"].set_timer(now + timedelta(milliseconds=101), "deploy", TaskPriority.INTERVAL_DEPLOY)
+    timers["r3"].set_timer(now + timedelta(milliseconds=100), "repair", TaskPriority.INTERVAL_REPAIR)
+    timers["r4"].set_timer(now + timedelta(milliseconds=100), "repair", TaskPriority.INTERVAL_REPAIR)
+    timers["r3"].cancel()
+    assert len(wheel) == 3
+
+    await recorder.event.wait()
+    await wheel.join()
+    # All due timers are handed over in a single batch, no earlier than requested
+    assert datetime.datetime.now().astimezone() >= now + timedelta(milliseconds=100)
+    assert recorder.batches == [
+        {
+            "r1": ("repair", TaskPriority.INTERVAL_REPAIR),
+            "r2": ("deploy", TaskPriority.INTERVAL_DEPLOY),
+            "r4": ("repair", TaskPriority.INTERVAL_REPAIR),
+        }
+    ]
+    assert len(wheel) == 0
+    assert all(timer.next_scheduled_time is None for timer in timers.values())
+
+    # Timers in the past fire immediately, timers that are cleared never fire
+    recorder.event.clear()
+    timers["r1"].set_timer(now, "late", TaskPriority.INTERVAL_REPAIR)
+    timers["r2"].set_timer(now + timedelta(seconds=3600), "later", TaskPriority.INTERVAL_REPAIR)
+    await recorder.event.wait()
+    assert recorder.batches[-1] == {"r1": ("late", TaskPriority.INTERVAL_REPAIR)}
+    wheel.clear()
+    assert len(wheel) == 0
+    assert timers["r2"].next_scheduled_time is None
+
+
+async def test_timer_jitter(environment_mock) -> None:
+    """
+    Verify that the jitter sets the timers of the resources up to the configured fraction of the interval earlier.
+    """
+    agent_config.scheduler_timer_jitter.set("0.5")
+    tm = MockTimerManager(environment_mock)
+    offsets = {tm._get_jitter(ResourceIdStr(f"test::Resource[agent,key={i}]"), 100) for i in range(100)}
+    assert all(timedelta(0) <= offset < timedelta(seconds=50) for offset in offsets)
+    # Spread over the resources, stable per resource
+    assert len(offsets) > 50
+    assert tm._get_jitter(ResourceIdStr("test::Resource[agent,key=1]"), 100) in offsets
+
+    agent_config.scheduler_timer_jitter.set("0")
+    tm = MockTimerManager(environment_mock)
+    assert tm._get_jitter(ResourceIdStr("test::Resource[agent,key=1]"), 100) == timedelta(0)
+
+
 @pytest.fixture
 def environment_mock() -> uuid.UUID:
     return uuid.UUID("83d604a0-691a-11ef-ae04-c8f750463317")
@@ -243,6 +243,56 @@ def test():
     utils.assert_no_warning(caplog, NOISY_LOGGERS + ["asyncio"])
 
 
+async def test_executor_prewarm(mpmanager: MPManager, environment) -> None:
+    """
+    Test that the MPManager creates processes ahead of their first use, within the pre-warm budget.
+    """
+    manager = mpmanager
+    await manager.start()
+    manager.process_pool.prewarm_budget = 1
+
+    def make_blueprint(name: str) -> executor.ExecutorBlueprint:
+        content = f"NAME = {name!r}".encode()
+        source = inmanta.data.model.ModuleSource(
+            metadata=ModuleSourceMetadata(
+                name=f"inmanta_plugins.test.{name}",
+                hash_value=inmanta.util.hash_file(content),
+                is_byte_code=False,
+            ),
+            source=content,
+        )
+        return executor.ExecutorBlueprint(
+            environment_id=uuid.UUID(environment),
+            pip_config=inmanta.data.PipConfig(),
+            requirements=[],
+            sources=[source],
+            python_version=sys.version_info[:2],
+        )
+
+    first = make_blueprint("first")
+    second = make_blueprint("second")
+
+    # Only the first blueprint fits in the budget
+    await manager.prewarm([first, second])
+    assert manager.get_prewarm_status() == {first.blueprint_hash(): executor.PrewarmState.WARMING}
+    await retry_limited(lambda: manager.get_prewarm_status() == {first.blueprint_hash(): executor.PrewarmState.READY}, 10)
+
+    # The first executor uses the pre-warmed process
+    first_process = manager.process_pool.pool[first]
+    first_executor = await manager.get_executor("agent1", "internal:", [executor.ModuleInstallSpec("test", "1", first)])
+    assert first_executor.process is first_process
+
+    # The pre-warmed process is in use now, which frees up budget for the second blueprint
+    await manager.prewarm([first, second])
+    await retry_limited(lambda: manager.get_prewarm_status().get(second.blueprint_hash()) == executor.PrewarmState.READY, 10)
+
+    # A pre-warmed process that was never used is stopped when its blueprint is no longer needed
+    second_process = manager.process_pool.pool[second]
+    await manager.prewarm([first])
+    await retry_limited(lambda: second_process.shut_down, 10)
+    assert manager.get_prewarm_status() == {first.blueprint_hash(): executor.PrewarmState.READY}
+
+
 async def test_executor_server_dirty_shutdown(mpmanager: MPManager, caplog):
     caplog.clear()
     manager = mpmanager
@@ -30,6 +30,7 @@ from inmanta import config, const, data
 from inmanta.agent import config as agent_config
 from inmanta.agent import executor
 from inmanta.data import PipConfig, model
+from packaging import version
 from utils import PipIndex, retry_limited, wait_until_deployment_finishes
 
 
@@ -196,6 +197,116 @@ async def test_environment_creation_locking(pip_index, tmpdir) -> None:
     await venv_manager_2.request_shutdown()
 
 
+async def test_environment_clone(pip_index, tmpdir, async_finalizer) -> None:
+    """
+    Verify that a venv is built from a clone of an existing venv when its requirements are a superset of the
+    requirements of that venv.
+    """
+    envs_dir = tmpdir.mkdir("venvs")
+    wheel_cache_dir = str(tmpdir.join("pip-cache"))
+    manager = executor.VirtualEnvironmentManager(
+        envs_dir=str(envs_dir),
+        thread_pool=concurrent.futures.ThreadPoolExecutor(
+            max_workers=1,
+        ),
+        wheel_cache_dir=wheel_cache_dir,
+    )
+    await manager.start()
+    async_finalizer.add(manager.request_shutdown)
+
+    env_id = uuid.uuid4()
+    pip_config = PipConfig(index_url=pip_index.url)
+
+    def make_blueprint(*requirements: str) -> executor.EnvBlueprint:
+        return executor.EnvBlueprint(
+            environment_id=env_id, pip_config=pip_config, requirements=requirements, python_version=sys.version_info[:2]
+        )
+
+    def get_metadata_file(venv: executor.ExecutorVirtualEnvironment, package: str) -> str:
+        return os.path.join(venv.site_packages_dir, f"{package}-1.0.0.dist-info", "METADATA")
+
+    base = await manager.get_environment(make_blueprint("pkg1==1.0.0"))
+
+    # Superset of the requirements: pkg1 is taken from the existing venv, pkg2 is installed
+    extended = await manager.get_environment(make_blueprint("pkg1==1.0.0", "pkg2"))
+    installed = extended.get_installed_packages()
+    assert installed["pkg1"] == version.Version("1.0.0")
+    assert installed["pkg2"] == version.Version("1.0.0")
+    assert os.path.samefile(get_metadata_file(extended, "pkg1"), get_metadata_file(base, "pkg1"))
+
+    # Different requirements: built from scratch
+    other = await manager.get_environment(make_blueprint("pkg1==2.0.0"))
+    assert other.get_installed_packages()["pkg1"] == version.Version("2.0.0")
+    assert "pkg2" not in other.get_installed_packages()
+
+    # Removing the original venv doesn't affect the clone
+    await base.request_shutdown()
+    assert base.id not in manager.pool
+    assert extended.get_installed_packages()["pkg1"] == version.Version("1.0.0")
+    assert os.path.exists(get_metadata_file(extended, "pkg1"))
+
+
+def test_environment_clone_scripts_and_data_files(tmpdir) -> None:
+    """
+    Verify that cloning a venv also clones the console scripts and data files of its packages, and that packages with files
+    outside of the venv are not cloned.
+    """
+    thread_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    source = executor.ExecutorVirtualEnvironment(str(tmpdir.join("source")), thread_pool)
+    source.init_env()
+    target = executor.ExecutorVirtualEnvironment(str(tmpdir.join("target")), thread_pool)
+    target.init_env()
+
+    def install_fake_package(name: str, files: dict[str, str]) -> None:
+        """
+        Install a package in the source venv by writing its files and metadata. The keys of the files are relative to the
+        site-packages directory, as in a RECORD file.
+        """
+        dist_info = f"{name}-1.0.0.dist-info"
+        files = {
+            **files,
+            f"{dist_info}/METADATA": f"Metadata-Version: 2.1\nName: {name}\nVersion: 1.0.0\n",
+            f"{dist_info}/RECORD": "",
+        }
+        for relative_path, content in files.items():
+            path = os.path.join(source.site_packages_dir, relative_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as fh:
+                fh.write(content)
+        with open(os.path.join(source.site_packages_dir, dist_info, "RECORD"), "w") as fh:
+            fh.write("".join(f"{relative_path},,\n" for relative_path in files))
+
+    venv_root = os.path.relpath(source.env_path, source.site_packages_dir)
+    outside_file = str(tmpdir.join("outside.txt"))
+    install_fake_package(
+        "withscript",
+        {
+            "withscript.py": "",
+            f"{venv_root}/bin/withscript": f"#!{source.python_path}\nimport withscript\n",
+            f"{venv_root}/share/withscript/data.txt": "data",
+        },
+    )
+    os.chmod(os.path.join(source.env_path, "bin", "withscript"), 0o755)
+    install_fake_package("outside", {"outside.py": "", outside_file: "data"})
+
+    target.clone_site_packages(source)
+
+    installed = set(target.get_installed_packages().keys())
+    assert "withscript" in installed
+    assert "outside" not in installed
+    assert os.path.exists(os.path.join(target.site_packages_dir, "withscript.py"))
+    assert not os.path.exists(os.path.join(target.site_packages_dir, "outside.py"))
+    # The script refers to the python interpreter of the clone
+    script = os.path.join(target.env_path, "bin", "withscript")
+    with open(script) as fh:
+        assert fh.readline() == f"#!{target.python_path}\n"
+    assert os.access(script, os.X_OK)
+    assert os.path.samefile(
+        os.path.join(target.env_path, "share", "withscript", "data.txt"),
+        os.path.join(source.env_path, "share", "withscript", "data.txt"),
+    )
+
+
 @pytest.mark.parametrize("auto_start_agent", [True])
 async def test_remove_executor_virtual_envs(
     clienthelper,
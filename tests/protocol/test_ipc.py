@@ -208,3 +208,47 @@ async def test_log_transport(caplog, request):
         utils.LogSequence(caplog).contains(log_shipper.logger_name, logging.DEBUG, "Could not send log line").assert_not(
             loggerpart="", level=-1, msg="", min_level=logging.DEBUG
         )
+
+
+async def test_log_batching(request):
+    """
+    Test that log lines emitted in the same event loop iteration are shipped as a single frame, but only when the
+    receiving side announced that it supports it.
+    """
+    loop = asyncio.get_running_loop()
+
+    class FrameSpy(IPCServer[None]):
+        def __init__(self, name: str, receives_batches: bool) -> None:
+            self.frames = []
+            if receives_batches:
+                self.features = frozenset({inmanta.protocol.ipc_light.LOG_BATCH})
+            super().__init__(name)
+
+        def frame_received(self, frame: inmanta.protocol.ipc_light.IPCFrame) -> None:
+            self.frames.append(frame)
+
+    for receives_batches in [True, False]:
+        parent_conn, child_conn = socket.socketpair()
+        server_transport, server_protocol = await loop.connect_accepted_socket(
+            lambda: FrameSpy("logs", receives_batches), parent_conn
+        )
+        request.addfinalizer(server_transport.close)
+        client_transport, client_protocol = await loop.connect_accepted_socket(lambda: IPCClient("Client"), child_conn)
+        request.addfinalizer(client_transport.close)
+
+        # Wait for the feature announcement
+        await inmanta.util.retry_limited(lambda: bool(client_protocol.peer_features) or not receives_batches, 1)
+
+        log_shipper = inmanta.protocol.ipc_light.LogShipper(client_protocol, loop)
+        for i in range(3):
+            log_shipper.handle(logging.LogRecord("deep.in.test", logging.INFO, "xxx", 5, "Test %s", (i,), exc_info=False))
+
+        if receives_batches:
+            await inmanta.util.retry_limited(lambda: len(server_protocol.frames) == 1, 1)
+            (batch,) = server_protocol.frames
+            assert isinstance(batch, inmanta.protocol.ipc_light.IPCLogRecordBatch)
+            assert [record.msg for record in batch.records] == ["Test 0", "Test 1", "Test 2"]
+        else:
+            await inmanta.util.retry_limited(lambda: len(server_protocol.frames) == 3, 1)
+            assert all(isinstance(frame, inmanta.protocol.ipc_light.IPCLogRecord) for frame in server_protocol.frames)
+            assert [frame.msg for frame in server_protocol.frames] == ["Test 0", "Test 1", "Test 2"]
@@ -139,6 +139,37 @@ async def test_client_files_stat(client):
     assert len(result.result["files"]) == len(other_files)
 
 
+async def test_client_upload_files(client):
+    files: dict[str, str] = {}
+    while len(files) < 10:
+        hash, content, body = make_random_file()
+        files[hash] = body
+
+    result = await client.upload_files(files=files)
+    assert result.code == 200
+    result = await client.stat_files(files=list(files))
+    assert result.code == 200
+    assert len(result.result["files"]) == 0
+    for hash, body in files.items():
+        result = await client.get_file(id=hash)
+        assert result.code == 200
+        assert result.result["content"] == body
+
+    # Files that already exist are ignored
+    hash, content, body = make_random_file()
+    result = await client.upload_files(files={**files, hash: body})
+    assert result.code == 200
+    result = await client.stat_files(files=[hash])
+    assert len(result.result["files"]) == 0
+
+    # Nothing is stored when a hash doesn't match
+    new_hash, content, new_body = make_random_file()
+    result = await client.upload_files(files={new_hash: new_body, hash + "a": body})
+    assert result.code == 400
+    result = await client.stat_files(files=[new_hash])
+    assert result.result["files"] == [new_hash]
+
+
 async def test_upload_file_twice(client):
     """
     This test checks that attempts to upload the same file twice (concurrently) don't cause an exception.
@@ -35,6 +35,7 @@ from inmanta.server import config as server_config
 from inmanta.server import protocol
 from inmanta.server.bootloader import InmantaBootloader
 from inmanta.server.protocol import Server, SliceStartupException
+from inmanta.vendor import pyformance
 
 
 class SupportAuthorizationLabel(const.AuthorizationLabel):
@@ -294,6 +295,79 @@ async def test_policy_evaluation(server_with_test_slice: protocol.Server) -> Non
         assert fh.read(1)
 
 
+async def test_policy_engine_decision_cache(server_with_test_slice: protocol.Server, monkeypatch) -> None:
+    """
+    Verify that identical requests reuse the cached decision of the policy engine, until the cache is invalidated.
+    """
+    authorization_provider = server_with_test_slice.get_authorization_provider()
+    assert isinstance(authorization_provider, providers.PolicyEngineAuthorizationProvider)
+
+    nr_of_evaluations = 0
+    _old_evaluate_policy = policy_engine.PolicyEngine._evaluate_policy
+
+    async def count_evaluations(self, query: str, error_message: str, input_data=None) -> dict[str, object]:
+        nonlocal nr_of_evaluations
+        nr_of_evaluations += 1
+        return await _old_evaluate_policy(self, query, error_message, input_data)
+
+    monkeypatch.setattr(policy_engine.PolicyEngine, "_evaluate_policy", count_evaluations)
+
+    env_id = "11111111-1111-1111-1111-111111111111"
+    client = utils.get_auth_client(env_to_role_dct={env_id: ["read-write"]}, is_admin=False)
+    for _ in range(3):
+        result = await client.read_only_method()
+        assert result.code == 200
+    assert nr_of_evaluations == 1
+
+    # A request with other parameters is evaluated separately
+    result = await client.environment_scoped_method(env_id)
+    assert result.code == 200
+    assert nr_of_evaluations == 2
+
+    # A changed role assignment invalidates the cache
+    authorization_provider.invalidate_cache()
+    result = await client.read_only_method()
+    assert result.code == 200
+    assert nr_of_evaluations == 3
+
+    hits = pyformance.global_registry().counter("internal.policy_engine.decision_cache.hits").get_count()
+    assert hits >= 2
+    hit_ratio = pyformance.global_registry()._gauges["internal.policy_engine.decision_cache.hit_ratio"].get_value()
+    assert 0 < hit_ratio < 1
+
+    # The cache can be disabled
+    policy_engine.decision_cache_size.set("0")
+    authorization_provider.invalidate_cache()
+    for _ in range(2):
+        result = await client.read_only_method()
+        assert result.code == 200
+    assert nr_of_evaluations == 5
+
+
+def test_policy_engine_decision_cache_key() -> None:
+    """
+    Verify that the decisions for large inputs are not cached and that the key doesn't depend on the order of the input.
+    """
+
+    def get_input(parameters: dict[str, object]) -> dict[str, object]:
+        return {"input": {"request": {"endpoint_id": "POST /api/v1/file", "parameters": parameters}, "token": {"sub": "a"}}}
+
+    env_id = uuid.uuid4()
+    key = policy_engine._get_decision_cache_key(get_input({"tid": env_id, "limit": 10}))
+    assert key is not None
+    assert key == policy_engine._get_decision_cache_key(get_input({"limit": 10, "tid": str(env_id)}))
+    assert key != policy_engine._get_decision_cache_key(get_input({"tid": env_id, "limit": 11}))
+
+    # Large or binary arguments are not cached
+    content = "a" * policy_engine.MAX_DECISION_CACHE_INPUT_SIZE
+    assert policy_engine._get_decision_cache_key(get_input({"tid": env_id, "content": content})) is None
+    assert (
+        policy_engine._get_decision_cache_key(get_input({"tid": env_id, "files": [{"id": str(i)} for i in range(5000)]}))
+        is None
+    )
+    assert policy_engine._get_decision_cache_key(get_input({"tid": env_id, "content": b"a"})) is None
+
+
 @pytest.mark.parametrize(
     "access_policy",
     [
@@ -55,6 +55,7 @@ from inmanta.server import SLICE_COMPILER, SLICE_SERVER, protocol
 from inmanta.server.bootloader import InmantaBootloader
 from inmanta.server.protocol import Server
 from inmanta.server.services.compilerservice import CompilerService, CompileRun, CompileStateListener
+from inmanta.server.services.compilerworker import CompilerWorkerException, CompilerWorkerPool
 from inmanta.server.services.notificationservice import NotificationService
 from inmanta.util import ensure_directory_exist
 from server.conftest import EnvironmentFactory
@@ -98,6 +99,7 @@ async def compile_and_assert(
     update=False,
     exporter_plugin=None,
     reinstall: bool = False,
+    compiler_worker_pool: Optional[CompilerWorkerPool] = None,
 ) -> tuple[CompileRun, abc.Mapping[str, object]]:
     """
     Create a compile data object and run it. Returns the compile run itself and the reports for each stage.
@@ -116,7 +118,7 @@ async def compile_and_assert(
     await compile.insert()
 
     # compile with export
-    cr = CompileRun(compile, project_work_dir)
+    cr = CompileRun(compile, project_work_dir, compiler_worker_pool)
     await cr.run()
 
     # get and process reports
@@ -587,6 +589,106 @@ async def test_compile_runner_repo_url_changed(environment_factory: EnvironmentF
     assert remote_url == env_other.repo_url
 
 
+@pytest.mark.slowtest
+@pytest.mark.parametrize("no_agent", [True])
+async def test_compile_runner_compiler_worker(environment_factory: EnvironmentFactory, server, client, tmpdir) -> None:
+    """
+    Verify that the compile runner reuses the compiler worker of an environment while the project and the environment
+    variables of the compile are unchanged, and that it replaces the worker when either of them changes.
+    """
+    testmarker_env = "TESTMARKER"
+    no_marker = "__no__marker__"
+    marker_print = "_INM_MM:"
+    marker_print2 = "_INM_MM2:"
+
+    def make_main(marker_print: str) -> str:
+        return f"""
+    import std::testing
+    marker = std::get_env("{testmarker_env}","{no_marker}")
+    std::print("{marker_print} {{{{marker}}}}")
+
+    std::testing::NullResource(name="test")
+        """
+
+    env = await environment_factory.create_environment(make_main(marker_print))
+
+    project_work_dir = os.path.join(tmpdir, "work")
+    ensure_directory_exist(project_work_dir)
+    compiler_worker_pool = CompilerWorkerPool(str(tmpdir))
+
+    def _compile_and_assert(export: bool = False, env_vars: dict[str, str] = {}):
+        return compile_and_assert(
+            env=env,
+            client=client,
+            project_work_dir=project_work_dir,
+            export=export,
+            env_vars=env_vars,
+            compiler_worker_pool=compiler_worker_pool,
+        )
+
+    try:
+        # The first compile starts the worker
+        compile, stages = await _compile_and_assert(export=True)
+        assert stages["Starting compiler worker"]["returncode"] == 0
+        assert stages["Recompiling configuration model"]["returncode"] == 0
+        assert f"{marker_print} {no_marker}" in stages["Recompiling configuration model"]["outstream"]
+        worker = compiler_worker_pool._workers[env.id]
+        assert worker.is_running()
+
+        # Nothing changed, the worker is reused
+        compile, stages = await _compile_and_assert()
+        assert "Starting compiler worker" not in stages
+        assert stages["Recompiling configuration model"]["returncode"] == 0
+        assert f"{marker_print} {no_marker}" in stages["Recompiling configuration model"]["outstream"]
+        assert compiler_worker_pool._workers[env.id] is worker
+
+        # Other environment variables, the worker is replaced
+        compile, stages = await _compile_and_assert(env_vars={testmarker_env: "present"})
+        assert stages["Starting compiler worker"]["returncode"] == 0
+        assert stages["Recompiling configuration model"]["returncode"] == 0
+        assert f"{marker_print} present" in stages["Recompiling configuration model"]["outstream"]
+        assert not worker.is_running()
+        worker = compiler_worker_pool._workers[env.id]
+
+        # The model changed, the worker is replaced
+        with open(os.path.join(project_work_dir, "main.cf"), "w", encoding="utf-8") as fh:
+            fh.write(make_main(marker_print2))
+        compile, stages = await _compile_and_assert(env_vars={testmarker_env: "present"})
+        assert stages["Starting compiler worker"]["returncode"] == 0
+        assert stages["Recompiling configuration model"]["returncode"] == 0
+        assert f"{marker_print2} present" in stages["Recompiling configuration model"]["outstream"]
+        assert not worker.is_running()
+        assert compiler_worker_pool._workers[env.id] is not worker
+    finally:
+        await compiler_worker_pool.stop()
+    assert not compiler_worker_pool._workers
+
+
+async def test_compiler_worker_startup_timeout(tmpdir) -> None:
+    """
+    Verify that a compiler worker that doesn't load the project in time is killed, that starting a worker is not retried
+    for the same fingerprint, and that it is retried once the worker of the environment is stopped.
+    """
+    # Stands in for the python of the compiler venv, never creates the socket of the worker
+    python_path = os.path.join(tmpdir, "python")
+    with open(python_path, "w", encoding="utf-8") as fh:
+        fh.write("#!/bin/sh\nexec sleep 60\n")
+    os.chmod(python_path, 0o755)
+
+    environment = uuid.uuid4()
+    compiler_worker_pool = CompilerWorkerPool(str(tmpdir), startup_timeout=0.5)
+    try:
+        with pytest.raises(CompilerWorkerException, match="did not load the project within 0.5 seconds"):
+            await compiler_worker_pool.start_worker(environment, "fingerprint", python_path, str(tmpdir), {}, [])
+        assert compiler_worker_pool.has_failed(environment, "fingerprint")
+        assert not compiler_worker_pool._workers
+
+        await compiler_worker_pool.stop_worker(environment)
+        assert not compiler_worker_pool.has_failed(environment, "fingerprint")
+    finally:
+        await compiler_worker_pool.stop()
+
+
 @pytest.fixture
 def unauthenticated_git_repo() -> abc.Iterator[str]:
     """
@@ -2832,3 +2934,45 @@ async def test_stale_local_state_halted_environment(mocked_compiler_service_bloc
         assert fh.read() == str(requested.id)
     await compilerslice._recompile_environments_with_stale_local_state()
     assert await data.Compile.get_next_run(env.id) is None
+
+
+async def test_stream_buffer() -> None:
+    """
+    Verify that the StreamBuffer writes the compile output to the report in large chunks.
+    """
+    # We perform the import here, because compilerservice is the name of a fixture in this file.
+    from inmanta.server.services import compilerservice
+
+    class CapturingReport:
+        def __init__(self) -> None:
+            self.writes: list[tuple[str, str]] = []
+
+        async def update_streams(self, out: str = "", err: str = "") -> None:
+            self.writes.append((out, err))
+
+    report = CapturingReport()
+    buffer = compilerservice.StreamBuffer(report, "out", flush_size=10, flush_interval=0.1)
+
+    # Small writes are combined
+    await buffer.write("aaa")
+    await buffer.write("")
+    await buffer.write("bbb")
+    assert report.writes == []
+    # Until the size threshold is reached
+    await buffer.write("cccc")
+    assert report.writes == [("aaabbbcccc", "")]
+
+    # Or output was buffered for long enough
+    await buffer.write("dd")
+    await retry_limited(lambda: len(report.writes) == 2, timeout=10)
+    assert report.writes[1] == ("dd", "")
+
+    # Remaining output is written on close
+    await buffer.write("e")
+    await buffer.close()
+    assert report.writes == [("aaabbbcccc", ""), ("dd", ""), ("e", "")]
+
+    err_buffer = compilerservice.StreamBuffer(report, "err")
+    await err_buffer.write("error")
+    await err_buffer.close()
+    assert report.writes[-1] == ("", "error")
@@ -23,6 +23,7 @@ import uuid
 import pytest
 
 from inmanta import data
+from inmanta.server import diff
 from inmanta.types import ResourceVersionIdStr
 from utils import insert_with_link_to_configuration_model
 
@@ -50,6 +51,7 @@ async def create_resource_in_multiple_versions(
     version_attributes_map: dict[int, dict[str, object]],
     agent: str = "internal",
     resource_type: str = "std::testing::NullResource",
+    with_hash: bool = False,
 ):
     key = f"{resource_type}[{agent},name={name}]"
 
@@ -62,6 +64,8 @@ async def create_resource_in_multiple_versions(
             attributes={**attributes, **{"name": name}},
             resource_set=resource_set,
         )
+        if with_hash:
+            res.make_hash()
         await res.insert()
 
 
@@ -376,6 +380,65 @@ async def test_resources_diff(client, environment, env_with_versions):
     assert_resource_added(result.result["data"][1])
 
 
+async def test_diff_hash_prefilter(client, environment, env_with_versions, monkeypatch):
+    """
+    Verify that resources with an unchanged attribute hash are filtered out before they are compared attribute by attribute,
+    while changes to the attributes that are not part of the attribute hash are still reported.
+    """
+    env_id = uuid.UUID(environment)
+    compared: list[str] = []
+    original_compare = diff.Resource.compare
+
+    def compare(self: diff.Resource, other: diff.Resource):
+        compared.append(self.resource_id)
+        return original_compare(self, other)
+
+    monkeypatch.setattr(diff.Resource, "compare", compare)
+
+    # A resource set that is shared by all versions
+    shared_resource_set = data.ResourceSet(environment=env_id, id=uuid.uuid4())
+    await insert_with_link_to_configuration_model(shared_resource_set, versions=[1, 2, 3])
+    for i in range(5):
+        res = data.Resource.new(
+            environment=env_id,
+            resource_version_id=ResourceVersionIdStr(f"std::testing::NullResource[internal,name=shared{i}],v=1"),
+            attributes={"name": f"shared{i}", "value": i},
+            resource_set=shared_resource_set,
+        )
+        res.make_hash()
+        await res.insert()
+
+    constant_value = {"key": "value"}
+    # Unchanged, but in a different resource set in every version
+    await create_resource_in_multiple_versions(env_id, "dir1", {1: constant_value, 2: constant_value}, with_hash=True)
+    # Only the requires differ, which are not part of the attribute hash
+    await create_resource_in_multiple_versions(
+        env_id,
+        "file1",
+        {1: {"requires": []}, 2: {"requires": ["std::testing::NullResource[internal,name=dir1]"]}},
+        with_hash=True,
+    )
+    # A regular attribute changes
+    await create_resource_in_multiple_versions(env_id, "file2", {1: {"key": "a"}, 2: {"key": "b"}}, with_hash=True)
+    # Only present in version 2
+    await create_resource_in_multiple_versions(env_id, "file3", {2: constant_value}, with_hash=True)
+
+    result = await client.get_diff_of_versions(environment, 1, 2)
+    assert result.code == 200
+    assert [(r["resource_id"], r["status"]) for r in result.result["data"]] == [
+        ("std::testing::NullResource[internal,name=file1]", "modified"),
+        ("std::testing::NullResource[internal,name=file2]", "modified"),
+        ("std::testing::NullResource[internal,name=file3]", "added"),
+    ]
+    assert set(result.result["data"][0]["attributes"].keys()) == {"requires"}
+    assert set(result.result["data"][1]["attributes"].keys()) == {"key"}
+    # Only the resources with a possible difference were compared attribute by attribute
+    assert sorted(compared) == [
+        "std::testing::NullResource[internal,name=file1]",
+        "std::testing::NullResource[internal,name=file2]",
+    ]
+
+
 async def test_validate_versions(client, environment, env_with_versions):
     """Test the version parameter validation of the diff endpoint."""
     result = await client.get_diff_of_versions(environment, 1, 2)
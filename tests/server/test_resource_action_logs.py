@@ -26,6 +26,8 @@ import pytest
 from tornado.httpclient import AsyncHTTPClient, HTTPRequest
 
 from inmanta import const, data
+from inmanta.config import Config
+from inmanta.data import dataview
 from inmanta.server import config
 from utils import insert_with_link_to_configuration_model
 
@@ -266,6 +268,63 @@ async def test_resource_logs_paging(server, client, order_by_column, order, env_
     assert response["metadata"] == {"total": 7, "before": 2, "after": 3, "page_size": 2}
 
 
+async def test_resource_logs_page_count_strategy(server, client, env_with_logs: tuple[str, list[datetime.datetime]]):
+    """Test the estimated and cached page count strategies for the resource logs"""
+    environment, msg_timings = env_with_logs
+
+    # Exact counts are the default, the strategy is not reported for them
+    result = await client.resource_logs(environment, resource_id_a, limit=2)
+    assert result.code == 200
+    assert result.result["metadata"] == {"total": 13, "before": 0, "after": 11, "page_size": 2}
+
+    Config.set("server", "page-count-strategy", "resource_logs=cached")
+    dataview.page_count_cache.clear()
+    result = await client.resource_logs(environment, resource_id_a, limit=2)
+    assert result.code == 200
+    assert result.result["metadata"] == {
+        "total": 13,
+        "before": 0,
+        "after": 11,
+        "page_size": 2,
+        "count_strategy": "cached",
+    }
+
+    # Add a log line, the cached counts are reused until the cache is cleared
+    resource_action = data.ResourceAction(
+        environment=uuid.UUID(environment),
+        version=9,
+        resource_version_ids=[f"{resource_id_a},v=9"],
+        action_id=uuid.uuid4(),
+        action=const.ResourceAction.deploy,
+        started=msg_timings[0],
+    )
+    await resource_action.insert()
+    resource_action.add_logs([data.LogLine.log(logging.INFO, "Extra log line", timestamp=msg_timings[13])])
+    await resource_action.save()
+
+    result = await client.resource_logs(environment, resource_id_a, limit=2)
+    assert result.code == 200
+    assert result.result["metadata"]["total"] == 13
+    dataview.page_count_cache.clear()
+    result = await client.resource_logs(environment, resource_id_a, limit=2)
+    assert result.code == 200
+    assert result.result["metadata"]["total"] == 14
+
+    # Estimated counts, the paging links are still based on exact checks
+    Config.set("server", "page-count-strategy", "resource_logs=estimated")
+    result = await client.resource_logs(environment, resource_id_a, limit=2)
+    assert result.code == 200
+    assert result.result["metadata"]["count_strategy"] == "estimated"
+    assert result.result["metadata"]["before"] == 0
+    assert result.result["metadata"]["page_size"] == 2
+    assert result.result["links"].get("next") is not None
+    assert result.result["links"].get("prev") is None
+
+    # An invalid strategy is rejected
+    with pytest.raises(ValueError):
+        config.server_page_count_strategy.validate("resource_logs=fast")
+
+
 @pytest.mark.parametrize(
     "sort, expected_status",
     [
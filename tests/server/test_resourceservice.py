@@ -16,7 +16,10 @@ limitations under the License.
 Contact: code@inmanta.com
 """
 
+import asyncio
 import datetime
+import logging
+import threading
 import uuid
 from datetime import timezone
 
@@ -28,6 +31,7 @@ from inmanta.agent import executor
 from inmanta.data import model
 from inmanta.deploy import persistence, state
 from inmanta.server import SLICE_RESOURCE
+from inmanta.server.services.resourceservice import ResourceActionLogLine, ResourceActionLogWriter
 from inmanta.types import ResourceIdStr, ResourceVersionIdStr
 
 
@@ -664,3 +668,60 @@ async def test_compliance_reporting_feature(
             "The handler reported the non_compliant state, but the compliance_reporting feature is not enabled."
             " Please check your entitlements file."
         ) in error_logs[0].msg
+
+
+async def test_resource_action_log_writer() -> None:
+    """
+    Verify that the ResourceActionLogWriter writes the records from a background thread, that producers wait for room when
+    its queue is full and that records are only dropped when no room was made in time.
+    """
+    logger = logging.getLogger(f"{const.NAME_RESOURCE_ACTION_LOGGER}.{uuid.uuid4()}")
+    handler_entered = threading.Event()
+    release_handler = threading.Event()
+    written: list[tuple[str, str]] = []
+
+    class BlockingHandler(logging.Handler):
+        def emit(self, record: logging.LogRecord) -> None:
+            written.append((record.getMessage(), threading.current_thread().name))
+            handler_entered.set()
+            release_handler.wait(timeout=10)
+
+    handler = BlockingHandler()
+    logger.addHandler(handler)
+    try:
+        writer = ResourceActionLogWriter(max_queue_size=3, put_timeout=0.1)
+
+        def record(msg: str) -> logging.LogRecord:
+            return ResourceActionLogLine(logger.name, logging.INFO, msg, datetime.datetime.now().astimezone())
+
+        # Before the writer is started, the records are written directly
+        release_handler.set()
+        await writer.write(record("direct"))
+        assert written == [("direct", threading.current_thread().name)]
+        release_handler.clear()
+        handler_entered.clear()
+
+        writer.start()
+        await writer.write(record("first"))
+        assert handler_entered.wait(timeout=10)
+        # The background thread is blocked on the first record, fill the queue
+        await writer.write(record("second"))
+        await writer.write(record("third"))
+        # No room is made within the timeout
+        await writer.write(record("dropped"))
+        assert writer.dropped == 1
+
+        # Room is made while the producer waits
+        writer._put_timeout = 10
+        waiting = asyncio.create_task(writer.write(record("waiting")))
+        await asyncio.sleep(0.1)
+        assert not waiting.done()
+        release_handler.set()
+        await asyncio.wait_for(waiting, timeout=10)
+        assert writer.dropped == 1
+
+        await writer.stop()
+        assert [msg for msg, _ in written] == ["direct", "first", "second", "third", "waiting"]
+        assert all(thread_name == "resource-action-log-writer" for _, thread_name in written[1:])
+    finally:
+        logger.removeHandler(handler)
@@ -603,6 +603,25 @@ async def test_agent(init_dataclasses_and_load_schema):
     assert agent3.get_status(has_active_session=False) == AgentStatus.down
 
 
+async def test_agent_insert_many_if_not_exist(environment):
+    """
+    Test the bulk insert of agents, which leaves existing agents untouched
+    """
+    env_id = uuid.UUID(environment)
+    await data.Agent(environment=env_id, name="agent0", paused=True).insert()
+
+    await data.Agent.insert_many_if_not_exist(env_id, [f"agent{i}" for i in range(100)])
+    agents = {agent.name: agent for agent in await data.Agent.get_list(environment=env_id)}
+    assert set(agents) == {f"agent{i}" for i in range(100)}
+    assert agents["agent0"].paused
+    assert not any(agent.paused for name, agent in agents.items() if name != "agent0")
+
+    # Overlapping and empty sets of endpoints
+    await data.Agent.insert_many_if_not_exist(env_id, {"agent99", "agent100"})
+    await data.Agent.insert_many_if_not_exist(env_id, [])
+    assert len(await data.Agent.get_list(environment=env_id)) == 101
+
+
 async def test_pause_agent_endpoint_set(environment):
     """
     Test the pause() method in the Agent class
@@ -1682,9 +1701,29 @@ async def test_dryrun(init_dataclasses_and_load_schema):
 
     dryrun_retrieved = await data.DryRun.get_by_id(dryrun.id)
     assert dryrun_retrieved.todo == 4
-    key = str(uuid.uuid5(dryrun.id, resource_version_id))
-    assert dryrun_retrieved.resources[key]["changes"] == {}
-    assert dryrun_retrieved.resources[key]["id"] == resource_version_id
+    resources = {rvid: payload async for rvid, payload in data.DryRun.get_resources(dryrun.id)}
+    assert resources == {resource_version_id: dryrun_data}
+
+    # A resource is only counted once
+    await data.DryRun.update_resource(dryrun.id, resource_version_id, {"id": resource_version_id, "changes": {"a": {}}})
+    dryrun_retrieved = await data.DryRun.get_by_id(dryrun.id)
+    assert dryrun_retrieved.todo == 4
+    resources = {rvid: payload async for rvid, payload in data.DryRun.get_resources(dryrun.id)}
+    assert resources == {resource_version_id: dryrun_data}
+
+    # Store a batch of resources
+    other_resources = {
+        f"std::testing::NullResource[agent1,name=file{i}],v={version}": {
+            "id": f"std::testing::NullResource[agent1,name=file{i}],v={version}",
+            "changes": {},
+        }
+        for i in range(3)
+    }
+    await data.DryRun.update_resources(dryrun.id, {**other_resources, resource_version_id: dryrun_data})
+    dryrun_retrieved = await data.DryRun.get_by_id(dryrun.id)
+    assert dryrun_retrieved.todo == 1
+    resources = {rvid: payload async for rvid, payload in data.DryRun.get_resources(dryrun.id)}
+    assert resources == {**other_resources, resource_version_id: dryrun_data}
 
 
 async def test_reports_append(init_dataclasses_and_load_schema):
@@ -1868,8 +1907,10 @@ async def test_compile_get_report(init_dataclasses_and_load_schema):
 async def test_match_tables_in_db_against_table_definitions_in_orm(
     postgres_db, database_name, postgresql_client, init_dataclasses_and_load_schema
 ):
+    # The partitions of a partitioned table are not tables on their own
     table_names = await postgresql_client.fetch(
-        "SELECT table_name FROM information_schema.tables " "WHERE table_schema='public'"
+        "SELECT table_name FROM information_schema.tables "
+        "WHERE table_schema='public' AND table_name NOT IN (SELECT relname FROM pg_catalog.pg_class WHERE relispartition)"
     )
     table_names_in_database = [x["table_name"] for x in table_names]
     table_names_in_classes_list = [x.table_name() for x in data._classes]
@@ -1880,6 +1921,7 @@ async def test_match_tables_in_db_against_table_definitions_in_orm(
         "role_assignment",
         "resource_set_configuration_model",
         "resource_diff",
+        "dryrun_resource",
     }
     # The following tables are not in the classes list, they are managed via the sqlalchemy ORM.
     sql_alchemy_tables: set[str] = {"inmanta_module", "module_files", "agent_modules", "token"}
@@ -2041,6 +2083,82 @@ async def test_purge_log_and_diff(postgresql_client, init_dataclasses_and_load_s
         assert rps_1.non_compliant_diff == env_2_diffs[0]["id"]
 
 
+async def test_purge_log_drop_partitions(postgresql_client, init_dataclasses_and_load_schema):
+    """
+    Verify that ResourceAction.purge_logs drops the partitions of the resource action tables that have expired as a whole,
+    and that it falls back to deleting rows for a partition that still contains resource actions that have to be retained.
+    """
+    project = data.Project(name="test")
+    await project.insert()
+
+    async def get_partitions(table_name: str) -> set[str]:
+        result = await postgresql_client.fetch(
+            "SELECT c.relname FROM pg_catalog.pg_inherits AS i INNER JOIN pg_catalog.pg_class AS c ON c.oid=i.inhrelid "
+            f"WHERE i.inhparent='public.{table_name}'::regclass"
+        )
+        return {record["relname"] for record in result}
+
+    today = datetime.datetime.now(datetime.timezone.utc).date()
+    # Only holds resource actions of the environment that is not halted
+    expired_day = today - datetime.timedelta(days=10)
+    # Also holds a resource action of the halted environment
+    mixed_day = today - datetime.timedelta(days=11)
+    for day in [expired_day, mixed_day]:
+        suffix = day.strftime("p%Y%m%d")
+        lower, upper = data.ResourceAction._get_partition_bounds(day)
+        await postgresql_client.execute(f"""
+            CREATE TABLE public.resourceaction_{suffix} PARTITION OF public.resourceaction
+                FOR VALUES FROM ('{lower}') TO ('{upper}');
+            CREATE TABLE public.resourceaction_resource_{suffix} PARTITION OF public.resourceaction_resource
+                FOR VALUES FROM ('{lower}') TO ('{upper}');
+            """)
+
+    async def create_resource_action(environment: uuid.UUID, day: datetime.date) -> None:
+        started = datetime.datetime.combine(day, datetime.time(12), tzinfo=datetime.timezone.utc)
+        await data.ResourceAction(
+            environment=environment,
+            version=1,
+            resource_version_ids=["std::testing::NullResource[agent1,name=file1],v=1"],
+            action_id=uuid.uuid4(),
+            action=const.ResourceAction.store,
+            started=started,
+            finished=started,
+        ).insert()
+
+    envs = []
+    for i in range(2):
+        env = data.Environment(name=f"dev-{i}", project=project.id, repo_url="", repo_branch="")
+        await env.insert()
+        envs.append(env)
+        await data.ConfigurationModel(
+            environment=env.id,
+            version=1,
+            date=datetime.datetime.now(),
+            total=1,
+            version_info={},
+            released=True,
+            is_suitable_for_partial_compiles=False,
+        ).insert()
+    await create_resource_action(envs[0].id, expired_day)
+    await create_resource_action(envs[0].id, mixed_day)
+    await create_resource_action(envs[1].id, mixed_day)
+    await envs[1].update_fields(halted=True)
+
+    await data.ResourceAction.purge_logs()
+
+    for table_name in ["resourceaction", "resourceaction_resource"]:
+        partitions = await get_partitions(table_name)
+        assert f"{table_name}_{expired_day.strftime('p%Y%m%d')}" not in partitions
+        assert f"{table_name}_{mixed_day.strftime('p%Y%m%d')}" in partitions
+        # The partitions for the upcoming days exist
+        for i in range(data.RESOURCE_ACTION_PARTITIONS_AHEAD + 1):
+            assert f"{table_name}_{(today + datetime.timedelta(days=i)).strftime('p%Y%m%d')}" in partitions
+    resource_actions = await data.ResourceAction.get_list()
+    assert len(resource_actions) == 1
+    assert resource_actions[0].environment == envs[1].id
+    assert len(await postgresql_client.fetch("SELECT * FROM public.resourceaction_resource")) == 1
+
+
 async def test_insert_many(init_dataclasses_and_load_schema):
     project1 = data.Project(name="proj1")
     project2 = data.Project(name="proj2")
@@ -2854,3 +2972,65 @@ async def test_get_partial_resources_since_version_raw(environment, server, post
     version, resource_sets = models[0]
     assert version == new_version
     assert resource_sets == {"10": []}
+
+
+async def test_get_partial_resources_since_version_raw_skip_unchanged(environment, server, postgresql_client, client):
+    """
+    Verify that get_partial_resources_since_version_raw only returns the intent of resources that changed since the previous
+    version when skip_unchanged is set, including for the shared resource set.
+    """
+
+    def get_resource_id(index: int, *, version: Optional[int] = None) -> ResourceVersionIdStr:
+        without_version = ResourceIdStr(f"mymodule::Myresource[myagent,id={index}]")
+        return ResourceVersionIdStr(f"{without_version},v={version}") if version is not None else without_version
+
+    async def put_version(resources: abc.Mapping[int, dict[str, object]]) -> int:
+        version: int = await client.reserve_version(tid=environment).value()
+        result = await client.put_version(
+            tid=environment,
+            version=version,
+            module_version_info={},
+            resources=[{"id": get_resource_id(i, version=version), **attributes} for i, attributes in resources.items()],
+        )
+        assert result.code == 200, result.result
+        await postgresql_client.execute(f"UPDATE configurationmodel SET released=true WHERE version={version}")
+        return version
+
+    base_version: int = await put_version({i: {"requires": [], "value": i} for i in range(10)})
+    new_version: int = await put_version(
+        {
+            # updated attribute
+            **{i: {"requires": [], "value": i + 100} for i in range(2)},
+            # updated requires
+            2: {"requires": [get_resource_id(3)], "value": 2},
+            # unchanged
+            **{i: {"requires": [], "value": i} for i in range(3, 9)},
+            # resource 9 was deleted, resource 10 is new
+            10: {"requires": [], "value": 10},
+        }
+    )
+
+    models = await data.Resource.get_partial_resources_since_version_raw(
+        environment=environment,
+        since=base_version,
+        projection=["resource_id", "attribute_hash"],
+        skip_unchanged=True,
+        connection=postgresql_client,
+    )
+    assert len(models) == 1
+    version, resource_sets = models[0]
+    assert version == new_version
+    assert resource_sets.keys() == {None}
+    assert {r["resource_id"] for r in resource_sets[None]} == {get_resource_id(i) for i in [*range(9), 10]}
+    assert {r["resource_id"] for r in resource_sets[None] if "attribute_hash" in r} == {
+        get_resource_id(i) for i in [0, 1, 2, 10]
+    }
+
+    # without skip_unchanged, all resources in the changed set are returned in full
+    models = await data.Resource.get_partial_resources_since_version_raw(
+        environment=environment,
+        since=base_version,
+        projection=["resource_id", "attribute_hash"],
+        connection=postgresql_client,
+    )
+    assert all(r["attribute_hash"] is not None for r in models[0][1][None])
@@ -16,6 +16,7 @@ limitations under the License.
 Contact: code@inmanta.com
 """
 
+import asyncio
 import json
 import logging
 import os
@@ -30,10 +31,13 @@ from inmanta.agent.code_manager import CodeManager
 from inmanta.ast import CompilerException, ExternalException, RuntimeException
 from inmanta.const import ResourceState
 from inmanta.data import Environment, Resource
-from inmanta.export import DependencyCycleException
+from inmanta.export import DependencyCycleException, Exporter
 from inmanta.module import InmantaModuleRequirement
-from inmanta.server import SLICE_RESOURCE
+from inmanta.protocol.exceptions import NotFound
+from inmanta.resources import Id
+from inmanta.server import SLICE_ORCHESTRATION, SLICE_RESOURCE
 from inmanta.server.server import Server
+from inmanta.server.services.orchestrationservice import VersionUpload
 from packaging.version import Version
 from utils import LogSequence, PipIndex, create_python_package
 
@@ -308,6 +312,41 @@ async def test_server_export(snippetcompiler, server: Server, client, environmen
     assert resources[0].resource_id == result.result["resources"][0]["resource_id"]
 
 
+async def test_server_export_failed_file_upload(
+    snippetcompiler, server: Server, client, environment, monkeypatch, caplog
+) -> None:
+    """
+    A file that can't be uploaded is logged and doesn't abort the export.
+    """
+    snippetcompiler.setup_for_snippet(
+        """
+            import std::testing
+            f = std::testing::NullResource(name="test")
+        """,
+        autostd=True,
+    )
+    # The server rejects a file of which the content doesn't match the hash
+    bad_hash: str = "0" * 40
+    register_code = Exporter.register_code
+
+    def register_code_and_bad_file(self: Exporter, code_manager: CodeManager) -> None:
+        register_code(self, code_manager)
+        self._file_store[bad_hash] = b"content"
+
+    monkeypatch.setattr(Exporter, "register_code", register_code_and_bad_file)
+
+    with caplog.at_level(logging.DEBUG):
+        await snippetcompiler.do_export_and_deploy()
+
+    LogSequence(caplog).contains("inmanta.export", logging.ERROR, f"Unable to upload file with hash {bad_hash}")
+    result = await client.stat_files(files=[bad_hash])
+    assert result.result["files"] == [bad_hash]
+
+    result = await client.list_versions(tid=environment)
+    assert result.code == 200
+    assert len(result.result["versions"]) == 1
+
+
 async def test_dict_export_server(snippetcompiler, server, client, environment):
     config.Config.set("config", "environment", environment)
     snippetcompiler.setup_for_snippet(
@@ -739,6 +778,134 @@ std::ResourceSet(name="resource_set_3", resources=[d, e])
     assert response.code == 404
 
 
+async def test_export_in_batches(snippetcompiler, server, client, environment) -> None:
+    """
+    Test that models with more resources than the export batch size are uploaded in batches, for full and partial exports.
+    """
+    config.Config.set("config", "export-batch-size", "2")
+
+    snippetcompiler.setup_for_snippet(
+        """
+import test_resources
+
+a = test_resources::Resource(value="A", agent="A", key="the_resource_a")
+b = test_resources::Resource(value="A", agent="A", key="the_resource_b", requires=a)
+c = test_resources::Resource(value="A", agent="B", key="the_resource_c", requires=b)
+d = test_resources::Resource(value="A", agent="B", key="the_resource_d")
+e = test_resources::Resource(value="A", agent="B", key="the_resource_e", requires=[c, d])
+std::ResourceSet(name="resource_set_1", resources=[d, e])
+        """,
+        autostd=True,
+    )
+    await snippetcompiler.do_export_and_deploy()
+    await assert_resource_set_assignment(
+        environment,
+        assignment={
+            "the_resource_a": None,
+            "the_resource_b": None,
+            "the_resource_c": None,
+            "the_resource_d": "resource_set_1",
+            "the_resource_e": "resource_set_1",
+        },
+    )
+    resources = await Resource.get_resources_in_latest_version_as_dto(environment=environment)
+    requires = {r.attributes["key"]: {Id.parse_id(req).attribute_value for req in r.attributes["requires"]} for r in resources}
+    assert requires["the_resource_e"] == {"the_resource_c", "the_resource_d"}
+
+    snippetcompiler.setup_for_snippet(
+        """
+import test_resources
+
+d = test_resources::Resource(value="A", agent="B", key="the_resource_d")
+f = test_resources::Resource(value="A", agent="B", key="the_resource_f")
+g = test_resources::Resource(value="A", agent="B", key="the_resource_g", requires=[d, f])
+std::ResourceSet(name="resource_set_1", resources=[d, f, g])
+        """,
+        autostd=True,
+    )
+    await snippetcompiler.do_export_and_deploy(partial_compile=True)
+    await assert_resource_set_assignment(
+        environment,
+        assignment={
+            "the_resource_a": None,
+            "the_resource_b": None,
+            "the_resource_c": None,
+            "the_resource_d": "resource_set_1",
+            "the_resource_f": "resource_set_1",
+            "the_resource_g": "resource_set_1",
+        },
+    )
+
+    # The upload sessions are closed once the version is stored
+    orchestration_service = server.get_slice(SLICE_ORCHESTRATION)
+    assert not orchestration_service._version_uploads
+    assert not os.listdir(os.path.join(config.state_dir.get(), "server", environment, "version_uploads"))
+
+    result = await client.upload_version_resources(tid=environment, upload_id=uuid.uuid4(), resources=[])
+    assert result.code == 404
+    result = await client.open_version_upload(tid=environment)
+    assert result.code == 200
+    result = await client.upload_version_resources(tid=environment, upload_id=result.result["data"], resources=[{"a": "b"}])
+    assert result.code == 400
+
+
+async def test_version_upload_not_removed_while_read(tmp_path) -> None:
+    """
+    Verify that an upload session is not removed while its batches are being read, and that it can't be read anymore once
+    it is removed.
+    """
+    upload = VersionUpload(uuid.uuid4(), str(tmp_path / "upload"))
+    await upload.add_batch([{"id": "a"}], max_size=1024)
+    await upload.add_batch([{"id": "b"}], max_size=1024)
+
+    batches = upload.read_batches()
+    assert await anext(batches) == [{"id": "a"}]
+    assert not upload.is_expired(timeout=-1)
+    remove = asyncio.create_task(upload.remove())
+    await asyncio.sleep(0.1)
+    assert not remove.done()
+    assert await anext(batches) == [{"id": "b"}]
+    with pytest.raises(StopAsyncIteration):
+        await anext(batches)
+
+    await remove
+    assert not os.path.exists(upload.path)
+    with pytest.raises(NotFound):
+        await anext(upload.read_batches())
+
+
+async def test_version_upload_limits(server, client, environment) -> None:
+    """
+    Verify that the number of open upload sessions and the number of bytes they stage are limited per environment.
+    """
+    config.Config.set("server", "version-upload-max-sessions", "2")
+    config.Config.set("server", "version-upload-max-size", "300")
+    orchestration_service = server.get_slice(SLICE_ORCHESTRATION)
+
+    upload_ids: list[str] = []
+    for _ in range(2):
+        result = await client.open_version_upload(tid=environment)
+        assert result.code == 200
+        upload_ids.append(result.result["data"])
+    result = await client.open_version_upload(tid=environment)
+    assert result.code == 400
+    assert "server.version-upload-max-sessions" in result.result["message"]
+
+    def get_resource(key: str) -> dict[str, object]:
+        return {"id": f"test::Resource[agent1,key={key}],v=1", "key": key, "requires": []}
+
+    result = await client.upload_version_resources(tid=environment, upload_id=upload_ids[0], resources=[get_resource("a")])
+    assert result.code == 200
+    # The limit on the staged bytes is shared by all sessions of the environment
+    resources = [get_resource(str(uuid.uuid4())) for _ in range(10)]
+    result = await client.upload_version_resources(tid=environment, upload_id=upload_ids[1], resources=resources)
+    assert result.code == 400
+    assert "server.version-upload-max-size" in result.result["message"]
+    upload = orchestration_service._version_uploads[uuid.UUID(upload_ids[1])]
+    assert upload.nr_of_batches == 0
+    assert not os.listdir(upload.path)
+
+
 async def test_resource_in_multiple_resource_sets(snippetcompiler, environment) -> None:
     """
     test that an error is raised if a resource is in multiple
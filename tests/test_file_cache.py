@@ -0,0 +1,106 @@
+"""
+Copyright 2026 Inmanta
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Contact: code@inmanta.com
+"""
+
+import asyncio
+import base64
+import os
+from unittest.mock import Mock
+
+from inmanta.agent.file_cache import FileCache
+from inmanta.protocol import common
+from inmanta.util import hash_file
+
+
+class MockFileClient:
+    """Client that serves the get_file endpoint from memory and counts the requests"""
+
+    def __init__(self, files: dict[str, bytes]) -> None:
+        self.files = files
+        self.requests: list[str] = []
+
+    async def get_file(self, hash_id: str) -> common.Result:
+        self.requests.append(hash_id)
+        # Give concurrent requests the opportunity to pile up
+        await asyncio.sleep(0.01)
+        if hash_id not in self.files:
+            return common.Result(404, result={"message": "not found"}, client=Mock(), method_properties=Mock())
+        content = base64.b64encode(self.files[hash_id]).decode()
+        return common.Result(200, result={"content": content}, client=Mock(), method_properties=Mock())
+
+
+def make_files(*contents: bytes) -> dict[str, bytes]:
+    return {hash_file(content): content for content in contents}
+
+
+async def test_file_cache_coalesce_and_hit(tmp_path) -> None:
+    files = make_files(b"a" * 10, b"b" * 10)
+    hash_a, hash_b = files.keys()
+    client = MockFileClient(files)
+    cache = FileCache(str(tmp_path), 100, client)
+    cache.load()
+
+    # Concurrent requests for the same file result in a single download
+    results = await asyncio.gather(*(cache.get(hash_a) for _ in range(5)))
+    assert results == [files[hash_a]] * 5
+    assert client.requests == [hash_a]
+
+    # Subsequent requests are served from disk
+    assert await cache.get(hash_a) == files[hash_a]
+    assert client.requests == [hash_a]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Files that don't exist are not cached
+    assert await cache.get("unknown") is None
+    assert await cache.get("unknown") is None
+    assert client.requests == [hash_a, "unknown", "unknown"]
+
+    # Prefetch only downloads the missing files
+    await cache.prefetch([hash_a, hash_b, hash_b])
+    assert client.requests == [hash_a, "unknown", "unknown", hash_b]
+    assert sorted(os.listdir(tmp_path)) == sorted([hash_a, hash_b])
+
+    # The cache is picked up again by a new process
+    client = MockFileClient(files)
+    cache = FileCache(str(tmp_path), 100, client)
+    cache.load()
+    assert await cache.get(hash_b) == files[hash_b]
+    assert client.requests == []
+
+
+async def test_file_cache_eviction(tmp_path) -> None:
+    files = make_files(b"a" * 40, b"b" * 40, b"c" * 40, b"d" * 200)
+    hash_a, hash_b, hash_c, hash_d = files.keys()
+    client = MockFileClient(files)
+    cache = FileCache(str(tmp_path), 100, client)
+    cache.load()
+
+    await cache.get(hash_a)
+    await cache.get(hash_b)
+    # Use a, so b becomes the least recently used file
+    await cache.get(hash_a)
+    await cache.get(hash_c)
+    assert sorted(os.listdir(tmp_path)) == sorted([hash_a, hash_c])
+
+    # Files larger than the cache are returned but not stored
+    assert await cache.get(hash_d) == files[hash_d]
+    assert sorted(os.listdir(tmp_path)) == sorted([hash_a, hash_c])
+
+    # A file removed by another process is downloaded again
+    os.remove(tmp_path / hash_a)
+    assert await cache.get(hash_a) == files[hash_a]
+    assert client.requests == [hash_a, hash_b, hash_c, hash_d, hash_a]
@@ -22,6 +22,7 @@ import json
 import logging
 import os
 import sys
+import types
 import uuid
 from collections.abc import AsyncIterator
 from datetime import UTC, datetime, timedelta, timezone
@@ -43,6 +44,7 @@ from inmanta.server import SLICE_AGENT_MANAGER, SLICE_ORCHESTRATION, SLICE_SERVE
 from inmanta.server import config as opt
 from inmanta.server.bootloader import InmantaBootloader
 from inmanta.server.protocol import ServerStartFailure
+from inmanta.server.services import orchestrationservice
 from inmanta.server.services.databaseservice import PostgreSQLVersion
 from inmanta.types import ResourceIdStr, ResourceVersionIdStr
 from utils import insert_with_link_to_configuration_model, log_contains, log_doesnt_contain, retry_limited
@@ -214,6 +216,51 @@ async def test_purge_versions(server, client, environment, has_released_versions
         assert {v["version"] for v in result.result["versions"]} == {*versions[4:]}
 
 
+async def test_purge_versions_time_budget(server, client, environment, monkeypatch) -> None:
+    """
+    Verify that the version purging deletes the versions in batches and stops when its time budget is exhausted.
+    The remaining versions are purged by the next run.
+    """
+    result = await client.set_setting(tid=environment, id=data.AUTO_DEPLOY, value="false")
+    assert result.code == 200
+
+    versions = []
+    for _ in range(5):
+        version = (await client.reserve_version(environment)).result["data"]
+        versions.append(version)
+        res = await client.put_version(
+            tid=environment,
+            version=version,
+            resources=[],
+            unknowns=[],
+            version_info={},
+            module_version_info={},
+        )
+        assert res.code == 200
+
+    result = await client.set_setting(tid=environment, id=data.AVAILABLE_VERSIONS_TO_KEEP, value=1)
+    assert result.code == 200
+
+    monkeypatch.setattr(orchestrationservice, "PURGE_VERSIONS_BATCH_SIZE", 2)
+    config.Config.set("server", "purge-versions-time-budget", "10")
+    # The budget is exhausted as soon as the first batch was deleted
+    clock = iter([0, 0])
+    monkeypatch.setattr(orchestrationservice, "time", types.SimpleNamespace(monotonic=lambda: next(clock, 1000)))
+    await server.get_slice(SLICE_ORCHESTRATION)._purge_versions()
+
+    result = await client.list_versions(environment)
+    assert result.code == 200
+    assert {v["version"] for v in result.result["versions"]} == {*versions[2:]}
+
+    monkeypatch.undo()
+    config.Config.set("server", "purge-versions-time-budget", "0")
+    await server.get_slice(SLICE_ORCHESTRATION)._purge_versions()
+
+    result = await client.list_versions(environment)
+    assert result.code == 200
+    assert {v["version"] for v in result.result["versions"]} == {versions[-1]}
+
+
 async def test_n_versions_env_setting_scope(client, server):
     """
     The AVAILABLE_VERSIONS_TO_KEEP environment setting used to be a global config option.
@@ -1369,6 +1416,94 @@ async def test_send_deploy_done_error_handling(server, client, environment, agen
     assert "No resource action exists for action_id" in str(exec_info.value)
 
 
+async def test_send_deploy_done_batched(server, client, environment, null_agent, clienthelper):
+    """
+    Ensure that deploy results that finish together are written in a single batch when group commit is enabled,
+    and that a failing result doesn't prevent the other results in the batch from being written.
+    """
+    config.Config.set("scheduler", "deploy-result-batch-window", "0.5")
+    env_id = uuid.UUID(environment)
+    model_version = await clienthelper.get_version()
+    resources = [
+        {
+            "name": f"file{i}",
+            "id": f"std::testing::NullResource[agent1,name=file{i}],v={model_version}",
+            "purge_on_delete": False,
+            "purged": False,
+            "requires": [],
+        }
+        for i in range(3)
+    ]
+    await clienthelper.put_version_simple(resources=resources, version=model_version, wait_for_released=True)
+
+    update_manager = persistence.ToDbUpdateManager(client, env_id)
+    action_ids = [uuid.uuid4() for _ in resources]
+    for action_id, resource in zip(action_ids, resources):
+        await update_manager.send_in_progress(action_id, Id.parse_id(resource["id"]))
+
+    def deploy_done(resource: dict[str, object], action_id: uuid.UUID, status: const.HandlerResourceState):
+        rvid = ResourceVersionIdStr(str(resource["id"]))
+        now = datetime.now().astimezone()
+        return update_manager.send_deploy_done(
+            attribute_hash=util.make_attribute_hash(resource_id=Id.parse_id(rvid).resource_str(), attributes=resource),
+            result=executor.DeployReport(
+                rvid=rvid,
+                action_id=action_id,
+                resource_state=status,
+                messages=[data.LogLine.log(level=const.LogLevel.INFO, msg="done", timestamp=now)],
+                changes={"attr1": AttributeStateChange(current="a", desired="b")},
+                change=const.Change.updated,
+            ),
+            state=state.ResourceState(
+                compliance=state.Compliance.COMPLIANT,
+                last_handler_run=state.HandlerResult.SUCCESSFUL,
+                blocked=state.Blocked.NOT_BLOCKED,
+                last_deployed=now,
+                last_handler_run_compliant=True,
+            ),
+            started=now,
+            finished=now,
+        )
+
+    results = await asyncio.gather(
+        deploy_done(resources[0], action_ids[0], const.HandlerResourceState.deployed),
+        deploy_done(resources[1], action_ids[1], const.HandlerResourceState.non_compliant),
+        # Unknown action id
+        deploy_done(resources[2], uuid.uuid4(), const.HandlerResourceState.deployed),
+        return_exceptions=True,
+    )
+    assert results[0] is None
+    assert results[1] is None
+    assert isinstance(results[2], ValueError)
+    assert "No resource action exists for action_id" in str(results[2])
+
+    for action_id, expected_status in [
+        (action_ids[0], const.ResourceState.deployed),
+        (action_ids[1], const.ResourceState.non_compliant),
+        (action_ids[2], const.ResourceState.deploying),
+    ]:
+        resource_action = await data.ResourceAction.get(action_id=action_id)
+        assert resource_action.status == expected_status
+        if expected_status is const.ResourceState.deploying:
+            assert resource_action.finished is None
+        else:
+            assert resource_action.finished is not None
+            assert [message["msg"] for message in resource_action.messages] == ["done"]
+            assert resource_action.change == const.Change.updated
+
+    rps_by_id = {rps.resource_id: rps for rps in await data.ResourcePersistentState.get_list(environment=env_id)}
+    deployed = rps_by_id[Id.parse_id(resources[0]["id"]).resource_str()]
+    assert not deployed.is_deploying
+    assert deployed.last_non_deploying_status is const.NonDeployingResourceState.deployed
+    assert deployed.last_success is not None
+    assert deployed.non_compliant_diff is None
+    non_compliant = rps_by_id[Id.parse_id(resources[1]["id"]).resource_str()]
+    assert non_compliant.last_non_deploying_status is const.NonDeployingResourceState.non_compliant
+    assert non_compliant.last_success is None
+    assert non_compliant.non_compliant_diff is not None
+    assert rps_by_id[Id.parse_id(resources[2]["id"]).resource_str()].is_deploying
+
+
 async def test_start_location_no_redirect(server):
     """
     Ensure that there is no redirection for the "start" location. (issue #3497)